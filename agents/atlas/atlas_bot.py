@@ -53,6 +53,7 @@ atlas_bot.py — GeekBrox 총괄 PM 봇 v1.0
 from __future__ import annotations
 
 import asyncio
+import fnmatch
 import os
 import re
 import subprocess
@@ -113,6 +114,31 @@ except ImportError:
     ACTOR_CLAUDE = "claude_code"
     ACTOR_CURSOR = "cursor_ai"
 
+try:
+    import state_bus   # shared_state 변경 알림 구독 (없으면 알림 푸시 없음)
+except ImportError:
+    state_bus = None
+
+from job_manager import JobManager   # blog_automation/scripts — 스크립트 비동기 실행
+import task_queue                    # blog_automation/scripts — 콘텐츠팀 봇과 공용 작업 대기열
+from workspace_index import WorkspaceIndex   # blog_automation/scripts — 현황 화면용 파일 인덱스
+from atlas_context import ContextBuilder, ContextSection, SnippetCache
+from doc_index import DocIndex
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Claude API 키 예산 공유 (llm_rate_limit — 없으면 제한 없이 호출)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+try:
+    from llm_rate_limit import RateLimitTimeout, estimate_tokens, get_limiter
+    _RATE_LIMIT_OK = True
+except ImportError:
+    _RATE_LIMIT_OK = False
+    class RateLimitTimeout(RuntimeError):
+        wait_sec = 0.0
+
+# PM 대화 응답이 API 한도 회복을 기다릴 최대 시간 (초)
+ATLAS_MAX_WAIT = int(os.environ.get("ATLAS_LLM_MAX_WAIT", "20"))
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # python-telegram-bot v20+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -144,10 +170,8 @@ BOT_TOKEN  = os.environ.get("TELEGRAM_BOT_TOKEN", "").strip()
 ALLOWED_ID = os.environ.get("TELEGRAM_CHAT_ID", "").strip()
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-# Rate Limit 방지 큐
+# Rate Limit 상태
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-_task_queue: deque = deque()
-_queue_running: bool = False
 QUEUE_DELAY = int(os.environ.get("INTER_POST_DELAY", "30"))
 _api_call_times: deque = deque(maxlen=20)
 
@@ -180,63 +204,19 @@ def is_allowed(update: Update) -> bool:
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 유틸: 스크립트 실행
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-def run_script(script_name: str, args: list[str] | None = None) -> tuple[bool, str]:
-    path = BLOG_SCRIPTS / script_name
-    if not path.exists():
-        return False, f"스크립트 없음: {path}"
-    try:
-        r = subprocess.run(
-            [sys.executable, str(path)] + (args or []),
-            capture_output=True, text=True, timeout=300, cwd=str(PROJECT_DIR),
-        )
-        out = (r.stdout + r.stderr).strip()
-        return r.returncode == 0, out[-1500:] if len(out) > 1500 else out
-    except subprocess.TimeoutExpired:
-        return False, "⏱️ 실행 시간 초과 (5분)"
-    except Exception as e:
-        return False, f"실행 오류: {e}"
+JOBS = JobManager(BLOG_SCRIPTS, cwd=PROJECT_DIR)
 
+# 메뉴 화면이 보는 폴더 — 버튼마다 glob · stat 하지 않고 인덱스에서 개수 · 최신 목록 조회
+WORKSPACE = WorkspaceIndex([
+    BLOG_DRAFTS, BLOG_DONE, BLOG_IMAGES,
+    GAME_DIR / "design", GAME_DIR / "gdd", GAME_DIR.parent / "interface",
+    OPS_DIR, PM_DIR / "sprints",
+])
 
-async def _process_queue(app_bot, chat_id: int):
-    global _queue_running
-    if _queue_running:
-        return
-    _queue_running = True
-    total = len(_task_queue)
-    completed = 0
-    try:
-        while _task_queue:
-            task = _task_queue.popleft()
-            completed += 1
-            remaining = len(_task_queue)
-            await app_bot.send_message(
-                chat_id=chat_id,
-                text=f"▶️ *작업 시작* [{completed}/{total}]\n📄 {task['label']}\n⏳ 남은: {remaining}개",
-                parse_mode="Markdown",
-            )
-            _record_api_call()
-            ok, out = await asyncio.get_event_loop().run_in_executor(
-                None, run_script, task["script"], task.get("args")
-            )
-            icon = "✅" if ok else "❌"
-            await app_bot.send_message(
-                chat_id=chat_id,
-                text=(
-                    f"{icon} *완료* [{completed}/{total}]: {task['label']}\n\n"
-                    f"```\n{out[:600]}\n```"
-                    + (f"\n\n⏳ 다음까지 {QUEUE_DELAY}초 대기..." if remaining > 0 else "")
-                ),
-                parse_mode="Markdown",
-            )
-            if remaining > 0:
-                await asyncio.sleep(QUEUE_DELAY)
-    finally:
-        _queue_running = False
-    await app_bot.send_message(
-        chat_id=chat_id,
-        text=f"🎉 *모든 작업 완료!* ({total}개)",
-        parse_mode="Markdown",
-    )
+
+async def run_script(script_name: str, args: list[str] | None = None) -> tuple[bool, str]:
+    """스크립트를 작업 관리자로 실행하고 끝날 때까지 기다림 (이벤트 루프 · 스레드를 막지 않음)."""
+    return await JOBS.run(script_name, args)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -252,7 +232,7 @@ def _read_md(path: Path, max_chars: int = 3000) -> str:
 
 def _latest_file(folder: Path, pattern: str = "*.md") -> Path | None:
     """폴더에서 수정 시간 기준 최신 파일 반환."""
-    files = sorted(folder.glob(pattern), key=lambda f: f.stat().st_mtime, reverse=True)
+    files = [e.path for e in WORKSPACE.files(folder) if fnmatch.fnmatch(e.path.name, pattern)]
     return files[0] if files else None
 
 
@@ -267,9 +247,9 @@ def dashboard_text() -> str:
     now = datetime.now().strftime("%Y-%m-%d %H:%M")
 
     # 콘텐츠팀 블로그 현황
-    done_posts  = list(BLOG_DONE.glob("*.md"))  if BLOG_DONE.exists()  else []
-    draft_posts = list(BLOG_DRAFTS.glob("*.md")) if BLOG_DRAFTS.exists() else []
-    blog_pct = int(len(done_posts) / 100 * 100)
+    done_posts  = WORKSPACE.count(BLOG_DONE, ".md")
+    draft_posts = WORKSPACE.count(BLOG_DRAFTS, ".md")
+    blog_pct = int(done_posts / 100 * 100)
 
     # 게임팀 현황 — PROJECT_STATE.md 파싱
     game_phase = "파일 없음"
@@ -302,8 +282,8 @@ def dashboard_text() -> str:
         f"━━━━━━━━━━━━━━━━━━\n"
         f"🕐 {now}\n\n"
         f"📝 *콘텐츠팀*\n"
-        f"  • 블로그 발행: *{len(done_posts)}/100* 편 ({blog_pct}%)\n"
-        f"  • 초안 대기: *{len(draft_posts)}개*\n\n"
+        f"  • 블로그 발행: *{done_posts}/100* 편 ({blog_pct}%)\n"
+        f"  • 초안 대기: *{draft_posts}개*\n\n"
         f"🎮 *게임개발팀*\n"
         f"  • 현재 단계: *{game_phase}*\n\n"
         f"📋 *우선순위 작업*\n"
@@ -339,34 +319,32 @@ def priority_text() -> str:
 
 # ── 2-1: 블로그 현황 ─────────────────────────
 def blog_status_text() -> str:
-    done   = sorted(BLOG_DONE.glob("*.md"),   reverse=True) if BLOG_DONE.exists()   else []
-    drafts = sorted(BLOG_DRAFTS.glob("*.md"), reverse=True) if BLOG_DRAFTS.exists() else []
-    images = list(BLOG_IMAGES.glob("*.*"))                  if BLOG_IMAGES.exists() else []
+    done   = WORKSPACE.count(BLOG_DONE, ".md")
+    drafts = WORKSPACE.count(BLOG_DRAFTS, ".md")
+    images = WORKSPACE.count(BLOG_IMAGES)
     now    = datetime.now().strftime("%Y-%m-%d %H:%M")
     rl     = _check_rate_limit_status()
 
     lines = [
         f"📝 *콘텐츠팀 블로그 현황* ({now})",
         "━━━━━━━━━━━━━━━━━━",
-        f"✅ 발행 완료: *{len(done)}/100* 편",
-        f"📝 초안 대기: *{len(drafts)}개*",
-        f"🖼️ 이미지: *{len(images)}개*",
+        f"✅ 발행 완료: *{done}/100* 편",
+        f"📝 초안 대기: *{drafts}개*",
+        f"🖼️ 이미지: *{images}개*",
         "",
         f"{'🟢 대기 초안 있음' if drafts else '⚪️ 대기 초안 없음'}",
         f"{'🟢 API 안전' if rl['safe'] else '🟡 API 주의'} (60초 내 {rl['recent_60s']}회)",
     ]
     if done:
         lines += ["", "📰 *최근 발행 5편*"]
-        for i, f in enumerate(done[:5], 1):
+        for i, f in enumerate(WORKSPACE.paths(BLOG_DONE, ".md", order="name", limit=5), 1):
             lines.append(f"  {i}. {f.stem[:40]}")
     return "\n".join(lines)
 
 
 # ── 2-4: 초안 목록 ───────────────────────────
 def get_drafts() -> list[Path]:
-    if not BLOG_DRAFTS.exists():
-        return []
-    return sorted(BLOG_DRAFTS.glob("*.md"), key=lambda f: f.stat().st_mtime, reverse=True)
+    return WORKSPACE.paths(BLOG_DRAFTS, ".md")
 
 
 def draft_list_text(drafts: list[Path]) -> str:
@@ -374,7 +352,8 @@ def draft_list_text(drafts: list[Path]) -> str:
         return "📭 대기 중인 초안이 없습니다."
     lines = [f"📋 *초안 목록* ({len(drafts)}개)\n"]
     for i, f in enumerate(drafts[:8], 1):
-        sz = f.stat().st_size // 1024
+        entry = WORKSPACE.entry(f)
+        sz = entry.size // 1024 if entry else 0
         lines.append(f"{i}. 📄 {f.stem[:35]} ({sz}KB)")
     if len(drafts) > 8:
         lines.append(f"… 외 {len(drafts) - 8}개")
@@ -396,14 +375,14 @@ def gdd_list_text() -> str:
     design_dir = GAME_DIR / "design"
     if not design_dir.exists():
         return "⚠️ design 폴더 없음"
-    files = sorted(design_dir.glob("*.md"), key=lambda f: f.stat().st_mtime, reverse=True)
+    files = WORKSPACE.files(design_dir, ".md")
     if not files:
         return "📭 GDD 파일 없음"
     lines = [f"📐 *GDD 문서 목록* ({len(files)}개)\n"]
     for i, f in enumerate(files, 1):
-        sz = f.stat().st_size // 1024
-        mtime = datetime.fromtimestamp(f.stat().st_mtime).strftime("%m/%d")
-        lines.append(f"{i}. 📄 {f.name} ({sz}KB, {mtime})")
+        sz = f.size // 1024
+        mtime = datetime.fromtimestamp(f.mtime).strftime("%m/%d")
+        lines.append(f"{i}. 📄 {f.path.name} ({sz}KB, {mtime})")
     return "\n".join(lines)
 
 
@@ -415,7 +394,7 @@ def concept_text() -> str:
         # 대체: 컨셉 관련 키워드가 있는 파일 찾기
         design_dir = GAME_DIR / "design"
         if design_dir.exists():
-            candidates = [f for f in design_dir.glob("*.md")
+            candidates = [f for f in WORKSPACE.paths(design_dir, ".md", order="name", reverse=False)
                           if "concept" in f.name.lower() or "컨셉" in f.name]
             if candidates:
                 concept_file = candidates[0]
@@ -450,16 +429,18 @@ def ops_research_text() -> str:
         return "⚠️ research 폴더 없음\n경로: " + str(research_dir)
 
     # 폴더 및 파일 목록
-    for item in sorted(research_dir.iterdir()):
-        if item.is_dir():
-            sub_files = list(item.glob("*.md"))
-            lines.append(f"📁 {item.name}/ ({len(sub_files)}개 파일)")
-            for f in sub_files[:3]:
+    items = [(d.name, d, None) for d in WORKSPACE.subdirs(research_dir)]
+    items += [(f.path.name, f.path, f) for f in WORKSPACE.files(research_dir, ".md")]
+    for _, item, entry in sorted(items, key=lambda x: x[0]):
+        if entry is None:
+            n_files = WORKSPACE.count(item, ".md")
+            lines.append(f"📁 {item.name}/ ({n_files}개 파일)")
+            for f in WORKSPACE.paths(item, ".md", order="name", reverse=False, limit=3):
                 lines.append(f"   • {f.name}")
-            if len(sub_files) > 3:
-                lines.append(f"   … 외 {len(sub_files) - 3}개")
-        elif item.suffix == ".md":
-            sz = item.stat().st_size // 1024
+            if n_files > 3:
+                lines.append(f"   … 외 {n_files - 3}개")
+        else:
+            sz = entry.size // 1024
             lines.append(f"📄 {item.name} ({sz}KB)")
 
     return "\n".join(lines)
@@ -470,17 +451,17 @@ def ops_mono_text() -> str:
     mono_dir = OPS_DIR / "monetization"
     if not mono_dir.exists():
         # 마케팅 관련 파일 탐색
-        candidates = list(OPS_DIR.rglob("*마케팅*")) + list(OPS_DIR.rglob("*marketing*"))
+        candidates = WORKSPACE.glob(OPS_DIR, "*마케팅*") + WORKSPACE.glob(OPS_DIR, "*marketing*")
         if not candidates:
             return "⚠️ 유료화 & 마케팅 파일 없음"
-        file_list = "\n".join(f"• {f.name}" for f in candidates[:10])
+        file_list = "\n".join(f"• {f.path.name}" for f in candidates[:10])
         return f"💰 *유료화 & 마케팅 현황*\n━━━━━━━━━━━━━━━━━━\n\n{file_list}"
 
-    files = list(mono_dir.rglob("*.md"))
-    lines = [f"💰 *유료화 & 마케팅* ({len(files)}개 문서)\n━━━━━━━━━━━━━━━━━━\n"]
-    for f in files[:8]:
-        sz = f.stat().st_size // 1024
-        lines.append(f"📄 {f.name} ({sz}KB)")
+    total = WORKSPACE.count(mono_dir, ".md", recursive=True)
+    lines = [f"💰 *유료화 & 마케팅* ({total}개 문서)\n━━━━━━━━━━━━━━━━━━\n"]
+    for f in WORKSPACE.files(mono_dir, ".md", recursive=True, limit=8):
+        sz = f.size // 1024
+        lines.append(f"📄 {f.path.name} ({sz}KB)")
     return "\n".join(lines)
 
 
@@ -663,7 +644,9 @@ def txt_help() -> str:
         "   ┗ 5-4 도움말\n\n"
         "🔘 *슬래시 명령어*\n"
         "`/start` `/menu` `/atlas` — 홈 메뉴\n"
-        "`/help` — 도움말\n\n"
+        "`/help` — 도움말\n"
+        "`/jobs` `/job 번호` `/cancel 번호` — 스크립트 작업 확인·취소\n"
+        "`/queue` — 작업 대기열 (콘텐츠팀 봇과 공용)\n\n"
         "✏️ *텍스트 입력* (최소 사용)\n"
         "`메모: [내용]` — 팀에 메모 전달\n"
         "`인증완료` — 카카오 인증 완료\n"
@@ -785,15 +768,8 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         )
         return
     if d == "ct_fetch_ok":
-        await edit("⏳ *자료조사 실행 중...*\n\nAniList API 수집 중입니다.", None)
-        ok, out = await asyncio.get_event_loop().run_in_executor(
-            None, run_script, "fetch_anime.py"
-        )
-        icon = "✅" if ok else "❌"
-        await edit(
-            f"{icon} *자료조사 {'완료' if ok else '실패'}*\n\n```\n{out[:800]}\n```",
-            KB([BTN("◀️ 콘텐츠팀", "m_content"), BTN("🏠 홈", "menu")]),
-        )
+        await queue_script(query.message, "fetch_anime.py", label="자료조사", kb="fetch",
+                           intro="🔍 *자료조사*\n\nAniList API 수집")
         return
     if d == "ct_generate":
         await edit(
@@ -804,16 +780,8 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         )
         return
     if d == "ct_generate_ok":
-        await edit("⏳ *글 생성 중...*\n\nClaude/Gemini로 초안을 작성 중입니다.", None)
-        ok, out = await asyncio.get_event_loop().run_in_executor(
-            None, run_script, "generate_post.py"
-        )
-        icon = "✅" if ok else "❌"
-        await edit(
-            f"{icon} *글 생성 {'완료' if ok else '실패'}*\n\n```\n{out[:800]}\n```",
-            KB([BTN("📋 초안 확인", "ct_drafts"),
-                BTN("◀️ 콘텐츠팀", "m_content")]),
-        )
+        await queue_script(query.message, "generate_post.py", label="글 생성", kb="generate",
+                           intro="✍️ *글 생성*\n\nClaude/Gemini로 초안 작성")
         return
     if d == "ct_drafts":
         drafts = get_drafts()
@@ -861,6 +829,7 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             return
         f = drafts[idx]
         f.unlink()
+        WORKSPACE.discard(f)
         await edit(f"🗑 *삭제 완료*: `{f.stem}`", KB([BTN("◀️ 초안 목록", "ct_drafts")]))
         return
     if d == "ct_post":
@@ -873,16 +842,8 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         )
         return
     if d == "ct_post_ok":
-        await edit("⏳ *포스팅 실행 중...*\n\nTistory에 업로드 중입니다.", None)
-        ok, out = await asyncio.get_event_loop().run_in_executor(
-            None, run_script, "post_to_tistory.py"
-        )
-        icon = "✅" if ok else "❌"
-        await edit(
-            f"{icon} *포스팅 {'완료' if ok else '실패'}*\n\n```\n{out[:800]}\n```",
-            KB([BTN("📊 블로그 현황", "ct_status"),
-                BTN("◀️ 콘텐츠팀", "m_content")]),
-        )
+        await queue_script(query.message, "post_to_tistory.py", label="포스팅", kb="post",
+                           intro="🚀 *포스팅*\n\nTistory 업로드")
         return
 
     # ── 3. 게임개발팀 ─────────────────────────
@@ -1046,81 +1007,79 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 # Atlas PM AI 응답 — 자유 텍스트 지시/질문 처리
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
+_SNIPPETS = SnippetCache()
+
+
 def _read_file_safe(path: Path, max_chars: int = 1500) -> str:
-    """파일을 안전하게 읽어 문자열 반환. 없으면 빈 문자열."""
-    try:
-        if path.exists():
-            return path.read_text(encoding="utf-8")[:max_chars]
-    except Exception:
-        pass
-    return ""
+    """파일을 안전하게 읽어 문자열 반환. 없으면 빈 문자열. (mtime 이 같으면 캐시에서)"""
+    return _SNIPPETS.read(path, max_chars)
 
 
-def _build_project_context() -> str:
-    """Atlas PM이 답변할 때 참고할 프로젝트 현재 상태를 수집."""
-    ctx_parts: list[str] = []
+# ── 컨텍스트 섹션 (등록 순서 = 출력 순서, 숫자 = 예산 배정 우선순위) ──
 
-    # ── 콘텐츠팀 ──────────────────────────────────────────────
-    done   = len(list(BLOG_DONE.glob("*.md")))   if BLOG_DONE.exists()   else 0
-    drafts = len(list(BLOG_DRAFTS.glob("*.md"))) if BLOG_DRAFTS.exists() else 0
-    ctx_parts.append(f"[콘텐츠팀] 블로그 발행 {done}/100편, 초안 대기 {drafts}개")
+def _ctx_content() -> str:
+    done   = WORKSPACE.count(BLOG_DONE, ".md")
+    drafts = WORKSPACE.count(BLOG_DRAFTS, ".md")
+    return f"[콘텐츠팀] 블로그 발행 {done}/100편, 초안 대기 {drafts}개"
 
-    # ── 게임팀 ────────────────────────────────────────────────
+
+def _ctx_game_state() -> str:
     ps_content = _read_file_safe(GAME_DIR / "PROJECT_STATE.md", 1500)
-    if ps_content:
-        ctx_parts.append(f"[게임팀] PROJECT_STATE:\n{ps_content}")
-    else:
-        ctx_parts.append("[게임팀] PROJECT_STATE.md 없음")
-
-    # 게임팀 인터페이스/UI 기획 문서 (통합 인터페이스 등)
-    interface_dir = GAME_DIR.parent / "interface"
-    if interface_dir.exists():
-        iface_files = list(interface_dir.glob("*.md"))
-        iface_summary_parts = [f"[게임팀/인터페이스] 파일 {len(iface_files)}개: {', '.join(f.name for f in iface_files)}"]
-        for ifile in iface_files[:4]:          # 최대 4개 파일 내용 포함
-            content = _read_file_safe(ifile, 800)
-            if content:
-                iface_summary_parts.append(f"── {ifile.name} ──\n{content}")
-        ctx_parts.append("\n\n".join(iface_summary_parts))
-
-    # GDD/컨셉 문서
-    gdd_dir = GAME_DIR / "gdd"
-    if gdd_dir.exists():
-        gdd_files = sorted(gdd_dir.glob("*.md"), key=lambda f: f.stat().st_mtime, reverse=True)[:3]
-        for gf in gdd_files:
-            ctx_parts.append(f"[게임팀/GDD] {gf.name}:\n{_read_file_safe(gf, 600)}")
-
-    # ── 운영팀 ────────────────────────────────────────────────
+    return f"[게임팀] PROJECT_STATE:\n{ps_content}" if ps_content else "[게임팀] PROJECT_STATE.md 없음"
+
+
+def _ctx_ops_state() -> str:
     ops_state = _read_file_safe(OPS_DIR / "OPS_STATE.md", 800)
-    if ops_state:
-        ctx_parts.append(f"[운영팀] OPS_STATE:\n{ops_state}")
-
-    # 운영팀 최근 수정 파일 5개 내용 포함
-    if OPS_DIR.exists():
-        ops_recent = sorted(OPS_DIR.rglob("*.md"), key=lambda f: f.stat().st_mtime, reverse=True)[:5]
-        ops_list = []
-        for of in ops_recent:
-            rel = of.relative_to(OPS_DIR)
-            snippet = _read_file_safe(of, 500)
-            ops_list.append(f"  {rel}:\n{snippet}")
-        ctx_parts.append("[운영팀] 최근 문서:\n" + "\n\n".join(ops_list))
-
-    # ── 우선순위 / PM ─────────────────────────────────────────
+    return f"[운영팀] OPS_STATE:\n{ops_state}" if ops_state else ""
+
+
+def _ctx_in_progress() -> str:
     ip_content = _read_file_safe(PM_DIR / "tasks" / "IN_PROGRESS.md", 1000)
-    if ip_content:
-        ctx_parts.append(f"[우선순위 작업]\n{ip_content}")
+    return f"[우선순위 작업]\n{ip_content}" if ip_content else ""
 
-    # project-management 루트 주요 파일
+
+def _ctx_pm_files() -> str:
+    """project-management 루트 주요 파일"""
+    parts = []
     for fname in ["PROJECT_OVERVIEW.md", "ROADMAP.md", "MILESTONES.md"]:
         c = _read_file_safe(PM_DIR / fname, 800)
         if c:
-            ctx_parts.append(f"[PM/{fname}]\n{c}")
+            parts.append(f"[PM/{fname}]\n{c}")
+    return "\n\n".join(parts)
 
-    # ── 3-Way shared_state ────────────────────────────────────
-    if _SHARED_STATE_OK:
-        ctx_parts.append(f"[3-Way 공유 상태]\n{telegram_format_status()}")
 
-    return "\n\n".join(ctx_parts)
+_PROJECT_CONTEXT = ContextBuilder([
+    ContextSection("콘텐츠팀",        0, _ctx_content),
+    ContextSection("게임팀 상태",     1, _ctx_game_state),
+    ContextSection("운영팀 상태",     3, _ctx_ops_state),
+    ContextSection("우선순위 작업",   2, _ctx_in_progress),
+    ContextSection("PM 문서",         4, _ctx_pm_files),
+])
+
+
+def _build_project_context() -> str:
+    """
+    Atlas PM이 답변할 때 참고할 프로젝트 현재 상태 (ATLAS_CONTEXT_TOKENS 예산 안에서).
+    자주 바뀌는 3-Way 공유 상태 · 현재 시각은 넣지 않음 → atlas_pm_reply 의 캐시 안 되는 블록으로.
+    기획 · 인터페이스 · 운영 문서 본문은 질문마다 DOC_INDEX 에서 관련 조각만 가져옴.
+    """
+    return _PROJECT_CONTEXT.build()
+
+
+# 팀 문서 검색 색인 (teams/game 전체 · 운영팀 · project-management 마크다운)
+DOC_INDEX = DocIndex(
+    SCRIPT_DIR / "data" / "doc_index.sqlite",
+    [GAME_DIR.parent, OPS_DIR, PM_DIR],
+    base=PROJECT_DIR,
+)
+
+
+def _related_docs(question: str) -> str:
+    """질문과 관련된 문서 조각 (검색 실패 시 빈 문자열 — 답변은 고정 컨텍스트만으로 진행)."""
+    try:
+        return DOC_INDEX.context(question)
+    except Exception:
+        return ""
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -1311,29 +1270,9 @@ def _kb_v0_menu() -> InlineKeyboardMarkup:
     ])
 
 
-def atlas_pm_reply(user_message: str) -> str:
-    """
-    Atlas PM으로서 Claude에게 질문/지시를 처리하고 응답을 반환.
-    실패 시 에러 메시지 반환.
-    """
-    if not _ANTHROPIC_OK:
-        return "⚠️ anthropic 라이브러리 없음. `.venv/bin/pip install anthropic` 실행 필요."
-
-    api_key = os.environ.get("ANTHROPIC_API_KEY", "").strip()
-    if not api_key:
-        return "⚠️ ANTHROPIC_API_KEY가 .env에 설정되지 않았습니다."
-
-    project_ctx = _build_project_context()
-    now = datetime.now().strftime("%Y-%m-%d %H:%M")
-
-    system_prompt = f"""당신은 GeekBrox 프로젝트의 총괄 PM인 Atlas입니다.
+_ATLAS_PM_SYSTEM = """당신은 GeekBrox 프로젝트의 총괄 PM인 Atlas입니다.
 Steve(대표)로부터 텔레그램으로 직접 지시와 질문을 받습니다.
 
-현재 날짜: {now}
-
-## 프로젝트 현재 상태
-{project_ctx}
-
 ## 당신의 역할
 - GeekBrox의 3개 팀(콘텐츠팀, 게임개발팀, 운영및사업팀)을 총괄 관리
 - Steve의 질문에 PM 관점으로 명확하고 실행 가능한 답변 제공
@@ -1344,18 +1283,80 @@ Steve(대표)로부터 텔레그램으로 직접 지시와 질문을 받습니
 - 간결하고 실행 가능한 내용으로 답변 (텔레그램 메시지 특성상 500자 이내 권장)
 - 필요시 구체적인 다음 액션(Next Action) 제시
 - 한국어로 답변
-- 마크다운 사용 가능 (*굵게*, `코드`, 목록 등)"""
+- 마크다운 사용 가능 (*굵게*, `코드`, 목록 등)
+
+## 프로젝트 현재 상태
+{project_ctx}"""
+
+
+_ANTHROPIC_CLIENTS: dict[str, object] = {}
+
+
+def _anthropic_client(api_key: str):
+    """키별 클라이언트 재사용 (HTTP 연결 유지 — 메시지마다 새 연결을 맺지 않음)."""
+    client = _ANTHROPIC_CLIENTS.get(api_key)
+    if client is None:
+        client = _ANTHROPIC_CLIENTS[api_key] = _anthropic.Anthropic(api_key=api_key)
+    return client
+
 
+def atlas_pm_reply(user_message: str) -> str:
+    """
+    Atlas PM으로서 Claude에게 질문/지시를 처리하고 응답을 반환.
+    실패 시 에러 메시지 반환.
+    """
+    if not _ANTHROPIC_OK:
+        return "⚠️ anthropic 라이브러리 없음. `.venv/bin/pip install anthropic` 실행 필요."
+
+    api_key = os.environ.get("ANTHROPIC_API_KEY", "").strip()
+    if not api_key:
+        return "⚠️ ANTHROPIC_API_KEY가 .env에 설정되지 않았습니다."
+
+    # 1번 블록(역할 · 원칙 · 프로젝트 상태)은 파일이 안 바뀌면 매번 같은 문자열 → 프롬프트 캐시
+    # 2번 블록(현재 시각 · 3-Way 공유 상태 · 질문 관련 문서)은 매번 바뀌므로 캐시 접두부 뒤에 둠
+    # 단, claude-haiku-4-5 의 최소 캐시 길이는 4096 토큰 — 지금 1번 블록(약 1.8k 토큰)은 그보다 짧아
+    #   캐시가 걸리지 않음 (cache_control 은 무시되고 요청은 정상 처리). 프로젝트 상태가 커져 최소치를
+    #   넘으면 그때부터 적중 — 호출마다 남기는 usage 로그의 캐시 읽기/생성 값으로 확인
+    stable = _ATLAS_PM_SYSTEM.format(project_ctx=_build_project_context())
+    volatile = f"현재 날짜: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+    if _SHARED_STATE_OK:
+        volatile += f"\n\n## 3-Way 공유 상태\n{telegram_format_status()}"
+    related = _related_docs(user_message)
+    if related:
+        volatile += f"\n\n## 질문 관련 문서 발췌\n{related}"
+    system_blocks = [
+        {"type": "text", "text": stable, "cache_control": {"type": "ephemeral"}},
+        {"type": "text", "text": volatile},
+    ]
+
+    limiter = get_limiter(api_key) if _RATE_LIMIT_OK else None
     try:
-        client = _anthropic.Anthropic(api_key=api_key)
-        response = client.messages.create(
+        if limiter:
+            # 콘텐츠팀 글 생성과 같은 키 예산을 공유 — 대화형이므로 오래 기다리지 않음
+            limiter.acquire(estimate_tokens(stable + volatile + user_message), 1024, max_wait=ATLAS_MAX_WAIT)
+        client = _anthropic_client(api_key)
+        raw = client.messages.with_raw_response.create(
             model="claude-haiku-4-5",
             max_tokens=1024,
-            system=system_prompt,
+            system=system_blocks,
             messages=[{"role": "user", "content": user_message}],
         )
-        return response.content[0].text
+        if limiter:
+            limiter.record_success(raw.headers)
+        message = raw.parse()
+        usage = message.usage
+        print(
+            f"💬 Atlas PM 토큰: 입력 {usage.input_tokens} · "
+            f"캐시 읽기 {getattr(usage, 'cache_read_input_tokens', 0) or 0} · "
+            f"캐시 생성 {getattr(usage, 'cache_creation_input_tokens', 0) or 0} · 출력 {usage.output_tokens}"
+        )
+        return message.content[0].text
+    except RateLimitTimeout as e:
+        return f"⏳ Claude API 한도 대기 중입니다. 약 {e.wait_sec:.0f}초 후 다시 질문해 주세요."
     except Exception as e:
+        if limiter and getattr(e, "status_code", None) in (429, 529):
+            wait = limiter.record_rate_limited(e)
+            return f"⏳ Claude API 한도 초과 — 약 {wait:.0f}초 후 다시 질문해 주세요."
         return f"⚠️ Atlas PM 응답 오류: {e}"
 
 
@@ -1374,19 +1375,10 @@ async def text_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
             await update.message.reply_text("⚠️ 초안이 없습니다.", reply_markup=kb_home())
             return
         target = str(drafts[idx])
-        await update.message.reply_text(
-            f"⏳ *초안 수정 중...*\n\n📄 `{drafts[idx].stem}`\n지시: {text[:100]}",
-            parse_mode="Markdown",
-        )
-        ok, out = await asyncio.get_event_loop().run_in_executor(
-            None, run_script, "generate_post.py",
-            ["--revise", target, "--instruction", text]
-        )
-        icon = "✅" if ok else "❌"
-        await update.message.reply_text(
-            f"{icon} *수정 {'완료' if ok else '실패'}*\n\n```\n{out[:600]}\n```",
-            reply_markup=KB([BTN("📋 초안 목록", "ct_drafts"), BTN("🏠 홈", "menu")]),
-            parse_mode="Markdown",
+        await queue_script(
+            update.message, "generate_post.py", ["--revise", target, "--instruction", text],
+            label=f"수정: {drafts[idx].stem[:30]}", kb="revise", priority="high", edit=False,
+            intro=f"✏️ *초안 수정*\n\n📄 `{drafts[idx].stem}`\n지시: {text[:100]}",
         )
         return
 
@@ -1495,6 +1487,228 @@ async def text_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     )
 
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# shared_state 변경 알림 → 텔레그램 (state_bus 구독, 폴링 없음)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+async def _start_state_feed(app: Application) -> None:
+    """충돌 · 완료 · 오류 알림(telegram.*)을 받는 즉시 전송. 구독이 없으면 shared_state 가 직접 보냄."""
+    if state_bus is None or not ALLOWED_ID:
+        return
+    try:
+        sub = state_bus.Subscriber(["telegram.*"], consumer=True)
+    except OSError:
+        return
+    app.bot_data["state_sub"] = sub
+    asyncio.get_running_loop().add_reader(sub.fileno(), _push_state_events, app, sub)
+
+
+async def _stop_state_feed(app: Application) -> None:
+    sub = app.bot_data.pop("state_sub", None)
+    if sub:
+        asyncio.get_running_loop().remove_reader(sub.fileno())
+        sub.close()
+
+
+def _push_state_events(app: Application, sub) -> None:
+    for topic, data in sub.drain():
+        markup = kb_conflict() if topic == "telegram.conflict" else None
+        app.create_task(_send_state_event(app, data.get("text", ""), markup))
+
+
+async def _send_state_event(app: Application, text: str, markup) -> None:
+    try:
+        await app.bot.send_message(chat_id=ALLOWED_ID, text=text, parse_mode="Markdown", reply_markup=markup)
+    except Exception:
+        # Markdown 파싱 오류 등 → 일반 텍스트로 한 번 더
+        await app.bot.send_message(chat_id=ALLOWED_ID, text=text, reply_markup=markup)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 작업 관리 (/jobs · /job <번호> · /cancel <번호>)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _job_arg(context: ContextTypes.DEFAULT_TYPE):
+    arg = (context.args or [""])[0].lstrip("#")
+    return JOBS.get(int(arg)) if arg.isdigit() else None
+
+
+async def cmd_jobs(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    if not is_allowed(update):
+        return
+    jobs = JOBS.list()[-15:]
+    if not jobs:
+        await update.message.reply_text("📭 실행한 작업이 없습니다.")
+        return
+    await update.message.reply_text(
+        "🛠 작업 목록\n\n" + "\n".join(j.summary() for j in jobs)
+        + "\n\n/job <번호> 출력 확인 · /cancel <번호> 취소"
+    )
+
+
+async def cmd_job(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    if not is_allowed(update):
+        return
+    job = _job_arg(context)
+    if not job:
+        await update.message.reply_text("사용법: /job <번호>  (/jobs 로 목록 확인)")
+        return
+    await update.message.reply_text(f"{job.summary()}\n\n{job.tail(30)[-3500:] or '(출력 없음)'}")
+
+
+async def cmd_cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    if not is_allowed(update):
+        return
+    job = _job_arg(context)
+    if not job:
+        await update.message.reply_text("사용법: /cancel <번호>  (/jobs 로 목록 확인)")
+        return
+    ok = await JOBS.cancel(job.id)
+    await update.message.reply_text(f"🛑 #{job.id} 취소 요청" if ok else f"#{job.id} 는 이미 끝난 작업입니다.")
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 작업 대기열 (task_queue — 두 봇 공용 SQLite, 재시작해도 유지)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+BOT_NAME = "atlas"
+_APP: Application | None = None
+_RUNNER: task_queue.QueueRunner | None = None
+
+# 포스팅 간격은 INTER_POST_DELAY 유지 (Claude 호출 한도는 generate_post 쪽 llm_rate_limit 이 관리)
+task_queue.LANE_GAPS.setdefault("post_to_tistory.py", QUEUE_DELAY)
+
+
+_RESULT_KB = {
+    "fetch":    lambda: KB([BTN("◀️ 콘텐츠팀", "m_content"), BTN("🏠 홈", "menu")]),
+    "generate": lambda: KB([BTN("📋 초안 확인", "ct_drafts"), BTN("◀️ 콘텐츠팀", "m_content")]),
+    "post":     lambda: KB([BTN("📊 블로그 현황", "ct_status"), BTN("◀️ 콘텐츠팀", "m_content")]),
+    "revise":   lambda: KB([BTN("📋 초안 목록", "ct_drafts"), BTN("🏠 홈", "menu")]),
+}
+
+
+async def queue_script(msg, script: str, args: list[str] | None = None, *, label: str,
+                       intro: str = "", kb: str | None = None, priority: str = "normal",
+                       edit: bool = True) -> None:
+    """
+    스크립트 실행을 대기열에 등록하고 바로 반환. 결과는 실행한 봇이 msg 를 고쳐서(또는 새 메시지로) 알림.
+    kb: 결과 메시지에 붙일 키보드 (_RESULT_KB 키)
+    """
+    meta = {"bot": BOT_NAME, "chat_id": msg.chat_id, "kb": kb}
+    # 대기열 DB 는 BEGIN IMMEDIATE (busy timeout 최대 30초) — 이벤트 루프를 막지 않도록 스레드에서
+    task_id, created = await asyncio.to_thread(
+        task_queue.enqueue, script, args, label=label, priority=priority, meta=meta,
+    )
+    if not created:
+        text = f"ℹ️ *{label}* 은(는) 이미 대기열에 있습니다 (#{task_id})"
+    else:
+        ahead = await asyncio.to_thread(task_queue.position, task_id)
+        text = (intro + "\n\n" if intro else "") + f"📥 대기열 #{task_id} — " + (
+            f"앞에 {ahead}개" if ahead else "곧 시작합니다"
+        )
+    sent = await (msg.edit_text if edit else msg.reply_text)(text, parse_mode="Markdown")
+    if created:
+        message_id = sent.message_id if hasattr(sent, "message_id") else msg.message_id
+        await asyncio.to_thread(task_queue.update_meta, task_id, message_id=message_id)
+    if _RUNNER:
+        _RUNNER.wake()
+
+
+async def _task_message(task: task_queue.Task, text: str, markup=None) -> None:
+    """등록한 봇이면 원래 메시지를 고치고, 다른 봇이 등록한 작업이면 새 메시지 (버튼은 등록한 봇 것만)."""
+    mine = task.meta.get("bot") == BOT_NAME
+    chat_id = task.meta.get("chat_id") or ALLOWED_ID
+    if mine and task.meta.get("message_id"):
+        try:
+            await _APP.bot.edit_message_text(text, chat_id=chat_id, message_id=task.meta["message_id"],
+                                             parse_mode="Markdown", reply_markup=markup)
+            return
+        except Exception:
+            pass
+    await _APP.bot.send_message(chat_id, text, parse_mode="Markdown", reply_markup=markup if mine else None)
+
+
+async def _task_execute(task: task_queue.Task) -> tuple[bool, str]:
+    if task.script == "generate_post.py":
+        _record_api_call()
+    job = JOBS.submit(task.script, task.args)
+    # 시작 알림이 실패해도 스크립트가 끝날 때까지 기다림 — 먼저 반환하면 같은 레인의 다음 작업이 겹쳐 실행됨
+    try:
+        await _task_message(
+            task,
+            f"▶️ *{task.label} 실행 중* (대기열 #{task.id} · 작업 #{job.id})\n"
+            f"`/job {job.id}` 출력 보기 · `/cancel {job.id}` 취소",
+        )
+    except Exception as e:
+        print(f"⚠️ 대기열 #{task.id} 시작 알림 실패: {e}")
+    return await job.wait()
+
+
+async def _task_done(task: task_queue.Task, ok: bool, out: str) -> None:
+    if not WORKSPACE.watching:
+        await asyncio.to_thread(WORKSPACE.rescan)   # 새 초안 · 게시 이동을 현황 화면에 바로 반영
+    icon = "✅" if ok else "❌"
+    factory = _RESULT_KB.get(task.meta.get("kb") or "")
+    await _task_message(
+        task,
+        f"{icon} *{task.label} {'완료' if ok else '실패'}* (#{task.id})\n\n```\n{out[-800:]}\n```",
+        factory() if factory else None,
+    )
+
+
+async def _start_task_runner(app: Application) -> None:
+    global _APP, _RUNNER
+    _APP = app
+    _RUNNER = task_queue.QueueRunner(_task_execute, on_done=_task_done, name=BOT_NAME)
+    _RUNNER.start()
+
+
+async def _cancel_jobs() -> None:
+    await asyncio.gather(*(JOBS.cancel(job.id) for job in JOBS.list(active_only=True)))
+
+
+async def _stop_task_runner(app: Application) -> None:
+    """
+    실행 중인 스크립트를 먼저 끝낸 뒤 작업을 대기열로 되돌림 → 재시작한 봇(또는 다른 봇)이 이어서 실행.
+    되돌리기를 프로세스 종료 뒤에 해야 다른 봇이 같은 단계를 죽어 가는 프로세스와 동시에 돌리지 않음.
+    """
+    if _RUNNER:
+        await _RUNNER.stop(terminate=_cancel_jobs)
+    await _cancel_jobs()
+
+
+async def _on_startup(app: Application) -> None:
+    await asyncio.to_thread(WORKSPACE.start)
+    # 문서 색인은 뒤에서 갱신 (첫 실행은 수 초) — 그 사이 질문은 갱신이 끝날 때까지 기다림
+    asyncio.get_running_loop().run_in_executor(None, DOC_INDEX.refresh, True)
+    await _start_state_feed(app)
+    await _start_task_runner(app)
+
+
+async def _on_shutdown(app: Application) -> None:
+    await _stop_task_runner(app)
+    await _stop_state_feed(app)
+    await asyncio.to_thread(WORKSPACE.stop)
+
+
+async def cmd_queue(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """/queue — 대기열 · 최근 결과, /queue cancel <번호> — 대기 중인 작업 취소."""
+    if not is_allowed(update):
+        return
+    args = context.args or []
+    if args[:1] == ["cancel"] and len(args) > 1 and args[1].lstrip("#").isdigit():
+        task_id = int(args[1].lstrip("#"))
+        ok = await asyncio.to_thread(task_queue.cancel, task_id)
+        await update.message.reply_text(f"🛑 대기열 #{task_id} 취소" if ok else f"#{task_id} 는 대기 중인 작업이 아닙니다.")
+        return
+    pending = await asyncio.to_thread(task_queue.pending)
+    recent = await asyncio.to_thread(task_queue.recent, 5)
+    await update.message.reply_text(
+        "📥 대기열\n\n" + ("\n".join(t.summary() for t in pending) or "(비어 있음)")
+        + ("\n\n최근\n" + "\n".join(t.summary() for t in recent) if recent else "")
+        + "\n\n/queue cancel <번호> 대기 작업 취소"
+    )
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 메인 진입점
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -1511,13 +1725,21 @@ def main() -> None:
     print(f"   OPS_DIR:  {OPS_DIR}")
     print(f"   PM_DIR:   {PM_DIR}")
 
-    app = Application.builder().token(BOT_TOKEN).build()
+    app = (
+        Application.builder().token(BOT_TOKEN).concurrent_updates(True)
+        .post_init(_on_startup).post_shutdown(_on_shutdown)
+        .build()
+    )
 
     # 슬래시 명령어
     app.add_handler(CommandHandler("start", cmd_start))
     app.add_handler(CommandHandler("menu",  cmd_menu))
     app.add_handler(CommandHandler("help",  cmd_help))
     app.add_handler(CommandHandler("atlas", cmd_start))   # /atlas 로도 홈 메뉴
+    app.add_handler(CommandHandler("jobs",   cmd_jobs))
+    app.add_handler(CommandHandler("job",    cmd_job))
+    app.add_handler(CommandHandler("cancel", cmd_cancel))
+    app.add_handler(CommandHandler("queue",  cmd_queue))
 
     # 버튼 핸들러
     app.add_handler(CallbackQueryHandler(button_handler))
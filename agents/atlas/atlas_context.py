@@ -0,0 +1,148 @@
+"""
+atlas_context.py — Atlas PM 대화용 프로젝트 컨텍스트 (파일 조각 캐시 + 토큰 예산 조립)
+
+atlas_pm_reply 가 메시지마다 PROJECT_STATE.md · 인터페이스 문서 · GDD · OPS_STATE.md · 운영팀 최근 문서 ·
+IN_PROGRESS.md · PM 파일을 전부 다시 읽어 붙이던 것을 대체한다.
+  - SnippetCache: 파일 조각을 (경로, 글자 수) 별로 보관, mtime · 크기가 바뀐 파일만 다시 읽음
+  - ContextBuilder: 섹션마다 우선순위를 두고 토큰 예산 안에서 중요한 섹션부터 채움
+      · 예산을 넘는 섹션은 남은 만큼 잘라 넣고, 남은 예산이 MIN_SECTION_TOKENS 미만이면 생략
+      · 출력 순서는 섹션 등록 순서 그대로 (읽기 쉬운 순서 유지)
+      · 섹션 내용이 지난번과 같으면 조립된 문자열을 그대로 재사용
+        → system 프롬프트 접두부가 바이트 단위로 같아 Anthropic 프롬프트 캐시가 적중
+
+환경변수:
+  ATLAS_CONTEXT_TOKENS   프로젝트 컨텍스트 토큰 예산 (기본 6000)
+
+사용 예:
+    snippets = SnippetCache()
+    builder = ContextBuilder([
+        ContextSection("게임팀", 1, lambda: snippets.read(GAME_DIR / "PROJECT_STATE.md", 1500)),
+        ...
+    ])
+    ctx = builder.build()
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+try:
+    from llm_rate_limit import estimate_tokens
+except ImportError:
+    def estimate_tokens(text: str) -> int:
+        """한국어 위주 프롬프트의 대략 토큰 수."""
+        return max(1, int(len(text) / 1.6))
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 설정
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+CONTEXT_TOKENS     = int(os.environ.get("ATLAS_CONTEXT_TOKENS", "6000"))
+MIN_SECTION_TOKENS = 80     # 이보다 적게 남으면 잘라 넣지 않고 생략
+SNIPPET_CACHE_SIZE = 256    # 보관할 파일 조각 수
+CHARS_PER_TOKEN    = 1.6    # 잘라낼 때 토큰 → 글자 환산 (estimate_tokens 와 같은 비율)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 파일 조각 캐시
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class SnippetCache:
+    """파일 앞부분 max_chars 자를 캐시. stat 1번으로 변경 여부 확인, 바뀐 파일만 다시 읽음."""
+
+    def __init__(self, max_entries: int = SNIPPET_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._items: OrderedDict[tuple[str, int], tuple[tuple[int, int], str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def read(self, path: Path, max_chars: int = 1500) -> str:
+        """파일 앞부분. 없거나 못 읽으면 빈 문자열."""
+        key = (str(path), max_chars)
+        try:
+            st = os.stat(path)
+        except OSError:
+            with self._lock:
+                self._items.pop(key, None)
+            return ""
+        stamp = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            cached = self._items.get(key)
+            if cached and cached[0] == stamp:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return cached[1]
+        try:
+            with open(path, encoding="utf-8", errors="replace") as f:
+                text = f.read(max_chars)
+        except OSError:
+            return ""
+        with self._lock:
+            self.misses += 1
+            self._items[key] = (stamp, text)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+        return text
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 예산 조립
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class ContextSection(NamedTuple):
+    name: str
+    priority: int                  # 작을수록 먼저 예산 배정
+    render: Callable[[], str]      # 빈 문자열이면 섹션 생략
+
+
+class ContextBuilder:
+    def __init__(self, sections: list[ContextSection], budget_tokens: int = CONTEXT_TOKENS):
+        self.sections = sections
+        self.budget_tokens = budget_tokens
+        self._lock = threading.Lock()
+        self._last_inputs: tuple[str, ...] | None = None
+        self._last: str = ""
+        self.tokens = 0               # 마지막 조립 결과의 추정 토큰 수
+        self.dropped: list[str] = []  # 마지막 조립에서 예산 때문에 빠진 섹션
+
+    def build(self) -> str:
+        texts = []
+        for section in self.sections:
+            try:
+                texts.append(section.render() or "")
+            except Exception:
+                texts.append("")
+        inputs = tuple(texts)
+        with self._lock:
+            if inputs == self._last_inputs:
+                return self._last
+            self._last = self._assemble(texts)
+            self._last_inputs = inputs
+            return self._last
+
+    def _assemble(self, texts: list[str]) -> str:
+        remaining = self.budget_tokens
+        chosen: dict[int, str] = {}
+        dropped: list[str] = []
+        order = sorted(range(len(self.sections)), key=lambda i: self.sections[i].priority)
+        for i in order:
+            text = texts[i]
+            if not text:
+                continue
+            cost = estimate_tokens(text)
+            if cost <= remaining:
+                chosen[i] = text
+                remaining -= cost
+            elif remaining >= MIN_SECTION_TOKENS:
+                chosen[i] = text[:int(remaining * CHARS_PER_TOKEN)].rstrip() + "…"
+                remaining = 0
+            else:
+                dropped.append(self.sections[i].name)
+        self.dropped = dropped
+        self.tokens = self.budget_tokens - remaining
+        return "\n\n".join(chosen[i] for i in sorted(chosen))
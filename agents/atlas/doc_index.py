@@ -0,0 +1,369 @@
+"""
+doc_index.py — Atlas PM 답변용 프로젝트 문서 검색 (BM25, SQLite 저장, 오프라인)
+
+atlas_context 의 고정 컨텍스트는 문서마다 앞부분 500~1500자만 넣어서 큰 기획 문서 깊숙한 내용은
+Atlas 가 볼 수 없었다. 여기서는 워크스페이스 마크다운 전체를 조각으로 나눠 색인하고,
+질문마다 관련 조각 상위 k개만 골라 붙인다.
+  - 조각: 마크다운 제목(#) 단위 섹션, 긴 섹션은 문단 경계에서 CHUNK_CHARS 자 안팎으로 나눔
+    각 조각에 "파일 › 상위 제목 › 제목" 경로를 붙여 제목 단어도 검색에 걸리게 함
+  - 토큰: 영문·숫자는 단어, 한글은 음절 2-gram ("전투는" → 전투 · 투는) — 조사가 붙어도 일치
+  - 점수: BM25 (k1=1.2, b=0.75). 역색인(postings)은 SQLite 에 저장 → 재시작해도 다시 만들지 않음
+  - 갱신: 파일 mtime · 크기가 바뀐 파일만 다시 색인, 없어진 파일은 제거 (REFRESH_SEC 간격으로 확인)
+  - 외부 패키지 · 모델 없음
+
+환경변수:
+  DOC_INDEX_TOP_K        질문당 가져올 조각 수 (기본 6)
+  DOC_INDEX_TOKENS       가져온 조각 전체 토큰 예산 (기본 1800)
+  DOC_INDEX_REFRESH_SEC  파일 변경 확인 간격 (기본 60초)
+  DOC_INDEX_EXCLUDE      색인에서 뺄 폴더 이름 (쉼표 구분, 기본 "_archive")
+
+사용 예:
+    index = DocIndex(DB_FILE, [GAME_DIR, PM_DIR])
+    for hit in index.search("카드 드로우 규칙", k=5):
+        print(hit.path, hit.heading, hit.score)
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+from typing import NamedTuple
+
+try:
+    from llm_rate_limit import estimate_tokens
+except ImportError:
+    def estimate_tokens(text: str) -> int:
+        """한국어 위주 프롬프트의 대략 토큰 수."""
+        return max(1, int(len(text) / 1.6))
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 설정
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+TOP_K        = int(os.environ.get("DOC_INDEX_TOP_K", "6"))
+TOKENS       = int(os.environ.get("DOC_INDEX_TOKENS", "1800"))
+REFRESH_SEC  = int(os.environ.get("DOC_INDEX_REFRESH_SEC", "60"))
+EXCLUDE_DIRS = {d.strip() for d in os.environ.get("DOC_INDEX_EXCLUDE", "_archive").split(",") if d.strip()}
+
+CHUNK_CHARS     = 1200
+MIN_CHUNK_CHARS = 400   # 이보다 짧은 섹션은 다음 섹션과 합침 (제목만 있는 짧은 섹션이 상위에 몰리지 않게)
+BM25_K1         = 1.2
+BM25_B          = 0.75
+SCHEMA_VERSION  = 1     # 조각 · 토큰 규칙을 바꾸면 올림 → 전체 재색인
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path     TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size     INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    id      INTEGER PRIMARY KEY,
+    path    TEXT NOT NULL,
+    heading TEXT NOT NULL,
+    text    TEXT NOT NULL,
+    length  INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS chunks_path ON chunks (path);
+CREATE TABLE IF NOT EXISTS postings (
+    term     TEXT NOT NULL,
+    chunk_id INTEGER NOT NULL,
+    tf       INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS postings_term ON postings (term);
+CREATE INDEX IF NOT EXISTS postings_chunk ON postings (chunk_id);
+"""
+
+_WORD_RE    = re.compile(r"[a-z0-9_]+|[가-힣]+")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.+?)\s*#*\s*$")
+
+# 질문에 흔한 말 — 점수에 넣지 않음 (문서 · 질문 모두)
+STOPWORDS = {
+    "어떻게", "어떤", "무엇", "뭐야", "뭐지", "뭔가", "알려줘", "알려", "정리해줘", "설명해줘", "해줘",
+    "있어", "있나", "있는지", "돼", "되나", "되는지", "대해", "대해서", "관련", "그리고", "하면",
+    "the", "and", "for", "what", "how", "is", "are", "of", "to", "in",
+}
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 토큰 / 조각
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def tokenize(text: str) -> list[str]:
+    """영문·숫자 단어(2자 이상) + 한글 음절 2-gram (1음절 단어는 그대로)."""
+    tokens: list[str] = []
+    for word in _WORD_RE.findall(text.lower()):
+        if word in STOPWORDS:
+            continue
+        if word[0] >= "가":
+            if len(word) == 1:
+                tokens.append(word)
+            else:
+                tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        elif len(word) > 1:
+            tokens.append(word)
+    return tokens
+
+
+def _split_long(text: str, limit: int = CHUNK_CHARS) -> list[str]:
+    """문단 경계에서 limit 자 안팎으로 나눔 (문단 하나가 더 길면 그대로 자름)."""
+    if len(text) <= limit:
+        return [text]
+    parts: list[str] = []
+    buf = ""
+    for para in re.split(r"\n\s*\n", text):
+        while len(para) > limit:
+            if buf:
+                parts.append(buf)
+                buf = ""
+            parts.append(para[:limit])
+            para = para[limit:]
+        if buf and len(buf) + len(para) + 2 > limit:
+            parts.append(buf)
+            buf = ""
+        buf = f"{buf}\n\n{para}" if buf else para
+    if buf.strip():
+        parts.append(buf)
+    return parts
+
+
+def chunk_markdown(text: str, title: str) -> list[tuple[str, str]]:
+    """
+    마크다운 → [(제목 경로, 본문)]. 코드 블록 안의 # 은 제목으로 보지 않음.
+    MIN_CHUNK_CHARS 보다 짧은 섹션은 뒤 섹션을 (제목 줄과 함께) 이어 붙임.
+    """
+    sections: list[tuple[str, str]] = []
+    stack: list[tuple[int, str]] = []
+    body: list[str] = []
+    in_code = False
+
+    def flush():
+        content = "\n".join(body).strip()
+        body.clear()
+        if not content:
+            return
+        heading = " › ".join([title] + [h for _, h in stack])
+        for part in _split_long(content):
+            if part.strip():
+                sections.append((heading, part.strip()))
+
+    for line in text.splitlines():
+        if line.lstrip().startswith("```"):
+            in_code = not in_code
+        m = None if in_code else _HEADING_RE.match(line)
+        if m:
+            flush()
+            level = len(m.group(1))
+            while stack and stack[-1][0] >= level:
+                stack.pop()
+            stack.append((level, m.group(2).strip()))
+        else:
+            body.append(line)
+    flush()
+
+    chunks: list[tuple[str, str]] = []
+    for heading, content in sections:
+        if chunks and len(chunks[-1][1]) < MIN_CHUNK_CHARS and len(chunks[-1][1]) + len(content) <= CHUNK_CHARS:
+            prev_heading, prev = chunks[-1]
+            sub = heading.rsplit(" › ", 1)[-1] if heading != prev_heading else ""
+            chunks[-1] = (prev_heading, f"{prev}\n\n{sub}\n{content}" if sub else f"{prev}\n\n{content}")
+        else:
+            chunks.append((heading, content))
+    return chunks
+
+
+class Hit(NamedTuple):
+    path: str
+    heading: str
+    text: str
+    score: float
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 색인
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class DocIndex:
+    def __init__(self, db_file: Path, roots: list[Path], base: Path | None = None):
+        """
+        roots 아래의 *.md 를 색인. 결과 경로는 base 기준 상대 경로로 표시 (기본: roots 의 공통 상위).
+        """
+        self.db_file = Path(db_file)
+        self.roots = [Path(r) for r in roots]
+        self.base = Path(base) if base else Path(os.path.commonpath([str(r) for r in self.roots]))
+        self._local = threading.local()
+        self._refresh_lock = threading.Lock()
+        self._refreshed_at = 0.0
+
+    # ── DB ──
+
+    def _db(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.db_file), timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                conn.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS chunks;"
+                                   " DROP TABLE IF EXISTS postings;")
+                conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            conn.executescript(_SCHEMA)
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _tx(self):
+        conn = self._db()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    # ── 갱신 ──
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        found: dict[str, tuple[int, int]] = {}
+        for root in self.roots:
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [d for d in dirnames if not d.startswith(".") and d not in EXCLUDE_DIRS]
+                for name in filenames:
+                    if not name.endswith(".md"):
+                        continue
+                    path = os.path.join(dirpath, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    found[path] = (st.st_mtime_ns, st.st_size)
+        return found
+
+    def refresh(self, force: bool = False) -> int:
+        """바뀐 파일만 다시 색인. REFRESH_SEC 안에 다시 부르면 건너뜀 (force=True 제외). 반환: 다시 색인한 파일 수"""
+        with self._refresh_lock:
+            if not force and time.time() - self._refreshed_at < REFRESH_SEC:
+                return 0
+            found = self._scan()
+            known = {p: (m, s) for p, m, s in self._db().execute("SELECT path, mtime_ns, size FROM files")}
+            changed = [p for p, stamp in found.items() if known.get(p) != stamp]
+            removed = [p for p in known if p not in found]
+            for path in removed:
+                with self._tx() as conn:
+                    self._delete(conn, path)
+            for path in changed:
+                self._index_file(path, found[path])
+            self._refreshed_at = time.time()
+            return len(changed)
+
+    def _delete(self, conn: sqlite3.Connection, path: str) -> None:
+        conn.execute("DELETE FROM postings WHERE chunk_id IN (SELECT id FROM chunks WHERE path = ?)", (path,))
+        conn.execute("DELETE FROM chunks WHERE path = ?", (path,))
+        conn.execute("DELETE FROM files WHERE path = ?", (path,))
+
+    def _index_file(self, path: str, stamp: tuple[int, int]) -> None:
+        try:
+            text = Path(path).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return
+        rel = self._rel(path)
+        chunks = chunk_markdown(text, rel)
+        with self._tx() as conn:
+            self._delete(conn, path)
+            for heading, body in chunks:
+                terms = Counter(tokenize(f"{heading}\n{body}"))
+                cur = conn.execute(
+                    "INSERT INTO chunks (path, heading, text, length) VALUES (?, ?, ?, ?)",
+                    (path, heading, body, sum(terms.values())),
+                )
+                conn.executemany(
+                    "INSERT INTO postings (term, chunk_id, tf) VALUES (?, ?, ?)",
+                    [(t, cur.lastrowid, n) for t, n in terms.items()],
+                )
+            conn.execute("INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)", (path, *stamp))
+
+    def _rel(self, path: str) -> str:
+        try:
+            return os.path.relpath(path, self.base)
+        except ValueError:
+            return path
+
+    # ── 검색 ──
+
+    def search(self, query: str, k: int = TOP_K) -> list[Hit]:
+        """BM25 상위 k개 조각. 색인이 오래됐으면 먼저 바뀐 파일만 반영."""
+        self.refresh()
+        terms = set(tokenize(query))
+        if not terms:
+            return []
+        conn = self._db()
+        n_chunks, avg_len = conn.execute("SELECT COUNT(*), AVG(length) FROM chunks").fetchone()
+        if not n_chunks:
+            return []
+        avg_len = avg_len or 1.0
+        scores: dict[int, float] = {}
+        lengths: dict[int, int] = {}
+        for term in terms:
+            rows = conn.execute(
+                "SELECT p.chunk_id, p.tf, c.length FROM postings p JOIN chunks c ON c.id = p.chunk_id"
+                " WHERE p.term = ?", (term,),
+            ).fetchall()
+            if not rows:
+                continue
+            idf = math.log(1 + (n_chunks - len(rows) + 0.5) / (len(rows) + 0.5))
+            for chunk_id, tf, length in rows:
+                lengths[chunk_id] = length
+                norm = tf + BM25_K1 * (1 - BM25_B + BM25_B * length / avg_len)
+                scores[chunk_id] = scores.get(chunk_id, 0.0) + idf * tf * (BM25_K1 + 1) / norm
+        top = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:k]
+        hits = []
+        for chunk_id, score in top:
+            row = conn.execute("SELECT path, heading, text FROM chunks WHERE id = ?", (chunk_id,)).fetchone()
+            if row:
+                hits.append(Hit(self._rel(row[0]), row[1], row[2], score))
+        return hits
+
+    def context(self, query: str, k: int = TOP_K, budget_tokens: int = TOKENS) -> str:
+        """질문과 관련된 조각을 토큰 예산 안에서 이어 붙인 텍스트 (없으면 빈 문자열)."""
+        parts: list[str] = []
+        remaining = budget_tokens
+        for hit in self.search(query, k):
+            block = f"── {hit.heading} ──\n{hit.text}"
+            cost = estimate_tokens(block)
+            if cost > remaining:
+                if remaining < 100:
+                    break
+                block = block[:int(remaining * 1.6)].rstrip() + "…"
+                cost = remaining
+            parts.append(block)
+            remaining -= cost
+        return "\n\n".join(parts)
+
+    def stats(self) -> dict:
+        conn = self._db()
+        return {
+            "files": conn.execute("SELECT COUNT(*) FROM files").fetchone()[0],
+            "chunks": conn.execute("SELECT COUNT(*) FROM chunks").fetchone()[0],
+            "terms": conn.execute("SELECT COUNT(DISTINCT term) FROM postings").fetchone()[0],
+        }
+
+
+if __name__ == "__main__":
+    import sys
+    # python3 doc_index.py "질문" [폴더 ...]  — 색인은 임시 폴더에 만들어 결과만 확인
+    import tempfile
+    question = sys.argv[1] if len(sys.argv) > 1 else ""
+    roots = [Path(p) for p in sys.argv[2:]] or [Path.cwd()]
+    index = DocIndex(Path(tempfile.gettempdir()) / "doc_index_cli.sqlite", roots)
+    started = time.time()
+    print(f"색인 갱신: {index.refresh(force=True)}개 파일 ({time.time() - started:.1f}초) — {index.stats()}")
+    for hit in index.search(question):
+        print(f"\n[{hit.score:.2f}] {hit.heading}\n{hit.text[:300]}")
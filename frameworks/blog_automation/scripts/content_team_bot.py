@@ -47,6 +47,10 @@ from collections import deque
 
 from dotenv import load_dotenv
 
+import task_queue
+from job_manager import JobManager
+from workspace_index import WorkspaceIndex
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # shared_state 연동
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -71,6 +75,11 @@ except ImportError:
     ACTOR_CURSOR = "cursor_ai"
     STATE_FILE = None
 
+try:
+    import state_bus   # shared_state 변경 알림 구독 (없으면 알림 푸시 없음)
+except ImportError:
+    state_bus = None
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # python-telegram-bot v20+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -107,10 +116,8 @@ BOT_TOKEN   = os.environ.get("TELEGRAM_BOT_TOKEN", "").strip()
 ALLOWED_ID  = os.environ.get("TELEGRAM_CHAT_ID", "").strip()
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-# Rate Limit 방지 큐
+# Rate Limit 상태
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-_task_queue: deque = deque()
-_queue_running: bool = False
 QUEUE_DELAY = int(os.environ.get("INTER_POST_DELAY", "30"))
 _api_call_times: deque = deque(maxlen=20)
 
@@ -131,48 +138,6 @@ def _record_api_call():
     _api_call_times.append(time.time())
 
 
-async def _process_queue(app_bot, chat_id: int):
-    global _queue_running
-    if _queue_running:
-        return
-    _queue_running = True
-    total = len(_task_queue)
-    completed = 0
-    try:
-        while _task_queue:
-            task = _task_queue.popleft()
-            completed += 1
-            remaining = len(_task_queue)
-            await app_bot.send_message(
-                chat_id=chat_id,
-                text=f"▶️ *작업 시작* [{completed}/{total}]\n📄 {task['label']}\n⏳ 남은: {remaining}개",
-                parse_mode="Markdown",
-            )
-            _record_api_call()
-            ok, out = await asyncio.get_event_loop().run_in_executor(
-                None, run_script, task["script"], task.get("args")
-            )
-            icon = "✅" if ok else "❌"
-            await app_bot.send_message(
-                chat_id=chat_id,
-                text=(
-                    f"{icon} *완료* [{completed}/{total}]: {task['label']}\n\n"
-                    f"```\n{out[:600]}\n```"
-                    + (f"\n\n⏳ 다음까지 {QUEUE_DELAY}초 대기..." if remaining > 0 else "")
-                ),
-                parse_mode="Markdown",
-            )
-            if remaining > 0:
-                await asyncio.sleep(QUEUE_DELAY)
-    finally:
-        _queue_running = False
-    await app_bot.send_message(
-        chat_id=chat_id,
-        text=f"🎉 *모든 작업 완료!* ({total}개)",
-        parse_mode="Markdown",
-    )
-
-
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 보안
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -185,53 +150,46 @@ def is_allowed(update: Update) -> bool:
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 유틸
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-def run_script(script_name: str, args: list[str] | None = None) -> tuple[bool, str]:
-    path = SCRIPT_DIR / script_name
-    if not path.exists():
-        return False, f"스크립트 없음: {path}"
-    try:
-        r = subprocess.run(
-            [sys.executable, str(path)] + (args or []),
-            capture_output=True, text=True, timeout=300, cwd=str(PROJECT_DIR),
-        )
-        out = (r.stdout + r.stderr).strip()
-        return r.returncode == 0, out[-1500:] if len(out) > 1500 else out
-    except subprocess.TimeoutExpired:
-        return False, "⏱️ 실행 시간 초과 (5분)"
-    except Exception as e:
-        return False, f"실행 오류: {e}"
+JOBS = JobManager(SCRIPT_DIR, cwd=PROJECT_DIR)
+WORKSPACE = WorkspaceIndex([POSTS_DIR, DONE_DIR, IMAGES_DIR])   # 현황 화면용 파일 수 · 목록 (glob 대신)
+
+
+async def run_script(script_name: str, args: list[str] | None = None) -> tuple[bool, str]:
+    """스크립트를 작업 관리자로 실행하고 끝날 때까지 기다림 (이벤트 루프 · 스레드를 막지 않음)."""
+    return await JOBS.run(script_name, args)
 
 
 def get_status_text() -> str:
-    drafts  = list(POSTS_DIR.glob("*.md")) if POSTS_DIR.exists() else []
-    done    = list(DONE_DIR.glob("*.md"))  if DONE_DIR.exists()  else []
-    images  = list(IMAGES_DIR.glob("*.*")) if IMAGES_DIR.exists() else []
+    drafts  = WORKSPACE.count(POSTS_DIR, ".md")
+    done    = WORKSPACE.count(DONE_DIR, ".md")
+    images  = WORKSPACE.count(IMAGES_DIR)
     now     = datetime.now().strftime("%Y-%m-%d %H:%M")
     rl      = _check_rate_limit_status()
     return (
         f"⚙️ *GeekBrox 블로그 현황* ({now})\n\n"
-        f"📝 초안 대기: *{len(drafts)}개*\n"
-        f"✅ 게시 완료: *{len(done)}개*\n"
-        f"🖼️ 이미지: *{len(images)}개*\n\n"
+        f"📝 초안 대기: *{drafts}개*\n"
+        f"✅ 게시 완료: *{done}개*\n"
+        f"🖼️ 이미지: *{images}개*\n\n"
         f"{'🟢 대기 초안 있음' if drafts else '⚪️ 대기 초안 없음'}\n"
         f"{'🟢 API 안전' if rl['safe'] else '🟡 API 주의'} (60초 내 {rl['recent_60s']}회 호출)"
     )
 
 
 def get_done_list_text() -> str:
-    done = sorted(DONE_DIR.glob("*.md"), reverse=True) if DONE_DIR.exists() else []
-    if not done:
+    total = WORKSPACE.count(DONE_DIR, ".md")
+    if not total:
         return "📭 게시 완료된 글이 없습니다."
-    lines = [f"📰 *게시 완료 목록* ({len(done)}개)\n"]
-    for i, f in enumerate(done[:20], 1):
+    lines = [f"📰 *게시 완료 목록* ({total}개)\n"]
+    for i, f in enumerate(WORKSPACE.paths(DONE_DIR, ".md", order="name", limit=20), 1):
         lines.append(f"{i}. {f.stem[:45]}")
-    if len(done) > 20:
-        lines.append(f"… 외 {len(done) - 20}개")
+    if total > 20:
+        lines.append(f"… 외 {total - 20}개")
     return "\n".join(lines)
 
 
 def get_queue_status_text() -> str:
     rl = _check_rate_limit_status()
+    counts = task_queue.counts()
     icon = "🟢" if rl["safe"] else "🟡"
     return (
         f"📊 *API & 큐 현황*\n\n"
@@ -239,9 +197,9 @@ def get_queue_status_text() -> str:
         f"🕐 최근 60초 호출: *{rl['recent_60s']}회*\n"
         f"⚡ 최근 5초 burst: *{rl['burst_5s']}회*\n"
         f"⏳ 권장 딜레이: *{rl['recommended_delay']}초*\n\n"
-        f"📋 대기 큐: *{len(_task_queue)}개*\n"
-        f"상태: {'🔄 처리 중' if _queue_running else '⏸ 대기'}\n"
-        f"글 간 딜레이: *{QUEUE_DELAY}초*"
+        f"📋 대기 큐: *{counts.get(task_queue.STATUS_READY, 0)}개*\n"
+        f"상태: {'🔄 처리 중' if counts.get(task_queue.STATUS_RUNNING) else '⏸ 대기'}\n"
+        f"포스팅 간 딜레이: *{QUEUE_DELAY}초*"
     )
 
 
@@ -274,8 +232,8 @@ def kb_home() -> InlineKeyboardMarkup:
 
 # ── 1. 블로그 제작 ────────────────────────────
 def kb_blog() -> InlineKeyboardMarkup:
-    drafts = list(POSTS_DIR.glob("*.md")) if POSTS_DIR.exists() else []
-    draft_label = f"1-3  초안 확인 ({len(drafts)}개)" if drafts else "1-3  초안 확인 (없음)"
+    drafts = WORKSPACE.count(POSTS_DIR, ".md")
+    draft_label = f"1-3  초안 확인 ({drafts}개)" if drafts else "1-3  초안 확인 (없음)"
     return KB(
         [BTN("1-1  🔍 자료조사",     "blog_fetch"),
          BTN("1-2  ✍️ 글 생성",      "blog_generate")],
@@ -422,7 +380,11 @@ def txt_help_slash() -> str:
         "`/start` — 봇 시작, 홈 메뉴 열기\n"
         "`/menu`  — 홈 메뉴 열기 (동일)\n"
         "`/help`  — 도움말 메뉴\n"
-        "`/?`     — 도움말 메뉴 (동일)\n\n"
+        "`/?`     — 도움말 메뉴 (동일)\n"
+        "`/jobs`  — 실행 중·최근 작업 목록\n"
+        "`/job 3` — 작업 #3 상태와 최근 출력\n"
+        "`/cancel 3` — 작업 #3 취소\n"
+        "`/queue`  — 대기열 (`/queue cancel 5` 대기 작업 취소)\n\n"
         "📌 *특수 텍스트 입력* (수정 지시·메모에만 사용)\n"
         "`메모: [내용]` — Claude Code에 메모 전달\n"
         "`note: [내용]` — 동일 (영문)\n"
@@ -439,7 +401,7 @@ def txt_help_tips() -> str:
         "⏱️ *작업 소요 시간*\n"
         "• 자료조사: 30초~1분\n"
         "• 글 1편 생성: 1~3분\n"
-        f"• 글 간 딜레이: {QUEUE_DELAY}초 (Rate Limit 방지)\n"
+        f"• 포스팅 간 딜레이: {QUEUE_DELAY}초\n"
         "• 포스팅: 2~5분\n\n"
         "🔔 *자동 알림 목록*\n"
         "• 글 생성 시작/완료/오류\n"
@@ -448,12 +410,12 @@ def txt_help_tips() -> str:
         "⚙️ *.env 환경변수*\n"
         "`TELEGRAM_BOT_TOKEN` — 봇 토큰\n"
         "`TELEGRAM_CHAT_ID`   — 허용 ID\n"
-        f"`INTER_POST_DELAY`   — 글 간 딜레이 (현재 {QUEUE_DELAY}초)\n"
+        f"`INTER_POST_DELAY`   — 포스팅 간 딜레이 (현재 {QUEUE_DELAY}초)\n"
         "`LLM_MAX_RETRY`      — 최대 재시도 (기본 4회)\n\n"
         "🛡️ *AI 크레딧 절약 설계*\n"
         "• 버튼 콜백 = LLM 없이 즉시 실행\n"
         "• 텍스트 입력은 수정 지시·메모에만 사용\n"
-        "• Rate Limit 자동 감지 + 딜레이 큐"
+        "• Rate Limit 자동 감지 + 작업 대기열 (재시작해도 유지)"
     )
 
 
@@ -538,38 +500,27 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     # 1. 블로그 제작 메뉴
     # ──────────────────────────────
     elif d == "m_blog":
-        drafts = list(POSTS_DIR.glob("*.md")) if POSTS_DIR.exists() else []
+        drafts = WORKSPACE.count(POSTS_DIR, ".md")
         await query.edit_message_text(
-            f"1️⃣ *블로그 제작*\n\n📝 대기 초안: *{len(drafts)}개*\n작업을 선택하세요.",
+            f"1️⃣ *블로그 제작*\n\n📝 대기 초안: *{drafts}개*\n작업을 선택하세요.",
             reply_markup=kb_blog(), parse_mode="Markdown",
         )
 
     # 1-1 자료조사
     elif d == "blog_fetch":
-        await query.edit_message_text(
-            "🔍 *자료조사 실행 중...*\n\nAniList에서 최신 애니 데이터를 수집합니다.\n⏳ 30초~1분 소요"
-        )
-        ok, out = await asyncio.get_event_loop().run_in_executor(
-            None, run_script, "fetch_anime.py"
-        )
-        icon = "✅" if ok else "❌"
-        await query.edit_message_text(
-            f"{icon} *자료조사 {'완료' if ok else '실패'}*\n\n```\n{out[:800]}\n```",
-            reply_markup=KB(
-                [BTN("1-2 ✍️ 글 생성으로 이동", "blog_generate")],
-                [BTN("◀️ 블로그 제작", "m_blog"), BTN("🏠 홈", "menu")],
-            ),
-            parse_mode="Markdown",
+        await queue_script(
+            query.message, "fetch_anime.py", label="자료조사", kb="fetch",
+            intro="🔍 *자료조사*\n\nAniList에서 최신 애니 데이터를 수집합니다.\n⏳ 30초~1분 소요",
         )
 
     # 1-2 글 생성
     elif d == "blog_generate":
-        drafts = list(POSTS_DIR.glob("*.md")) if POSTS_DIR.exists() else []
+        drafts = WORKSPACE.count(POSTS_DIR, ".md")
         rl = _check_rate_limit_status()
         rl_warn = f"\n⚠️ API 호출 빈번 ({rl['recent_60s']}회/60초) — 딜레이 적용" if not rl["safe"] else ""
         if drafts:
             await query.edit_message_text(
-                f"⚠️ 미발행 초안 *{len(drafts)}개* 있습니다.{rl_warn}\n\n계속 생성하시겠습니까?",
+                f"⚠️ 미발행 초안 *{drafts}개* 있습니다.{rl_warn}\n\n계속 생성하시겠습니까?",
                 reply_markup=KB(
                     [BTN("▶️ 계속 생성", "blog_gen_confirm"),
                      BTN("📋 초안 먼저 확인", "blog_drafts")],
@@ -578,43 +529,18 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
                 parse_mode="Markdown",
             )
         else:
-            await query.edit_message_text(
-                f"✍️ *글 생성 시작*\n\n⏳ 글 간 딜레이: {QUEUE_DELAY}초{rl_warn}\n생성 중입니다...",
-                parse_mode="Markdown",
-            )
-            _record_api_call()
-            ok, out = await asyncio.get_event_loop().run_in_executor(
-                None, run_script, "generate_post.py"
-            )
-            icon = "✅" if ok else "❌"
-            await query.edit_message_text(
-                f"{icon} *글 생성 {'완료' if ok else '실패'}*\n\n```\n{out[:800]}\n```",
-                reply_markup=KB(
-                    [BTN("1-3 📋 초안 확인", "blog_drafts")],
-                    [BTN("◀️ 블로그 제작", "m_blog"), BTN("🏠 홈", "menu")],
-                ),
-                parse_mode="Markdown",
+            await queue_script(
+                query.message, "generate_post.py", label="글 생성", kb="generate",
+                intro=f"✍️ *글 생성*{rl_warn}",
             )
 
     elif d == "blog_gen_confirm":
-        await query.edit_message_text("✍️ 글 생성 중...")
-        _record_api_call()
-        ok, out = await asyncio.get_event_loop().run_in_executor(
-            None, run_script, "generate_post.py"
-        )
-        icon = "✅" if ok else "❌"
-        await query.edit_message_text(
-            f"{icon} *글 생성 {'완료' if ok else '실패'}*\n\n```\n{out[:800]}\n```",
-            reply_markup=KB(
-                [BTN("1-3 📋 초안 확인", "blog_drafts")],
-                [BTN("◀️ 블로그 제작", "m_blog"), BTN("🏠 홈", "menu")],
-            ),
-            parse_mode="Markdown",
-        )
+        await queue_script(query.message, "generate_post.py", label="글 생성", kb="generate",
+                           intro="✍️ *글 생성*")
 
     # 1-3 초안 목록
     elif d == "blog_drafts":
-        md_files = sorted(POSTS_DIR.glob("*.md")) if POSTS_DIR.exists() else []
+        md_files = WORKSPACE.paths(POSTS_DIR, ".md", order="name", reverse=False)
         if not md_files:
             await query.edit_message_text(
                 "📭 *초안 없음*\n\n먼저 자료조사 → 글 생성을 진행하세요.",
@@ -660,8 +586,9 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             p = Path(files[idx])
             if p.exists():
                 p.unlink()
+                WORKSPACE.discard(p)
                 await query.answer(f"🗑 삭제: {p.stem[:20]}")
-        md_files = sorted(POSTS_DIR.glob("*.md")) if POSTS_DIR.exists() else []
+        md_files = WORKSPACE.paths(POSTS_DIR, ".md", order="name", reverse=False)
         context.user_data["md_files"] = [str(f) for f in md_files]
         if md_files:
             await query.edit_message_text(
@@ -692,7 +619,7 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
     # 1-4 포스팅 실행
     elif d == "blog_post":
-        md_files = sorted(POSTS_DIR.glob("*.md")) if POSTS_DIR.exists() else []
+        md_files = WORKSPACE.paths(POSTS_DIR, ".md", order="name", reverse=False)
         if not md_files:
             await query.edit_message_text(
                 "📭 포스팅할 초안이 없습니다.",
@@ -719,23 +646,12 @@ async def button_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         )
 
     elif d == "blog_post_confirm":
-        await query.edit_message_text(
-            "🚀 포스팅 실행 중...\n\n"
-            "브라우저를 자동 제어합니다.\n"
-            "추가 인증 시 `인증완료` 를 입력해주세요.\n"
-            "⏳ 2~5분 소요"
-        )
-        ok, out = await asyncio.get_event_loop().run_in_executor(
-            None, run_script, "post_to_tistory.py"
-        )
-        icon = "✅" if ok else "❌"
-        await query.edit_message_text(
-            f"{icon} *포스팅 {'완료' if ok else '실패'}*\n\n```\n{out[-1000:]}\n```",
-            reply_markup=KB(
-                [BTN("2-2 📰 게시 완료 목록", "stats_done")],
-                [BTN("◀️ 블로그 제작", "m_blog"), BTN("🏠 홈", "menu")],
-            ),
-            parse_mode="Markdown",
+        await queue_script(
+            query.message, "post_to_tistory.py", label="포스팅", kb="post",
+            intro="🚀 *포스팅*\n\n"
+                  "브라우저를 자동 제어합니다.\n"
+                  "추가 인증 시 `인증완료` 를 입력해주세요.\n"
+                  "⏳ 2~5분 소요",
         )
 
     # ──────────────────────────────
@@ -920,18 +836,10 @@ async def text_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         if not p.exists():
             await update.message.reply_text("❌ 파일이 삭제되었습니다.", reply_markup=kb_home())
             return
-        await update.message.reply_text(
-            f"✏️ 수정 요청 접수\n대상: `{p.stem[:40]}`\n지시: _{text}_\n\n재생성 중...",
-            parse_mode="Markdown",
-        )
-        ok, out = await asyncio.get_event_loop().run_in_executor(
-            None, run_script, "generate_post.py",
-            ["--revise", str(p), "--instruction", text]
-        )
-        icon = "✅" if ok else "⚠️"
-        await update.message.reply_text(
-            f"{icon} 수정 {'완료' if ok else '실패'}\n\n```\n{out[:600]}\n```",
-            reply_markup=kb_home(), parse_mode="Markdown",
+        await queue_script(
+            update.message, "generate_post.py", ["--revise", str(p), "--instruction", text],
+            label=f"수정: {p.stem[:30]}", kb="revise", priority="high", edit=False,
+            intro=f"✏️ 수정 요청 접수\n대상: `{p.stem[:40]}`\n지시: _{text}_",
         )
         return
 
@@ -978,6 +886,235 @@ async def text_handler(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     )
 
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# shared_state 변경 알림 → 텔레그램 (state_bus 구독, 폴링 없음)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+async def _start_state_feed(app: Application) -> None:
+    """충돌 · 완료 · 오류 알림(telegram.*)을 받는 즉시 전송. 구독이 없으면 shared_state 가 직접 보냄."""
+    if state_bus is None or not ALLOWED_ID:
+        return
+    try:
+        sub = state_bus.Subscriber(["telegram.*"], consumer=True)
+    except OSError:
+        return
+    app.bot_data["state_sub"] = sub
+    asyncio.get_running_loop().add_reader(sub.fileno(), _push_state_events, app, sub)
+
+
+async def _stop_state_feed(app: Application) -> None:
+    sub = app.bot_data.pop("state_sub", None)
+    if sub:
+        asyncio.get_running_loop().remove_reader(sub.fileno())
+        sub.close()
+
+
+def _push_state_events(app: Application, sub) -> None:
+    for topic, data in sub.drain():
+        markup = kb_conflicts() if topic == "telegram.conflict" else None
+        app.create_task(_send_state_event(app, data.get("text", ""), markup))
+
+
+async def _send_state_event(app: Application, text: str, markup) -> None:
+    try:
+        await app.bot.send_message(chat_id=ALLOWED_ID, text=text, parse_mode="Markdown", reply_markup=markup)
+    except Exception:
+        # Markdown 파싱 오류 등 → 일반 텍스트로 한 번 더
+        await app.bot.send_message(chat_id=ALLOWED_ID, text=text, reply_markup=markup)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 작업 관리 (/jobs · /job <번호> · /cancel <번호>)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _job_arg(context: ContextTypes.DEFAULT_TYPE):
+    arg = (context.args or [""])[0].lstrip("#")
+    return JOBS.get(int(arg)) if arg.isdigit() else None
+
+
+async def cmd_jobs(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    if not is_allowed(update):
+        return
+    jobs = JOBS.list()[-15:]
+    if not jobs:
+        await update.message.reply_text("📭 실행한 작업이 없습니다.")
+        return
+    await update.message.reply_text(
+        "🛠 작업 목록\n\n" + "\n".join(j.summary() for j in jobs)
+        + "\n\n/job <번호> 출력 확인 · /cancel <번호> 취소"
+    )
+
+
+async def cmd_job(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    if not is_allowed(update):
+        return
+    job = _job_arg(context)
+    if not job:
+        await update.message.reply_text("사용법: /job <번호>  (/jobs 로 목록 확인)")
+        return
+    await update.message.reply_text(f"{job.summary()}\n\n{job.tail(30)[-3500:] or '(출력 없음)'}")
+
+
+async def cmd_cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    if not is_allowed(update):
+        return
+    job = _job_arg(context)
+    if not job:
+        await update.message.reply_text("사용법: /cancel <번호>  (/jobs 로 목록 확인)")
+        return
+    ok = await JOBS.cancel(job.id)
+    await update.message.reply_text(f"🛑 #{job.id} 취소 요청" if ok else f"#{job.id} 는 이미 끝난 작업입니다.")
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 작업 대기열 (task_queue — 두 봇 공용 SQLite, 재시작해도 유지)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+BOT_NAME = "content_team"
+_APP: Application | None = None
+_RUNNER: task_queue.QueueRunner | None = None
+
+# 포스팅 간격은 INTER_POST_DELAY 유지 (Claude 호출 한도는 generate_post 쪽 llm_rate_limit 이 관리)
+task_queue.LANE_GAPS.setdefault("post_to_tistory.py", QUEUE_DELAY)
+
+
+_RESULT_KB = {
+    "fetch": lambda: KB(
+        [BTN("1-2 ✍️ 글 생성으로 이동", "blog_generate")],
+        [BTN("◀️ 블로그 제작", "m_blog"), BTN("🏠 홈", "menu")],
+    ),
+    "generate": lambda: KB(
+        [BTN("1-3 📋 초안 확인", "blog_drafts")],
+        [BTN("◀️ 블로그 제작", "m_blog"), BTN("🏠 홈", "menu")],
+    ),
+    "post": lambda: KB(
+        [BTN("2-2 📰 게시 완료 목록", "stats_done")],
+        [BTN("◀️ 블로그 제작", "m_blog"), BTN("🏠 홈", "menu")],
+    ),
+    "revise": kb_home,
+}
+
+
+async def queue_script(msg, script: str, args: list[str] | None = None, *, label: str,
+                       intro: str = "", kb: str | None = None, priority: str = "normal",
+                       edit: bool = True) -> None:
+    """
+    스크립트 실행을 대기열에 등록하고 바로 반환. 결과는 실행한 봇이 msg 를 고쳐서(또는 새 메시지로) 알림.
+    kb: 결과 메시지에 붙일 키보드 (_RESULT_KB 키)
+    """
+    meta = {"bot": BOT_NAME, "chat_id": msg.chat_id, "kb": kb}
+    # 대기열 DB 는 BEGIN IMMEDIATE (busy timeout 최대 30초) — 이벤트 루프를 막지 않도록 스레드에서
+    task_id, created = await asyncio.to_thread(
+        task_queue.enqueue, script, args, label=label, priority=priority, meta=meta,
+    )
+    if not created:
+        text = f"ℹ️ *{label}* 은(는) 이미 대기열에 있습니다 (#{task_id})"
+    else:
+        ahead = await asyncio.to_thread(task_queue.position, task_id)
+        text = (intro + "\n\n" if intro else "") + f"📥 대기열 #{task_id} — " + (
+            f"앞에 {ahead}개" if ahead else "곧 시작합니다"
+        )
+    sent = await (msg.edit_text if edit else msg.reply_text)(text, parse_mode="Markdown")
+    if created:
+        message_id = sent.message_id if hasattr(sent, "message_id") else msg.message_id
+        await asyncio.to_thread(task_queue.update_meta, task_id, message_id=message_id)
+    if _RUNNER:
+        _RUNNER.wake()
+
+
+async def _task_message(task: task_queue.Task, text: str, markup=None) -> None:
+    """등록한 봇이면 원래 메시지를 고치고, 다른 봇이 등록한 작업이면 새 메시지 (버튼은 등록한 봇 것만)."""
+    mine = task.meta.get("bot") == BOT_NAME
+    chat_id = task.meta.get("chat_id") or ALLOWED_ID
+    if mine and task.meta.get("message_id"):
+        try:
+            await _APP.bot.edit_message_text(text, chat_id=chat_id, message_id=task.meta["message_id"],
+                                             parse_mode="Markdown", reply_markup=markup)
+            return
+        except Exception:
+            pass
+    await _APP.bot.send_message(chat_id, text, parse_mode="Markdown", reply_markup=markup if mine else None)
+
+
+async def _task_execute(task: task_queue.Task) -> tuple[bool, str]:
+    if task.script == "generate_post.py":
+        _record_api_call()
+    job = JOBS.submit(task.script, task.args)
+    # 시작 알림이 실패해도 스크립트가 끝날 때까지 기다림 — 먼저 반환하면 같은 레인의 다음 작업이 겹쳐 실행됨
+    try:
+        await _task_message(
+            task,
+            f"▶️ *{task.label} 실행 중* (대기열 #{task.id} · 작업 #{job.id})\n"
+            f"`/job {job.id}` 출력 보기 · `/cancel {job.id}` 취소",
+        )
+    except Exception as e:
+        print(f"⚠️ 대기열 #{task.id} 시작 알림 실패: {e}")
+    return await job.wait()
+
+
+async def _task_done(task: task_queue.Task, ok: bool, out: str) -> None:
+    if not WORKSPACE.watching:
+        await asyncio.to_thread(WORKSPACE.rescan)   # 새 초안 · 게시 이동을 현황 화면에 바로 반영
+    icon = "✅" if ok else "❌"
+    factory = _RESULT_KB.get(task.meta.get("kb") or "")
+    await _task_message(
+        task,
+        f"{icon} *{task.label} {'완료' if ok else '실패'}* (#{task.id})\n\n```\n{out[-800:]}\n```",
+        factory() if factory else None,
+    )
+
+
+async def _start_task_runner(app: Application) -> None:
+    global _APP, _RUNNER
+    _APP = app
+    _RUNNER = task_queue.QueueRunner(_task_execute, on_done=_task_done, name=BOT_NAME)
+    _RUNNER.start()
+
+
+async def _cancel_jobs() -> None:
+    await asyncio.gather(*(JOBS.cancel(job.id) for job in JOBS.list(active_only=True)))
+
+
+async def _stop_task_runner(app: Application) -> None:
+    """
+    실행 중인 스크립트를 먼저 끝낸 뒤 작업을 대기열로 되돌림 → 재시작한 봇(또는 다른 봇)이 이어서 실행.
+    되돌리기를 프로세스 종료 뒤에 해야 다른 봇이 같은 단계를 죽어 가는 프로세스와 동시에 돌리지 않음.
+    """
+    if _RUNNER:
+        await _RUNNER.stop(terminate=_cancel_jobs)
+    await _cancel_jobs()
+
+
+async def _on_startup(app: Application) -> None:
+    await asyncio.to_thread(WORKSPACE.start)
+    await _start_state_feed(app)
+    await _start_task_runner(app)
+
+
+async def _on_shutdown(app: Application) -> None:
+    await _stop_task_runner(app)
+    await _stop_state_feed(app)
+    await asyncio.to_thread(WORKSPACE.stop)
+
+
+async def cmd_queue(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """/queue — 대기열 · 최근 결과, /queue cancel <번호> — 대기 중인 작업 취소."""
+    if not is_allowed(update):
+        return
+    args = context.args or []
+    if args[:1] == ["cancel"] and len(args) > 1 and args[1].lstrip("#").isdigit():
+        task_id = int(args[1].lstrip("#"))
+        ok = await asyncio.to_thread(task_queue.cancel, task_id)
+        await update.message.reply_text(f"🛑 대기열 #{task_id} 취소" if ok else f"#{task_id} 는 대기 중인 작업이 아닙니다.")
+        return
+    pending = await asyncio.to_thread(task_queue.pending)
+    recent = await asyncio.to_thread(task_queue.recent, 5)
+    await update.message.reply_text(
+        "📥 대기열\n\n" + ("\n".join(t.summary() for t in pending) or "(비어 있음)")
+        + ("\n\n최근\n" + "\n".join(t.summary() for t in recent) if recent else "")
+        + "\n\n/queue cancel <번호> 대기 작업 취소"
+    )
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 메인
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -992,12 +1129,20 @@ def main() -> None:
     print(f"   POSTS  : {POSTS_DIR}")
     print(f"   DONE   : {DONE_DIR}")
 
-    app = Application.builder().token(BOT_TOKEN).build()
+    app = (
+        Application.builder().token(BOT_TOKEN).concurrent_updates(True)
+        .post_init(_on_startup).post_shutdown(_on_shutdown)
+        .build()
+    )
 
     app.add_handler(CommandHandler("start", cmd_start))
     app.add_handler(CommandHandler("menu",  cmd_menu))
     app.add_handler(CommandHandler("help",  cmd_help))
     app.add_handler(CommandHandler("?",     cmd_help))
+    app.add_handler(CommandHandler("jobs",   cmd_jobs))
+    app.add_handler(CommandHandler("job",    cmd_job))
+    app.add_handler(CommandHandler("cancel", cmd_cancel))
+    app.add_handler(CommandHandler("queue",  cmd_queue))
     app.add_handler(CallbackQueryHandler(button_handler))
     app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, text_handler))
 
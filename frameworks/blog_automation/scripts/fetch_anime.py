@@ -2,18 +2,33 @@
 AniList GraphQL API로 현재 시즌 인기 애니 Top 10 수집
 MAL API로 평점/순위 병합
 결과를 JSON으로 output 폴더에 저장
+
+API 응답은 http_cache.py(SQLite, provider별 TTL)에 캐시 — --refresh 로 캐시 무시하고 재조회
+
+증분 수집:
+  - 이전 seasonal_top_anime.json(같은 시즌)과 anilist_id 기준으로 비교
+  - MAL 은 새로 들어온 작품 + mal_fetched_at 이 MAL_STALE_HOURS 보다 오래된 작품만 재조회
+  - 변경 내역(추가 / 제외 / 순위 변동)을 seasonal_changes.json 에 기록 → 후속 단계에서 사용
+  - --refresh 면 전 작품 MAL 재조회
+
+아카이브 모드: --archive 2022-2024 [--season FALL ...] [--restart]
+  → 시즌별 전체 페이지(hasNextPage)를 archive/anime_{연도}_{시즌}.jsonl 에 이어 쓰기
+  → archive/cursor.json 에 페이지 커서 저장, 중단 후 재실행하면 이어서 수집
 """
 
+import argparse
 import json
 import os
 import re
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
 import requests
 from dotenv import load_dotenv
 
+import http_cache
+
 load_dotenv()
 
 ANILIST_GRAPHQL_URL = "https://graphql.anilist.co"
@@ -22,7 +37,17 @@ SCRIPT_DIR   = Path(__file__).resolve().parent
 PROJECT_DIR  = SCRIPT_DIR.parent.parent                          # /geekbrox
 CONTENT_DIR  = PROJECT_DIR / "teams" / "content" / "workspace"  # /geekbrox/teams/content/workspace/
 OUTPUT_DIR   = CONTENT_DIR / "blog" / "data"                    # /geekbrox/teams/content/workspace/blog/data/
+CHANGES_FILE = OUTPUT_DIR / "seasonal_changes.json"
 TOP_N = 10
+# MAL 통계(평점·순위·멤버 수)를 다시 조회할 주기 (시간)
+MAL_STALE_HOURS = int(os.environ.get("MAL_STALE_HOURS", "24"))
+# MAL 상세 동시 조회 스레드 수 (초당 요청 수는 throttle.py 의 "mal" 한도)
+MAL_WORKERS = int(os.environ.get("MAL_WORKERS", "4"))
+
+MAL_FIELDS = (
+    "mal_score", "mal_rank", "mal_popularity", "mal_members",
+    "mal_synopsis", "mal_episodes", "mal_status", "mal_fetched_at",
+)
 
 
 def get_current_season():
@@ -58,17 +83,8 @@ def extract_korean_from_synonyms(synonyms: list[str] | None) -> str | None:
 # AniList
 # ─────────────────────────────────────────────────────────────
 
-def fetch_seasonal_top_anime(season: str, year: int) -> list[dict]:
-    """AniList GraphQL로 해당 시즌 인기 애니 Top 10 조회."""
-    query = """
-    query ($season: MediaSeason!, $seasonYear: Int!, $perPage: Int!) {
-      Page(page: 1, perPage: $perPage) {
-        media(
-          season: $season
-          seasonYear: $seasonYear
-          type: ANIME
-          sort: [POPULARITY_DESC]
-        ) {
+# 시즌 목록 · 아카이브 조회가 함께 쓰는 media 필드
+MEDIA_FIELDS = """
           id
           idMal
           title {
@@ -80,29 +96,81 @@ def fetch_seasonal_top_anime(season: str, year: int) -> list[dict]:
           description
           genres
           averageScore
+          startDate {
+            year
+          }
           coverImage {
             extraLarge
             large
             medium
           }
-        }
-      }
+"""
+
+SEASON_PAGE_QUERY = """
+query ($season: MediaSeason!, $seasonYear: Int!, $page: Int!, $perPage: Int!) {
+  Page(page: $page, perPage: $perPage) {
+    pageInfo {
+      currentPage
+      hasNextPage
     }
-    """
+    media(
+      season: $season
+      seasonYear: $seasonYear
+      type: ANIME
+      sort: [POPULARITY_DESC]
+    ) {%s}
+  }
+}
+""" % MEDIA_FIELDS
+
+
+def _parse_media(m: dict) -> dict:
+    title = m.get("title") or {}
+    desc = m.get("description")
+    if desc:
+        desc = re.sub(r"<[^>]+>", "", desc).strip() or None
+    cover = m.get("coverImage") or {}
+    cover_url = (
+        cover.get("extraLarge")
+        or cover.get("large")
+        or cover.get("medium")
+    )
+    return {
+        "anilist_id": m.get("id"),       # AniList ID (상세 조회용)
+        "mal_id": m.get("idMal"),         # MAL ID (MAL API 조회용)
+        "title_korean": extract_korean_from_synonyms(m.get("synonyms")),
+        "title_english": title.get("english") or title.get("romaji"),
+        "title_native": title.get("native"),
+        "title_romaji": title.get("romaji"),
+        "start_year": (m.get("startDate") or {}).get("year"),  # TMDB 매칭용 방영 연도
+        "genres": m.get("genres") or [],
+        "synopsis": desc,
+        "average_score": m.get("averageScore"),  # AniList 점수 (0~100)
+        "cover_image_url": cover_url,
+        # MAL 데이터 (아래에서 병합)
+        "mal_score": None,       # MAL 평점 (0~10)
+        "mal_rank": None,        # MAL 전체 순위
+        "mal_popularity": None,  # MAL 인기 순위
+        "mal_members": None,     # MAL 멤버 수
+        "mal_synopsis": None,    # MAL 영문 줄거리
+    }
+
+
+def fetch_season_page(season: str, year: int, page: int = 1, per_page: int = TOP_N) -> tuple[list[dict], bool]:
+    """AniList 시즌 인기순 목록 1페이지. 반환: (작품 목록, 다음 페이지 존재 여부)"""
     variables = {
         "season": season,
         "seasonYear": year,
-        "perPage": TOP_N,
+        "page": page,
+        "perPage": per_page,
     }
     try:
-        resp = requests.post(
-            ANILIST_GRAPHQL_URL,
-            json={"query": query, "variables": variables},
+        data = http_cache.request_json(
+            "anilist", "POST", ANILIST_GRAPHQL_URL,
+            json_body={"query": SEASON_PAGE_QUERY, "variables": variables},
             headers={"Content-Type": "application/json"},
             timeout=15,
         )
-        resp.raise_for_status()
-        data = resp.json()
     except requests.RequestException as e:
         raise RuntimeError(f"AniList API 요청 실패: {e}") from e
     except json.JSONDecodeError as e:
@@ -112,40 +180,18 @@ def fetch_seasonal_top_anime(season: str, year: int) -> list[dict]:
         messages = [e.get("message", str(e)) for e in data["errors"]]
         raise RuntimeError(f"AniList GraphQL 오류: {'; '.join(messages)}")
 
-    page = data.get("data", {}).get("Page")
-    if not page:
+    page_data = data.get("data", {}).get("Page")
+    if not page_data:
         raise RuntimeError("AniList 응답에 Page 데이터가 없습니다.")
 
-    media_list = page.get("media") or []
-    result = []
-    for m in media_list:
-        title = m.get("title") or {}
-        desc = m.get("description")
-        if desc:
-            desc = re.sub(r"<[^>]+>", "", desc).strip() or None
-        cover = m.get("coverImage") or {}
-        cover_url = (
-            cover.get("extraLarge")
-            or cover.get("large")
-            or cover.get("medium")
-        )
-        result.append({
-            "anilist_id": m.get("id"),       # AniList ID (상세 조회용)
-            "mal_id": m.get("idMal"),         # MAL ID (MAL API 조회용)
-            "title_korean": extract_korean_from_synonyms(m.get("synonyms")),
-            "title_english": title.get("english") or title.get("romaji"),
-            "title_native": title.get("native"),
-            "genres": m.get("genres") or [],
-            "synopsis": desc,
-            "average_score": m.get("averageScore"),  # AniList 점수 (0~100)
-            "cover_image_url": cover_url,
-            # MAL 데이터 (아래에서 병합)
-            "mal_score": None,       # MAL 평점 (0~10)
-            "mal_rank": None,        # MAL 전체 순위
-            "mal_popularity": None,  # MAL 인기 순위
-            "mal_members": None,     # MAL 멤버 수
-            "mal_synopsis": None,    # MAL 영문 줄거리
-        })
+    media_list = page_data.get("media") or []
+    has_next = bool((page_data.get("pageInfo") or {}).get("hasNextPage"))
+    return [_parse_media(m) for m in media_list], has_next
+
+
+def fetch_seasonal_top_anime(season: str, year: int) -> list[dict]:
+    """AniList GraphQL로 해당 시즌 인기 애니 Top 10 조회."""
+    result, _ = fetch_season_page(season, year, page=1, per_page=TOP_N)
     return result
 
 
@@ -166,13 +212,11 @@ def fetch_mal_detail(mal_id: int) -> dict:
             f"{MAL_API_URL}/anime/{mal_id}"
             f"?fields=id,title,mean,rank,popularity,num_list_users,synopsis,status,num_episodes"
         )
-        resp = requests.get(
-            url,
+        data = http_cache.request_json(
+            "mal", "GET", url,
             headers={"X-MAL-CLIENT-ID": client_id},
             timeout=10,
         )
-        resp.raise_for_status()
-        data = resp.json()
         return {
             "mal_score":      data.get("mean"),           # 예: 8.45
             "mal_rank":       data.get("rank"),            # 예: 123
@@ -193,13 +237,32 @@ def fetch_mal_detail(mal_id: int) -> dict:
         return {}
 
 
-def enrich_with_mal(anime_list: list[dict]) -> list[dict]:
-    """anime_list 각 항목에 MAL 데이터를 병합."""
+def _mal_is_fresh(prev: dict | None, now: datetime) -> bool:
+    """이전 스냅샷의 MAL 데이터가 MAL_STALE_HOURS 이내에 조회된 것인지."""
+    fetched_at = (prev or {}).get("mal_fetched_at")
+    if not fetched_at:
+        return False
+    try:
+        age = now - datetime.fromisoformat(fetched_at)
+    except ValueError:
+        return False
+    return age.total_seconds() < MAL_STALE_HOURS * 3600
+
+
+def enrich_with_mal(anime_list: list[dict], previous: dict[int, dict] | None = None, force: bool = False) -> list[dict]:
+    """
+    anime_list 각 항목에 MAL 데이터를 병합.
+    previous({anilist_id: 이전 항목})에 아직 신선한 MAL 데이터가 있으면 요청 없이 재사용 (force 면 전부 재조회).
+    """
     client_id = os.environ.get("MAL_CLIENT_ID")
     if not client_id:
         print("  ⚠️  MAL_CLIENT_ID 없음 — MAL 데이터 스킵")
         return anime_list
 
+    previous = previous or {}
+    now = datetime.now()
+    reused = 0
+    todo: list[int] = []
     print(f"  🔗 MAL API 병합 시작 ({len(anime_list)}편)...")
     for i, anime in enumerate(anime_list):
         mal_id = anime.get("mal_id")
@@ -208,57 +271,277 @@ def enrich_with_mal(anime_list: list[dict]) -> list[dict]:
             print(f"  [{i+1}] {title}: MAL ID 없음 — 스킵")
             continue
 
-        mal_data = fetch_mal_detail(mal_id)
+        prev = previous.get(anime.get("anilist_id"))
+        if not force and prev and prev.get("mal_id") == mal_id and _mal_is_fresh(prev, now):
+            for key in MAL_FIELDS:
+                anime[key] = prev.get(key)
+            reused += 1
+            continue
+        todo.append(i)
+
+    # 동시 조회 — 실제 속도·동시 요청 수는 throttle("mal"), 재시도·실패 기억은 http_cache 에서 처리
+    results: dict[int, dict] = {}
+    if todo:
+        with ThreadPoolExecutor(max_workers=max(1, MAL_WORKERS), thread_name_prefix="mal") as pool:
+            futures = {pool.submit(fetch_mal_detail, anime_list[i]["mal_id"]): i for i in todo}
+            for fut in as_completed(futures):
+                results[futures[fut]] = fut.result()
+
+    fetched_at = datetime.now().isoformat(timespec="seconds")
+    for i in todo:
+        anime = anime_list[i]
+        title = anime.get("title_english") or anime.get("title_native") or "?"
+        mal_data = results.get(i)
         if mal_data:
-            anime["mal_score"]      = mal_data.get("mal_score")
-            anime["mal_rank"]       = mal_data.get("mal_rank")
-            anime["mal_popularity"] = mal_data.get("mal_popularity")
-            anime["mal_members"]    = mal_data.get("mal_members")
-            anime["mal_synopsis"]   = mal_data.get("mal_synopsis")
-            anime["mal_episodes"]   = mal_data.get("mal_episodes")
-            anime["mal_status"]     = mal_data.get("mal_status")
+            for key, value in mal_data.items():
+                anime[key] = value
+            anime["mal_fetched_at"] = fetched_at
             score_str = f"{mal_data['mal_score']}/10" if mal_data.get("mal_score") else "점수 없음"
             rank_str  = f"#{mal_data['mal_rank']}" if mal_data.get("mal_rank") else "순위 없음"
             print(f"  [{i+1}] {title}: MAL {score_str}, 순위 {rank_str}")
         else:
             print(f"  [{i+1}] {title}: MAL 데이터 없음")
 
-        time.sleep(0.5)  # MAL API rate limit 방지
-
+    if reused:
+        print(f"  ♻️  MAL: {reused}편은 최근 조회 결과 재사용 ({MAL_STALE_HOURS}시간 이내)")
     return anime_list
 
 
+# ─────────────────────────────────────────────────────────────
+# 증분 비교
+# ─────────────────────────────────────────────────────────────
+
+def load_previous_snapshot(out_path: Path, season: str, year: int) -> dict | None:
+    """같은 시즌의 이전 결과 파일. 없거나 시즌이 바뀌었으면 None."""
+    if not out_path.exists():
+        return None
+    try:
+        data = json.loads(out_path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return None
+    if data.get("season") != season or data.get("season_year") != year:
+        return None
+    return data
+
+
+def diff_snapshots(prev_list: list[dict], new_list: list[dict]) -> dict:
+    """
+    anilist_id 기준 변경 내역.
+    반환: {"added": [...], "removed": [...], "rank_changed": [...], "unchanged": n}
+    각 항목: {"anilist_id", "title", "rank", ("prev_rank")}
+    """
+    def _title(a: dict) -> str:
+        return a.get("title_korean") or a.get("title_english") or a.get("title_native") or "?"
+
+    prev_rank = {a["anilist_id"]: a.get("rank", i) for i, a in enumerate(prev_list, start=1) if a.get("anilist_id")}
+    new_rank = {a["anilist_id"]: a["rank"] for a in new_list if a.get("anilist_id")}
+
+    changes = {"added": [], "removed": [], "rank_changed": [], "unchanged": 0}
+    for a in new_list:
+        aid = a.get("anilist_id")
+        if aid not in prev_rank:
+            changes["added"].append({"anilist_id": aid, "title": _title(a), "rank": a["rank"]})
+        elif prev_rank[aid] != a["rank"]:
+            changes["rank_changed"].append(
+                {"anilist_id": aid, "title": _title(a), "rank": a["rank"], "prev_rank": prev_rank[aid]}
+            )
+        else:
+            changes["unchanged"] += 1
+    for a in prev_list:
+        aid = a.get("anilist_id")
+        if aid and aid not in new_rank:
+            changes["removed"].append({"anilist_id": aid, "title": _title(a), "prev_rank": prev_rank[aid]})
+    return changes
+
+
+def _write_json(path: Path, payload: dict) -> None:
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp.replace(path)
+
+
+# ─────────────────────────────────────────────────────────────
+# 아카이브 (여러 시즌 전체 페이지 → JSON Lines)
+# ─────────────────────────────────────────────────────────────
+
+ARCHIVE_DIR     = OUTPUT_DIR / "archive"
+ARCHIVE_CURSOR  = ARCHIVE_DIR / "cursor.json"
+# AniList Page 최대 크기
+ARCHIVE_PER_PAGE = 50
+SEASONS = ("WINTER", "SPRING", "SUMMER", "FALL")
+
+
+def iter_season_pages(season: str, year: int, start_page: int = 1, per_page: int = ARCHIVE_PER_PAGE):
+    """
+    시즌 전체를 pageInfo.hasNextPage 를 따라 한 페이지씩 yield: (page, 작품 목록, 다음 페이지 존재 여부).
+    요청 간격은 http_cache → throttle("anilist") 가 공식 한도(90 req/min) 안에서 조절.
+    """
+    page = start_page
+    while True:
+        records, has_next = fetch_season_page(season, year, page=page, per_page=per_page)
+        yield page, records, has_next
+        if not has_next or not records:
+            return
+        page += 1
+
+
+def _load_cursor() -> dict:
+    try:
+        return json.loads(ARCHIVE_CURSOR.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_cursor(cursor: dict) -> None:
+    tmp = ARCHIVE_CURSOR.with_suffix(".tmp")
+    tmp.write_text(json.dumps(cursor, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp.replace(ARCHIVE_CURSOR)
+
+
+def archive_seasons(targets: list[tuple[int, str]], restart: bool = False):
+    """
+    (연도, 시즌) 목록의 전체 작품을 archive/anime_{연도}_{시즌}.jsonl 에 페이지 단위로 이어 쓰고
+    기록한 작품을 그대로 yield 한다 (전체를 메모리에 올리지 않음).
+    페이지를 쓸 때마다 cursor.json 에 다음 페이지와 파일 오프셋을 저장 →
+    중단 후 재실행하면 마지막으로 확정된 페이지 다음부터 이어서 받는다.
+    """
+    ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
+    cursor = {} if restart else _load_cursor()
+
+    for year, season in targets:
+        key = f"{year}_{season}"
+        path = ARCHIVE_DIR / f"anime_{key}.jsonl"
+        state = cursor.get(key) or {}
+        if state.get("done") and path.exists():
+            print(f"  ⏭️  {key}: 완료됨 ({state.get('count', 0)}편)")
+            continue
+        if not path.exists():
+            state = {}
+        next_page = state.get("next_page", 1)
+        count = state.get("count", 0)
+        offset = state.get("offset", 0)
+
+        with open(path, "a+b") as f:
+            # 커서 저장 전에 죽었으면 확정되지 않은 꼬리 부분을 잘라낸다
+            f.truncate(offset)
+            f.seek(offset)
+            print(f"  📥 {key}: {next_page}페이지부터")
+            for page, records, has_next in iter_season_pages(season, year, start_page=next_page):
+                for rec in records:
+                    rec["season"] = season
+                    rec["season_year"] = year
+                    f.write((json.dumps(rec, ensure_ascii=False) + "\n").encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+                count += len(records)
+                cursor[key] = {
+                    "next_page": page + 1, "offset": f.tell(), "count": count,
+                    "done": not has_next or not records,
+                    "updated_at": datetime.now().isoformat(timespec="seconds"),
+                }
+                _save_cursor(cursor)
+                yield from records
+        print(f"  ✅ {key}: {count}편 → {path.name}")
+
+
+def parse_archive_targets(years: str, seasons: list[str] | None = None) -> list[tuple[int, str]]:
+    """'2022-2024' 또는 '2024' + 시즌 필터 → [(2022, 'WINTER'), ...] (시간순)."""
+    first, _, last = years.partition("-")
+    start, end = int(first), int(last or first)
+    wanted = [s.upper() for s in seasons] if seasons else list(SEASONS)
+    for s in wanted:
+        if s not in SEASONS:
+            raise ValueError(f"알 수 없는 시즌: {s} (WINTER/SPRING/SUMMER/FALL)")
+    return [(y, s) for y in range(start, end + 1) for s in SEASONS if s in wanted]
+
+
+def run_archive(years: str, seasons: list[str] | None = None, restart: bool = False) -> int:
+    targets = parse_archive_targets(years, seasons)
+    print(f"🗄️  AniList 아카이브 수집: {len(targets)}개 시즌 → {ARCHIVE_DIR}")
+    total = 0
+    for _ in archive_seasons(targets, restart=restart):
+        total += 1
+    print(f"\n✅ 아카이브 완료: 이번 실행에서 {total}편 기록")
+    return total
+
+
 # ─────────────────────────────────────────────────────────────
 # 메인
 # ─────────────────────────────────────────────────────────────
 
-def main() -> None:
+def main(force: bool = False) -> dict:
+    """시즌 목록 수집 + 저장. 반환: 변경 내역 (seasonal_changes.json 과 동일)."""
     try:
         season, year = get_current_season()
+        out_path = OUTPUT_DIR / "seasonal_top_anime.json"
+        previous = load_previous_snapshot(out_path, season, year)
+
         print(f"📡 AniList 조회 중... ({year} {season})")
         anime_list = fetch_seasonal_top_anime(season, year)
         print(f"  ✅ AniList: {len(anime_list)}편 수집")
+        for rank, anime in enumerate(anime_list, start=1):
+            anime["rank"] = rank
 
-        # MAL 데이터 병합
-        anime_list = enrich_with_mal(anime_list)
+        # MAL 데이터 병합 (이전 스냅샷의 신선한 값은 재사용)
+        prev_list = previous.get("anime", []) if previous else []
+        prev_by_id = {a["anilist_id"]: a for a in prev_list if a.get("anilist_id")}
+        anime_list = enrich_with_mal(anime_list, prev_by_id, force=force)
 
         OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-        out_path = OUTPUT_DIR / "seasonal_top_anime.json"
+        now = datetime.now().isoformat()
         payload = {
             "season": season,
             "season_year": year,
-            "fetched_at": datetime.now().isoformat(),
+            "fetched_at": now,
             "count": len(anime_list),
             "anime": anime_list,
         }
-        with open(out_path, "w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+        _write_json(out_path, payload)
         print(f"\n✅ 저장 완료: {out_path} (총 {len(anime_list)}편)")
 
+        changes = diff_snapshots(prev_list, anime_list)
+        changes.update({
+            "season": season,
+            "season_year": year,
+            "fetched_at": now,
+            "previous_fetched_at": previous.get("fetched_at") if previous else None,
+        })
+        _write_json(CHANGES_FILE, changes)
+        if previous:
+            print(
+                f"🔄 변경: 추가 {len(changes['added'])} · 제외 {len(changes['removed'])} · "
+                f"순위 변동 {len(changes['rank_changed'])} · 동일 {changes['unchanged']} → {CHANGES_FILE.name}"
+            )
+        else:
+            print(f"🆕 이전 스냅샷 없음 — 전체 {len(anime_list)}편을 추가로 기록 → {CHANGES_FILE.name}")
+        return changes
+
     except Exception as e:
         print(f"오류: {e}")
         raise
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="시즌 인기 애니 Top N 수집 (AniList + MAL)")
+    parser.add_argument(
+        "--refresh", action="store_true",
+        help="HTTP 응답 캐시(TTL)를 무시하고 외부 API를 다시 조회",
+    )
+    parser.add_argument(
+        "--archive", metavar="YEAR[-YEAR]",
+        help="지정 연도 범위의 시즌 전체를 페이지 단위로 archive/*.jsonl 에 기록 (중단 시 이어받기)",
+    )
+    parser.add_argument(
+        "--season", action="append", metavar="SEASON",
+        help="--archive 와 함께: 특정 시즌만 (WINTER/SPRING/SUMMER/FALL, 여러 번 사용 가능)",
+    )
+    parser.add_argument(
+        "--restart", action="store_true",
+        help="--archive 와 함께: 커서를 무시하고 처음부터 다시 수집",
+    )
+    args = parser.parse_args()
+    http_cache.set_refresh(args.refresh)
+    if args.archive:
+        run_archive(args.archive, args.season, restart=args.restart)
+    else:
+        main(force=args.refresh)
@@ -3,6 +3,16 @@ seasonal_top_anime.json을 읽어 각 애니마다 한국어 블로그 글 초
 커버 이미지 다운로드 → teams/content/workspace/blog/images/
 글 저장 → teams/content/workspace/blog/drafts/애니제목.md
 
+워커 풀 모드: --workers N
+  → 작품별 작업을 blog/data/draft_queue.sqlite 에 적재, N개 프로세스가 하나씩 가져가 수집·이미지·글 생성.
+  → LLM 호출 간격은 llm_rate_limit 장부로 워커 간 공유, 텔레그램 알림은 부모 프로세스가 모아서 전송.
+  → 중단 후 재실행하면 완료된 작품은 건너뛰고 나머지만 처리.
+
+배치 모드: --batch
+  → 전 작품 프롬프트를 Anthropic Message Batch 1건으로 제출, 완료되면 drafts/ 에 일괄 저장.
+  → batch_id 는 blog/data/batch_state.json 에 저장되어 재실행 시 이어서 폴링.
+  → 로컬 확인: python mock_anthropic_server.py 후 ANTHROPIC_BASE_URL=http://127.0.0.1:8787
+
 수정 모드: --revise <md파일경로> --instruction <지시문>
   → 해당 .md 파일 내용을 지시에 맞게 Claude로 수정 후 같은 파일에 덮어쓰기.
   → content_team_bot.py 등에서 subprocess로 호출 시 사용.
@@ -10,6 +20,8 @@ seasonal_top_anime.json을 읽어 각 애니마다 한국어 블로그 글 초
 LLM 전략:
   1차: Claude Sonnet (고품질)
   2차: Gemini 2.5 Flash fallback (Claude rate limit 또는 오류 시 자동 전환)
+  스트리밍: LLM_STREAM=1(기본) → drafts/{slug}.md.partial 에 실시간 기록, 끊기면 이어쓰기, 완료 시 .md 로 교체
+            프로세스가 죽어 남은 .partial 도 LLM_STREAM_PARTIAL_MAX_AGE 시간 이내면 다음 실행에서 이어씀
   환경변수: ANTHROPIC_API_KEY, GOOGLE_API_KEY
 
 확장 데이터 소스:
@@ -18,22 +30,35 @@ LLM 전략:
   - YouTube Data API: 공식 PV/트레일러 링크 + 시청자 반응
   - Reddit API: 팬 반응/화제 댓글 (인기 서브레딧)
   환경변수: TMDB_API_KEY, YOUTUBE_API_KEY, REDDIT_CLIENT_ID, REDDIT_CLIENT_SECRET
+  수집 방식: 작품 내 4개 소스 + 작품 간 모두 동시 조회 (ENRICH_WORKERS, provider별 한도는 throttle.py)
+  응답 캐시: http_cache.py (SQLite, provider별 TTL) — --refresh 로 캐시 무시하고 재조회
 """
 
 import argparse
 import json
+import multiprocessing
 import os
+import queue
 import re
+import sqlite3
 import sys
 import time
 import urllib.parse
-import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
-import requests
 from anthropic import Anthropic
 from dotenv import load_dotenv
 
+import http_cache
+import image_fetch
+import image_optimize
+import tg_dispatch
+import tmdb_index
+from llm_rate_limit import estimate_tokens, get_limiter
+
 load_dotenv()
 
 # shared_state 연동 (없으면 조용히 스킵)
@@ -61,29 +86,20 @@ except ImportError:
 
 def _tg_notify(text: str) -> None:
     """
-    텔레그램으로 진행 상황 메시지 전송.
+    텔레그램으로 메시지 전송 — tg_dispatch 큐에 넣고 즉시 반환 (글 생성이 네트워크를 기다리지 않음).
     TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID 환경변수가 없으면 조용히 스킵.
     """
-    bot_token = os.environ.get("TELEGRAM_BOT_TOKEN", "").strip()
-    chat_id   = os.environ.get("TELEGRAM_CHAT_ID", "").strip()
-    if not bot_token or not chat_id:
-        return
-    try:
-        url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
-        payload = json.dumps({
-            "chat_id": chat_id,
-            "text": text,
-            "parse_mode": "Markdown",
-        }).encode("utf-8")
-        req = urllib.request.Request(
-            url,
-            data=payload,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        urllib.request.urlopen(req, timeout=10)
-    except Exception:
-        pass  # 알림 실패는 조용히 무시 (메인 작업 영향 없음)
+    tg_dispatch.notify(text)
+
+
+def _tg_progress(key: str, text: str) -> None:
+    """진행 상황 메시지 — key(글 1편)마다 메시지 1개를 계속 수정 (짧은 간격의 갱신은 병합)."""
+    tg_dispatch.progress(key, text)
+
+
+def _tg_end_progress(key: str) -> None:
+    """글 1편이 끝나면 호출 — 그 글의 진행 메시지는 더 고치지 않음."""
+    tg_dispatch.end_progress(key)
 
 SCRIPT_DIR   = Path(__file__).resolve().parent
 PROJECT_DIR  = SCRIPT_DIR.parent.parent                          # /geekbrox
@@ -111,17 +127,19 @@ def slugify(text: str, max_len: int = 80) -> str:
     return text[:max_len] or "untitled"
 
 
+def display_title(anime: dict) -> str:
+    """표시용 제목 (한 → 영 → 일). 초안 파일명 슬러그의 기준."""
+    return (
+        anime.get("title_korean")
+        or anime.get("title_english")
+        or anime.get("title_native")
+        or "제목없음"
+    )
+
+
 def download_image(url: str, save_path: Path) -> bool:
-    """이미지를 save_path에 다운로드. 성공 시 True 반환."""
-    try:
-        resp = requests.get(url, timeout=30)
-        resp.raise_for_status()
-        save_path.parent.mkdir(parents=True, exist_ok=True)
-        save_path.write_bytes(resp.content)
-        return True
-    except Exception as e:
-        print(f"  ⚠️  이미지 다운로드 실패 ({url}): {e}")
-        return False
+    """이미지를 save_path에 다운로드 (스트리밍·조건부 요청은 image_fetch.py). 성공 시 True 반환."""
+    return image_fetch.download_image(url, save_path)
 
 
 def get_image_extension(url: str) -> str:
@@ -135,211 +153,278 @@ def get_image_extension(url: str) -> str:
 # TMDB API
 # ─────────────────────────────────────────────────────────────
 
-def tmdb_search_anime(title_en: str, title_native: str = None) -> dict:
-    """TMDB에서 애니메이션 검색 → 상세 정보 반환."""
-    api_key = os.environ.get("TMDB_API_KEY")
-    if not api_key:
-        return {}
-
-    search_titles = [t for t in [title_en, title_native] if t]
-    for search_query in search_titles:
+def _tmdb_find_id(api_key: str, titles: list[str], year: int | None) -> tuple[int | None, float, str, bool]:
+    """
+    제목 후보별로 /search/tv 를 호출해 점수가 가장 높은 TMDB ID 선택 (충분히 확실하면 조기 종료).
+    반환: (tmdb_id, 점수, TMDB 제목, 점수를 매긴 검색 결과가 하나라도 있었는지)
+    """
+    best: tuple[int | None, float, str] = (None, 0.0, "")
+    scored = False
+    for search_query in dict.fromkeys(t for t in titles if t):
         try:
-            # TV 시리즈 검색 (애니는 대부분 TV)
             url = (
                 f"https://api.themoviedb.org/3/search/tv"
-                f"?api_key={api_key}&query={urllib.parse.quote(search_query)}&language=ko-KR"
-            )
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
-            results = resp.json().get("results", [])
-            if not results:
-                continue
-
-            # 첫 번째 결과 상세 조회
-            tmdb_id = results[0]["id"]
-            detail_url = (
-                f"https://api.themoviedb.org/3/tv/{tmdb_id}"
-                f"?api_key={api_key}&language=ko-KR&append_to_response=images,videos"
+                f"?api_key={api_key}&query={urllib.parse.quote(search_query)}&language=en-US"
             )
-            detail_resp = requests.get(detail_url, timeout=10)
-            detail_resp.raise_for_status()
-            detail = detail_resp.json()
-
-            # 이미지 수집 (포스터 + 백드롭)
-            images_data = detail.get("images", {})
-            posters = images_data.get("posters", [])[:5]
-            backdrops = images_data.get("backdrops", [])[:5]
-
-            # 트레일러 수집
-            videos = detail.get("videos", {}).get("results", [])
-            trailers = [v for v in videos if v.get("type") in ("Trailer", "Teaser")][:3]
-
-            return {
-                "tmdb_id": tmdb_id,
-                "overview_ko": detail.get("overview", ""),
-                "vote_average": detail.get("vote_average", 0),
-                "vote_count": detail.get("vote_count", 0),
-                "first_air_date": detail.get("first_air_date", ""),
-                "networks": [n.get("name") for n in detail.get("networks", [])],
-                "poster_path": detail.get("poster_path", ""),
-                "backdrop_paths": [b["file_path"] for b in backdrops if b.get("file_path")],
-                "poster_paths": [p["file_path"] for p in posters if p.get("file_path")],
-                "trailers": [
-                    {"key": t["key"], "name": t["name"], "site": t["site"]}
-                    for t in trailers
-                ],
-            }
+            results = http_cache.request_json("tmdb", "GET", url).get("results", [])
         except Exception as e:
             print(f"  ⚠️  TMDB 검색 실패 ({search_query}): {e}")
             continue
-    return {}
+        if not results:
+            continue
+        scored = True
+        tmdb_id, score, name = tmdb_index.best_match(results[:10], titles, year)
+        if score > best[1]:
+            best = (tmdb_id, score, name)
+        if tmdb_id and score >= 1.0:
+            break
+    return (*best, scored)
+
+
+def tmdb_search_anime(
+    title_en: str,
+    title_native: str = None,
+    title_romaji: str = None,
+    anilist_id: int = None,
+    mal_id: int = None,
+    year: int = None,
+) -> dict:
+    """
+    TMDB 상세 정보 반환.
+    tmdb_index 에 AniList/MAL ID 매핑이 있으면 /tv/{id} 1회로 끝나고,
+    없으면 romaji·영어·일본어 제목 + 방영 연도 점수로 검색 결과를 골라 인덱스에 기록한다.
+    """
+    api_key = os.environ.get("TMDB_API_KEY")
+    if not api_key:
+        return {}
+
+    found, tmdb_id = tmdb_index.lookup(anilist_id, mal_id)
+    if not found:
+        titles = [title_romaji, title_en, title_native]
+        tmdb_id, score, name, scored = _tmdb_find_id(api_key, titles, year)
+        # 검색이 모두 실패(네트워크 · 5xx)했거나 결과가 비었으면 기록하지 않음 → 다음 실행에서 다시 검색
+        if tmdb_id or scored:
+            tmdb_index.remember(anilist_id, mal_id, tmdb_id, score, name)
+        if tmdb_id:
+            print(f"  🔎 TMDB 매칭: {name} (#{tmdb_id}, 점수 {score:.2f})")
+        elif scored:
+            print(f"  ⚠️  TMDB 매칭 실패 ({title_en}, 최고 점수 {score:.2f})")
+        else:
+            print(f"  ⚠️  TMDB 검색 결과 없음 ({title_en}) — 인덱스에 기록하지 않음")
+    if not tmdb_id:
+        return {}
+
+    try:
+        detail_url = (
+            f"https://api.themoviedb.org/3/tv/{tmdb_id}"
+            f"?api_key={api_key}&language=ko-KR&append_to_response=images,videos"
+        )
+        detail = http_cache.request_json("tmdb", "GET", detail_url)
+    except Exception as e:
+        print(f"  ⚠️  TMDB 상세 조회 실패 (#{tmdb_id}): {e}")
+        return {}
+
+    # 이미지 수집 (포스터 + 백드롭)
+    images_data = detail.get("images", {})
+    posters = images_data.get("posters", [])[:5]
+    backdrops = images_data.get("backdrops", [])[:5]
+
+    # 트레일러 수집
+    videos = detail.get("videos", {}).get("results", [])
+    trailers = [v for v in videos if v.get("type") in ("Trailer", "Teaser")][:3]
+
+    return {
+        "tmdb_id": tmdb_id,
+        "overview_ko": detail.get("overview", ""),
+        "vote_average": detail.get("vote_average", 0),
+        "vote_count": detail.get("vote_count", 0),
+        "first_air_date": detail.get("first_air_date", ""),
+        "networks": [n.get("name") for n in detail.get("networks", [])],
+        "poster_path": detail.get("poster_path", ""),
+        "backdrop_paths": [b["file_path"] for b in backdrops if b.get("file_path")],
+        "poster_paths": [p["file_path"] for p in posters if p.get("file_path")],
+        "trailers": [
+            {"key": t["key"], "name": t["name"], "site": t["site"]}
+            for t in trailers
+        ],
+    }
 
 
 # ─────────────────────────────────────────────────────────────
 # AniList 추가 데이터 (캐릭터, 성우, 관련 작품)
 # ─────────────────────────────────────────────────────────────
 
-def anilist_get_details(anime_id: int) -> dict:
-    """AniList GraphQL로 상세 정보 조회 (캐릭터, 성우, 스태프, 관련 작품)."""
-    query = """
-    query ($id: Int) {
-      Media(id: $id, type: ANIME) {
-        id
-        title { romaji english native }
-        studios(isMain: true) { nodes { name } }
-        staff(perPage: 5, sort: [RELEVANCE]) {
-          nodes {
-            name { full native }
-            primaryOccupations
-          }
+# id_in 한 번에 조회할 작품 수 — 중첩 connection(캐릭터·스태프 등) 때문에
+# 페이지당 복잡도가 커서 AniList 쿼리 복잡도 한도 안쪽으로 나눠 보낸다.
+ANILIST_BATCH_SIZE = int(os.environ.get("ANILIST_BATCH_SIZE", "25"))
+
+ANILIST_DETAIL_QUERY = """
+query ($ids: [Int], $perPage: Int) {
+  Page(page: 1, perPage: $perPage) {
+    media(id_in: $ids, type: ANIME) {
+      id
+      title { romaji english native }
+      studios(isMain: true) { nodes { name } }
+      staff(perPage: 5, sort: [RELEVANCE]) {
+        nodes {
+          name { full native }
+          primaryOccupations
+        }
+      }
+      characters(perPage: 6, sort: [ROLE, RELEVANCE]) {
+        nodes {
+          name { full native }
+          description
+          image { medium }
         }
-        characters(perPage: 6, sort: [ROLE, RELEVANCE]) {
-          nodes {
+        edges {
+          role
+          voiceActors(language: JAPANESE) {
             name { full native }
-            description
-            image { medium }
-          }
-          edges {
-            role
-            voiceActors(language: JAPANESE) {
-              name { full native }
-            }
           }
         }
-        relations {
-          nodes {
-            id title { romaji english }
-            type format status
-          }
-          edges { relationType }
+      }
+      relations {
+        nodes {
+          id title { romaji english }
+          type format status
         }
-        recommendations(perPage: 3) {
-          nodes {
-            mediaRecommendation {
-              title { romaji english }
-              averageScore
-            }
+        edges { relationType }
+      }
+      recommendations(perPage: 3) {
+        nodes {
+          mediaRecommendation {
+            title { romaji english }
+            averageScore
           }
         }
-        tags { name rank isMediaSpoiler }
-        trailer { id site }
-        externalLinks { url site }
       }
+      tags { name rank isMediaSpoiler }
+      trailer { id site }
+      externalLinks { url site }
     }
-    """
-    try:
-        resp = requests.post(
-            "https://graphql.anilist.co",
-            json={"query": query, "variables": {"id": anime_id}},
-            headers={"Content-Type": "application/json"},
-            timeout=15,
-        )
-        resp.raise_for_status()
-        data = resp.json()
-        media = data.get("data", {}).get("Media", {})
-        if not media:
-            return {}
-
-        # 스튜디오
-        studios = [s["name"] for s in media.get("studios", {}).get("nodes", [])]
-
-        # 스태프 (감독 등)
-        staff = []
-        for s in media.get("staff", {}).get("nodes", []):
-            staff.append({
-                "name": s.get("name", {}).get("full", ""),
-                "role": ", ".join(s.get("primaryOccupations", [])[:2]),
-            })
+  }
+}
+"""
 
-        # 캐릭터 & 성우
-        char_nodes = media.get("characters", {}).get("nodes", [])
-        char_edges = media.get("characters", {}).get("edges", [])
-        characters = []
-        for node, edge in zip(char_nodes, char_edges):
-            va_list = edge.get("voiceActors", [])
-            va_name = va_list[0]["name"]["full"] if va_list else ""
-            characters.append({
-                "name": node.get("name", {}).get("full", ""),
-                "name_native": node.get("name", {}).get("native", ""),
-                "role": edge.get("role", ""),
-                "voice_actor": va_name,
-                "image": node.get("image", {}).get("medium", ""),
-            })
 
-        # 관련 작품
-        rel_nodes = media.get("relations", {}).get("nodes", [])
-        rel_edges = media.get("relations", {}).get("edges", [])
-        relations = []
-        for node, edge in zip(rel_nodes, rel_edges):
-            relations.append({
-                "title": node.get("title", {}).get("romaji", ""),
-                "relation": edge.get("relationType", ""),
-                "format": node.get("format", ""),
+def _parse_anilist_media(media: dict) -> dict:
+    """AniList Media 노드 → 블로그용 상세 정보 dict."""
+    # 스튜디오
+    studios = [s["name"] for s in media.get("studios", {}).get("nodes", [])]
+
+    # 스태프 (감독 등)
+    staff = []
+    for s in media.get("staff", {}).get("nodes", []):
+        staff.append({
+            "name": s.get("name", {}).get("full", ""),
+            "role": ", ".join(s.get("primaryOccupations", [])[:2]),
+        })
+
+    # 캐릭터 & 성우
+    char_nodes = media.get("characters", {}).get("nodes", [])
+    char_edges = media.get("characters", {}).get("edges", [])
+    characters = []
+    for node, edge in zip(char_nodes, char_edges):
+        va_list = edge.get("voiceActors", [])
+        va_name = va_list[0]["name"]["full"] if va_list else ""
+        characters.append({
+            "name": node.get("name", {}).get("full", ""),
+            "name_native": node.get("name", {}).get("native", ""),
+            "role": edge.get("role", ""),
+            "voice_actor": va_name,
+            "image": node.get("image", {}).get("medium", ""),
+        })
+
+    # 관련 작품
+    rel_nodes = media.get("relations", {}).get("nodes", [])
+    rel_edges = media.get("relations", {}).get("edges", [])
+    relations = []
+    for node, edge in zip(rel_nodes, rel_edges):
+        relations.append({
+            "title": node.get("title", {}).get("romaji", ""),
+            "relation": edge.get("relationType", ""),
+            "format": node.get("format", ""),
+        })
+
+    # 추천 작품
+    recs = []
+    for r in media.get("recommendations", {}).get("nodes", []):
+        mr = r.get("mediaRecommendation", {})
+        if mr:
+            recs.append({
+                "title": mr.get("title", {}).get("romaji", ""),
+                "score": mr.get("averageScore", 0),
             })
 
-        # 추천 작품
-        recs = []
-        for r in media.get("recommendations", {}).get("nodes", []):
-            mr = r.get("mediaRecommendation", {})
-            if mr:
-                recs.append({
-                    "title": mr.get("title", {}).get("romaji", ""),
-                    "score": mr.get("averageScore", 0),
-                })
-
-        # 태그 (스포일러 제외, 상위 8개)
-        tags = [
-            t["name"] for t in media.get("tags", [])
-            if not t.get("isMediaSpoiler") and t.get("rank", 0) >= 60
-        ][:8]
-
-        # 트레일러
-        trailer = media.get("trailer")
-        trailer_url = ""
-        if trailer:
-            if trailer.get("site") == "youtube":
-                trailer_url = f"https://www.youtube.com/watch?v={trailer['id']}"
-
-        # 외부 링크
-        ext_links = {
-            link["site"]: link["url"]
-            for link in media.get("externalLinks", [])
-            if link.get("site") in ("Crunchyroll", "Netflix", "Amazon Prime Video", "Funimation", "Bilibili")
-        }
+    # 태그 (스포일러 제외, 상위 8개)
+    tags = [
+        t["name"] for t in media.get("tags", [])
+        if not t.get("isMediaSpoiler") and t.get("rank", 0) >= 60
+    ][:8]
+
+    # 트레일러
+    trailer = media.get("trailer")
+    trailer_url = ""
+    if trailer:
+        if trailer.get("site") == "youtube":
+            trailer_url = f"https://www.youtube.com/watch?v={trailer['id']}"
+
+    # 외부 링크
+    ext_links = {
+        link["site"]: link["url"]
+        for link in media.get("externalLinks", [])
+        if link.get("site") in ("Crunchyroll", "Netflix", "Amazon Prime Video", "Funimation", "Bilibili")
+    }
+
+    return {
+        "studios": studios,
+        "staff": staff,
+        "characters": characters,
+        "relations": relations,
+        "recommendations": recs,
+        "tags": tags,
+        "trailer_url": trailer_url,
+        "streaming": ext_links,
+    }
+
+
+def anilist_get_details_batch(anime_ids: list[int]) -> dict[int, dict]:
+    """
+    AniList GraphQL Page(media(id_in:))로 여러 작품 상세 정보를 한 번에 조회.
+    ANILIST_BATCH_SIZE 단위로 나눠 요청하며, 반환: {anilist_id: 상세 dict}
+    (응답에 없는 ID는 결과에서 빠짐)
+    """
+    ids = list(dict.fromkeys(i for i in anime_ids if i))
+    result: dict[int, dict] = {}
+    size = max(1, ANILIST_BATCH_SIZE)
+    for start in range(0, len(ids), size):
+        chunk = ids[start:start + size]
+        try:
+            data = http_cache.request_json(
+                "anilist", "POST", "https://graphql.anilist.co",
+                json_body={
+                    "query": ANILIST_DETAIL_QUERY,
+                    "variables": {"ids": chunk, "perPage": len(chunk)},
+                },
+                headers={"Content-Type": "application/json"},
+                timeout=20,
+            )
+            if data.get("errors"):
+                messages = [e.get("message", str(e)) for e in data["errors"]]
+                print(f"  ⚠️  AniList GraphQL 오류: {'; '.join(messages)}")
+            page = (data.get("data") or {}).get("Page") or {}
+            for media in page.get("media") or []:
+                if media and media.get("id"):
+                    result[media["id"]] = _parse_anilist_media(media)
+        except Exception as e:
+            print(f"  ⚠️  AniList 상세 일괄 조회 실패 ({len(chunk)}편): {e}")
+    return result
 
-        return {
-            "studios": studios,
-            "staff": staff,
-            "characters": characters,
-            "relations": relations,
-            "recommendations": recs,
-            "tags": tags,
-            "trailer_url": trailer_url,
-            "streaming": ext_links,
-        }
-    except Exception as e:
-        print(f"  ⚠️  AniList 상세 조회 실패: {e}")
-        return {}
+
+def anilist_get_details(anime_id: int) -> dict:
+    """AniList GraphQL로 상세 정보 조회 (캐릭터, 성우, 스태프, 관련 작품) — 단건."""
+    return anilist_get_details_batch([anime_id]).get(anime_id, {})
 
 
 # ─────────────────────────────────────────────────────────────
@@ -366,9 +451,7 @@ def youtube_search_pv(title_en: str, title_native: str = None) -> list[dict]:
                 f"?key={api_key}&q={urllib.parse.quote(query)}&part=snippet"
                 f"&type=video&maxResults=3&order=relevance&videoDuration=short"
             )
-            resp = requests.get(url, timeout=10)
-            resp.raise_for_status()
-            items = resp.json().get("items", [])
+            items = http_cache.request_json("youtube", "GET", url).get("items", [])
             for item in items:
                 vid_id = item.get("id", {}).get("videoId", "")
                 snippet = item.get("snippet", {})
@@ -412,9 +495,8 @@ def reddit_get_discussions(title_en: str, title_native: str = None) -> list[dict
             f"https://www.reddit.com/r/anime/search.json"
             f"?q={urllib.parse.quote(search_query)}&sort=top&limit=5&t=year&restrict_sr=1"
         )
-        resp = requests.get(url, headers=headers, timeout=10)
-        resp.raise_for_status()
-        posts = resp.json().get("data", {}).get("children", [])
+        posts = http_cache.request_json("reddit", "GET", url, headers=headers) \
+            .get("data", {}).get("children", [])
         for post in posts[:3]:
             data = post.get("data", {})
             score = data.get("score", 0)
@@ -433,6 +515,92 @@ def reddit_get_discussions(title_en: str, title_native: str = None) -> list[dict
     return results
 
 
+# ─────────────────────────────────────────────────────────────
+# 동시 데이터 수집 (TMDB · AniList · YouTube · Reddit)
+# ─────────────────────────────────────────────────────────────
+
+# 전체 동시 API 호출 수 (provider별 세부 한도·속도는 throttle.py)
+ENRICH_WORKERS = int(os.environ.get("ENRICH_WORKERS", "8"))
+
+
+def _empty_enrichment() -> dict:
+    return {"tmdb": {}, "anilist": {}, "youtube": [], "reddit": []}
+
+
+def _enrich_jobs(anime: dict) -> list[tuple[str, object, tuple]]:
+    """작품 1편에 필요한 (레코드 키, 조회 함수, 인자) 목록. AniList 상세는 iter_enriched 에서 일괄 조회."""
+    title_en = anime.get("title_english") or anime.get("title_native") or ""
+    title_native = anime.get("title_native") or ""
+    tmdb_args = (
+        title_en, title_native, anime.get("title_romaji"),
+        anime.get("anilist_id"), anime.get("mal_id"), anime.get("start_year"),
+    )
+    jobs = [
+        ("tmdb",    tmdb_search_anime,      tmdb_args),
+        ("youtube", youtube_search_pv,      (title_en, title_native)),
+        ("reddit",  reddit_get_discussions, (title_en, title_native)),
+    ]
+    return jobs
+
+
+def _run_enrich_job(fn, args: tuple):
+    try:
+        return fn(*args)
+    except Exception as e:
+        print(f"  ⚠️  {fn.__name__} 실패: {e}")
+        return None
+
+
+def iter_enriched(anime_list: list[dict]) -> Iterator[tuple[int, dict, dict]]:
+    """
+    모든 작품의 TMDB/AniList/YouTube/Reddit 조회를 하나의 스레드 풀에서 동시에 실행.
+    작품 1편의 조회가 모두 끝나는 즉시 (원래 순번, anime, 병합 레코드)를 yield 하므로
+    호출 측은 나머지 작품이 수집되는 동안 바로 이미지 수집·글 생성을 시작할 수 있다.
+    AniList 상세는 작품별 요청 대신 ANILIST_BATCH_SIZE 단위 일괄 요청(id_in)으로 조회.
+    병합 레코드: {"tmdb": {...}, "anilist": {...}, "youtube": [...], "reddit": [...]}
+    """
+    pool = ThreadPoolExecutor(max_workers=max(1, ENRICH_WORKERS), thread_name_prefix="enrich")
+    try:
+        futures = {}
+        records: dict[int, dict] = {}
+        remaining: dict[int, int] = {}
+        anilist_idx: dict[int, list[int]] = {}
+        for idx, anime in enumerate(anime_list, start=1):
+            jobs = _enrich_jobs(anime)
+            records[idx] = _empty_enrichment()
+            remaining[idx] = len(jobs)
+            for key, fn, args in jobs:
+                futures[pool.submit(_run_enrich_job, fn, args)] = ([idx], key)
+            if anime.get("anilist_id"):
+                anilist_idx.setdefault(anime["anilist_id"], []).append(idx)
+                remaining[idx] += 1
+
+        # AniList 상세: 일괄 요청 1건이 여러 작품의 "anilist" 조회를 한꺼번에 완료시킨다
+        ids = list(anilist_idx)
+        size = max(1, ANILIST_BATCH_SIZE)
+        for start in range(0, len(ids), size):
+            chunk = ids[start:start + size]
+            members = [idx for aid in chunk for idx in anilist_idx[aid]]
+            fut = pool.submit(_run_enrich_job, anilist_get_details_batch, (chunk,))
+            futures[fut] = (members, "anilist")
+
+        for fut in as_completed(futures):
+            members, key = futures[fut]
+            result = fut.result()
+            for idx in members:
+                if key == "anilist":
+                    value = (result or {}).get(anime_list[idx - 1]["anilist_id"])
+                else:
+                    value = result
+                if value:
+                    records[idx][key] = value
+                remaining[idx] -= 1
+                if remaining[idx] == 0:
+                    yield idx, anime_list[idx - 1], records.pop(idx)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 # ─────────────────────────────────────────────────────────────
 # 멀티소스 이미지 수집
 # ─────────────────────────────────────────────────────────────
@@ -448,58 +616,60 @@ def collect_images(anime: dict, tmdb_data: dict, anilist_details: dict, slug: st
     반환: {image_key: relative_path}
     """
     IMAGES_DIR.mkdir(parents=True, exist_ok=True)
-    paths = {}
 
-    # 1. 커버 이미지 (AniList)
     cover_url = anime.get("cover_image_url", "")
-    if cover_url:
-        ext = get_image_extension(cover_url)
-        cover_path = IMAGES_DIR / f"{slug}_cover{ext}"
-        if download_image(cover_url, cover_path):
-            paths["cover"] = f"../images/{slug}_cover{ext}"
-
-    # TMDB 이미지 처리
     backdrop_paths = tmdb_data.get("backdrop_paths", [])
     poster_paths = tmdb_data.get("poster_paths", [])
 
+    # 받을 이미지 목록 {image_key: (url, 파일명)}
+    plan: dict[str, tuple[str, str]] = {}
+    # 1. 커버 이미지 (AniList)
+    if cover_url:
+        plan["cover"] = (cover_url, f"{slug}_cover{get_image_extension(cover_url)}")
     # 2. TMDB 포스터 (기본 정보용)
     if poster_paths:
-        poster_url = TMDB_IMAGE_BASE + poster_paths[0]
-        poster_path = IMAGES_DIR / f"{slug}_poster.jpg"
-        if download_image(poster_url, poster_path):
-            paths["poster"] = f"../images/{slug}_poster.jpg"
-    elif cover_url:
-        # TMDB 없으면 AniList 커버 재사용
-        paths["poster"] = paths.get("cover", "")
-
+        plan["poster"] = (TMDB_IMAGE_BASE + poster_paths[0], f"{slug}_poster.jpg")
     # 3. TMDB 스틸컷 1 (스토리용)
     if len(backdrop_paths) >= 1:
-        still1_url = TMDB_IMAGE_BASE + backdrop_paths[0]
-        still1_path = IMAGES_DIR / f"{slug}_still1.jpg"
-        if download_image(still1_url, still1_path):
-            paths["still1"] = f"../images/{slug}_still1.jpg"
-
+        plan["still1"] = (TMDB_IMAGE_BASE + backdrop_paths[0], f"{slug}_still1.jpg")
     # 4. TMDB 스틸컷 2 (볼거리용)
     if len(backdrop_paths) >= 2:
-        still2_url = TMDB_IMAGE_BASE + backdrop_paths[1]
-        still2_path = IMAGES_DIR / f"{slug}_still2.jpg"
-        if download_image(still2_url, still2_path):
-            paths["still2"] = f"../images/{slug}_still2.jpg"
+        plan["still2"] = (TMDB_IMAGE_BASE + backdrop_paths[1], f"{slug}_still2.jpg")
+    # 5. 마무리 직전 이미지 (TMDB 3번째 스틸컷 or 두 번째 포스터)
+    if len(backdrop_paths) >= 3:
+        plan["still3"] = (TMDB_IMAGE_BASE + backdrop_paths[2], f"{slug}_still3.jpg")
+    elif len(poster_paths) >= 2:
+        plan["still3"] = (TMDB_IMAGE_BASE + poster_paths[1], f"{slug}_poster2.jpg")
+
+    # 전부 병렬 다운로드
+    ok = image_fetch.download_images({
+        key: (url, IMAGES_DIR / name) for key, (url, name) in plan.items()
+    })
+
+    def saved(key: str) -> bool:
+        return key in plan and ok.get(key, False)
+
+    paths = {}
+    if saved("cover"):
+        paths["cover"] = f"../images/{plan['cover'][1]}"
+
+    if saved("poster"):
+        paths["poster"] = f"../images/{plan['poster'][1]}"
+    elif not poster_paths and cover_url:
+        # TMDB 없으면 AniList 커버 재사용
+        paths["poster"] = paths.get("cover", "")
+
+    if saved("still1"):
+        paths["still1"] = f"../images/{plan['still1'][1]}"
+
+    if saved("still2"):
+        paths["still2"] = f"../images/{plan['still2'][1]}"
     elif len(backdrop_paths) == 1:
         paths["still2"] = paths.get("still1", "")
 
-    # 5. 마무리 직전 이미지 (TMDB 3번째 스틸컷 or 대체)
-    if len(backdrop_paths) >= 3:
-        still3_url = TMDB_IMAGE_BASE + backdrop_paths[2]
-        still3_path = IMAGES_DIR / f"{slug}_still3.jpg"
-        if download_image(still3_url, still3_path):
-            paths["still3"] = f"../images/{slug}_still3.jpg"
-    elif poster_paths and len(poster_paths) >= 2:
-        alt_poster_url = TMDB_IMAGE_BASE + poster_paths[1]
-        alt_path = IMAGES_DIR / f"{slug}_poster2.jpg"
-        if download_image(alt_poster_url, alt_path):
-            paths["still3"] = f"../images/{slug}_poster2.jpg"
-    else:
+    if saved("still3"):
+        paths["still3"] = f"../images/{plan['still3'][1]}"
+    elif "still3" not in plan:
         paths["still3"] = paths.get("poster", paths.get("cover", ""))
 
     return paths
@@ -514,7 +684,7 @@ def _is_rate_limit_error(e: Exception) -> bool:
     return any(kw in msg for kw in ("rate_limit", "rate limit", "429", "too many requests", "overloaded"))
 
 
-def _call_gemini(prompt: str, max_tokens: int = 8192) -> str:
+def _call_gemini(prompt: str, max_tokens: int = 8192, system: str | list[str] | None = None) -> str:
     gemini_key = os.environ.get("GOOGLE_API_KEY")
     if not gemini_key:
         raise RuntimeError(
@@ -526,58 +696,356 @@ def _call_gemini(prompt: str, max_tokens: int = 8192) -> str:
         from google.genai import types
         client = genai.Client(api_key=gemini_key)
         response = client.models.generate_content(
-            model="gemini-2.5-flash",
+            model=GEMINI_MODEL,
             contents=prompt,
-            config=types.GenerateContentConfig(max_output_tokens=max_tokens),
+            config=types.GenerateContentConfig(
+                max_output_tokens=max_tokens,
+                system_instruction=_system_text(system),
+            ),
         )
         return response.text
     except Exception as e:
         raise RuntimeError(f"Gemini API 호출 실패: {e}") from e
 
 
+# ─────────────────────────────────────────────────────────────
+# 프롬프트 캐시 (system 블록) + 사용량 기록
+# ─────────────────────────────────────────────────────────────
+
+# 호출별 토큰·캐시 적중 기록 (JSON Lines)
+LLM_USAGE_FILE = BLOG_DIR / "data" / "llm_usage.jsonl"
+
+
+def _system_blocks(system: str | list[str] | None) -> list[dict] | None:
+    """
+    Anthropic system 파라미터. 첫 블록(모든 호출 공통 지시)에 cache_control 을 붙여
+    같은 접두부를 쓰는 후속 호출은 캐시에서 읽도록 한다.
+    """
+    if not system:
+        return None
+    parts = [system] if isinstance(system, str) else list(system)
+    blocks = [{"type": "text", "text": t} for t in parts if t]
+    if blocks:
+        blocks[0]["cache_control"] = {"type": "ephemeral"}
+    return blocks
+
+
+def _system_text(system: str | list[str] | None) -> str | None:
+    """Gemini system_instruction 용 평문."""
+    if not system:
+        return None
+    return system if isinstance(system, str) else "\n\n".join(t for t in system if t)
+
+
+def _record_llm_usage(kind: str, model: str, usage) -> None:
+    """input/output/캐시 생성·적중 토큰 수를 llm_usage.jsonl 에 1줄 추가."""
+    if usage is None:
+        return
+    row = {
+        "ts": datetime.now().isoformat(timespec="seconds"),
+        "kind": kind,
+        "model": model,
+        "input_tokens": getattr(usage, "input_tokens", 0) or 0,
+        "output_tokens": getattr(usage, "output_tokens", 0) or 0,
+        "cache_creation_input_tokens": getattr(usage, "cache_creation_input_tokens", 0) or 0,
+        "cache_read_input_tokens": getattr(usage, "cache_read_input_tokens", 0) or 0,
+    }
+    if row["cache_read_input_tokens"] or row["cache_creation_input_tokens"]:
+        print(
+            f"  💾 프롬프트 캐시: 적중 {row['cache_read_input_tokens']:,} tok · "
+            f"생성 {row['cache_creation_input_tokens']:,} tok · 신규 입력 {row['input_tokens']:,} tok"
+        )
+    try:
+        LLM_USAGE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(LLM_USAGE_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+    except OSError:
+        pass
+
+
+# ─────────────────────────────────────────────────────────────
+# 스트리밍 생성 (.partial 초안에 실시간 기록)
+# ─────────────────────────────────────────────────────────────
+
+CLAUDE_MODEL = "claude-sonnet-4-5-20250929"
+GEMINI_MODEL = "gemini-2.5-flash"
+# 1이면 글 생성 시 스트리밍으로 받아 {slug}.md.partial 에 바로 기록
+LLM_STREAM = os.environ.get("LLM_STREAM", "1").strip() != "0"
+# 스트림이 중간에 끊겼을 때 부분 결과에서 이어쓰기 최대 횟수
+STREAM_RESUME_MAX = int(os.environ.get("LLM_STREAM_RESUME_MAX", "2"))
+# 이전 실행(크래시 등)이 남긴 .partial 을 이어쓰기 앞부분으로 재사용할 최대 경과 시간 (시간, 0이면 재사용 안 함)
+STREAM_PARTIAL_MAX_AGE = float(os.environ.get("LLM_STREAM_PARTIAL_MAX_AGE", "24"))
+# 진행 중 tok/s 추정용 (한국어 위주 마크다운 기준 대략치, 완료 시 실제 usage로 보정)
+_CHARS_PER_TOKEN = 1.6
+
+
+class _DraftStream:
+    """
+    스트리밍 텍스트를 .partial 파일에 이어 쓰고 첫 토큰 지연 · tok/s 를 상태판에 보고.
+    이전 실행이 남긴 .partial 이 STREAM_PARTIAL_MAX_AGE 이내면 비우지 않고 이어쓰기 앞부분으로 사용.
+    """
+
+    REPORT_INTERVAL = 3.0
+
+    def __init__(self, path: Path, progress: str = ""):
+        self.path = path
+        self.progress = progress
+        self.provider = ""
+        self.round_chars = 0
+        self._f = None
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if self._resumable(path):
+            print(f"  ↩️  이전 실행의 부분 초안 {len(self.text()):,}자에서 이어쓰기: {path.name}")
+        else:
+            path.write_text("", encoding="utf-8")
+
+    @staticmethod
+    def _resumable(path: Path) -> bool:
+        if STREAM_PARTIAL_MAX_AGE <= 0:
+            return False
+        try:
+            st = path.stat()
+        except OSError:
+            return False
+        return st.st_size > 0 and time.time() - st.st_mtime <= STREAM_PARTIAL_MAX_AGE * 3600
+
+    def text(self) -> str:
+        return self.path.read_text(encoding="utf-8") if self.path.exists() else ""
+
+    def rstrip(self) -> str:
+        """이어쓰기 전 끝 공백 제거 (Claude assistant prefill 은 공백으로 끝날 수 없음)."""
+        text = self.text()
+        stripped = text.rstrip()
+        if stripped != text:
+            self.path.write_text(stripped, encoding="utf-8")
+        return stripped
+
+    def begin(self, provider: str) -> None:
+        self.provider = provider
+        self.round_chars = 0
+        self._started = time.monotonic()
+        self._first = None
+        self._last_report = 0.0
+        self._f = open(self.path, "a", encoding="utf-8")
+
+    def write(self, chunk: str) -> None:
+        if not chunk:
+            return
+        now = time.monotonic()
+        if self._first is None:
+            self._first = now
+            print(f"  ⚡ {self.provider} 첫 토큰: {self._first - self._started:.1f}초")
+        self._f.write(chunk)
+        self._f.flush()
+        self.round_chars += len(chunk)
+        if now - self._last_report >= self.REPORT_INTERVAL:
+            self._last_report = now
+            self._report(self.round_chars / _CHARS_PER_TOKEN, approx=True)
+
+    def close(self, output_tokens: int | None = None) -> None:
+        if self._f:
+            self._f.close()
+            self._f = None
+        if output_tokens and self._first is not None:
+            tps = self._report(output_tokens)
+            print(f"  ✅ {self.provider} 스트리밍 완료: {output_tokens:,} tok · {tps:.1f} tok/s")
+
+    def _report(self, tokens: float, approx: bool = False) -> float:
+        if self._first is None:
+            return 0.0
+        gen_sec = max(time.monotonic() - self._first, 1e-6)
+        tps = tokens / gen_sec
+        claude_update_progress(
+            progress=self.progress,
+            detail=(
+                f"{self.provider} 생성 중 — 첫 토큰 {self._first - self._started:.1f}초 · "
+                f"{'≈' if approx else ''}{tps:.0f} tok/s · {len(self.text()):,}자"
+            ),
+        )
+        return tps
+
+
+def _continuation_prompt(prompt: str, partial: str) -> str:
+    """끊긴 부분 결과에서 이어쓰기 위한 프롬프트 (prefill 미지원 모델용)."""
+    return (
+        f"{prompt}\n\n"
+        f"## 이어쓰기\n"
+        f"아래는 이미 작성된 글의 앞부분입니다. 앞부분을 반복하지 말고 "
+        f"마지막 글자 바로 다음부터 이어서 나머지만 출력하세요.\n"
+        f"---\n{partial}\n---"
+    )
+
+
+def _stream_claude(
+    client: Anthropic,
+    prompt: str,
+    max_tokens: int,
+    sink: _DraftStream,
+    limiter=None,
+    system: str | list[str] | None = None,
+    usage_kind: str = "draft",
+) -> str:
+    """Claude 스트리밍. 연결이 중간에 끊기면 지금까지 받은 텍스트를 prefill 로 넣어 이어서 생성."""
+    resumes = 0
+    while True:
+        done = sink.rstrip()
+        messages = [{"role": "user", "content": prompt}]
+        if done:
+            messages.append({"role": "assistant", "content": done})
+        if limiter:
+            limiter.acquire(
+                estimate_tokens((_system_text(system) or "") + prompt + done), max_tokens,
+                on_wait=_notify_llm_wait,
+            )
+        output_tokens = None
+        sink.begin("Claude")
+        try:
+            kwargs = {"system": _system_blocks(system)} if system else {}
+            with client.messages.stream(
+                model=CLAUDE_MODEL,
+                max_tokens=max_tokens,
+                messages=messages,
+                **kwargs,
+            ) as stream:
+                if limiter:
+                    limiter.record_success(stream.response.headers)
+                for text in stream.text_stream:
+                    sink.write(text)
+                usage = stream.get_final_message().usage
+                output_tokens = usage.output_tokens
+            _record_llm_usage(usage_kind, CLAUDE_MODEL, usage)
+            return sink.text()
+        except Exception as e:
+            if _is_rate_limit_error(e) or sink.round_chars == 0 or resumes >= STREAM_RESUME_MAX:
+                raise
+            resumes += 1
+            print(f"  ⚠️  Claude 스트림 중단 ({e}) → {len(sink.text()):,}자에서 이어쓰기 ({resumes}/{STREAM_RESUME_MAX})")
+        finally:
+            sink.close(output_tokens)
+
+
+def _stream_gemini(prompt: str, max_tokens: int, sink: _DraftStream, system: str | list[str] | None = None) -> str:
+    """Gemini 스트리밍. 부분 결과가 있으면 이어쓰기 프롬프트로 나머지만 생성."""
+    gemini_key = os.environ.get("GOOGLE_API_KEY")
+    if not gemini_key:
+        raise RuntimeError("GOOGLE_API_KEY 환경변수가 없습니다. .env에 추가하거나 Google AI Studio에서 발급하세요.")
+    from google import genai
+    from google.genai import types
+    client = genai.Client(api_key=gemini_key)
+
+    resumes = 0
+    while True:
+        done = sink.text()
+        contents = _continuation_prompt(prompt, done) if done.strip() else prompt
+        output_tokens = None
+        sink.begin("Gemini")
+        try:
+            for chunk in client.models.generate_content_stream(
+                model=GEMINI_MODEL,
+                contents=contents,
+                config=types.GenerateContentConfig(
+                    max_output_tokens=max_tokens,
+                    system_instruction=_system_text(system),
+                ),
+            ):
+                sink.write(chunk.text or "")
+                usage = getattr(chunk, "usage_metadata", None)
+                if usage and getattr(usage, "candidates_token_count", None):
+                    output_tokens = usage.candidates_token_count
+            return sink.text()
+        except Exception as e:
+            if sink.round_chars == 0 or resumes >= STREAM_RESUME_MAX:
+                raise RuntimeError(f"Gemini API 호출 실패: {e}") from e
+            resumes += 1
+            print(f"  ⚠️  Gemini 스트림 중단 ({e}) → {len(sink.text()):,}자에서 이어쓰기 ({resumes}/{STREAM_RESUME_MAX})")
+        finally:
+            sink.close(output_tokens)
+
+
+def write_draft_atomic(post_path: Path, body: str) -> None:
+    """{slug}.md.partial 에 최종 본문을 쓴 뒤 {slug}.md 로 원자적 교체."""
+    partial = post_path.with_name(post_path.name + ".partial")
+    partial.write_text(body.strip(), encoding="utf-8")
+    os.replace(partial, post_path)
+
+
 # ─────────────────────────────────────────────────────────────
 # Rate Limit 자동 재시도 (Exponential Backoff)
 # ─────────────────────────────────────────────────────────────
 
-# 글 생성 간격 (초) — 연속 요청 시 Rate Limit 방지
-INTER_POST_DELAY = int(os.environ.get("INTER_POST_DELAY", "30"))
 # 최대 재시도 횟수
 MAX_RETRY = int(os.environ.get("LLM_MAX_RETRY", "4"))
-# 재시도 초기 대기 시간 (초)
-RETRY_BASE_WAIT = int(os.environ.get("LLM_RETRY_BASE_WAIT", "60"))
+# 호출 간격·재시도 대기는 llm_rate_limit.py 가 응답 헤더(retry-after, anthropic-ratelimit-*)로 계산
+# (헤더 없는 429 에만 LLM_RETRY_BASE_WAIT 기반 60→480초 백오프)
+
 
+def _notify_llm_wait(wait_sec: float) -> None:
+    """Rate Limit 예산이 찰 때까지 기다려야 할 때 상태판·텔레그램에 알림."""
+    wait = int(wait_sec)
+    print(f"  ⏳ Claude rate limit 예산 대기: {wait}초")
+    claude_set_waiting(reason="Claude rate limit 예산 대기", wait_sec=wait)
+    if wait >= 30:
+        _tg_notify(
+            f"⏳ *Claude Rate Limit 대기*\n"
+            f"API 한도가 회복될 때까지 *{wait}초* 대기 후 자동 진행\n"
+            f"(약 {wait // 60}분 {wait % 60}초)"
+        )
 
-def _call_llm_with_retry(prompt: str, max_tokens: int = 8192) -> str:
-    """Rate Limit 발생 시 Exponential Backoff로 자동 재시도, 최종 실패 시 Gemini fallback."""
+
+def _call_llm_with_retry(
+    prompt: str,
+    max_tokens: int = 8192,
+    partial_path: Path | None = None,
+    progress: str = "",
+    system: str | list[str] | None = None,
+    usage_kind: str = "draft",
+) -> str:
+    """
+    Rate Limit 발생 시 Exponential Backoff로 자동 재시도, 최종 실패 시 Gemini fallback.
+    partial_path 가 주어지고 LLM_STREAM=1 이면 스트리밍으로 받아 해당 파일에 실시간 기록하며,
+    재시도·Gemini 전환 시에도 그때까지 받은 부분 결과에서 이어서 생성한다.
+    system 의 첫 블록은 프롬프트 캐시 대상 (호출마다 동일한 공통 지시를 넣을 것).
+    """
     api_key = os.environ.get("ANTHROPIC_API_KEY")
+    sink = _DraftStream(partial_path, progress) if (partial_path and LLM_STREAM) else None
+    limiter = get_limiter(api_key) if api_key else None
 
     for attempt in range(1, MAX_RETRY + 1):
         if api_key:
             try:
                 client = Anthropic(api_key=api_key)
-                message = client.messages.create(
-                    model="claude-sonnet-4-5-20250929",
+                if sink:
+                    return _stream_claude(client, prompt, max_tokens, sink, limiter, system, usage_kind)
+                limiter.acquire(
+                    estimate_tokens((_system_text(system) or "") + prompt), max_tokens,
+                    on_wait=_notify_llm_wait,
+                )
+                kwargs = {"system": _system_blocks(system)} if system else {}
+                raw = client.messages.with_raw_response.create(
+                    model=CLAUDE_MODEL,
                     max_tokens=max_tokens,
                     messages=[{"role": "user", "content": prompt}],
+                    **kwargs,
                 )
+                limiter.record_success(raw.headers)
+                message = raw.parse()
+                _record_llm_usage(usage_kind, CLAUDE_MODEL, message.usage)
                 block = message.content[0]
                 if block.type != "text":
                     raise RuntimeError(f"Claude API 비텍스트 응답: {block.type}")
                 return block.text
             except Exception as e:
                 if _is_rate_limit_error(e):
-                    wait_sec = RETRY_BASE_WAIT * (2 ** (attempt - 1))  # 60 → 120 → 240 → 480초
-                    print(f"  ⚠️  Claude rate limit (시도 {attempt}/{MAX_RETRY}) → {wait_sec}초 대기 후 재시도...")
+                    wait_sec = int(limiter.record_rate_limited(e))
+                    print(f"  ⚠️  Claude rate limit (시도 {attempt}/{MAX_RETRY}) → {wait_sec}초 후 재시도...")
                     if attempt < MAX_RETRY:
-                        # ── Rate Limit 알림 ──
+                        # ── Rate Limit 알림 (실제 대기는 다음 시도의 limiter.acquire 에서) ──
                         _tg_notify(
                             f"⚠️ *Claude Rate Limit 감지!*\n"
                             f"🔄 시도 {attempt}/{MAX_RETRY}\n"
-                            f"⏳ *{wait_sec}초* 대기 후 자동 재시도\n"
+                            f"⏳ 서버 안내 기준 *{wait_sec}초* 후 자동 재시도\n"
                             f"(약 {wait_sec // 60}분 {wait_sec % 60}초)"
                         )
-                        time.sleep(wait_sec)
-                        _tg_notify(f"🔄 *Rate Limit 대기 완료* — 재시도 중...")
                         continue
                     else:
                         print("  ⚠️  Claude 최대 재시도 초과 → Gemini fallback으로 전환합니다.")
@@ -593,21 +1061,123 @@ def _call_llm_with_retry(prompt: str, max_tokens: int = 8192) -> str:
             break
 
     print("  🤖 Gemini 2.5 Flash 호출 중...")
-    text = _call_gemini(prompt, max_tokens=max_tokens)
+    if sink:
+        text = _stream_gemini(prompt, max_tokens, sink, system)
+    else:
+        text = _call_gemini(prompt, max_tokens=max_tokens, system=system)
     print("  ✅ Gemini fallback 성공")
     return text
 
 
-def _call_llm(prompt: str, max_tokens: int = 8192) -> str:
-    """외부 호출 인터페이스 — 재시도 로직 포함."""
-    return _call_llm_with_retry(prompt, max_tokens=max_tokens)
+def _call_llm(
+    prompt: str,
+    max_tokens: int = 8192,
+    partial_path: Path | None = None,
+    progress: str = "",
+    system: str | list[str] | None = None,
+    usage_kind: str = "draft",
+) -> str:
+    """외부 호출 인터페이스 — 재시도 로직 포함 (partial_path 지정 시 스트리밍)."""
+    return _call_llm_with_retry(
+        prompt, max_tokens=max_tokens, partial_path=partial_path, progress=progress,
+        system=system, usage_kind=usage_kind,
+    )
 
 
 # ─────────────────────────────────────────────────────────────
 # 블로그 글 생성 (확장 버전)
 # ─────────────────────────────────────────────────────────────
 
-def generate_blog_draft(
+# 블로그 글 공통 지시 (모든 작품 동일) — system 블록으로 보내 프롬프트 캐시 적용
+BLOG_SYSTEM_PROMPT = """당신은 애니메이션 전문 한국어 블로그 작가입니다.
+사용자가 주는 작품 데이터로 기존 단순 소개 글보다 3~4배 많은 분량의, 팬들이 정말 읽고 싶어 하는 깊이 있는 정보와 분석을 담은 블로그 글을 작성합니다.
+
+---
+
+## 블로그 글 형식 & 이미지 배치 규칙
+
+사용자 메시지의 "이미지 마크다운" 항목에 주어진 이미지를 **반드시 아래 순서와 위치에 정확히** 삽입하세요 (경로 변경 금지).
+값이 "없음"인 이미지는 해당 위치를 비워 둡니다.
+
+1. **글 맨 첫 줄**: `# 제목` 바로 다음 줄 → [커버 이미지]
+2. **기본 정보 섹션 직후** → [포스터 이미지]
+3. **스토리 소개 섹션 직후** → [스틸컷 1]
+4. **볼거리/포인트 섹션 직후** → [스틸컷 2]
+5. **총평 섹션 바로 직전** → [스틸컷 3]
+
+---
+
+## 글 구조
+
+아래 구조로 **풍부하고 깊이 있는** 블로그 글을 작성하세요:
+
+```
+# (사용자 메시지의 "글 제목" 그대로)
+
+[커버 이미지]
+
+## 💡 도입부 (2~3 문단)
+- 이 작품이 왜 지금 화제인지, 무엇이 특별한지
+- 독자의 흥미를 자극하는 훅(Hook) 문장
+- 핵심 매력 한 줄 요약
+
+## 📋 기본 정보
+- 제목, 장르, 제작사, 방영일, 에피소드 수
+- AniList / MAL / TMDB 3사 평점 비교 표로 정리
+- MAL 순위 및 멤버 수 (인기 지표로 활용)
+- 스트리밍 서비스 안내
+
+[포스터 이미지]
+
+## 📖 스토리 소개 (3~4 문단, 스포일러 없이)
+- 세계관 설명 (3~5문장)
+- 주인공 소개 + 핵심 갈등
+- 이전 시즌/원작과의 연결 (해당 시)
+- 이번 시즌/파트만의 새로운 요소
+
+[스틸컷 1]
+
+## 🎬 주요 캐릭터 & 성우진
+- 주인공과 주요 등장인물 소개 (3~5명)
+- 각 캐릭터의 역할과 매력 포인트
+- 성우 정보 + 다른 대표작
+
+## ✨ 이 작품의 볼거리 3가지
+각 항목마다 2~3문장으로 구체적으로 서술
+
+[스틸컷 2]
+
+## 🌐 해외 팬 반응
+- Reddit r/anime 주요 반응 요약
+- 글로벌 평점 해석 (TMDB x/10, AniList y/100 — 작품 데이터의 수치 인용)
+- 어떤 층에서 특히 인기인지
+
+## 🎯 이런 분께 추천합니다
+- 추천 대상 3~4가지 (예: ○○○을 좋아하신다면)
+- 비슷한 추천 애니 2~3개 + 간단한 이유
+
+[스틸컷 3]
+
+## ⭐ 총평
+- 이 작품의 강점과 약점 솔직하게
+- 현 시점 평점 및 이유
+- 한 줄 추천 멘트
+
+---
+해시태그 (10~15개)
+```
+
+## 주의사항
+- 반드시 **마크다운만** 출력 (코드 블록 래핑 없이 본문만)
+- 이미지 경로는 사용자 메시지에 지정된 것 **그대로** 사용 (절대 변경 금지)
+- 총평 섹션에는 반드시 별점 (예: ⭐⭐⭐⭐☆ 4/5)을 포함
+- 스포일러 금지 (결말, 반전 등)
+- 합니다체 사용, 이모지 적절히 활용
+- 전체 분량: **최소 2,000자 이상** (기존 글의 3~4배)
+"""
+
+
+def build_blog_prompt(
     anime: dict,
     season_label: str,
     image_paths: dict,
@@ -617,7 +1187,8 @@ def generate_blog_draft(
     reddit_data: list,
 ) -> str:
     """
-    다중 API 데이터를 통합한 고품질 한국어 블로그 글 생성.
+    다중 API 데이터를 통합한 블로그 글 생성 user 프롬프트 (generate_blog_draft · --batch 공용).
+    형식·이미지 배치 규칙은 BLOG_SYSTEM_PROMPT 에 있고, 여기에는 작품별 데이터만 담는다.
     이미지 5개 삽입 구조:
       - 글 상단: cover
       - 기본 정보 직후: poster
@@ -712,29 +1283,18 @@ def generate_blog_draft(
     still2_md = img_md(img_still2, f"{title_display} 스틸컷 2")
     still3_md = img_md(img_still3, f"{title_display} 스틸컷 3")
 
+    # 작품별 데이터만 user 블록으로 — 형식·이미지 배치 규칙은 BLOG_SYSTEM_PROMPT (프롬프트 캐시)
     prompt = f"""다음 애니메이션에 대한 **심층 한국어 블로그 글**을 작성해 주세요.
-기존 단순 소개 글보다 3~4배 많은 분량으로, 팬들이 정말 읽고 싶어 하는 깊이 있는 정보와 분석을 담아야 합니다.
 
----
+## 글 제목
+# {post_title}
 
-## 블로그 글 형식 & 이미지 배치 규칙
-
-**이미지는 반드시 아래 순서와 위치에 정확히 삽입하세요 (경로 변경 금지):**
-
-1. **글 맨 첫 줄**: `# 제목` 바로 다음 줄
-{cover_md if cover_md else "(커버 이미지 없음)"}
-
-2. **기본 정보 섹션 직후**:
-{poster_md if poster_md else "(포스터 이미지 없음)"}
-
-3. **스토리 소개 섹션 직후**:
-{still1_md if still1_md else "(스틸컷 1 없음)"}
-
-4. **볼거리/포인트 섹션 직후**:
-{still2_md if still2_md else "(스틸컷 2 없음)"}
-
-5. **총평 섹션 바로 직전**:
-{still3_md if still3_md else "(스틸컷 3 없음)"}
+## 이미지 마크다운 (위치 규칙은 시스템 지시 참고, 경로 변경 금지)
+- [커버 이미지]: {cover_md.strip() if cover_md else "없음"}
+- [포스터 이미지]: {poster_md.strip() if poster_md else "없음"}
+- [스틸컷 1]: {still1_md.strip() if still1_md else "없음"}
+- [스틸컷 2]: {still2_md.strip() if still2_md else "없음"}
+- [스틸컷 3]: {still3_md.strip() if still3_md else "없음"}
 
 ---
 
@@ -781,105 +1341,65 @@ def generate_blog_draft(
 
 ## Reddit 팬 반응 (r/anime)
 {reddit_str or "(Reddit 데이터 없음)"}
-
----
-
-## 작성 요청 사항
-
-아래 구조로 **풍부하고 깊이 있는** 블로그 글을 작성하세요:
-
-```
-# {post_title}
-
-[커버 이미지: {cover_md.strip() if cover_md else "없음"}]
-
-## 💡 도입부 (2~3 문단)
-- 이 작품이 왜 지금 화제인지, 무엇이 특별한지
-- 독자의 흥미를 자극하는 훅(Hook) 문장
-- 핵심 매력 한 줄 요약
-
-## 📋 기본 정보
-- 제목, 장르, 제작사, 방영일, 에피소드 수
-- AniList / MAL / TMDB 3사 평점 비교 표로 정리
-- MAL 순위 및 멤버 수 (인기 지표로 활용)
-- 스트리밍 서비스 안내
-
-[포스터 이미지: {poster_md.strip() if poster_md else "없음"}]
-
-## 📖 스토리 소개 (3~4 문단, 스포일러 없이)
-- 세계관 설명 (3~5문장)
-- 주인공 소개 + 핵심 갈등
-- 이전 시즌/원작과의 연결 (해당 시)
-- 이번 시즌/파트만의 새로운 요소
-
-[스틸컷 1: {still1_md.strip() if still1_md else "없음"}]
-
-## 🎬 주요 캐릭터 & 성우진
-- 주인공과 주요 등장인물 소개 (3~5명)
-- 각 캐릭터의 역할과 매력 포인트
-- 성우 정보 + 다른 대표작
-
-## ✨ 이 작품의 볼거리 3가지
-각 항목마다 2~3문장으로 구체적으로 서술
-
-[스틸컷 2: {still2_md.strip() if still2_md else "없음"}]
-
-## 🌐 해외 팬 반응
-- Reddit r/anime 주요 반응 요약
-- 글로벌 평점 해석 (TMDB {tmdb_vote:.1f}/10, AniList {anime.get("average_score", 0)}/100)
-- 어떤 층에서 특히 인기인지
-
-## 🎯 이런 분께 추천합니다
-- 추천 대상 3~4가지 (예: ○○○을 좋아하신다면)
-- 비슷한 추천 애니 2~3개 + 간단한 이유
-
-[스틸컷 3: {still3_md.strip() if still3_md else "없음"}]
-
-## ⭐ 총평
-- 이 작품의 강점과 약점 솔직하게
-- 현 시점 평점 및 이유
-- 한 줄 추천 멘트
-
----
-해시태그 (10~15개)
-```
-
-## 주의사항
-- 반드시 **마크다운만** 출력 (코드 블록 래핑 없이 본문만)
-- 이미지 경로는 위 지정된 것 **그대로** 사용 (절대 변경 금지)
-- 총평 섹션에는 반드시 별점 (예: ⭐⭐⭐⭐☆ 4/5)을 포함
-- 스포일러 금지 (결말, 반전 등)
-- 합니다체 사용, 이모지 적절히 활용
-- 전체 분량: **최소 2,000자 이상** (기존 글의 3~4배)
 """
+    return prompt
 
-    return _call_llm(prompt, max_tokens=8192)
+
+def generate_blog_draft(
+    anime: dict,
+    season_label: str,
+    image_paths: dict,
+    anilist_details: dict,
+    tmdb_data: dict,
+    youtube_data: list,
+    reddit_data: list,
+    draft_path: Path | None = None,
+    progress: str = "",
+) -> str:
+    """
+    다중 API 데이터를 통합한 고품질 한국어 블로그 글 생성.
+    draft_path 를 주면 생성 중인 본문을 {draft_path}.partial 에 스트리밍 기록.
+    """
+    prompt = build_blog_prompt(
+        anime, season_label, image_paths, anilist_details,
+        tmdb_data, youtube_data, reddit_data,
+    )
+    partial_path = draft_path.with_name(draft_path.name + ".partial") if draft_path else None
+    return _call_llm(
+        prompt, max_tokens=8192, partial_path=partial_path, progress=progress,
+        system=BLOG_SYSTEM_PROMPT, usage_kind="draft",
+    )
 
 
 # ─────────────────────────────────────────────────────────────
 # 수정 모드
 # ─────────────────────────────────────────────────────────────
 
+REVISE_SYSTEM_PROMPT = """## 수정 모드
+지금은 새 글 작성이 아니라 기존 블로그 글 수정입니다.
+사용자 메시지의 "현재 글 원문"을 "사용자 지시"에 맞게 고친 **수정한 전체 글**만 출력하세요.
+- 코드 블록이나 설명 없이 수정된 마크다운 본문만 출력합니다.
+- 지시를 반영해 수정한 **전체** 마크다운을 출력하세요.
+- 제목(# ...), 이미지(![...](...)), 본문 구조를 유지하면서 지시대로 고치세요.
+- 출력은 반드시 마크다운만 하세요."""
+
+
 def revise_blog_draft(file_path: Path, instruction: str) -> str:
     """기존 블로그 글(.md) 내용을 instruction에 맞게 수정한 본문 반환."""
     raw = file_path.read_text(encoding="utf-8")
-    prompt = f"""다음은 블로그 글 마크다운 원문입니다. 사용자 지시에 맞게 **수정한 전체 글**만 출력하세요.
-코드 블록이나 설명 없이 수정된 마크다운 본문만 출력합니다.
-
-## 사용자 지시
+    prompt = f"""## 사용자 지시
 {instruction}
 
 ## 현재 글 원문
 ---
 {raw}
----
+---"""
 
-## 요청 사항
-- 지시를 반영해 수정한 **전체** 마크다운을 출력하세요.
-- 제목(# ...), 이미지(![...](...)), 본문 구조를 유지하면서 지시대로 고치세요.
-- 출력은 반드시 마크다운만 하세요."""
-
-    return _call_llm(prompt, max_tokens=8192).strip()
+    # 첫 system 블록을 글 생성과 동일하게 두어 같은 프롬프트 캐시를 재사용
+    return _call_llm(
+        prompt, max_tokens=8192,
+        system=[BLOG_SYSTEM_PROMPT, REVISE_SYSTEM_PROMPT], usage_kind="revise",
+    ).strip()
 
 
 # ─────────────────────────────────────────────────────────────
@@ -906,6 +1426,115 @@ def load_anime_list() -> tuple[str, int, list]:
 # 메인
 # ─────────────────────────────────────────────────────────────
 
+def _produce_draft(n: int, total: int, anime: dict, enriched: dict, season_label: str) -> tuple[int, int]:
+    """
+    수집 완료된 작품 1편의 이미지 수집 → 최적화 → 글 생성 → 저장.
+    반환: (글자 수, 이미지 수). 실패 시 예외 (호출 측에서 알림).
+    """
+    title_display = display_title(anime)
+    slug = slugify(title_display)
+
+    # 진행 메시지는 글마다 따로 (--workers 로 동시에 만들어도 섞이지 않음), 끝나면 닫음
+    progress_key = f"generate_post:{slug}"
+    try:
+        # ── 글 시작 알림 + 상태 기록 ──
+        claude_update_progress(
+            progress=f"{n}/{total}",
+            detail=f"[{n}/{total}] {title_display} — 데이터 수집 완료",
+        )
+        _tg_progress(
+            progress_key,
+            f"✍️ *[{n}/{total}] 생성 시작*\n"
+            f"📄 {title_display}\n"
+            f"🔍 데이터 수집 완료 (TMDB · AniList · YouTube · Reddit 동시 조회)"
+        )
+
+        tmdb_data       = enriched["tmdb"]
+        anilist_details = enriched["anilist"]
+        youtube_data    = enriched["youtube"]
+        reddit_data     = enriched["reddit"]
+
+        if tmdb_data.get("tmdb_id"):
+            print(f"  ✅ TMDB: 포스터 {len(tmdb_data.get('poster_paths', []))}개, 스틸컷 {len(tmdb_data.get('backdrop_paths', []))}개")
+        else:
+            print(f"  ⚠️  TMDB: 결과 없음")
+        if anime.get("anilist_id"):
+            print(f"  ✅ AniList: 캐릭터 {len(anilist_details.get('characters', []))}명, 태그 {len(anilist_details.get('tags', []))}개")
+        else:
+            print(f"  ⚠️  AniList ID 없음 — 기본 정보만 사용")
+        print(f"  {'✅' if youtube_data else '⚠️ '} YouTube: PV {len(youtube_data)}개")
+        print(f"  {'✅' if reddit_data else '⚠️ '} Reddit: 인기 글 {len(reddit_data)}개")
+
+        # 5. 이미지 수집 (5개)
+        print(f"  🖼️  이미지 수집 중 (최대 5개)...")
+        image_paths = collect_images(anime, tmdb_data, anilist_details, slug)
+        print(f"  ✅ 이미지: {len(image_paths)}개 수집 ({', '.join(image_paths.keys())})")
+
+        # 리사이즈 · 메타데이터 제거 · WebP 변환 (본문에는 최적화본 경로가 들어감)
+        image_paths, opt_report = image_optimize.optimize_post_images(image_paths, IMAGES_DIR)
+        if opt_report["src_bytes"]:
+            print(f"  🗜️  이미지 최적화: {image_optimize.format_report(opt_report)}")
+
+        # ── LLM 호출 직전 알림 + 상태 기록 ──
+        claude_update_progress(
+            progress=f"{n}/{total}",
+            detail=f"[{n}/{total}] {title_display} — Claude API 호출 중",
+        )
+        _tg_progress(
+            progress_key,
+            f"🤖 *[{n}/{total}] AI 글 생성 중...*\n"
+            f"📄 {title_display}\n"
+            f"🖼 이미지 {len(image_paths)}개 수집 완료\n"
+            f"✍️ Claude API 호출 중 (30초~2분 소요)"
+        )
+
+        # 6. 블로그 글 생성 (스트리밍 → {slug}.md.partial)
+        post_path = POSTS_DIR / f"{slug}.md"
+        print(f"  ✍️  블로그 글 생성 중...")
+        body = generate_blog_draft(
+            anime=anime,
+            season_label=season_label,
+            image_paths=image_paths,
+            anilist_details=anilist_details,
+            tmdb_data=tmdb_data,
+            youtube_data=youtube_data,
+            reddit_data=reddit_data,
+            draft_path=post_path,
+            progress=f"{n}/{total}",
+        )
+
+        # 7. 저장 (.partial → .md 원자적 교체)
+        write_draft_atomic(post_path, body)
+        word_count = len(body.replace(" ", ""))
+        print(f"  ✅ 저장 완료: {post_path} ({word_count:,}자)")
+        return word_count, len(image_paths)
+    finally:
+        _tg_end_progress(progress_key)
+
+
+def _notify_draft_done(n: int, total: int, title: str, word_count: int, image_count: int, remaining: int) -> None:
+    _tg_notify(
+        f"✅ *[{n}/{total}] 생성 완료!*\n"
+        f"📄 {title}\n"
+        f"📝 분량: *{word_count:,}자*\n"
+        f"🖼 이미지: {image_count}개\n"
+        + (
+            f"\n📋 남은 글: *{remaining}개*"
+            if remaining > 0
+            else "\n🎉 마지막 글 완료!"
+        )
+    )
+
+
+def _notify_draft_failed(n: int, total: int, title: str, error) -> None:
+    _tg_notify(
+        f"❌ *[{n}/{total}] 생성 실패!*\n"
+        f"📄 {title}\n"
+        f"🔴 오류: `{str(error)[:200]}`\n"
+        f"⏩ 다음 글로 넘어갑니다..."
+    )
+
+
 def main() -> None:
     try:
         season_label, _year, anime_list = load_anime_list()
@@ -940,7 +1569,7 @@ def main() -> None:
     conflicts = claude_set_task(
         action=f"블로그 글 생성 ({total}개)",
         target_files=[str(POSTS_DIR)],
-        detail=f"글 간 딜레이 {INTER_POST_DELAY}초",
+        detail="호출 간격은 API rate limit 헤더 기준 자동 조절",
         progress=f"0/{total}",
     )
     # 충돌 감지 시 경고 (알림은 shared_state가 자동 전송)
@@ -954,163 +1583,30 @@ def main() -> None:
     _tg_notify(
         f"🚀 *블로그 글 생성 시작*\n"
         f"📋 총 *{total}개* 글 생성 예정\n"
-        f"⏳ 글 간 딜레이: {INTER_POST_DELAY}초\n"
-        f"⏱ 예상 소요시간: 약 {total * (2 + INTER_POST_DELAY // 60)}~{total * (4 + INTER_POST_DELAY // 60)}분"
+        f"⏳ 글 간 간격: API 한도 기준 자동 조절\n"
+        f"⏱ 예상 소요시간: 약 {total * 1}~{total * 3}분"
     )
 
     success_count = 0
     fail_count = 0
 
-    for i, anime in enumerate(anime_list, start=1):
-        title_display = (
-            anime.get("title_korean")
-            or anime.get("title_english")
-            or anime.get("title_native")
-            or "제목없음"
-        )
-        title_en = anime.get("title_english") or anime.get("title_native") or ""
-        title_native = anime.get("title_native") or ""
-        slug = slugify(title_display) or f"anime_{i}"
-
-        print(f"[{i}/{total}] {title_display}")
-        print(f"  🔍 다중 API 데이터 수집 중...")
-
-        # ── 글 시작 알림 + 상태 기록 ──
-        claude_update_progress(
-            progress=f"{i}/{total}",
-            detail=f"[{i}/{total}] {title_display} — 데이터 수집 중",
-        )
-        _tg_notify(
-            f"✍️ *[{i}/{total}] 생성 시작*\n"
-            f"📄 {title_display}\n"
-            f"🔍 데이터 수집 중... (TMDB → AniList → YouTube → Reddit)"
-        )
-
+    # 4개 소스는 백그라운드에서 동시에 수집 → 먼저 끝난 작품부터 글 생성
+    for n, (i, anime, enriched) in enumerate(iter_enriched(anime_list), start=1):
+        title_display = display_title(anime)
+        print(f"[{n}/{total}] {title_display} (시즌 #{i})")
         try:
-            # 1. TMDB 검색
-            print(f"  📽️  TMDB 조회 중...")
-            tmdb_data = tmdb_search_anime(title_en, title_native)
-            if tmdb_data.get("tmdb_id"):
-                print(f"  ✅ TMDB: 포스터 {len(tmdb_data.get('poster_paths', []))}개, 스틸컷 {len(tmdb_data.get('backdrop_paths', []))}개")
-            else:
-                print(f"  ⚠️  TMDB: 결과 없음")
-            time.sleep(0.3)
-
-            # 2. AniList 상세 (anilist_id가 JSON에 없으면 건너뜀)
-            anilist_details = {}
-            anilist_id = anime.get("anilist_id")
-            if anilist_id:
-                print(f"  🎌 AniList 상세 조회 중...")
-                anilist_details = anilist_get_details(anilist_id)
-                print(f"  ✅ AniList: 캐릭터 {len(anilist_details.get('characters', []))}명, 태그 {len(anilist_details.get('tags', []))}개")
-                time.sleep(0.5)
-            else:
-                print(f"  ⚠️  AniList ID 없음 — 기본 정보만 사용")
-
-            # 3. YouTube PV 검색
-            print(f"  🎬 YouTube PV 검색 중...")
-            youtube_data = youtube_search_pv(title_en, title_native)
-            if youtube_data:
-                print(f"  ✅ YouTube: PV {len(youtube_data)}개 발견")
-            else:
-                print(f"  ⚠️  YouTube: 결과 없음")
-            time.sleep(0.3)
-
-            # 4. Reddit 반응
-            print(f"  💬 Reddit 반응 수집 중...")
-            reddit_data = reddit_get_discussions(title_en, title_native)
-            if reddit_data:
-                print(f"  ✅ Reddit: 인기 글 {len(reddit_data)}개")
-            else:
-                print(f"  ⚠️  Reddit: 결과 없음")
-            time.sleep(0.3)
-
-            # 5. 이미지 수집 (5개)
-            print(f"  🖼️  이미지 수집 중 (최대 5개)...")
-            image_paths = collect_images(anime, tmdb_data, anilist_details, slug)
-            print(f"  ✅ 이미지: {len(image_paths)}개 수집 ({', '.join(image_paths.keys())})")
-
-            # ── LLM 호출 직전 알림 + 상태 기록 ──
-            claude_update_progress(
-                progress=f"{i}/{total}",
-                detail=f"[{i}/{total}] {title_display} — Claude API 호출 중",
-            )
-            _tg_notify(
-                f"🤖 *[{i}/{total}] AI 글 생성 중...*\n"
-                f"📄 {title_display}\n"
-                f"🖼 이미지 {len(image_paths)}개 수집 완료\n"
-                f"✍️ Claude API 호출 중 (30초~2분 소요)"
-            )
-
-            # 6. 블로그 글 생성
-            print(f"  ✍️  블로그 글 생성 중...")
-            body = generate_blog_draft(
-                anime=anime,
-                season_label=season_label,
-                image_paths=image_paths,
-                anilist_details=anilist_details,
-                tmdb_data=tmdb_data,
-                youtube_data=youtube_data,
-                reddit_data=reddit_data,
-            )
-
-            # 7. 저장
-            post_filename = f"{slug}.md"
-            post_path = POSTS_DIR / post_filename
-            post_path.write_text(body.strip(), encoding="utf-8")
-            word_count = len(body.replace(" ", ""))
-            print(f"  ✅ 저장 완료: {post_path} ({word_count:,}자)")
+            word_count, image_count = _produce_draft(n, total, anime, enriched, season_label)
             success_count += 1
-
-            # ── 글 완료 알림 ──
-            remaining = total - i
-            _tg_notify(
-                f"✅ *[{i}/{total}] 생성 완료!*\n"
-                f"📄 {title_display}\n"
-                f"📝 분량: *{word_count:,}자*\n"
-                f"🖼 이미지: {len(image_paths)}개\n"
-                + (
-                    f"\n⏳ 다음 글까지 *{INTER_POST_DELAY}초* 대기 중...\n"
-                    f"📋 남은 글: *{remaining}개*"
-                    if remaining > 0
-                    else "\n🎉 마지막 글 완료!"
-                )
-            )
-
+            _notify_draft_done(n, total, title_display, word_count, image_count, total - n)
         except Exception as e:
             fail_count += 1
             print(f"  ❌ 실패: {e}")
-            claude_set_error(f"[{i}/{total}] {title_display}: {str(e)[:100]}")
-
-            # ── 에러 알림 ──
-            _tg_notify(
-                f"❌ *[{i}/{total}] 생성 실패!*\n"
-                f"📄 {title_display}\n"
-                f"🔴 오류: `{str(e)[:200]}`\n"
-                f"⏩ 다음 글로 넘어갑니다..."
-            )
+            claude_set_error(f"[{n}/{total}] {title_display}: {str(e)[:100]}")
+            _notify_draft_failed(n, total, title_display, e)
             # 실패해도 다음 글로 계속 진행 (raise 제거)
 
         print()
 
-        # ── 글 간 딜레이 (Rate Limit 방지) ──
-        if i < total:
-            remaining = total - i
-            print(f"  ⏳ Rate Limit 방지: {INTER_POST_DELAY}초 대기 후 다음 글 진행... (남은 글: {remaining}개)")
-            claude_set_waiting(reason="Rate Limit 방지 딜레이", wait_sec=INTER_POST_DELAY)
-            # 딜레이 중 카운트다운 알림 (30초 이상일 때만)
-            if INTER_POST_DELAY >= 30:
-                half = INTER_POST_DELAY // 2
-                time.sleep(half)
-                _tg_notify(
-                    f"⏳ *대기 중...* ({half}초 경과 / {INTER_POST_DELAY}초)\n"
-                    f"📋 남은 글: *{remaining}개* — 곧 다음 글 시작합니다"
-                )
-                time.sleep(INTER_POST_DELAY - half)
-            else:
-                time.sleep(INTER_POST_DELAY)
-            print()
-
     # ── 전체 완료 알림 + 상태 기록 ──
     result_str = f"성공 {success_count}개 / 실패 {fail_count}개 (총 {total}개)"
     claude_set_done(result=result_str)
@@ -1128,6 +1624,454 @@ def main() -> None:
     )
 
 
+# ─────────────────────────────────────────────────────────────
+# 워커 풀 모드 (--workers N) — SQLite 작업 큐 + 멀티 프로세스
+# ─────────────────────────────────────────────────────────────
+
+# 작품 1편 = 작업 1건. 워커가 죽어도 큐가 남아 있어 재실행 시 미완료 작품만 처리
+DRAFT_QUEUE_FILE = BLOG_DIR / "data" / "draft_queue.sqlite"
+# 실패한 작품을 다음 실행에서 다시 시도하는 최대 횟수
+DRAFT_MAX_ATTEMPTS = int(os.environ.get("DRAFT_MAX_ATTEMPTS", "3"))
+
+
+_JOBS_SCHEMA = """CREATE TABLE IF NOT EXISTS jobs (
+    job_key    TEXT PRIMARY KEY,
+    idx        INTEGER NOT NULL,
+    season     TEXT NOT NULL,
+    title      TEXT NOT NULL,
+    anime      TEXT NOT NULL,
+    status     TEXT NOT NULL DEFAULT 'pending',
+    worker     INTEGER,
+    attempts   INTEGER NOT NULL DEFAULT 0,
+    error      TEXT,
+    updated_at TEXT
+)"""
+
+
+def _job_key(anime: dict) -> str:
+    """작품의 고정 키 — 목록 순서(인기 순위)가 바뀌어도 같은 작품은 같은 작업."""
+    if anime.get("anilist_id"):
+        return f"anilist:{anime['anilist_id']}"
+    if anime.get("mal_id"):
+        return f"mal:{anime['mal_id']}"
+    return f"slug:{slugify(display_title(anime))}"
+
+
+def _queue_connect() -> sqlite3.Connection:
+    DRAFT_QUEUE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(DRAFT_QUEUE_FILE, timeout=30, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    cols = [r[1] for r in conn.execute("PRAGMA table_info(jobs)")]
+    if cols and "job_key" not in cols:
+        _migrate_position_jobs(conn)
+    conn.execute(_JOBS_SCHEMA)
+    return conn
+
+
+def _migrate_position_jobs(conn: sqlite3.Connection) -> None:
+    """예전 큐(목록 위치 idx 가 키)를 작품 키 기준으로 옮김 — done 기록은 저장된 작품 JSON 기준으로 유지."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        rows = conn.execute(
+            "SELECT idx, season, title, anime, status, worker, attempts, error, updated_at FROM jobs"
+        ).fetchall()
+        conn.execute("DROP TABLE jobs")
+        conn.execute(_JOBS_SCHEMA)
+        for row in rows:
+            conn.execute(
+                "INSERT OR IGNORE INTO jobs (job_key, idx, season, title, anime, status, worker, attempts, error, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (_job_key(json.loads(row[3])), *row),
+            )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def _enqueue_season(conn: sqlite3.Connection, season_label: str, anime_list: list) -> None:
+    """
+    시즌 목록을 큐에 적재. 작업은 작품 키(_job_key)로 구분하고 idx 는 현재 목록 위치(표시 · 처리 순서)로 갱신.
+    같은 시즌이면 done 은 유지하고, 아직 안 끝난 작업은 최신 작품 정보로 교체하며
+    running(이전 실행 중 죽은 워커) · failed(재시도 한도 이내) 는 pending 으로 되돌린다.
+    목록에서 빠진 작품의 작업은 삭제.
+    """
+    now = datetime.now().isoformat(timespec="seconds")
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if conn.execute("SELECT 1 FROM jobs WHERE season != ? LIMIT 1", (season_label,)).fetchone():
+            conn.execute("DELETE FROM jobs")
+        keys: set[str] = set()
+        for idx, anime in enumerate(anime_list, start=1):
+            key = _job_key(anime)
+            if key in keys:
+                continue             # 같은 작품이 목록에 두 번 — 먼저 나온 순위로
+            keys.add(key)
+            title, payload = display_title(anime), json.dumps(anime, ensure_ascii=False)
+            conn.execute(
+                "INSERT INTO jobs (job_key, idx, season, title, anime, updated_at) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(job_key) DO UPDATE SET idx = excluded.idx, "
+                "title = CASE WHEN status = 'done' THEN title ELSE excluded.title END, "
+                "anime = CASE WHEN status = 'done' THEN anime ELSE excluded.anime END",
+                (key, idx, season_label, title, payload, now),
+            )
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS current_keys (job_key TEXT PRIMARY KEY)")
+        conn.execute("DELETE FROM current_keys")
+        conn.executemany("INSERT INTO current_keys VALUES (?)", [(k,) for k in keys])
+        conn.execute("DELETE FROM jobs WHERE job_key NOT IN (SELECT job_key FROM current_keys)")
+        conn.execute(
+            "UPDATE jobs SET status = 'pending', worker = NULL, updated_at = ? "
+            "WHERE status = 'running' OR (status = 'failed' AND attempts < ?)",
+            (now, DRAFT_MAX_ATTEMPTS),
+        )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def _claim_job(conn: sqlite3.Connection, worker_id: int) -> tuple[str, int, dict] | None:
+    """대기 중인 작업 1건을 원자적으로 가져와 running 으로 표시. 반환: (작품 키, 목록 위치, 작품)"""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        row = conn.execute(
+            "SELECT job_key, idx, anime FROM jobs WHERE status = 'pending' ORDER BY idx LIMIT 1"
+        ).fetchone()
+        if row:
+            conn.execute(
+                "UPDATE jobs SET status = 'running', worker = ?, attempts = attempts + 1, updated_at = ? "
+                "WHERE job_key = ?",
+                (worker_id, datetime.now().isoformat(timespec="seconds"), row[0]),
+            )
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    return (row[0], row[1], json.loads(row[2])) if row else None
+
+
+def _finish_job(conn: sqlite3.Connection, key: str, error: str | None = None) -> None:
+    conn.execute(
+        "UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE job_key = ?",
+        ("failed" if error else "done", error, datetime.now().isoformat(timespec="seconds"), key),
+    )
+
+
+def _queue_counts(conn: sqlite3.Connection) -> dict[str, int]:
+    return dict(conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+
+
+def _draft_worker(worker_id: int, season_label: str, total: int, events, refresh: bool) -> None:
+    """
+    워커 프로세스 본체. 큐에서 작품을 하나씩 가져와 수집 → 이미지 → 글 생성.
+    텔레그램 · 상태판 갱신은 직접 하지 않고 events 큐로 부모에게 넘긴다 (알림 스트림 1개로 합침).
+    LLM 호출 간격은 llm_rate_limit 장부(파일 락)를 통해 모든 워커가 공유.
+    """
+    global _tg_notify, _tg_progress, _tg_end_progress, claude_update_progress, claude_set_waiting
+    _tg_notify = lambda text: events.put(("tg", text))
+    _tg_progress = lambda key, text: events.put(("tg_progress", key, text))
+    _tg_end_progress = lambda key: events.put(("tg_end_progress", key))
+    claude_update_progress = lambda progress="", detail="": events.put(("progress", worker_id, detail))
+    claude_set_waiting = lambda reason="", wait_sec=0: events.put(("waiting", reason, wait_sec))
+    http_cache.set_refresh(refresh)
+
+    conn = _queue_connect()
+    try:
+        while True:
+            job = _claim_job(conn, worker_id)
+            if job is None:
+                break
+            key, idx, anime = job
+            title = display_title(anime)
+            print(f"[W{worker_id}] [{idx}/{total}] {title}")
+            try:
+                _, _, enriched = next(iter_enriched([anime]))
+                word_count, image_count = _produce_draft(idx, total, anime, enriched, season_label)
+            except Exception as e:
+                print(f"[W{worker_id}]   ❌ 실패: {e}")
+                _finish_job(conn, key, str(e)[:500])
+                events.put(("failed", idx, title, str(e)))
+                continue
+            _finish_job(conn, key)
+            events.put(("done", idx, title, word_count, image_count))
+    finally:
+        conn.close()
+        image_optimize.shutdown()
+        events.put(("exit", worker_id))
+
+
+def run_worker_mode(workers: int, refresh: bool = False) -> None:
+    """--workers N: 작품별 작업을 SQLite 큐에 넣고 N개 프로세스가 나눠서 처리."""
+    season_label, _year, anime_list = load_anime_list()
+    IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+    POSTS_DIR.mkdir(parents=True, exist_ok=True)
+    total = len(anime_list)
+
+    conn = _queue_connect()
+    _enqueue_season(conn, season_label, anime_list)
+    counts = _queue_counts(conn)
+    pending = counts.get("pending", 0)
+    if counts.get("done"):
+        print(f"⏭️  이미 완료된 작품 {counts['done']}편 건너뜀 (큐: {DRAFT_QUEUE_FILE.name})")
+    if not pending:
+        print("처리할 작품이 없습니다.")
+        conn.close()
+        return
+    workers = max(1, min(workers, pending))
+
+    conflicts = claude_set_task(
+        action=f"블로그 글 생성 ({pending}개, 워커 {workers}개)",
+        target_files=[str(POSTS_DIR)],
+        detail="호출 간격은 API rate limit 헤더 기준 자동 조절 (워커 간 공유)",
+        progress=f"0/{pending}",
+    )
+    if any(c.get("severity") == "critical" for c in conflicts or []):
+        print("🚨 충돌 감지! — 텔레그램에서 '충돌 해제' 후 계속하세요.")
+        conn.close()
+        return
+
+    print(f"👷 워커 {workers}개로 {pending}편 생성 시작")
+    _tg_notify(
+        f"🚀 *블로그 글 생성 시작*\n"
+        f"📋 총 *{pending}개* 글 생성 예정 (워커 {workers}개 병렬)\n"
+        f"⏳ 글 간 간격: API 한도 기준 자동 조절"
+    )
+
+    # spawn — 부모의 스레드 풀 · HTTP 세션을 물려받지 않도록 새 인터프리터로 시작
+    # daemon 이 아님 — 워커 안에서 image_optimize 가 자식 프로세스 풀을 만들기 때문
+    # (풀은 워커가 끝날 때 image_optimize.shutdown(), 남은 워커는 아래 finally 에서 정리)
+    ctx = multiprocessing.get_context("spawn")
+    events = ctx.Queue()
+    procs = [
+        ctx.Process(target=_draft_worker, args=(w, season_label, total, events, refresh))
+        for w in range(1, workers + 1)
+    ]
+    for p in procs:
+        p.start()
+
+    success_count = fail_count = 0
+    alive = workers
+    try:
+        while alive:
+            try:
+                event = events.get(timeout=5)
+            except queue.Empty:
+                if not any(p.is_alive() for p in procs):
+                    break
+                continue
+            kind = event[0]
+            if kind == "tg":
+                _tg_notify(event[1])
+            elif kind == "tg_progress":
+                _tg_progress(event[1], event[2])
+            elif kind == "tg_end_progress":
+                _tg_end_progress(event[1])
+            elif kind == "progress":
+                claude_update_progress(
+                    progress=f"{success_count + fail_count}/{pending}",
+                    detail=f"[W{event[1]}] {event[2]}",
+                )
+            elif kind == "waiting":
+                claude_set_waiting(reason=event[1], wait_sec=event[2])
+            elif kind == "done":
+                success_count += 1
+                _, idx, title, word_count, image_count = event
+                _notify_draft_done(idx, total, title, word_count, image_count,
+                                   pending - success_count - fail_count)
+            elif kind == "failed":
+                fail_count += 1
+                _, idx, title, error = event
+                claude_set_error(f"[{idx}/{total}] {title}: {error[:100]}")
+                _notify_draft_failed(idx, total, title, error)
+            elif kind == "exit":
+                alive -= 1
+    finally:
+        for p in procs:
+            p.join(timeout=10)
+        for p in procs:
+            if p.is_alive():
+                p.terminate()
+                p.join(timeout=5)
+
+    # 워커가 비정상 종료해 running 으로 남은 작업은 다음 실행 때 pending 으로 복구됨
+    left = _queue_counts(conn)
+    conn.close()
+    stuck = left.get("running", 0)
+    result_str = f"성공 {success_count}개 / 실패 {fail_count}개 (총 {pending}개)"
+    if stuck:
+        result_str += f" · 중단 {stuck}개 (재실행 시 이어서 처리)"
+    claude_set_done(result=result_str)
+    print(f"🎉 완료: {result_str}")
+    _tg_notify(
+        f"🎉 *모든 글 생성 완료!*\n\n"
+        f"📊 결과 요약\n"
+        f"✅ 성공: *{success_count}개*\n"
+        f"❌ 실패: *{fail_count}개*\n"
+        f"👷 워커: {workers}개\n\n"
+        f"📋 초안 확인 후 포스팅을 진행해 주세요!"
+    )
+
+
+# ─────────────────────────────────────────────────────────────
+# 배치 모드 (Anthropic Message Batches) — 시즌 전체 초안 일괄 생성
+# ─────────────────────────────────────────────────────────────
+
+# 진행 중인 배치 정보 (재시작 시 batch_id 로 이어서 폴링)
+BATCH_STATE_FILE = BLOG_DIR / "data" / "batch_state.json"
+# 배치 상태 확인 주기 (초)
+BATCH_POLL_SEC = int(os.environ.get("BATCH_POLL_SEC", "60"))
+
+
+def _load_batch_state() -> dict | None:
+    if not BATCH_STATE_FILE.exists():
+        return None
+    try:
+        return json.loads(BATCH_STATE_FILE.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+def _save_batch_state(state: dict) -> None:
+    BATCH_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = BATCH_STATE_FILE.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp.replace(BATCH_STATE_FILE)
+
+
+def _submit_batch(client: Anthropic, season_label: str, anime_list: list) -> dict:
+    """전 작품 데이터 수집 → 프롬프트 생성 → Message Batch 1건으로 제출. 반환: 저장된 배치 상태."""
+    total = len(anime_list)
+    requests_, items = [], {}
+    for n, (i, anime, enriched) in enumerate(iter_enriched(anime_list), start=1):
+        title_display = display_title(anime)
+        slug = slugify(title_display) or f"anime_{i}"
+        print(f"[{n}/{total}] {title_display} — 데이터·이미지 준비")
+        claude_update_progress(progress=f"{n}/{total}", detail=f"[배치 준비] {title_display}")
+        try:
+            image_paths = collect_images(anime, enriched["tmdb"], enriched["anilist"], slug)
+            image_paths, _ = image_optimize.optimize_post_images(image_paths, IMAGES_DIR)
+            prompt = build_blog_prompt(
+                anime, season_label, image_paths, enriched["anilist"],
+                enriched["tmdb"], enriched["youtube"], enriched["reddit"],
+            )
+        except Exception as e:
+            print(f"  ❌ 준비 실패: {e}")
+            continue
+        custom_id = f"post-{i}"
+        items[custom_id] = {"slug": slug, "title": title_display}
+        requests_.append({
+            "custom_id": custom_id,
+            "params": {
+                "model": CLAUDE_MODEL,
+                "max_tokens": 8192,
+                "system": _system_blocks(BLOG_SYSTEM_PROMPT),
+                "messages": [{"role": "user", "content": prompt}],
+            },
+        })
+
+    if not requests_:
+        raise RuntimeError("배치로 제출할 글이 없습니다.")
+
+    batch = client.messages.batches.create(requests=requests_)
+    state = {
+        "batch_id": batch.id,
+        "season_label": season_label,
+        "submitted_at": datetime.now().isoformat(),
+        "items": items,
+    }
+    _save_batch_state(state)
+    print(f"📦 Message Batch 제출: {batch.id} ({len(requests_)}건)")
+    _tg_notify(
+        f"📦 *배치 제출 완료*\n"
+        f"🆔 `{batch.id}`\n"
+        f"📋 {len(requests_)}건 — 완료되면 초안을 한 번에 저장합니다"
+    )
+    return state
+
+
+def _wait_batch(client: Anthropic, batch_id: str, total: int):
+    """processing_status 가 ended 될 때까지 BATCH_POLL_SEC 간격으로 확인."""
+    while True:
+        batch = client.messages.batches.retrieve(batch_id)
+        c = batch.request_counts
+        done = c.succeeded + c.errored + c.canceled + c.expired
+        detail = f"배치 {batch.processing_status} — 완료 {done}/{total} (처리 중 {c.processing})"
+        print(f"  ⏳ {detail}")
+        claude_update_progress(progress=f"{done}/{total}", detail=detail)
+        if batch.processing_status == "ended":
+            return batch
+        time.sleep(BATCH_POLL_SEC)
+
+
+def run_batch_mode() -> None:
+    """--batch: 모든 글을 Message Batch 1건으로 생성. 중단 후 재실행하면 저장된 batch_id 로 이어서 진행."""
+    api_key = os.environ.get("ANTHROPIC_API_KEY")
+    if not api_key:
+        raise RuntimeError("--batch 모드는 ANTHROPIC_API_KEY 가 필요합니다.")
+    client = Anthropic(api_key=api_key)
+
+    IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+    POSTS_DIR.mkdir(parents=True, exist_ok=True)
+
+    state = _load_batch_state()
+    if state and state.get("batch_id"):
+        print(f"🔁 진행 중인 배치 이어서 확인: {state['batch_id']}")
+        claude_set_task(
+            action=f"블로그 글 배치 생성 ({len(state['items'])}개, 재개)",
+            target_files=[str(POSTS_DIR)],
+            detail=f"batch {state['batch_id']}",
+        )
+    else:
+        season_label, _year, anime_list = load_anime_list()
+        claude_set_task(
+            action=f"블로그 글 배치 생성 ({len(anime_list)}개)",
+            target_files=[str(POSTS_DIR)],
+            detail="Message Batches API",
+            progress=f"0/{len(anime_list)}",
+        )
+        state = _submit_batch(client, season_label, anime_list)
+
+    batch_id = state["batch_id"]
+    items = state["items"]
+    total = len(items)
+    _wait_batch(client, batch_id, total)
+
+    success_count = 0
+    fail_count = 0
+    for entry in client.messages.batches.results(batch_id):
+        item = items.get(entry.custom_id)
+        if not item:
+            continue
+        result = entry.result
+        if result.type != "succeeded":
+            fail_count += 1
+            print(f"  ❌ {item['title']}: {result.type}")
+            continue
+        _record_llm_usage("batch", result.message.model, result.message.usage)
+        text = "".join(b.text for b in result.message.content if b.type == "text")
+        if not text.strip():
+            fail_count += 1
+            print(f"  ❌ {item['title']}: 빈 응답")
+            continue
+        post_path = POSTS_DIR / f"{item['slug']}.md"
+        write_draft_atomic(post_path, text)
+        success_count += 1
+        print(f"  ✅ {item['title']} → {post_path.name} ({len(text.replace(' ', '')):,}자)")
+
+    # 결과 저장이 끝났으므로 배치 상태 정리 (재실행 시 새 배치 제출)
+    BATCH_STATE_FILE.unlink(missing_ok=True)
+
+    result_str = f"성공 {success_count}개 / 실패 {fail_count}개 (총 {total}개, batch {batch_id})"
+    claude_set_done(result=result_str)
+    print(f"🎉 배치 완료: {result_str}")
+    _tg_notify(
+        f"🎉 *배치 글 생성 완료!*\n\n"
+        f"✅ 성공: *{success_count}개*\n"
+        f"❌ 실패: *{fail_count}개*\n\n"
+        f"📋 초안 확인 후 포스팅을 진행해 주세요!"
+    )
+
+
 def run_revise_mode(revise_path: Path, instruction: str) -> None:
     """--revise <파일> --instruction <지시> 모드."""
     if not revise_path.exists():
@@ -1157,9 +2101,26 @@ if __name__ == "__main__":
         "--instruction", type=str, default="", metavar="TEXT",
         help="수정 지시문 (--revise와 함께 사용)",
     )
+    parser.add_argument(
+        "--batch", action="store_true",
+        help="Message Batches API로 전체 글 일괄 생성 (중단 시 재실행하면 같은 배치 이어서 확인)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=0, metavar="N",
+        help="N개 프로세스가 SQLite 작업 큐를 나눠 처리 (중단 후 재실행 시 미완료 작품만)",
+    )
+    parser.add_argument(
+        "--refresh", action="store_true",
+        help="HTTP 응답 캐시(TTL)를 무시하고 외부 API를 다시 조회",
+    )
     args = parser.parse_args()
+    http_cache.set_refresh(args.refresh)
 
     if args.revise is not None:
         run_revise_mode(args.revise, args.instruction or "")
+    elif args.batch:
+        run_batch_mode()
+    elif args.workers > 1:
+        run_worker_mode(args.workers, refresh=args.refresh)
     else:
         main()
@@ -0,0 +1,351 @@
+"""
+http_cache.py — 외부 메타데이터 API 응답 디스크 캐시 (SQLite)
+
+대상: AniList GraphQL · TMDB · MAL · YouTube · Reddit 의 JSON 응답
+저장: teams/content/workspace/blog/data/http_cache.sqlite
+
+동작:
+  - 캐시 키 = provider + HTTP 메서드 + 정규화된 URL(쿼리 정렬, API 키 제외) + JSON 본문
+  - provider별 TTL 이내면 네트워크 없이 바로 반환
+  - TTL 만료 시 ETag / Last-Modified 가 있으면 조건부 요청 → 304면 본문 재사용
+  - 전체 크기가 HTTP_CACHE_MAX_MB 를 넘으면 가장 오래 안 쓴 항목부터 삭제 (LRU)
+  - set_refresh(True) (스크립트의 --refresh) 면 TTL 무시하고 항상 재조회
+  - 실제 네트워크 요청만 throttle.py 의 provider 한도를 소모
+  - 429 · 5xx · 연결 오류는 지터를 섞은 지수 백오프로 재시도 (Retry-After 우선)
+  - 재시도 후에도 실패하면 짧은 시간(HTTP_NEGATIVE_TTL) 동안 실패를 기억해 같은 요청을 다시 보내지 않음
+    (404 는 provider TTL 동안 기억)
+
+환경변수:
+  HTTP_CACHE_MAX_MB   캐시 최대 크기 (기본 200MB)
+  HTTP_CACHE_DISABLE  1 이면 캐시 없이 바로 요청
+  HTTP_RETRIES        일시적 오류 재시도 횟수 (기본 3)
+  HTTP_NEGATIVE_TTL   일시적 실패를 기억하는 시간 (기본 600초)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+import urllib.parse
+from email.utils import formatdate
+from pathlib import Path
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from throttle import throttled
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 경로 / 설정
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+SCRIPT_DIR   = Path(__file__).resolve().parent
+PROJECT_DIR  = SCRIPT_DIR.parent.parent
+DATA_DIR     = PROJECT_DIR / "teams" / "content" / "workspace" / "blog" / "data"
+CACHE_FILE   = DATA_DIR / "http_cache.sqlite"
+
+HOUR = 3600
+# provider별 신선도 유지 시간 (초)
+PROVIDER_TTL: dict[str, int] = {
+    "anilist": 6 * HOUR,        # 인기 순위·점수는 하루에도 변동
+    "tmdb":    7 * 24 * HOUR,   # 작품 메타데이터·이미지 목록은 거의 고정
+    "mal":     12 * HOUR,
+    "youtube": 3 * 24 * HOUR,   # 검색 쿼터 절약이 우선
+    "reddit":  12 * HOUR,
+}
+DEFAULT_TTL = 6 * HOUR
+
+MAX_BYTES = int(float(os.environ.get("HTTP_CACHE_MAX_MB", "200")) * 1024 * 1024)
+DISABLED  = os.environ.get("HTTP_CACHE_DISABLE", "").strip() == "1"
+
+RETRIES      = int(os.environ.get("HTTP_RETRIES", "3"))
+NEGATIVE_TTL = int(os.environ.get("HTTP_NEGATIVE_TTL", "600"))
+RETRY_STATUS = {429, 500, 502, 503, 504}
+RETRY_BASE_SEC = 0.5
+RETRY_MAX_SEC  = 30.0
+
+# 캐시 키에서 제외할 쿼리 파라미터 (API 키 등 비밀값)
+SECRET_PARAMS = {"api_key", "key", "client_id", "client_secret", "access_token"}
+
+_refresh = False
+
+
+def set_refresh(flag: bool = True) -> None:
+    """True 면 이후 요청은 TTL 을 무시하고 네트워크에서 재조회 (--refresh)."""
+    global _refresh
+    _refresh = flag
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 공유 HTTP 세션 (커넥션 재사용)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    global _session
+    with _session_lock:
+        if _session is None:
+            s = requests.Session()
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+            s.mount("https://", adapter)
+            s.mount("http://", adapter)
+            _session = s
+        return _session
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# SQLite 저장소 (스레드별 커넥션)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+_local = threading.local()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key           TEXT PRIMARY KEY,
+    provider      TEXT NOT NULL,
+    url           TEXT NOT NULL,
+    status        INTEGER NOT NULL,
+    body          BLOB NOT NULL,
+    etag          TEXT,
+    last_modified TEXT,
+    fetched_at    REAL NOT NULL,
+    expires_at    REAL NOT NULL,
+    last_access   REAL NOT NULL,
+    size          INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access);
+CREATE TABLE IF NOT EXISTS failures (
+    key         TEXT PRIMARY KEY,
+    provider    TEXT NOT NULL,
+    url         TEXT NOT NULL,
+    status      INTEGER NOT NULL,   -- 0 = 연결 오류 / 타임아웃
+    error       TEXT,
+    expires_at  REAL NOT NULL
+);
+"""
+
+
+def _db() -> sqlite3.Connection:
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(CACHE_FILE), timeout=30)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        _local.conn = conn
+    return conn
+
+
+def _normalize_url(url: str, params: dict | None) -> str:
+    parts = urllib.parse.urlsplit(url)
+    query = urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+    if params:
+        query += [(k, str(v)) for k, v in params.items() if v is not None]
+    query = sorted((k, v) for k, v in query if k not in SECRET_PARAMS)
+    return urllib.parse.urlunsplit((
+        parts.scheme, parts.netloc.lower(), parts.path,
+        urllib.parse.urlencode(query), "",
+    ))
+
+
+def cache_key(provider: str, method: str, url: str,
+              params: dict | None = None, json_body: Any = None) -> str:
+    raw = "\n".join([
+        provider,
+        method.upper(),
+        _normalize_url(url, params),
+        json.dumps(json_body, sort_keys=True, ensure_ascii=False) if json_body is not None else "",
+    ])
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _evict_if_needed(conn: sqlite3.Connection) -> None:
+    total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+    if total <= MAX_BYTES:
+        return
+    target = int(MAX_BYTES * 0.9)
+    for key, size in conn.execute(
+        "SELECT key, size FROM responses ORDER BY last_access ASC"
+    ).fetchall():
+        if total <= target:
+            break
+        conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+        total -= size
+    conn.commit()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 재시도 / 실패 기억 (negative cache)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _retry_wait(attempt: int, resp: requests.Response | None) -> float:
+    """Retry-After(초)가 있으면 그 값, 없으면 0.5→1→2…초에 ±50% 지터."""
+    retry_after = resp.headers.get("Retry-After") if resp is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), RETRY_MAX_SEC)
+        except ValueError:
+            pass
+    return min(RETRY_BASE_SEC * 2 ** attempt, RETRY_MAX_SEC) * random.uniform(0.5, 1.5)
+
+
+def _send(provider: str, method: str, url: str, **kwargs) -> requests.Response:
+    """throttle 을 거쳐 요청. 429 · 5xx · 연결 오류는 RETRIES 회까지 재시도."""
+    session = get_session()
+    for attempt in range(RETRIES + 1):
+        try:
+            with throttled(provider):
+                resp = session.request(method, url, **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt >= RETRIES:
+                raise
+            time.sleep(_retry_wait(attempt, None))
+            continue
+        if resp.status_code not in RETRY_STATUS or attempt >= RETRIES:
+            return resp
+        time.sleep(_retry_wait(attempt, resp))
+    return resp
+
+
+def _remember_failure(conn: sqlite3.Connection, key: str, provider: str, url: str,
+                      status: int, error: str, ttl: float) -> None:
+    conn.execute(
+        "INSERT OR REPLACE INTO failures (key, provider, url, status, error, expires_at) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (key, provider, url, status, error[:300], time.time() + ttl),
+    )
+    conn.commit()
+
+
+def _raise_remembered(row: tuple, url: str) -> None:
+    status, error = row
+    if status == 0:
+        raise requests.ConnectionError(f"{error} (최근 실패 기억 — 재요청 생략)")
+    resp = requests.Response()
+    resp.status_code = status
+    resp.url = url
+    raise requests.HTTPError(f"{status} {error} (최근 실패 기억 — 재요청 생략)", response=resp)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 공개 API
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def request_json(
+    provider: str,
+    method: str,
+    url: str,
+    *,
+    params: dict | None = None,
+    json_body: Any = None,
+    headers: dict | None = None,
+    timeout: float = 10,
+    ttl: int | None = None,
+) -> Any:
+    """
+    캐시를 거쳐 JSON 응답을 반환.
+    HTTP 오류는 requests.HTTPError 로 그대로 올려 보내므로 호출 측의 기존 예외 처리가 유지된다.
+    """
+    ttl = PROVIDER_TTL.get(provider, DEFAULT_TTL) if ttl is None else ttl
+
+    if DISABLED:
+        resp = _send(provider, method, url, params=params, json=json_body,
+                     headers=headers, timeout=timeout)
+        resp.raise_for_status()
+        return resp.json()
+
+    key = cache_key(provider, method, url, params, json_body)
+    conn = _db()
+    now = time.time()
+    row = conn.execute(
+        "SELECT body, etag, last_modified, expires_at, fetched_at FROM responses WHERE key = ?",
+        (key,),
+    ).fetchone()
+
+    if row and not _refresh and row[3] > now:
+        conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+        conn.commit()
+        return json.loads(row[0])
+
+    if not _refresh:
+        failed = conn.execute(
+            "SELECT status, error FROM failures WHERE key = ? AND expires_at > ?", (key, now),
+        ).fetchone()
+        if failed:
+            _raise_remembered(failed, url)
+
+    req_headers = dict(headers or {})
+    if row:
+        if row[1]:
+            req_headers["If-None-Match"] = row[1]
+        if row[2]:
+            req_headers["If-Modified-Since"] = row[2]
+        elif not row[1]:
+            req_headers["If-Modified-Since"] = formatdate(row[4], usegmt=True)
+
+    try:
+        resp = _send(provider, method, url, params=params, json=json_body,
+                     headers=req_headers, timeout=timeout)
+    except (requests.ConnectionError, requests.Timeout) as e:
+        _remember_failure(conn, key, provider, _normalize_url(url, params), 0,
+                          type(e).__name__, NEGATIVE_TTL)
+        raise
+
+    now = time.time()
+    if resp.status_code == 304 and row:
+        conn.execute(
+            "UPDATE responses SET expires_at = ?, last_access = ? WHERE key = ?",
+            (now + ttl, now, key),
+        )
+        conn.commit()
+        return json.loads(row[0])
+
+    if resp.status_code >= 400:
+        if resp.status_code in RETRY_STATUS or resp.status_code == 404:
+            _remember_failure(
+                conn, key, provider, _normalize_url(url, params), resp.status_code, resp.reason or "",
+                ttl if resp.status_code == 404 else NEGATIVE_TTL,
+            )
+        resp.raise_for_status()
+    conn.execute("DELETE FROM failures WHERE key = ?", (key,))
+    body = resp.content
+    data = resp.json()
+    conn.execute(
+        "INSERT OR REPLACE INTO responses "
+        "(key, provider, url, status, body, etag, last_modified, fetched_at, expires_at, last_access, size) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            key, provider, _normalize_url(url, params), resp.status_code, body,
+            resp.headers.get("ETag"), resp.headers.get("Last-Modified"),
+            now, now + ttl, now, len(body),
+        ),
+    )
+    conn.commit()
+    _evict_if_needed(conn)
+    return data
+
+
+def cache_stats() -> dict:
+    """provider별 항목 수 / 바이트 합계."""
+    conn = _db()
+    rows = conn.execute(
+        "SELECT provider, COUNT(*), COALESCE(SUM(size), 0) FROM responses GROUP BY provider"
+    ).fetchall()
+    return {p: {"entries": n, "bytes": b} for p, n, b in rows}
+
+
+if __name__ == "__main__":
+    import sys
+    if sys.argv[1:2] == ["clear"]:
+        CACHE_FILE.unlink(missing_ok=True)
+        print("✅ HTTP 캐시 삭제 완료")
+    else:
+        for p, st in sorted(cache_stats().items()):
+            print(f"{p:8s} {st['entries']:5d}개  {st['bytes'] / 1024:,.0f}KB")
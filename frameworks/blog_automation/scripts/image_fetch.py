@@ -0,0 +1,201 @@
+"""
+image_fetch.py — 블로그 이미지 병렬 다운로더
+
+동작:
+  - 공유 HTTP 세션(커넥션 풀)으로 여러 이미지를 동시에 다운로드
+  - 응답을 청크 단위로 임시 파일에 바로 기록 → 완료 시 os.replace 로 원자적 교체
+    (전체 파일을 메모리에 올리지 않음)
+  - IMAGES_DIR/.image_manifest.json 에 파일별 URL · ETag · Last-Modified · sha256 기록
+      · 같은 파일이 같은 URL로 이미 있고 재검증 주기(IMAGE_REVALIDATE_HOURS) 이내면 요청 생략
+      · 주기가 지나면 If-None-Match / If-Modified-Since 조건부 요청 → 304면 그대로 사용
+      · 다른 파일명으로 이미 받은 URL이면 네트워크 없이 로컬 복사
+      · 새로 받은 내용의 해시가 기존 파일과 같으면 파일을 건드리지 않음
+
+환경변수:
+  IMAGE_DOWNLOAD_WORKERS   동시 다운로드 수 (기본 6)
+  IMAGE_REVALIDATE_HOURS   재검증 주기 (기본 168시간 = 7일)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from pathlib import Path
+
+from http_cache import get_session
+from throttle import throttled
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 설정
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+DOWNLOAD_WORKERS  = int(os.environ.get("IMAGE_DOWNLOAD_WORKERS", "6"))
+REVALIDATE_SEC    = float(os.environ.get("IMAGE_REVALIDATE_HOURS", "168")) * 3600
+MANIFEST_NAME     = ".image_manifest.json"
+CHUNK_SIZE        = 64 * 1024
+
+_manifest_lock = threading.Lock()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 매니페스트 (파일명 → 메타데이터)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _manifest_path(images_dir: Path) -> Path:
+    return images_dir / MANIFEST_NAME
+
+
+def _load_manifest(images_dir: Path) -> dict:
+    path = _manifest_path(images_dir)
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+
+
+def _save_manifest(images_dir: Path, manifest: dict) -> None:
+    path = _manifest_path(images_dir)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp.replace(path)
+
+
+def _sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 단건 다운로드
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _fetch_one(url: str, save_path: Path, manifest: dict) -> tuple[bool, dict | None, str]:
+    """
+    url → save_path. 반환: (성공 여부, 갱신할 매니페스트 항목, 처리 결과 태그)
+    태그: fresh(요청 생략) / 304 / copy(로컬 복사) / same(내용 동일) / downloaded
+    """
+    name = save_path.name
+    entry = manifest.get(name)
+    now = time.time()
+
+    if entry and entry.get("url") == url and save_path.exists():
+        if now - entry.get("checked_at", 0) < REVALIDATE_SEC:
+            return True, None, "fresh"
+    elif save_path.exists() and not entry:
+        # 매니페스트 도입 이전에 받은 파일 — 해시만 기록하고 mtime 기준으로 재검증
+        entry = {
+            "url": url,
+            "sha256": _sha256_file(save_path),
+            "last_modified": formatdate(save_path.stat().st_mtime, usegmt=True),
+        }
+    else:
+        # 같은 URL을 다른 파일명으로 이미 받았으면 로컬 복사
+        for other_name, other in manifest.items():
+            other_path = save_path.parent / other_name
+            if other_name != name and other.get("url") == url and other_path.exists():
+                shutil.copy2(other_path, save_path)
+                return True, dict(other, checked_at=other.get("checked_at", now)), "copy"
+        entry = None
+
+    headers = {}
+    if entry and entry.get("url") == url and save_path.exists():
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    with throttled("image_cdn"):
+        resp = get_session().get(url, headers=headers, timeout=30, stream=True)
+    try:
+        if resp.status_code == 304 and save_path.exists():
+            return True, dict(entry, url=url, checked_at=now), "304"
+        resp.raise_for_status()
+
+        save_path.parent.mkdir(parents=True, exist_ok=True)
+        h = hashlib.sha256()
+        size = 0
+        fd, tmp_name = tempfile.mkstemp(dir=save_path.parent, prefix=f".{name}.", suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in resp.iter_content(CHUNK_SIZE):
+                    if chunk:
+                        f.write(chunk)
+                        h.update(chunk)
+                        size += len(chunk)
+            digest = h.hexdigest()
+            tag = "downloaded"
+            if save_path.exists() and entry and entry.get("sha256") == digest:
+                os.unlink(tmp_name)
+                tag = "same"
+            else:
+                os.replace(tmp_name, save_path)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+    finally:
+        resp.close()
+
+    return True, {
+        "url": url,
+        "etag": resp.headers.get("ETag"),
+        "last_modified": resp.headers.get("Last-Modified"),
+        "sha256": digest,
+        "size": size,
+        "checked_at": now,
+    }, tag
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 공개 API
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def download_images(jobs: dict[str, tuple[str, Path]]) -> dict[str, bool]:
+    """
+    jobs: {key: (url, save_path)} 를 병렬 다운로드.
+    반환: {key: 성공 여부}
+    같은 폴더의 매니페스트를 읽고, 모든 작업이 끝나면 한 번에 갱신한다.
+    """
+    if not jobs:
+        return {}
+    images_dir = next(iter(jobs.values()))[1].parent
+    images_dir.mkdir(parents=True, exist_ok=True)
+    with _manifest_lock:
+        manifest = _load_manifest(images_dir)
+
+    def run(item):
+        key, (url, path) = item
+        try:
+            ok, entry, _tag = _fetch_one(url, path, manifest)
+            return key, path.name, ok, entry
+        except Exception as e:
+            print(f"  ⚠️  이미지 다운로드 실패 ({url}): {e}")
+            return key, path.name, False, None
+
+    workers = max(1, min(DOWNLOAD_WORKERS, len(jobs)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="img") as pool:
+        results = list(pool.map(run, jobs.items()))
+
+    updates = {name: entry for _, name, ok, entry in results if ok and entry}
+    if updates:
+        with _manifest_lock:
+            current = _load_manifest(images_dir)
+            current.update(updates)
+            _save_manifest(images_dir, current)
+    return {key: ok for key, _, ok, _ in results}
+
+
+def download_image(url: str, save_path: Path) -> bool:
+    """이미지 1개 다운로드 (매니페스트·조건부 요청 동일 적용). 성공 시 True."""
+    return download_images({"_": (url, save_path)}).get("_", False)
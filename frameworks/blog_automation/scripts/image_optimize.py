@@ -0,0 +1,292 @@
+"""
+image_optimize.py — 블로그 이미지 최적화 (리사이즈 · 메타데이터 제거 · WebP/JPEG 변환 · 썸네일)
+
+collect_images() 로 받은 원본(TMDB w780 / AniList extraLarge)을 Tistory 업로드 전에 줄인다.
+  - 가로 IMAGE_MAX_WIDTH 이하로 축소 (원본이 더 작으면 그대로)
+  - EXIF 등 메타데이터 제거 (회전 정보는 먼저 픽셀에 반영)
+  - IMAGE_FORMAT 정책에 따라 webp / avif / jpeg / keep(원래 형식 유지) 로 인코딩
+  - {stem}_thumb 썸네일(IMAGE_THUMB_WIDTH) 함께 생성
+  - 원본 sha256 + 설정값 기준 캐시(.optimize_cache.json) → 재실행 시 인코딩 생략
+      · 인코딩 결과가 원본보다 크면 원본 유지도 캐시에 기록 (다시 인코딩하지 않음)
+      · 캐시 저장은 파일 락 안에서 다시 읽어 병합 (generate_post --workers 병렬 실행 대비)
+  - 인코딩은 ProcessPoolExecutor 로 CPU 코어 전부 사용 (daemon 프로세스 안에서는 자식을 못 만들므로 직접 인코딩)
+
+Pillow 가 없으면 원본 경로를 그대로 돌려준다 (pip install pillow).
+
+환경변수:
+  IMAGE_OPTIMIZE       0 이면 최적화 단계 생략 (기본 1)
+  IMAGE_FORMAT         webp | avif | jpeg | keep (기본 webp, avif 미지원 환경이면 webp)
+  IMAGE_QUALITY        인코딩 품질 (기본 82)
+  IMAGE_MAX_WIDTH      본문 이미지 최대 가로 (기본 1200)
+  IMAGE_THUMB_WIDTH    썸네일 가로 (기본 400)
+  IMAGE_OPT_WORKERS    프로세스 수 (기본 CPU 코어 수)
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    from PIL import Image, ImageOps, features
+except ImportError:
+    Image = ImageOps = features = None
+
+try:
+    import fcntl
+except ImportError:  # Windows — 락 없이 동작
+    fcntl = None
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 설정
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+ENABLED      = os.environ.get("IMAGE_OPTIMIZE", "1").strip() != "0"
+FORMAT       = os.environ.get("IMAGE_FORMAT", "webp").strip().lower()
+QUALITY      = int(os.environ.get("IMAGE_QUALITY", "82"))
+MAX_WIDTH    = int(os.environ.get("IMAGE_MAX_WIDTH", "1200"))
+THUMB_WIDTH  = int(os.environ.get("IMAGE_THUMB_WIDTH", "400"))
+WORKERS      = int(os.environ.get("IMAGE_OPT_WORKERS", "0")) or (os.cpu_count() or 2)
+
+CACHE_NAME   = ".optimize_cache.json"
+_EXT = {"webp": ".webp", "avif": ".avif", "jpeg": ".jpg"}
+_PIL_FORMAT = {".webp": "WEBP", ".avif": "AVIF", ".jpg": "JPEG", ".jpeg": "JPEG", ".png": "PNG", ".gif": "GIF"}
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+_warned = False
+
+
+def _effective_format() -> str:
+    """설정된 형식이 현재 Pillow 빌드에서 인코딩 가능한지 확인 후 실제 형식 반환."""
+    if FORMAT == "avif":
+        try:
+            if features.check("avif"):
+                return "avif"
+        except Exception:
+            pass
+        return "webp"
+    return FORMAT if FORMAT in ("webp", "jpeg", "keep") else "webp"
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=max(1, WORKERS))
+            atexit.register(_pool.shutdown, wait=False, cancel_futures=True)
+        return _pool
+
+
+def shutdown() -> None:
+    """
+    인코딩 풀 종료. multiprocessing 자식 프로세스(generate_post --workers)는 atexit 이 돌지 않고
+    종료 시 자식 프로세스를 join 하므로, 풀을 만든 워커는 끝나기 전에 반드시 호출해야 한다.
+    """
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 인코딩 (워커 프로세스에서 실행)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _save(img, path: Path, quality: int) -> None:
+    fmt = _PIL_FORMAT.get(path.suffix.lower(), "JPEG")
+    if fmt == "JPEG" and img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+    elif fmt in ("WEBP", "AVIF") and img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+    kwargs: dict = {}
+    if fmt == "JPEG":
+        kwargs = {"quality": quality, "optimize": True, "progressive": True}
+    elif fmt == "WEBP":
+        kwargs = {"quality": quality, "method": 5}
+    elif fmt == "AVIF":
+        kwargs = {"quality": quality}
+    elif fmt == "PNG":
+        kwargs = {"optimize": True}
+    tmp = path.with_name(f".{path.name}.part")
+    img.save(tmp, format=fmt, **kwargs)
+    os.replace(tmp, path)
+
+
+def _resized(img, width: int):
+    if img.width <= width:
+        return img.copy()
+    height = max(1, round(img.height * width / img.width))
+    return img.resize((width, height), Image.LANCZOS)
+
+
+def _optimize_one(src: str, out: str, thumb: str, max_width: int, thumb_width: int, quality: int) -> int:
+    """src → out(본문용) + thumb(썸네일). 반환: out 파일 크기."""
+    with Image.open(src) as im:
+        im = ImageOps.exif_transpose(im)
+        im.info.pop("exif", None)
+        im.info.pop("icc_profile", None)
+        _save(_resized(im, max_width), Path(out), quality)
+        _save(_resized(im, thumb_width), Path(thumb), quality)
+    return os.path.getsize(out)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 캐시
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _load_cache(images_dir: Path) -> dict:
+    path = images_dir / CACHE_NAME
+    try:
+        return json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    except Exception:
+        return {}
+
+
+@contextmanager
+def _cache_locked(images_dir: Path):
+    with open(images_dir / f"{CACHE_NAME}.lock", "a+") as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _save_cache(images_dir: Path, updates: dict) -> None:
+    """이번 실행에서 바뀐 항목만 락 안에서 최신 캐시 파일에 병합해 원자적으로 저장."""
+    path = images_dir / CACHE_NAME
+    with _cache_locked(images_dir):
+        cache = _load_cache(images_dir)
+        cache.update(updates)
+        tmp = path.with_name(f".{CACHE_NAME}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(cache, ensure_ascii=False, indent=2), encoding="utf-8")
+        tmp.replace(path)
+
+
+def _cache_key(src: Path, fmt: str) -> str:
+    h = hashlib.sha256()
+    with open(src, "rb") as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b""):
+            h.update(chunk)
+    h.update(f"|{fmt}|{QUALITY}|{MAX_WIDTH}|{THUMB_WIDTH}".encode())
+    return h.hexdigest()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 공개 API
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def optimize_post_images(image_paths: dict[str, str], images_dir: Path) -> tuple[dict[str, str], dict]:
+    """
+    collect_images() 결과({key: "../images/파일명"})를 최적화본 경로로 바꿔 반환.
+    반환: (새 image_paths, 리포트 {"src_bytes", "out_bytes", "saved_bytes", "encoded", "cached"})
+    실패한 이미지는 원본 경로를 유지한다.
+    """
+    global _warned
+    report = {"src_bytes": 0, "out_bytes": 0, "saved_bytes": 0, "encoded": 0, "cached": 0}
+    if not ENABLED or not image_paths:
+        return dict(image_paths), report
+    if Image is None:
+        if not _warned:
+            print("  ⚠️  Pillow 없음 — 이미지 최적화 생략 (pip install pillow)")
+            _warned = True
+        return dict(image_paths), report
+
+    fmt = _effective_format()
+    prefix = "../images/"
+    cache = _load_cache(images_dir)
+
+    # 같은 원본을 여러 key가 공유할 수 있으므로 파일 단위로 처리
+    sources = sorted({
+        rel[len(prefix):] for rel in image_paths.values()
+        if rel and rel.startswith(prefix) and (images_dir / rel[len(prefix):]).exists()
+    })
+    mapping: dict[str, str] = {}
+    updates: dict[str, dict] = {}
+    futures = {}
+    for name in sources:
+        src = images_dir / name
+        stem, ext = src.stem, src.suffix.lower()
+        out_ext = ext if fmt == "keep" else _EXT[fmt]
+        out = images_dir / f"{stem}_opt{out_ext}"
+        thumb = images_dir / f"{stem}_thumb{out_ext}"
+        key = _cache_key(src, fmt)
+        src_size = src.stat().st_size
+
+        entry = cache.get(name)
+        if entry and entry.get("key") == key and entry.get("keep"):
+            report["cached"] += 1
+            report["src_bytes"] += src_size
+            report["out_bytes"] += src_size
+            continue
+        if entry and entry.get("key") == key and out.exists() and thumb.exists():
+            mapping[name] = out.name
+            report["cached"] += 1
+            report["src_bytes"] += src_size
+            report["out_bytes"] += out.stat().st_size
+            continue
+
+        args = (str(src), str(out), str(thumb), MAX_WIDTH, THUMB_WIDTH, QUALITY)
+        if multiprocessing.current_process().daemon:
+            fut = Future()
+            try:
+                fut.set_result(_optimize_one(*args))
+            except Exception as e:
+                fut.set_exception(e)
+        else:
+            fut = _get_pool().submit(_optimize_one, *args)
+        futures[fut] = (name, out, thumb, key, src_size)
+
+    for fut, (name, out, thumb, key, src_size) in futures.items():
+        try:
+            out_size = fut.result()
+        except Exception as e:
+            print(f"  ⚠️  이미지 최적화 실패 ({name}): {e}")
+            continue
+        # 원본보다 커지면(이미 압축된 작은 이미지) 원본 유지 — 결과물은 지우고 캐시에 기록
+        if out_size >= src_size:
+            out.unlink(missing_ok=True)
+            thumb.unlink(missing_ok=True)
+            updates[name] = {"key": key, "keep": True, "src_bytes": src_size}
+            report["encoded"] += 1
+            report["src_bytes"] += src_size
+            report["out_bytes"] += src_size
+            continue
+        mapping[name] = out.name
+        updates[name] = {"key": key, "out": out.name, "thumb": thumb.name,
+                         "src_bytes": src_size, "out_bytes": out_size}
+        report["encoded"] += 1
+        report["src_bytes"] += src_size
+        report["out_bytes"] += out_size
+
+    if updates:
+        _save_cache(images_dir, updates)
+    report["saved_bytes"] = report["src_bytes"] - report["out_bytes"]
+
+    new_paths = {}
+    for k, rel in image_paths.items():
+        name = rel[len(prefix):] if rel and rel.startswith(prefix) else None
+        new_paths[k] = prefix + mapping[name] if name in mapping else rel
+    return new_paths, report
+
+
+def format_report(report: dict) -> str:
+    """예: '3.2MB → 0.9MB (-72%, 인코딩 4 · 캐시 1)'"""
+    src, out = report["src_bytes"], report["out_bytes"]
+    if not src:
+        return "최적화 대상 없음"
+    pct = round(100 * (src - out) / src)
+    return (
+        f"{src / 1048576:.1f}MB → {out / 1048576:.1f}MB (-{pct}%, "
+        f"인코딩 {report['encoded']} · 캐시 {report['cached']})"
+    )
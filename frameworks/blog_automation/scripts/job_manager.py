@@ -0,0 +1,250 @@
+"""
+job_manager.py — 텔레그램 봇용 스크립트 실행 관리 (asyncio 서브프로세스)
+
+content_team_bot.py · atlas_bot.py 가 fetch_anime / generate_post / post_to_tistory 를 돌릴 때
+기본 스레드풀에서 subprocess.run(timeout=300) 으로 끝날 때까지 막혀 있던 것을 대체한다.
+  - asyncio.create_subprocess_exec — 스레드를 점유하지 않음
+  - stdout/stderr 를 줄 단위로 읽어 작업별 링 버퍼(최근 JOB_RING_LINES 줄)에 저장 → 실행 중에도 tail 가능
+  - 작업마다 번호(#1, #2 …)와 상태: queued → running → done / failed / cancelled / timeout
+  - 스크립트별 동시 실행 수 제한 (초과분은 queued 로 대기)
+  - 작업은 매니저가 소유 → 요청한 핸들러가 끝나거나 취소돼도 계속 실행
+
+환경변수:
+  JOB_LIMITS         스크립트별 동시 실행 수 (예: "generate_post.py=1,fetch_anime.py=1")
+  JOB_LIMIT_DEFAULT  목록에 없는 스크립트의 동시 실행 수 (기본 2)
+  JOB_TIMEOUT_SEC    작업 최대 실행 시간, 0 이면 제한 없음 (기본 0)
+  JOB_RING_LINES     작업별로 보관할 출력 줄 수 (기본 500)
+  JOB_KEEP           끝난 작업 기록 보관 수 (기본 50)
+
+사용 예:
+    jobs = JobManager(SCRIPT_DIR, cwd=PROJECT_DIR)
+    job = jobs.submit("generate_post.py", ["--workers", "2"])
+    ok, out = await job.wait()
+    print(jobs.get(job.id).tail(20))
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import itertools
+import os
+import signal
+import sys
+import time
+from pathlib import Path
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 설정
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+DEFAULT_LIMITS = {"generate_post.py": 1, "post_to_tistory.py": 1, "fetch_anime.py": 1}
+LIMIT_DEFAULT  = int(os.environ.get("JOB_LIMIT_DEFAULT", "2"))
+TIMEOUT_SEC    = int(os.environ.get("JOB_TIMEOUT_SEC", "0"))
+RING_LINES     = int(os.environ.get("JOB_RING_LINES", "500"))
+JOB_KEEP       = int(os.environ.get("JOB_KEEP", "50"))
+KILL_GRACE_SEC = 5
+OUTPUT_CHARS   = 1500   # wait() 가 돌려주는 출력 길이 (예전 run_script 와 동일)
+STREAM_LIMIT   = 1024 * 1024   # 한 줄 최대 길이 (진행 표시줄 등 줄바꿈 없는 출력 대비)
+
+STATUS_QUEUED    = "queued"
+STATUS_RUNNING   = "running"
+STATUS_DONE      = "done"
+STATUS_FAILED    = "failed"
+STATUS_CANCELLED = "cancelled"
+STATUS_TIMEOUT   = "timeout"
+FINISHED = (STATUS_DONE, STATUS_FAILED, STATUS_CANCELLED, STATUS_TIMEOUT)
+
+STATUS_ICON = {
+    STATUS_QUEUED: "⏸", STATUS_RUNNING: "▶️", STATUS_DONE: "✅",
+    STATUS_FAILED: "❌", STATUS_CANCELLED: "🛑", STATUS_TIMEOUT: "⏱️",
+}
+
+
+def _parse_limits(raw: str) -> dict[str, int]:
+    limits = dict(DEFAULT_LIMITS)
+    for item in raw.split(","):
+        name, _, n = item.strip().partition("=")
+        if name and n.strip().isdigit():
+            limits[name] = max(1, int(n))
+    return limits
+
+
+class Job:
+    def __init__(self, job_id: int, script: str, args: list[str]):
+        self.id = job_id
+        self.script = script
+        self.args = args
+        self.status = STATUS_QUEUED
+        self.returncode: int | None = None
+        self.error = ""
+        self.created_at = time.time()
+        self.started_at: float | None = None
+        self.finished_at: float | None = None
+        self.lines: collections.deque[str] = collections.deque(maxlen=RING_LINES)
+        self._proc: asyncio.subprocess.Process | None = None
+        self._task: asyncio.Task | None = None
+        self._done = asyncio.Event()
+        self._cancel_requested = False
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED
+
+    @property
+    def ok(self) -> bool:
+        return self.status == STATUS_DONE
+
+    @property
+    def elapsed(self) -> float:
+        if not self.started_at:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    def tail(self, n: int = 20) -> str:
+        return "\n".join(list(self.lines)[-n:])
+
+    def output(self) -> str:
+        """예전 run_script 와 같은 형식의 출력 (끝부분 OUTPUT_CHARS 자 + 실패 사유)."""
+        out = "\n".join(self.lines).strip()
+        if len(out) > OUTPUT_CHARS:
+            out = out[-OUTPUT_CHARS:]
+        if self.status == STATUS_TIMEOUT:
+            out = f"⏱️ 실행 시간 초과 ({TIMEOUT_SEC}초)\n{out}"
+        elif self.status == STATUS_CANCELLED:
+            out = f"🛑 작업 #{self.id} 취소됨\n{out}"
+        elif self.error:
+            out = f"실행 오류: {self.error}\n{out}"
+        return out.strip()
+
+    async def wait(self) -> tuple[bool, str]:
+        """끝날 때까지 기다림 (작업 자체는 호출 측이 취소돼도 계속됨). 반환: (성공 여부, 출력)"""
+        await asyncio.shield(self._done.wait())
+        return self.ok, self.output()
+
+    def summary(self) -> str:
+        icon = STATUS_ICON.get(self.status, "•")
+        args = f" {' '.join(self.args)}" if self.args else ""
+        line = f"{icon} #{self.id} {self.script}{args} — {self.status}"
+        if self.started_at:
+            line += f" ({int(self.elapsed)}초)"
+        return line
+
+
+class JobManager:
+    def __init__(self, script_dir: Path, cwd: Path | None = None):
+        self.script_dir = Path(script_dir)
+        self.cwd = Path(cwd) if cwd else self.script_dir
+        self.limits = _parse_limits(os.environ.get("JOB_LIMITS", ""))
+        self._ids = itertools.count(1)
+        self._jobs: dict[int, Job] = {}
+        self._slots: dict[str, asyncio.Semaphore] = {}
+
+    # ── 조회 ──
+
+    def get(self, job_id: int) -> Job | None:
+        return self._jobs.get(job_id)
+
+    def list(self, active_only: bool = False) -> list[Job]:
+        jobs = list(self._jobs.values())
+        return [j for j in jobs if not j.finished] if active_only else jobs
+
+    # ── 실행 ──
+
+    def submit(self, script: str, args: list[str] | None = None) -> Job:
+        """작업 등록 후 바로 반환 (실행 중인 이벤트 루프 안에서 호출)."""
+        job = Job(next(self._ids), script, list(args or []))
+        self._jobs[job.id] = job
+        job._task = asyncio.get_running_loop().create_task(self._run(job), name=f"job-{job.id}")
+        self._prune()
+        return job
+
+    async def run(self, script: str, args: list[str] | None = None) -> tuple[bool, str]:
+        return await self.submit(script, args).wait()
+
+    async def cancel(self, job_id: int) -> bool:
+        """대기 중이면 바로 취소, 실행 중이면 SIGTERM → KILL_GRACE_SEC 후 SIGKILL."""
+        job = self._jobs.get(job_id)
+        if not job or job.finished:
+            return False
+        job._cancel_requested = True
+        if job._proc is None:
+            job._task.cancel()
+            return True
+        await self._terminate(job._proc)
+        return True
+
+    def _slot(self, script: str) -> asyncio.Semaphore:
+        sem = self._slots.get(script)
+        if sem is None:
+            sem = self._slots[script] = asyncio.Semaphore(self.limits.get(script, LIMIT_DEFAULT))
+        return sem
+
+    async def _run(self, job: Job) -> None:
+        path = self.script_dir / job.script
+        try:
+            if not path.exists():
+                job.status, job.error = STATUS_FAILED, f"스크립트 없음: {path}"
+                return
+            async with self._slot(job.script):
+                job.status = STATUS_RUNNING
+                job.started_at = time.time()
+                job._proc = await asyncio.create_subprocess_exec(
+                    sys.executable, "-u", str(path), *job.args,
+                    stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT,
+                    cwd=str(self.cwd), start_new_session=True, limit=STREAM_LIMIT,
+                )
+                try:
+                    await asyncio.wait_for(self._pump(job), TIMEOUT_SEC or None)
+                except asyncio.TimeoutError:
+                    await self._terminate(job._proc)
+                    job.status = STATUS_TIMEOUT
+                job.returncode = await job._proc.wait()
+                if job.status == STATUS_RUNNING:
+                    if job._cancel_requested:
+                        job.status = STATUS_CANCELLED
+                    else:
+                        job.status = STATUS_DONE if job.returncode == 0 else STATUS_FAILED
+        except asyncio.CancelledError:
+            job.status = STATUS_CANCELLED
+            if job._proc and job._proc.returncode is None:
+                await self._terminate(job._proc)
+        except Exception as e:
+            job.status, job.error = STATUS_FAILED, str(e)
+        finally:
+            job.finished_at = time.time()
+            job._done.set()
+
+    @staticmethod
+    async def _pump(job: Job) -> None:
+        """출력을 줄 단위로 링 버퍼에."""
+        stream = job._proc.stdout
+        while True:
+            try:
+                line = await stream.readline()
+            except ValueError:   # STREAM_LIMIT 초과 — 잘라서 한 줄로
+                line = await stream.read(STREAM_LIMIT)
+            if not line:
+                break
+            job.lines.append(line.decode("utf-8", "replace").rstrip("\n"))
+
+    @staticmethod
+    async def _terminate(proc: asyncio.subprocess.Process) -> None:
+        if proc.returncode is not None:
+            return
+        try:
+            os.killpg(proc.pid, signal.SIGTERM)   # 자식 프로세스(브라우저 등)까지
+        except (ProcessLookupError, AttributeError, PermissionError):
+            proc.terminate()
+        try:
+            await asyncio.wait_for(proc.wait(), KILL_GRACE_SEC)
+        except asyncio.TimeoutError:
+            try:
+                os.killpg(proc.pid, signal.SIGKILL)
+            except (ProcessLookupError, AttributeError, PermissionError):
+                proc.kill()
+            await proc.wait()
+
+    def _prune(self) -> None:
+        finished = [j for j in self._jobs.values() if j.finished]
+        for job in finished[:max(0, len(finished) - JOB_KEEP)]:
+            self._jobs.pop(job.id, None)
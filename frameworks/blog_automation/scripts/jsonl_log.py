@@ -0,0 +1,201 @@
+"""
+jsonl_log.py — 추가 전용 JSON Lines 로그 (세그먼트 분할 + 끝에서부터 읽기)
+
+shared_state.py 의 활동 로그 · 충돌 이력처럼 계속 쌓이기만 하는 기록용.
+  - append(): 한 줄을 O_APPEND 로 한 번에 기록 → 기존 내용을 읽거나 다시 쓰지 않음 (O(1))
+  - 세그먼트 파일 {prefix}-{YYYYmmdd-HHMMSS}.jsonl 이 max_bytes 를 넘거나 max_age 가 지나면 새 파일로 교체
+  - 닫힌 세그먼트 요약(첫/마지막 시각 · 건수 · 크기)을 {prefix}.index.json 에 기록 → 기간 조회 시 건너뛰기
+  - tail(n): 최신 세그먼트 끝에서부터 블록 단위로 거꾸로 읽어 최근 n건만 파싱
+  - 전체 이력은 지우지 않음 (분석용: iter_all)
+  - 여러 프로세스가 동시에 써도 교체 판단은 파일 락(fcntl) 안에서 한 번만
+
+사용 예:
+    log = SegmentedLog(CONTENT_DIR / "logs", "activity")
+    log.append({"at": "...", "actor": "claude_code", "status": "running"})
+    recent = log.tail(15)          # 오래된 → 최신 순
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows — 락 없이 동작
+    fcntl = None
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 설정
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+DEFAULT_MAX_BYTES = int(float(os.environ.get("LOG_SEGMENT_MB", "5")) * 1024 * 1024)
+DEFAULT_MAX_AGE   = int(float(os.environ.get("LOG_ROTATE_HOURS", "24")) * 3600)
+TAIL_BLOCK = 8192
+_STAMP = "%Y%m%d-%H%M%S"
+
+
+class SegmentedLog:
+    def __init__(self, directory: Path, prefix: str,
+                 max_bytes: int = DEFAULT_MAX_BYTES, max_age: int = DEFAULT_MAX_AGE):
+        self.dir = Path(directory)
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.index_file = self.dir / f"{prefix}.index.json"
+        self._lock_file = self.dir / f".{prefix}.lock"
+
+    # ── 세그먼트 ──
+
+    def segments(self) -> list[Path]:
+        """오래된 → 최신 순 (파일명의 시각 기준)."""
+        if not self.dir.exists():
+            return []
+        return sorted(self.dir.glob(f"{self.prefix}-*.jsonl"))
+
+    def _started_at(self, path: Path) -> float:
+        stamp = path.stem[len(self.prefix) + 1:].split("_")[0]
+        try:
+            return datetime.strptime(stamp, _STAMP).timestamp()
+        except ValueError:
+            return path.stat().st_mtime
+
+    def _new_segment(self, now: float) -> Path:
+        name = f"{self.prefix}-{datetime.fromtimestamp(now).strftime(_STAMP)}"
+        path = self.dir / f"{name}.jsonl"
+        n = 1
+        while path.exists():   # 같은 초에 두 번 교체된 경우
+            path = self.dir / f"{name}_{n:03d}.jsonl"
+            n += 1
+        path.touch()
+        return path
+
+    @contextmanager
+    def _locked(self):
+        self.dir.mkdir(parents=True, exist_ok=True)
+        with open(self._lock_file, "a+") as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _current(self, now: float) -> Path:
+        segs = self.segments()
+        if segs:
+            cur = segs[-1]
+            size = cur.stat().st_size
+            if size < self.max_bytes and (size == 0 or now - self._started_at(cur) < self.max_age):
+                return cur
+            self._close_segment(cur)
+        return self._new_segment(now)
+
+    # ── 쓰기 ──
+
+    def append(self, entry: dict) -> None:
+        line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+        with self._locked():
+            path = self._current(time.time())
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+
+    # ── 인덱스 ──
+
+    def _load_index(self) -> list[dict]:
+        try:
+            return json.loads(self.index_file.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+
+    def _close_segment(self, path: Path) -> None:
+        """교체되는 세그먼트 요약을 인덱스에 추가 (세그먼트당 1회)."""
+        index = self._load_index()
+        if any(e["name"] == path.name for e in index):
+            return
+        first = last = None
+        count = 0
+        with open(path, "rb") as f:
+            for raw in f:
+                count += 1
+                if first is None:
+                    first = _entry_time(raw)
+                last = raw
+        index.append({
+            "name": path.name,
+            "first_at": first,
+            "last_at": _entry_time(last) if last else None,
+            "count": count,
+            "bytes": path.stat().st_size,
+        })
+        tmp = self.index_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(index, ensure_ascii=False, indent=2), encoding="utf-8")
+        tmp.replace(self.index_file)
+
+    # ── 읽기 ──
+
+    def tail(self, n: int) -> list[dict]:
+        """최근 n건 (오래된 → 최신 순). 최신 세그먼트 끝에서부터 필요한 만큼만 읽는다."""
+        out: list[dict] = []
+        for path in reversed(self.segments()):
+            for raw in _reverse_lines(path):
+                try:
+                    out.append(json.loads(raw))
+                except json.JSONDecodeError:
+                    continue
+                if len(out) >= n:
+                    return out[::-1]
+        return out[::-1]
+
+    def iter_all(self, since: str | None = None) -> Iterator[dict]:
+        """전체 이력 (오래된 → 최신). since('YYYY-MM-DD ...') 이전에 끝난 닫힌 세그먼트는 건너뜀."""
+        closed = {e["name"]: e for e in self._load_index()}
+        for path in self.segments():
+            meta = closed.get(path.name)
+            if since and meta and meta.get("last_at") and meta["last_at"] < since:
+                continue
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if since and (entry.get("at") or entry.get("detected_at") or "") < since:
+                        continue
+                    yield entry
+
+
+def _entry_time(raw: bytes) -> str | None:
+    try:
+        entry = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return entry.get("at") or entry.get("detected_at")
+
+
+def _reverse_lines(path: Path) -> Iterator[bytes]:
+    """파일 끝에서부터 한 줄씩 (블록 단위 역방향 읽기)."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        rest = b""
+        while pos > 0:
+            step = min(TAIL_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            chunk = f.read(step) + rest
+            lines = chunk.split(b"\n")
+            rest = lines.pop(0)
+            for line in reversed(lines):
+                if line.strip():
+                    yield line
+        if rest.strip():
+            yield rest
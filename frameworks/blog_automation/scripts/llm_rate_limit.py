@@ -0,0 +1,277 @@
+"""
+llm_rate_limit.py — Anthropic API 키별 Rate Limit 관리 (프로세스 간 공유)
+
+고정 대기(INTER_POST_DELAY, 60→480초 백오프) 대신 서버가 알려주는 실제 한도로 다음 호출 시점을 계산한다.
+  - 응답 헤더 anthropic-ratelimit-{requests,tokens,input-tokens,output-tokens}-{limit,remaining,reset}
+    를 읽어 요청 수 / 토큰 예산을 기록
+  - 429·529 응답의 retry-after 를 그대로 따름 (헤더가 없을 때만 지수 백오프)
+  - 예산은 reset 시각까지 선형으로 다시 찬다고 보고, 필요한 만큼 찰 때까지만 대기
+  - 상태는 teams/content/workspace/llm_ratelimit.json (파일 락)에 저장되어
+    generate_post.py · content_team_bot · atlas_bot 이 같은 키의 예산을 함께 사용
+  - API 키는 sha256 앞 16자리로만 구분 (원문 저장 안 함)
+
+사용 예:
+    limiter = get_limiter(api_key)
+    limiter.acquire(est_input_tokens=3000, est_output_tokens=8192)
+    raw = client.messages.with_raw_response.create(...)
+    limiter.record_headers(raw.headers)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator
+
+try:
+    import fcntl
+except ImportError:  # Windows — 락 없이 동작
+    fcntl = None
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 경로 / 설정
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+SCRIPT_DIR   = Path(__file__).resolve().parent
+PROJECT_DIR  = SCRIPT_DIR.parent.parent
+CONTENT_DIR  = PROJECT_DIR / "teams" / "content" / "workspace"
+LEDGER_FILE  = Path(os.environ.get("LLM_RATELIMIT_LEDGER", str(CONTENT_DIR / "llm_ratelimit.json")))
+
+# retry-after 헤더가 없는 429 에 대한 백오프 (초)
+FALLBACK_BASE_WAIT = int(os.environ.get("LLM_RETRY_BASE_WAIT", "60"))
+FALLBACK_MAX_WAIT  = 480
+# 한 번에 잠드는 최대 시간 — 다른 프로세스가 갱신한 장부를 다시 읽기 위함
+POLL_SEC = 15.0
+# 회복 속도를 알 수 없을 때(가득 찬 예산에서 차감) 가정하는 전체 회복 시간 — Anthropic 한도는 분 단위
+REFILL_WINDOW_SEC = 60.0
+
+BUDGETS = ("requests", "tokens", "input-tokens", "output-tokens")
+
+
+class RateLimitTimeout(RuntimeError):
+    """acquire(max_wait=...) 한도보다 오래 기다려야 할 때."""
+
+    def __init__(self, wait_sec: float):
+        super().__init__(f"LLM rate limit — 약 {wait_sec:.0f}초 후 재시도 필요")
+        self.wait_sec = wait_sec
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 장부 파일 (락 + 원자적 저장)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+@contextmanager
+def _ledger() -> Iterator[dict]:
+    """장부를 락을 잡은 채로 읽고, 블록이 끝나면 저장."""
+    LEDGER_FILE.parent.mkdir(parents=True, exist_ok=True)
+    lock_path = LEDGER_FILE.with_suffix(".lock")
+    with open(lock_path, "a+") as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            try:
+                data = json.loads(LEDGER_FILE.read_text(encoding="utf-8"))
+            except (FileNotFoundError, json.JSONDecodeError):
+                data = {}
+            yield data
+            tmp = LEDGER_FILE.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+            tmp.replace(LEDGER_FILE)
+        finally:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _parse_reset(value: str | None, now: float) -> float | None:
+    """reset 헤더(RFC 3339) → epoch 초."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        try:
+            return now + float(value)
+        except ValueError:
+            return None
+
+
+def _available(b: dict, now: float) -> tuple[float, float]:
+    """
+    (현재 남은 예산 추정치, 초당 회복량). reset 시각까지 limit 으로 선형 회복한다고 가정.
+    reset 이 없거나 지났으면 REFILL_WINDOW_SEC 동안 전부 회복되는 속도로 본다.
+    """
+    limit, remaining = b["limit"], b["remaining"]
+    observed, reset = b["observed_at"], b.get("reset") or 0.0
+    if remaining >= limit:
+        return limit, 0.0
+    if reset > observed:
+        rate = (limit - remaining) / (reset - observed)
+    else:
+        rate = limit / REFILL_WINDOW_SEC
+    return min(limit, remaining + rate * max(0.0, now - observed)), rate
+
+
+def _bucket_wait(b: dict | None, need: float, now: float) -> float:
+    if not b or need <= 0:
+        return 0.0
+    need = min(need, b["limit"])
+    current, rate = _available(b, now)
+    if current >= need:
+        return 0.0
+    return (need - current) / rate if rate > 0 else max(0.0, (b.get("reset") or now) - now)
+
+
+def _bucket_take(b: dict | None, amount: float, now: float) -> None:
+    """다른 프로세스가 보도록 예산을 미리 차감 (실제 값은 다음 응답 헤더로 교정)."""
+    if not b or amount <= 0:
+        return
+    current, rate = _available(b, now)
+    if rate <= 0:   # 가득 찬 예산 — 관측된 회복 속도가 없으므로 창 기준으로 회복
+        rate = b["limit"] / REFILL_WINDOW_SEC
+    b["remaining"] = max(0.0, current - min(amount, b["limit"]))
+    b["observed_at"] = now
+    b["reset"] = now + (b["limit"] - b["remaining"]) / rate
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Rate Limiter
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class LLMRateLimiter:
+    def __init__(self, api_key: str):
+        self.key = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16]
+
+    def _entry(self, data: dict) -> dict:
+        return data.setdefault(self.key, {"budgets": {}, "blocked_until": 0.0, "strikes": 0})
+
+    def _wait_for(self, entry: dict, need: dict[str, float], now: float) -> float:
+        wait = max(0.0, entry.get("blocked_until", 0.0) - now)
+        budgets = entry.get("budgets", {})
+        for name, amount in need.items():
+            wait = max(wait, _bucket_wait(budgets.get(name), amount, now))
+        return wait
+
+    def acquire(
+        self,
+        est_input_tokens: int = 0,
+        est_output_tokens: int = 0,
+        max_wait: float | None = None,
+        on_wait: Callable[[float], None] | None = None,
+    ) -> float:
+        """
+        요청 1건을 보낼 수 있는 가장 이른 시점까지 대기 후 예산 차감.
+        반환: 실제 대기한 초. max_wait 초과 예상 시 RateLimitTimeout.
+        on_wait(wait_sec) 은 5초 이상 기다려야 할 때 처음 한 번 호출.
+        """
+        need = {
+            "requests": 1,
+            "input-tokens": est_input_tokens,
+            "output-tokens": est_output_tokens,
+            "tokens": est_input_tokens + est_output_tokens,
+        }
+        waited = 0.0
+        notified = False
+        while True:
+            with _ledger() as data:
+                entry = self._entry(data)
+                now = time.time()
+                wait = self._wait_for(entry, need, now)
+                if wait <= 0:
+                    for name, amount in need.items():
+                        _bucket_take(entry["budgets"].get(name), amount, now)
+                    entry["last_request_at"] = now
+                    return waited
+            if max_wait is not None and waited + wait > max_wait:
+                raise RateLimitTimeout(wait)
+            if on_wait and not notified and wait >= 5:
+                on_wait(wait)
+                notified = True
+            step = min(wait, POLL_SEC)
+            time.sleep(step)
+            waited += step
+
+    def record_headers(self, headers) -> None:
+        """응답 헤더에서 한도 정보를 읽어 장부 갱신 (성공 응답이면 백오프 단계 초기화)."""
+        if headers is None:
+            return
+        now = time.time()
+        with _ledger() as data:
+            entry = self._entry(data)
+            for name in BUDGETS:
+                limit = headers.get(f"anthropic-ratelimit-{name}-limit")
+                remaining = headers.get(f"anthropic-ratelimit-{name}-remaining")
+                if limit is None or remaining is None:
+                    continue
+                try:
+                    entry["budgets"][name] = {
+                        "limit": float(limit),
+                        "remaining": float(remaining),
+                        "reset": _parse_reset(headers.get(f"anthropic-ratelimit-{name}-reset"), now),
+                        "observed_at": now,
+                    }
+                except ValueError:
+                    continue
+            retry_after = headers.get("retry-after")
+            if retry_after:
+                try:
+                    entry["blocked_until"] = max(entry.get("blocked_until", 0.0), now + float(retry_after))
+                except ValueError:
+                    pass
+
+    def record_success(self, headers=None) -> None:
+        self.record_headers(headers)
+        with _ledger() as data:
+            self._entry(data)["strikes"] = 0
+
+    def record_rate_limited(self, error: Exception) -> float:
+        """
+        429/529 예외 처리. retry-after 가 있으면 그 값, 없으면 60→120→240→480초 백오프.
+        반환: 다음 요청까지 남은 대기 시간(초).
+        """
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        self.record_headers(headers)
+        now = time.time()
+        with _ledger() as data:
+            entry = self._entry(data)
+            entry["strikes"] = entry.get("strikes", 0) + 1
+            if not (headers and headers.get("retry-after")):
+                backoff = min(FALLBACK_BASE_WAIT * 2 ** (entry["strikes"] - 1), FALLBACK_MAX_WAIT)
+                entry["blocked_until"] = max(entry.get("blocked_until", 0.0), now + backoff)
+            return max(0.0, entry.get("blocked_until", 0.0) - now)
+
+    def status(self) -> dict:
+        """현재 추정 예산 (디버그·상태 표시용)."""
+        now = time.time()
+        with _ledger() as data:
+            entry = self._entry(data)
+            out = {name: round(_available(b, now)[0]) for name, b in entry["budgets"].items()}
+            out["blocked_for"] = round(max(0.0, entry.get("blocked_until", 0.0) - now), 1)
+            return out
+
+
+_limiters: dict[str, LLMRateLimiter] = {}
+
+
+def get_limiter(api_key: str) -> LLMRateLimiter:
+    lim = _limiters.get(api_key)
+    if lim is None:
+        lim = _limiters[api_key] = LLMRateLimiter(api_key)
+    return lim
+
+
+def estimate_tokens(text: str) -> int:
+    """한국어 위주 프롬프트의 대략 토큰 수 (예산 예약용)."""
+    return max(1, int(len(text) / 1.6))
+
+
+if __name__ == "__main__":
+    key = os.environ.get("ANTHROPIC_API_KEY", "")
+    if not key:
+        print("ANTHROPIC_API_KEY 없음")
+    else:
+        print(json.dumps(get_limiter(key).status(), ensure_ascii=False, indent=2))
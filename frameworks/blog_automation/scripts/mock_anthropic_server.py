@@ -0,0 +1,236 @@
+"""
+mock_anthropic_server.py — 로컬 테스트용 Anthropic API 모의 서버 (표준 라이브러리만 사용)
+
+generate_post.py 의 --batch / 일반 생성 흐름을 실제 API 비용 없이 확인할 때 사용.
+  POST /v1/messages                       → 고정 마크다운 응답 (stream=true 는 SSE)
+  POST /v1/messages/batches               → 배치 생성 (MOCK_BATCH_SECONDS 후 ended)
+  GET  /v1/messages/batches/{id}          → 배치 상태
+  GET  /v1/messages/batches/{id}/results  → 결과 JSONL
+
+사용 예:
+    python mock_anthropic_server.py --port 8787
+    ANTHROPIC_BASE_URL=http://127.0.0.1:8787 ANTHROPIC_API_KEY=test python generate_post.py --batch
+
+환경변수:
+  MOCK_BATCH_SECONDS  배치가 ended 상태가 되기까지 걸리는 시간 (기본 5초)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+BATCH_SECONDS = float(os.environ.get("MOCK_BATCH_SECONDS", "5"))
+
+_batches: dict[str, dict] = {}
+_cached_prefixes: set[str] = set()
+_lock = threading.Lock()
+
+
+def _iso(ts: float) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _fake_text(params: dict) -> str:
+    """프롬프트에서 제목 줄을 찾아 그럴듯한 마크다운 초안 생성."""
+    messages = params.get("messages") or []
+    prompt = ""
+    if messages:
+        content = messages[0].get("content")
+        if isinstance(content, list):
+            prompt = "".join(b.get("text", "") for b in content if isinstance(b, dict))
+        else:
+            prompt = content or ""
+    m = re.search(r"^# (.+)$", prompt, re.MULTILINE)
+    title = m.group(1).strip() if m else "모의 응답"
+    return (
+        f"# {title}\n\n"
+        f"## 📺 작품 기본 정보\n- 모의 서버가 생성한 본문입니다.\n\n"
+        f"## ⭐ 총평\n⭐⭐⭐⭐☆ 4/5\n\n#모의응답 #테스트"
+    )
+
+
+def _cache_usage(params: dict) -> tuple[int, int]:
+    """cache_control 이 붙은 system 블록까지를 접두부로 보고 (생성, 적중) 토큰 수 흉내."""
+    system = params.get("system")
+    if not isinstance(system, list):
+        return 0, 0
+    prefix = []
+    for block in system:
+        prefix.append(block.get("text", ""))
+        if block.get("cache_control"):
+            key = "\x00".join(prefix)
+            tokens = len(key) // 2
+            with _lock:
+                if key in _cached_prefixes:
+                    return 0, tokens
+                _cached_prefixes.add(key)
+            return tokens, 0
+    return 0, 0
+
+
+def _message(params: dict) -> dict:
+    text = _fake_text(params)
+    created, read = _cache_usage(params)
+    return {
+        "id": f"msg_{uuid.uuid4().hex[:24]}",
+        "type": "message",
+        "role": "assistant",
+        "model": params.get("model", "mock"),
+        "content": [{"type": "text", "text": text}],
+        "stop_reason": "end_turn",
+        "stop_sequence": None,
+        "usage": {"input_tokens": 1000, "output_tokens": len(text) // 2,
+                  "cache_creation_input_tokens": created, "cache_read_input_tokens": read},
+    }
+
+
+def _batch_view(b: dict, base_url: str) -> dict:
+    now = time.time()
+    ended = now - b["created"] >= BATCH_SECONDS
+    n = len(b["requests"])
+    return {
+        "id": b["id"],
+        "type": "message_batch",
+        "processing_status": "ended" if ended else "in_progress",
+        "request_counts": {
+            "processing": 0 if ended else n,
+            "succeeded": n if ended else 0,
+            "errored": 0, "canceled": 0, "expired": 0,
+        },
+        "created_at": _iso(b["created"]),
+        "expires_at": _iso(b["created"] + 86400),
+        "ended_at": _iso(b["created"] + BATCH_SECONDS) if ended else None,
+        "archived_at": None,
+        "cancel_initiated_at": None,
+        "results_url": f"{base_url}/v1/messages/batches/{b['id']}/results" if ended else None,
+    }
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def _base_url(self) -> str:
+        return f"http://{self.headers.get('Host', '127.0.0.1')}"
+
+    def _json(self, code: int, obj, headers: dict | None = None) -> None:
+        body = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+        self.send_response(code)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("request-id", f"req_{uuid.uuid4().hex[:12]}")
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def _ratelimit_headers(self) -> dict:
+        reset = _iso(time.time() + 60)
+        return {
+            "anthropic-ratelimit-requests-limit": "50",
+            "anthropic-ratelimit-requests-remaining": "49",
+            "anthropic-ratelimit-requests-reset": reset,
+            "anthropic-ratelimit-output-tokens-limit": "80000",
+            "anthropic-ratelimit-output-tokens-remaining": "79000",
+            "anthropic-ratelimit-output-tokens-reset": reset,
+        }
+
+    def do_POST(self) -> None:
+        path = self.path.split("?")[0]
+        body = self._read_body()
+        if path == "/v1/messages/batches":
+            bid = f"msgbatch_{uuid.uuid4().hex[:20]}"
+            with _lock:
+                _batches[bid] = {"id": bid, "created": time.time(), "requests": body.get("requests", [])}
+                view = _batch_view(_batches[bid], self._base_url())
+            self._json(200, view)
+        elif path == "/v1/messages":
+            msg = _message(body)
+            if body.get("stream"):
+                self._stream(msg)
+            else:
+                self._json(200, msg, self._ratelimit_headers())
+        else:
+            self._json(404, {"type": "error", "error": {"type": "not_found_error", "message": path}})
+
+    def _stream(self, msg: dict) -> None:
+        text = msg["content"][0]["text"]
+        start = dict(msg, content=[], stop_reason=None)
+        events = [
+            ("message_start", {"type": "message_start", "message": start}),
+            ("content_block_start", {"type": "content_block_start", "index": 0,
+                                     "content_block": {"type": "text", "text": ""}}),
+        ]
+        for i in range(0, len(text), 40):
+            events.append(("content_block_delta", {"type": "content_block_delta", "index": 0,
+                                                   "delta": {"type": "text_delta", "text": text[i:i + 40]}}))
+        events += [
+            ("content_block_stop", {"type": "content_block_stop", "index": 0}),
+            ("message_delta", {"type": "message_delta",
+                               "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                               "usage": {"output_tokens": msg["usage"]["output_tokens"]}}),
+            ("message_stop", {"type": "message_stop"}),
+        ]
+        payload = "".join(
+            f"event: {name}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n" for name, data in events
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Content-Length", str(len(payload)))
+        for k, v in self._ratelimit_headers().items():
+            self.send_header(k, v)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+        path = self.path.split("?")[0]
+        m = re.fullmatch(r"/v1/messages/batches/([\w-]+)(/results)?", path)
+        with _lock:
+            b = _batches.get(m.group(1)) if m else None
+        if not b:
+            self._json(404, {"type": "error", "error": {"type": "not_found_error", "message": path}})
+            return
+        if not m.group(2):
+            self._json(200, _batch_view(b, self._base_url()))
+            return
+        lines = [
+            json.dumps({"custom_id": r["custom_id"],
+                        "result": {"type": "succeeded", "message": _message(r.get("params", {}))}},
+                       ensure_ascii=False)
+            for r in b["requests"]
+        ]
+        body = ("\n".join(lines) + "\n").encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/binary")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, fmt, *args) -> None:
+        print(f"[mock] {self.command} {self.path} → {args[1] if len(args) > 1 else ''}")
+
+
+def serve(port: int = 8787) -> ThreadingHTTPServer:
+    """백그라운드 스레드에서 서버 시작 후 반환 (스크립트 내 확인용)."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로컬 Anthropic API 모의 서버")
+    parser.add_argument("--port", type=int, default=8787)
+    args = parser.parse_args()
+    print(f"🧪 mock Anthropic API: http://127.0.0.1:{args.port}  (Ctrl+C 종료)")
+    ThreadingHTTPServer(("127.0.0.1", args.port), Handler).serve_forever()
@@ -0,0 +1,175 @@
+"""
+path_claims.py — 작업 대상 경로(클레임) 겹침 검사용 경로 트라이
+
+shared_state._detect_conflicts 가 쓴다. 도구가 등록한 target_files 는 파일 · 디렉터리 · glob 이 섞여 있어
+문자열 집합 교집합으로는 "drafts/ 전체" 와 "drafts/a.md" 같은 포함 관계를 못 잡는다.
+
+  - normalize(): ~ 확장 · 절대 경로화 · 정규화 (끝의 / 제거) — 같은 경로는 항상 같은 문자열
+  - 클레임은 경로 구성요소 단위 트라이에 저장. glob 은 첫 와일드카드 앞까지(정적 접두사)를 키로,
+    나머지 패턴을 노드에 함께 저장
+  - 겹침 조회: 질의 경로를 따라 내려가며
+      · 지나가는 조상 노드의 클레임 → 질의 경로를 포함 (디렉터리 클레임)
+      · 도착 노드 아래의 클레임     → 질의 경로에 포함 (질의가 디렉터리)
+    노드마다 소유자별 하위 클레임 수를 유지해 "누가 이 아래를 잡고 있나" 는 경로 깊이만큼만 걸린다.
+    하위 클레임 탐색은 per_owner 개를 찾은 소유자의 가지 · glob 다음 구성요소와 안 맞는 가지를 잘라내,
+    디렉터리 질의도 하위 클레임 전체를 훑지 않고 (깊이 × per_owner) 정도에서 멈춘다.
+
+사용 예:
+    trie = ClaimTrie()
+    trie.add("cursor_ai", "/repo/blog/drafts")
+    trie.overlaps("/repo/blog/drafts/a.md", exclude="claude_code")
+    → [("cursor_ai", "/repo/blog/drafts", "/repo/blog/drafts/a.md")]
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import os
+from collections import Counter
+
+_GLOB_CHARS = set("*?[")
+
+
+def normalize(path: str) -> str:
+    """~ 확장 + 절대 경로 + 정규화. glob 문자는 그대로 둔다."""
+    path = os.path.expanduser(str(path).strip())
+    return os.path.normpath(os.path.abspath(path))
+
+
+def _is_glob(part: str) -> bool:
+    return any(ch in _GLOB_CHARS for ch in part)
+
+
+def _split(path: str) -> tuple[list[str], list[str]]:
+    """정규화된 경로 → (정적 구성요소, glob 구성요소). glob 이 아니면 두 번째는 빈 리스트."""
+    parts = [p for p in path.split(os.sep) if p]
+    for i, part in enumerate(parts):
+        if _is_glob(part):
+            return parts[:i], parts[i:]
+    return parts, []
+
+
+def _pattern_overlaps(pattern: list[str], parts: list[str]) -> bool:
+    """
+    glob 구성요소 pattern 과 경로 구성요소 parts 가 겹칠 수 있는지 (둘 다 같은 노드 기준 상대 경로).
+    짧은 쪽이 긴 쪽의 조상일 수 있으면 겹침으로 본다 (디렉터리 포함). '**' 이후는 무엇이든 일치.
+    """
+    for i, pat in enumerate(pattern):
+        if pat == "**":
+            return True
+        if i >= len(parts):
+            return True          # parts 가 pattern 일치 경로들의 조상 디렉터리
+        if not fnmatch.fnmatchcase(parts[i], pat):
+            return False
+    return True                  # pattern 이 parts 의 조상 디렉터리와 일치
+
+
+def _globs_overlap(a: list[str], b: list[str]) -> bool:
+    """두 glob 구성요소가 같은 경로와 일치할 수 있는지 (보수적 판단)."""
+    for pa, pb in zip(a, b):
+        if pa == "**" or pb == "**":
+            return True
+        if _is_glob(pa) and _is_glob(pb):
+            continue             # 와일드카드끼리는 겹칠 수 있다고 봄
+        if _is_glob(pa):
+            if not fnmatch.fnmatchcase(pb, pa):
+                return False
+        elif _is_glob(pb):
+            if not fnmatch.fnmatchcase(pa, pb):
+                return False
+        elif pa != pb:
+            return False
+    return True
+
+
+def _component_may_match(pattern: list[str], depth: int, part: str) -> bool:
+    """질의 glob 의 depth 번째 구성요소가 정적 구성요소 part 와 맞을 수 있는지 (가지치기용)."""
+    if "**" in pattern[:depth + 1] or depth >= len(pattern):
+        return True
+    return fnmatch.fnmatchcase(part, pattern[depth])
+
+
+class _Node:
+    __slots__ = ("children", "claims", "owners")
+
+    def __init__(self):
+        self.children: dict[str, _Node] = {}
+        self.claims: list[tuple[str, str, list[str]]] = []   # (소유자, 정규화된 클레임, glob 나머지)
+        self.owners: Counter = Counter()                     # 이 노드 아래(자신 포함) 소유자별 클레임 수
+
+
+class ClaimTrie:
+    def __init__(self):
+        self._root = _Node()
+
+    def add(self, owner: str, claim: str) -> None:
+        path = normalize(claim)
+        static, pattern = _split(path)
+        node = self._root
+        node.owners[owner] += 1
+        for part in static:
+            node = node.children.setdefault(part, _Node())
+            node.owners[owner] += 1
+        node.claims.append((owner, path, pattern))
+
+    def overlaps(self, claim: str, exclude: str | None = None,
+                 per_owner: int | None = None) -> list[tuple[str, str, str]]:
+        """
+        claim 과 겹치는 기존 클레임. 반환: [(소유자, 기존 클레임, 질의 클레임)]
+        exclude 소유자의 클레임은 건너뜀 (자기 자신).
+        per_owner 를 주면 질의 경로 아래의 클레임은 소유자마다 그 개수까지만 찾고 멈춤 (충돌 여부 판단용).
+        """
+        path = normalize(claim)
+        static, pattern = _split(path)
+        found: list[tuple[str, str, str]] = []
+
+        # 1) 내려가는 길의 조상 노드: 기존 클레임이 질의 경로를 포함하는지
+        node = self._root
+        for depth, part in enumerate(static):
+            rest = static[depth:] + pattern
+            for owner, existing, ex_pattern in node.claims:
+                if owner == exclude:
+                    continue
+                if not ex_pattern or (_globs_overlap(ex_pattern, rest) if pattern
+                                      else _pattern_overlaps(ex_pattern, rest)):
+                    found.append((owner, existing, path))
+            child = node.children.get(part)
+            if child is None or not any(o != exclude for o in child.owners):
+                return found
+            node = child
+
+        # 2) 도착 노드 아래: 질의 경로(디렉터리 · glob)가 기존 클레임을 포함하는지
+        for owner, existing in self._below(node, exclude, pattern, per_owner):
+            found.append((owner, existing, path))
+        return found
+
+    def _below(self, node: _Node, exclude: str | None, pattern: list[str], per_owner: int | None):
+        """
+        node 자신과 하위에서 질의 glob 나머지(pattern, 없으면 디렉터리 전체)와 겹치는 클레임.
+        찾을 게 남은 소유자가 없는 가지와 pattern 다음 구성요소와 안 맞는 가지는 내려가지 않음.
+        """
+        taken: Counter = Counter()
+
+        def wanted(owners: Counter) -> bool:
+            return any(n and o != exclude and (per_owner is None or taken[o] < per_owner)
+                       for o, n in owners.items())
+
+        stack = [(node, [])]
+        while stack:
+            cur, rel = stack.pop()
+            if not wanted(cur.owners):
+                continue
+            for owner, existing, ex_pattern in cur.claims:
+                if owner == exclude or (per_owner is not None and taken[owner] >= per_owner):
+                    continue
+                if pattern and not (_globs_overlap(pattern, rel + ex_pattern) if ex_pattern
+                                    else _pattern_overlaps(pattern, rel)):
+                    continue
+                taken[owner] += 1
+                yield owner, existing
+            depth = len(rel)
+            for part, child in cur.children.items():
+                if pattern and not _component_may_match(pattern, depth, part):
+                    continue
+                if wanted(child.owners):
+                    stack.append((child, rel + [part]))
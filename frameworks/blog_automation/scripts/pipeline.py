@@ -0,0 +1,346 @@
+"""
+pipeline.py — 자료조사 → 글 생성 → 포스팅 통합 실행기 (작품별 체크포인트 + 재개)
+
+fetch_anime.py / generate_post.py / post_to_tistory.py 를 한 번에 돌리면서
+작품(slug)별로 어느 단계까지 끝났는지 blog/data/pipeline_journal.json 에 기록한다.
+
+단계 (작품별):
+  fetched   시즌 목록(seasonal_top_anime.json)에 포함됨
+  enriched  TMDB · AniList · YouTube · Reddit 수집 결과 저장 (blog/data/enriched/{slug}.json)
+  images    이미지 다운로드 + 최적화 완료 (경로는 저널에 기록)
+  drafted   drafts/{slug}.md 생성 완료
+  posted    티스토리 포스팅 완료 (--post 일 때만, published/ 로 이동 확인)
+
+각 단계는 결과물이 이미 있으면 건너뛰므로 여러 번 실행해도 안전하다.
+중간에 죽어도 --resume 으로 다시 실행하면 끝나지 않은 작업만 이어서 한다.
+
+사용법:
+  python pipeline.py                     # 새로 시작 (시즌 목록 재수집, 저널 초기화)
+  python pipeline.py --resume            # 저널 기준으로 미완료 단계만 실행
+  python pipeline.py --resume --only <slug> [--only <slug> ...]
+  python pipeline.py --resume --post     # 생성된 초안까지 포스팅
+  python pipeline.py --refresh           # HTTP 응답 캐시 무시
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import fetch_anime
+import generate_post as gp
+import http_cache
+import image_optimize
+
+try:
+    from shared_state import (
+        claude_set_task, claude_update_progress, claude_set_done, claude_set_error,
+    )
+except ImportError:
+    def claude_set_task(*a, **k): return []
+    def claude_update_progress(*a, **k): pass
+    def claude_set_done(*a, **k): pass
+    def claude_set_error(*a, **k): pass
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 경로
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+SCRIPT_DIR    = Path(__file__).resolve().parent
+DATA_DIR      = gp.BLOG_DIR / "data"
+JOURNAL_FILE  = DATA_DIR / "pipeline_journal.json"
+ENRICHED_DIR  = DATA_DIR / "enriched"
+DONE_DIR      = gp.BLOG_DIR / "published"
+
+STAGES = ("fetched", "enriched", "images", "drafted", "posted")
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 저널
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+def load_journal() -> dict:
+    if JOURNAL_FILE.exists():
+        try:
+            return json.loads(JOURNAL_FILE.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            pass
+    return {"season_label": None, "started_at": _now(), "titles": {}}
+
+
+def save_journal(journal: dict) -> None:
+    JOURNAL_FILE.parent.mkdir(parents=True, exist_ok=True)
+    journal["updated_at"] = _now()
+    tmp = JOURNAL_FILE.with_suffix(".tmp")
+    tmp.write_text(json.dumps(journal, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp.replace(JOURNAL_FILE)
+
+
+def _done(entry: dict, stage: str) -> bool:
+    return bool(entry.get("stages", {}).get(stage))
+
+
+def _mark(journal: dict, entry: dict, stage: str) -> None:
+    entry.setdefault("stages", {})[stage] = _now()
+    entry["error"] = None
+    save_journal(journal)
+
+
+def _fail(journal: dict, entry: dict, stage: str, e: Exception) -> None:
+    entry["error"] = f"{stage}: {str(e)[:300]}"
+    save_journal(journal)
+    print(f"  ❌ [{entry['title']}] {stage} 실패: {e}")
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 단계 함수 (모두 멱등)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def stage_fetch(resume: bool, refresh: bool = False) -> None:
+    """시즌 목록 수집. --resume 이고 목록 파일이 있으면 생략."""
+    if resume and gp.INPUT_JSON.exists():
+        print(f"⏭️  fetch: 기존 목록 사용 ({gp.INPUT_JSON.name})")
+        return
+    fetch_anime.main(force=refresh)
+
+
+def _enriched_path(slug: str) -> Path:
+    return ENRICHED_DIR / f"{slug}.json"
+
+
+def _load_enriched(slug: str) -> dict | None:
+    path = _enriched_path(slug)
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return None
+
+
+def _save_enriched(slug: str, record: dict) -> None:
+    ENRICHED_DIR.mkdir(parents=True, exist_ok=True)
+    path = _enriched_path(slug)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(record, ensure_ascii=False, indent=2), encoding="utf-8")
+    tmp.replace(path)
+
+
+def stage_images(journal: dict, entry: dict, anime: dict, record: dict) -> dict | None:
+    paths = entry.get("image_paths") or {}
+    files_ok = all(
+        (gp.IMAGES_DIR / rel[len("../images/"):]).exists()
+        for rel in paths.values() if rel and rel.startswith("../images/")
+    )
+    if _done(entry, "images") and files_ok:
+        return paths
+    try:
+        paths = gp.collect_images(anime, record["tmdb"], record["anilist"], entry["slug"])
+        paths, report = image_optimize.optimize_post_images(paths, gp.IMAGES_DIR)
+        if report["src_bytes"]:
+            print(f"  🗜️  이미지 최적화: {image_optimize.format_report(report)}")
+    except Exception as e:
+        _fail(journal, entry, "images", e)
+        return None
+    entry["image_paths"] = paths
+    _mark(journal, entry, "images")
+    return paths
+
+
+def _draft_path(slug: str) -> Path:
+    return gp.POSTS_DIR / f"{slug}.md"
+
+
+def stage_is_materialized(entry: dict, stage: str) -> bool:
+    """저널상 완료된 단계의 결과물이 실제로 남아 있는지 확인 (수동 삭제 대비)."""
+    name = f"{entry['slug']}.md"
+    if stage == "drafted":
+        return _draft_path(entry["slug"]).exists() or (DONE_DIR / name).exists()
+    if stage == "posted":
+        return (DONE_DIR / name).exists()
+    return True
+
+
+def stage_draft(journal: dict, entry: dict, anime: dict, record: dict, season_label: str, progress: str) -> bool:
+    slug = entry["slug"]
+    post_path = _draft_path(slug)
+    if _done(entry, "drafted") and stage_is_materialized(entry, "drafted"):
+        return True
+    try:
+        body = gp.generate_blog_draft(
+            anime=anime,
+            season_label=season_label,
+            image_paths=entry.get("image_paths") or {},
+            anilist_details=record["anilist"],
+            tmdb_data=record["tmdb"],
+            youtube_data=record["youtube"],
+            reddit_data=record["reddit"],
+            draft_path=post_path,
+            progress=progress,
+        )
+        gp.write_draft_atomic(post_path, body)
+    except Exception as e:
+        _fail(journal, entry, "drafted", e)
+        return False
+    entry["draft"] = str(post_path.relative_to(gp.BLOG_DIR))
+    _mark(journal, entry, "drafted")
+    print(f"  ✅ 초안 저장: {post_path.name} ({len(body.replace(' ', '')):,}자)")
+    return True
+
+
+def stage_post(journal: dict, entry: dict) -> bool:
+    """post_to_tistory.py --file 로 1편 포스팅 (selenium 은 별도 프로세스에서만 로드)."""
+    name = f"{entry['slug']}.md"
+    if _done(entry, "posted") or (DONE_DIR / name).exists():
+        if not _done(entry, "posted"):
+            _mark(journal, entry, "posted")
+        return True
+    draft = _draft_path(entry["slug"])
+    if not draft.exists():
+        return False
+    proc = subprocess.run(
+        [sys.executable, str(SCRIPT_DIR / "post_to_tistory.py"), "--file", str(draft)],
+        cwd=str(SCRIPT_DIR),
+    )
+    if proc.returncode == 0 and (DONE_DIR / name).exists():
+        _mark(journal, entry, "posted")
+        return True
+    _fail(journal, entry, "posted", RuntimeError(f"post_to_tistory 종료 코드 {proc.returncode}"))
+    return False
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 실행
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _finish_title(journal, entry, anime, record, season_label, progress, post: bool) -> None:
+    if stage_images(journal, entry, anime, record) is None:
+        return
+    if not stage_draft(journal, entry, anime, record, season_label, progress):
+        return
+    if post:
+        stage_post(journal, entry)
+
+
+def print_summary(journal: dict, slugs: list[str], post: bool) -> tuple[int, int]:
+    """작품별 단계 현황 표 출력. 반환: (완료 수, 미완료 수)"""
+    wanted = STAGES if post else STAGES[:-1]
+    complete = incomplete = 0
+    print("\n📊 파이프라인 요약")
+    print("  " + " ".join(f"{s[:8]:>8s}" for s in wanted) + "  작품")
+    for slug in slugs:
+        entry = journal["titles"][slug]
+        marks = " ".join(f"{'✅' if _done(entry, s) else '·':>7s}" for s in wanted)
+        err = f"  ← {entry['error']}" if entry.get("error") else ""
+        print(f"  {marks}  {entry['title']}{err}")
+        if all(_done(entry, s) for s in wanted):
+            complete += 1
+        else:
+            incomplete += 1
+    print(f"\n  완료 {complete}편 / 미완료 {incomplete}편 — 저널: {JOURNAL_FILE}")
+    return complete, incomplete
+
+
+def run(resume: bool, only: list[str], post: bool, refresh: bool = False) -> int:
+    stage_fetch(resume, refresh)
+    season_label, _year, anime_list = gp.load_anime_list()
+
+    journal = load_journal() if resume else {"season_label": None, "started_at": _now(), "titles": {}}
+    if journal.get("season_label") not in (None, season_label):
+        print(f"⚠️  저널 시즌({journal['season_label']})과 목록 시즌({season_label})이 달라 저널을 새로 시작합니다.")
+        journal = {"season_label": None, "started_at": _now(), "titles": {}}
+    journal["season_label"] = season_label
+
+    # 작품 목록 → 저널 항목 (fetched)
+    targets: list[tuple[str, dict]] = []
+    for anime in anime_list:
+        title = gp.display_title(anime)
+        slug = gp.slugify(title)
+        if only and slug not in only:
+            continue
+        entry = journal["titles"].setdefault(slug, {"slug": slug, "title": title, "stages": {}})
+        entry["anilist_id"] = anime.get("anilist_id")
+        entry.setdefault("stages", {}).setdefault("fetched", _now())
+        targets.append((slug, anime))
+    save_journal(journal)
+
+    if only:
+        missing = set(only) - {s for s, _ in targets}
+        for slug in sorted(missing):
+            print(f"⚠️  --only {slug}: 시즌 목록에 없는 slug")
+    if not targets:
+        print("처리할 작품이 없습니다.")
+        return 1
+
+    gp.IMAGES_DIR.mkdir(parents=True, exist_ok=True)
+    gp.POSTS_DIR.mkdir(parents=True, exist_ok=True)
+    total = len(targets)
+    conflicts = claude_set_task(
+        action=f"블로그 파이프라인 ({total}편{', 포스팅 포함' if post else ''})",
+        target_files=[str(gp.POSTS_DIR)],
+        detail="재개 모드" if resume else "새로 시작",
+        progress=f"0/{total}",
+    )
+    if any(c.get("severity") == "critical" for c in conflicts or []):
+        print("🚨 충돌 감지 — 텔레그램에서 '충돌 해제' 후 --resume 으로 다시 실행하세요.")
+        return 1
+
+    # 이미 끝난 작품은 건너뛰고, 수집 결과가 있는 작품은 바로 다음 단계로
+    wanted_last = "posted" if post else "drafted"
+    ready, pending = [], []
+    for slug, anime in targets:
+        entry = journal["titles"][slug]
+        if _done(entry, wanted_last) and stage_is_materialized(entry, wanted_last):
+            continue
+        record = _load_enriched(slug) if _done(entry, "enriched") else None
+        (ready if record else pending).append((slug, anime, record))
+
+    skipped = total - len(ready) - len(pending)
+    if skipped:
+        print(f"⏭️  이미 완료된 작품 {skipped}편 건너뜀")
+
+    n = 0
+    for slug, anime, record in ready:
+        n += 1
+        entry = journal["titles"][slug]
+        print(f"[{n}/{len(ready) + len(pending)}] {entry['title']} (수집 결과 재사용)")
+        claude_update_progress(progress=f"{n}/{total}", detail=entry["title"])
+        _finish_title(journal, entry, anime, record, season_label, f"{n}/{total}", post)
+
+    if pending:
+        for idx, anime, record in gp.iter_enriched([a for _, a, _ in pending]):
+            n += 1
+            slug = pending[idx - 1][0]
+            entry = journal["titles"][slug]
+            print(f"[{n}/{len(ready) + len(pending)}] {entry['title']}")
+            claude_update_progress(progress=f"{n}/{total}", detail=entry["title"])
+            _save_enriched(slug, record)
+            _mark(journal, entry, "enriched")
+            _finish_title(journal, entry, anime, record, season_label, f"{n}/{total}", post)
+
+    complete, incomplete = print_summary(journal, [s for s, _ in targets], post)
+    result = f"완료 {complete}편 / 미완료 {incomplete}편"
+    if incomplete:
+        claude_set_error(f"파이프라인 미완료 {incomplete}편 — --resume 으로 재실행")
+    else:
+        claude_set_done(result=result)
+    return 0 if not incomplete else 1
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="fetch → generate → post 통합 실행 (작품별 체크포인트)")
+    parser.add_argument("--resume", action="store_true", help="저널 기준으로 미완료 단계만 실행")
+    parser.add_argument("--only", action="append", default=[], metavar="SLUG",
+                        help="지정한 slug 만 처리 (여러 번 사용 가능)")
+    parser.add_argument("--post", action="store_true", help="초안 생성 후 티스토리 포스팅까지 실행")
+    parser.add_argument("--refresh", action="store_true", help="HTTP 응답 캐시 무시하고 재조회")
+    args = parser.parse_args()
+    http_cache.set_refresh(args.refresh)
+    sys.exit(run(args.resume, args.only, args.post, args.refresh))
@@ -9,6 +9,7 @@ teams/content/workspace/blog/drafts/ 의 .md 파일을 Selenium으로 티스토
 from __future__ import annotations
 
 import json
+import mimetypes
 import os
 import re
 import shutil
@@ -624,18 +625,23 @@ def login(driver: webdriver.Chrome) -> None:
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 def read_first_post() -> tuple[str, str, Path, Path | None]:
-    """drafts/ 폴더에서 첫 번째 .md 파일 하나만 읽어 (제목, 본문, 파일경로, 이미지경로) 반환.
-
-    이미지는 md 파일 내 ![...](../images/xxx) 패턴에서 추출하고,
-    없으면 images/ 폴더에서 파일명 stem이 같은 이미지를 자동 탐색.
-    """
+    """drafts/ 폴더에서 첫 번째 .md 파일 하나만 읽어 (제목, 본문, 파일경로, 이미지경로) 반환."""
     if not POSTS_DIR.exists():
         raise FileNotFoundError(f"posts 폴더 없음: {POSTS_DIR}")
     md_files = sorted(POSTS_DIR.glob("*.md"))
     if not md_files:
         raise FileNotFoundError(f"posts 폴더에 .md 없음: {POSTS_DIR}")
+    return read_post(md_files[0])
 
-    p = md_files[0]
+
+def read_post(p: Path) -> tuple[str, str, Path, Path | None]:
+    """지정한 .md 파일을 읽어 (제목, 본문, 파일경로, 이미지경로) 반환.
+
+    이미지는 md 파일 내 ![...](../images/xxx) 패턴에서 추출하고,
+    없으면 images/ 폴더에서 파일명 stem이 같은 이미지를 자동 탐색.
+    """
+    if not p.exists():
+        raise FileNotFoundError(f"글 파일 없음: {p}")
     raw = p.read_text(encoding="utf-8")
     lines = raw.splitlines()
     title = p.stem
@@ -655,7 +661,7 @@ def read_first_post() -> tuple[str, str, Path, Path | None]:
             img_path = candidate
     # 2) md 본문에서 못 찾으면 파일명 stem으로 images 폴더 탐색
     if not img_path:
-        for ext in (".png", ".jpg", ".jpeg", ".gif", ".webp"):
+        for ext in (".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif"):
             candidate = IMAGES_DIR / (p.stem + ext)
             if candidate.exists():
                 img_path = candidate
@@ -925,6 +931,15 @@ def switch_to_markdown_mode(driver: webdriver.Chrome) -> bool:
     return False
 
 
+# image_optimize 결과물(_opt.webp / .avif)까지 — 구버전 mimetypes 에 없는 형식은 직접 지정
+_IMAGE_MIME = {".webp": "image/webp", ".avif": "image/avif"}
+
+
+def _image_mime(img_path: Path) -> str:
+    mime = _IMAGE_MIME.get(img_path.suffix.lower()) or mimetypes.guess_type(img_path.name)[0] or ""
+    return mime if mime.startswith("image/") else "image/jpeg"
+
+
 def upload_image_to_editor(driver: webdriver.Chrome, img_path: Path) -> bool:
     """에디터 본문 맨 앞에 이미지를 삽입. Tistory TinyMCE 에디터 이미지 업로드 UI 활용.
     성공 시 True.
@@ -1005,8 +1020,7 @@ def upload_image_to_editor(driver: webdriver.Chrome, img_path: Path) -> bool:
                 import base64
                 with open(img_path, "rb") as f:
                     img_b64 = base64.b64encode(f.read()).decode()
-                suffix = img_path.suffix.lower()
-                mime = "image/png" if suffix == ".png" else ("image/gif" if suffix == ".gif" else "image/jpeg")
+                mime = _image_mime(img_path)
                 driver.execute_script(f"""
                     var b64 = '{img_b64}';
                     var binary = atob(b64);
@@ -1804,8 +1818,9 @@ def move_to_done(md_path: Path) -> None:
     print(f"파일 이동: {md_path.name} → published/")
 
 
-def main() -> None:
-    title, body, md_path, img_path = read_first_post()
+def main(md_file: Path | None = None) -> bool:
+    """md_file 미지정 시 drafts/ 의 첫 글을 포스팅. 반환: 성공 여부."""
+    title, body, md_path, img_path = read_post(md_file) if md_file else read_first_post()
     print(f"포스팅 대상: {md_path.name} ({title})")
     print(f"  [스크립트] {Path(__file__).resolve()}")
     if img_path:
@@ -1821,6 +1836,7 @@ def main() -> None:
             print("완료")
         else:
             print("포스팅 실패 → 파일 이동하지 않음 (재시도 가능)")
+        return bool(success)
     finally:
         try:
             driver.quit()
@@ -1868,5 +1884,12 @@ def dump_publish_dom() -> None:
 if __name__ == "__main__":
     if "--dump-dom" in sys.argv:
         dump_publish_dom()
+    elif "--file" in sys.argv:
+        # pipeline.py 등에서 특정 초안만 포스팅: --file <drafts/xxx.md>
+        idx = sys.argv.index("--file")
+        if idx + 1 >= len(sys.argv):
+            print("사용법: post_to_tistory.py --file <md 파일 경로>")
+            sys.exit(2)
+        sys.exit(0 if main(Path(sys.argv[idx + 1]).resolve()) else 1)
     else:
         main()
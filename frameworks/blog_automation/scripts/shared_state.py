@@ -2,26 +2,54 @@
 shared_state.py — Claude Code ↔ Cursor AI ↔ Telegram Bot 3-way 공유 상태 관리
 
 역할:
-  - 3개 도구가 하나의 JSON 파일을 통해 서로 현재 상태를 파악
+  - 3개 도구가 하나의 SQLite 파일(WAL)을 통해 서로 현재 상태를 파악
   - 동일 파일 동시 수정 등 충돌 상황 감지 → 텔레그램으로 Steve에게 알림
   - 각 도구가 작업 시작 전 충돌 여부 확인
 
 파일 위치:
-  teams/content/workspace/shared_state.json   ← 실시간 상태
-  teams/content/workspace/activity_log.json   ← 전체 이력 (최근 200개)
-  teams/content/workspace/conflicts.json      ← 충돌 이력
+  teams/content/workspace/shared_state.sqlite  ← 실시간 상태 · 충돌 · 메시지 · 메모
+  teams/content/workspace/logs/                ← 활동 로그 · 충돌 이력 (추가 전용 JSONL 세그먼트, 전체 보관)
+
+저장 구조 (여러 프로세스가 동시에 써도 갱신이 사라지지 않도록):
+  - actors 테이블: 도구별 1행 → 진행률 갱신은 UPDATE 1건 (파일 전체 재작성 없음)
+  - 활동 로그: jsonl_log.SegmentedLog 에 한 줄 추가 (O(1)) → 크기·날짜 기준 세그먼트 교체,
+    조회는 최신 세그먼트 끝에서부터 필요한 건수만 읽음
+  - 작업 등록은 BEGIN IMMEDIATE 트랜잭션 안에서 충돌 검사 → 등록 (compare-and-set)
+  - 예전 shared_state.json / activity_log.json / conflicts.json 이 있으면 DB 최초 생성 시 가져옴
+
+변경 알림 (state_bus.py — Unix 도메인 소켓):
+  - 커밋 후 actor.{actor} · message.{actor} · conflict 토픽으로 즉시 알림 → 폴링 불필요
+  - claude_wait_messages / cursor_wait_messages: 메시지가 올 때까지 기다렸다가 읽기
+  - 텔레그램 알림(충돌 · 완료 · 오류)은 telegram.* 로 봇에 넘기고, 받는 봇이 없으면 직접 전송
 """
 
 from __future__ import annotations
 
 import json
 import os
+import sqlite3
+import threading
 import time
 import urllib.request
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from jsonl_log import SegmentedLog
+
+from path_claims import ClaimTrie, normalize as _normalize_path
+
+try:
+    import state_bus     # 변경 알림 (없으면 알림 없이 동작)
+except ImportError:
+    state_bus = None
+
+try:
+    import tg_dispatch   # 백그라운드 전송 (없으면 아래 동기 전송)
+except ImportError:
+    tg_dispatch = None
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 경로 설정
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -31,6 +59,17 @@ CONTENT_DIR    = PROJECT_DIR / "teams" / "content" / "workspace"  # /geekbrox/te
 STATE_FILE     = CONTENT_DIR / "shared_state.json"
 LOG_FILE       = CONTENT_DIR / "activity_log.json"
 CONFLICT_FILE  = CONTENT_DIR / "conflicts.json"
+DB_FILE        = CONTENT_DIR / "shared_state.sqlite"
+LOGS_DIR       = CONTENT_DIR / "logs"
+# STATE_FILE · LOG_FILE · CONFLICT_FILE 은 예전 JSON 저장소 (DB 최초 생성 시 1회 가져오기용)
+
+CONFLICT_KEEP  = 100   # DB 에는 최근 것만 (전체 이력은 CONFLICT_LOG)
+CONFLICT_SAMPLE = 5    # 새 경로 1개당 소유자별로 찾는 겹침 클레임 수 (디렉터리 클레임 아래 전체를 훑지 않음)
+MESSAGE_KEEP   = 10
+NOTE_KEEP      = 30
+
+ACTIVITY_LOG   = SegmentedLog(LOGS_DIR, "activity")
+CONFLICT_LOG   = SegmentedLog(LOGS_DIR, "conflicts")
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 상수
@@ -80,20 +119,25 @@ def _load(path: Path, default) -> Any:
         return default
 
 
-def _save(path: Path, data: Any) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_suffix(".tmp")
-    tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
-    tmp.replace(path)
-
-
 def _load_state() -> dict:
-    return _load(STATE_FILE, _default_state())
-
-
-def _save_state(state: dict) -> None:
-    state["last_updated"] = _now()
-    _save(STATE_FILE, state)
+    """예전 shared_state.json 과 같은 모양의 상태 dict (DB 각 테이블에서 조립)."""
+    conn = _db()
+    state = _default_state()
+    for row in conn.execute(f"SELECT actor, {', '.join(_ACTOR_COLS)} FROM actors"):
+        state["actors"][row[0]] = _actor_dict(row[1:])
+    state["unresolved_conflicts"] = [
+        json.loads(r[0]) for r in conn.execute("SELECT data FROM conflicts WHERE resolved = 0 ORDER BY id")
+    ]
+    for to_actor, data in conn.execute("SELECT to_actor, data FROM messages ORDER BY id"):
+        state["messages"].setdefault(to_actor, []).append(json.loads(data))
+    state["shared_notes"] = [json.loads(r[0]) for r in conn.execute("SELECT data FROM notes ORDER BY id")]
+    for key, value in conn.execute("SELECT key, value FROM meta WHERE key IN ('last_updated', 'last_completed')"):
+        state[key] = json.loads(value)
+    return state
+
+
+def _touch(conn: sqlite3.Connection) -> None:
+    conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('last_updated', ?)", (json.dumps(_now()),))
 
 
 def _default_state() -> dict:
@@ -158,15 +202,188 @@ def _default_state() -> dict:
     }
 
 
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# SQLite 저장소 (스레드별 커넥션, WAL)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+_local = threading.local()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS actors (
+    actor         TEXT PRIMARY KEY,
+    status        TEXT NOT NULL,
+    action        TEXT,
+    target_files  TEXT NOT NULL DEFAULT '[]',
+    progress      TEXT,
+    detail        TEXT,
+    started_at    TEXT,
+    last_active   TEXT,
+    session_note  TEXT
+);
+CREATE TABLE IF NOT EXISTS conflicts (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    resolved  INTEGER NOT NULL DEFAULT 0,
+    data      TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS messages (
+    id        INTEGER PRIMARY KEY AUTOINCREMENT,
+    to_actor  TEXT NOT NULL,
+    data      TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_messages_to ON messages(to_actor);
+CREATE TABLE IF NOT EXISTS notes (
+    id    INTEGER PRIMARY KEY AUTOINCREMENT,
+    data  TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key    TEXT PRIMARY KEY,
+    value  TEXT NOT NULL
+);
+"""
+
+_ACTOR_COLS = ("status", "action", "target_files", "progress", "detail",
+               "started_at", "last_active", "session_note")
+
+
+def _db() -> sqlite3.Connection:
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        CONTENT_DIR.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(DB_FILE), timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        _local.conn = conn
+        with _tx() as c:
+            for actor, fields in _default_state()["actors"].items():
+                c.execute(
+                    f"INSERT OR IGNORE INTO actors (actor, {', '.join(_ACTOR_COLS)}) VALUES (?{', ?' * len(_ACTOR_COLS)})",
+                    (actor, *_actor_values(fields)),
+                )
+            if not c.execute("SELECT 1 FROM meta WHERE key = 'legacy_imported'").fetchone():
+                _import_legacy_json(c)
+                c.execute("INSERT INTO meta (key, value) VALUES ('legacy_imported', ?)", (json.dumps(_now()),))
+            _migrate_activity_table(c)
+    return conn
+
+
+@contextmanager
+def _tx():
+    """
+    쓰기 트랜잭션. BEGIN IMMEDIATE 로 시작해 읽기-검사-쓰기가 다른 프로세스와 겹치지 않음.
+    트랜잭션 안에서 _after_commit() 으로 맡긴 작업(로그 기록 등)은 COMMIT 후에 실행, ROLLBACK 이면 버림.
+    """
+    conn = _local.conn if getattr(_local, "conn", None) else _db()
+    conn.execute("BEGIN IMMEDIATE")
+    _local.after_commit = []
+    try:
+        yield conn
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    finally:
+        pending, _local.after_commit = _local.after_commit, None
+    for fn, arg in pending:
+        fn(arg)
+
+
+def _after_commit(fn, arg) -> None:
+    """트랜잭션 안이면 COMMIT 후로 미루고, 밖이면 바로 실행 (DB 쓰기 락을 파일 I/O 로 붙잡지 않음)."""
+    pending = getattr(_local, "after_commit", None)
+    if pending is None:
+        fn(arg)
+    else:
+        pending.append((fn, arg))
+
+
+def _actor_values(fields: dict) -> tuple:
+    return tuple(
+        json.dumps(fields.get(c) or [], ensure_ascii=False) if c == "target_files" else fields.get(c)
+        for c in _ACTOR_COLS
+    )
+
+
+def _actor_dict(row: tuple) -> dict:
+    d = dict(zip(_ACTOR_COLS, row))
+    d["target_files"] = json.loads(d["target_files"] or "[]")
+    return d
+
+
+def _read_actors(conn: sqlite3.Connection) -> dict[str, dict]:
+    return {
+        r[0]: _actor_dict(r[1:])
+        for r in conn.execute(f"SELECT actor, {', '.join(_ACTOR_COLS)} FROM actors")
+    }
+
+
+def _set_actor(conn: sqlite3.Connection, actor: str, **fields) -> None:
+    """지정한 컬럼만 UPDATE (행이 없으면 기본값으로 생성)."""
+    conn.execute("INSERT OR IGNORE INTO actors (actor, status) VALUES (?, ?)", (actor, STATUS_IDLE))
+    if "target_files" in fields:
+        fields["target_files"] = json.dumps(fields["target_files"] or [], ensure_ascii=False)
+    cols = ", ".join(f"{k} = ?" for k in fields)
+    conn.execute(f"UPDATE actors SET {cols} WHERE actor = ?", (*fields.values(), actor))
+    _touch(conn)
+
+
+def _append_limited(conn: sqlite3.Connection, table: str, keep: int, data: dict, to_actor: str | None = None) -> None:
+    """messages / notes 에 추가 후 최근 keep 개만 유지."""
+    payload = json.dumps(data, ensure_ascii=False)
+    if to_actor is None:
+        cur = conn.execute(f"INSERT INTO {table} (data) VALUES (?)", (payload,))
+        conn.execute(f"DELETE FROM {table} WHERE id <= ?", (cur.lastrowid - keep,))
+    else:
+        conn.execute(f"INSERT INTO {table} (to_actor, data) VALUES (?, ?)", (to_actor, payload))
+        conn.execute(
+            f"DELETE FROM {table} WHERE to_actor = ? AND id NOT IN "
+            f"(SELECT id FROM {table} WHERE to_actor = ? ORDER BY id DESC LIMIT ?)",
+            (to_actor, to_actor, keep),
+        )
+    _touch(conn)
+
+
+def _import_legacy_json(conn: sqlite3.Connection) -> None:
+    """예전 JSON 저장소 내용을 새 DB 로 옮김 (1회, meta.legacy_imported 로 표시)."""
+    state = _load(STATE_FILE, None)
+    if state:
+        for actor, fields in (state.get("actors") or {}).items():
+            conn.execute(
+                f"INSERT OR REPLACE INTO actors (actor, {', '.join(_ACTOR_COLS)}) VALUES (?{', ?' * len(_ACTOR_COLS)})",
+                (actor, *_actor_values({"status": STATUS_IDLE, **fields})),
+            )
+        for to_actor, msgs in (state.get("messages") or {}).items():
+            for m in msgs:
+                conn.execute("INSERT INTO messages (to_actor, data) VALUES (?, ?)",
+                             (to_actor, json.dumps(m, ensure_ascii=False)))
+        for n in state.get("shared_notes") or []:
+            conn.execute("INSERT INTO notes (data) VALUES (?)", (json.dumps(n, ensure_ascii=False),))
+        if state.get("last_completed"):
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('last_completed', ?)",
+                         (json.dumps(state["last_completed"], ensure_ascii=False),))
+    for entry in _load(LOG_FILE, []):
+        ACTIVITY_LOG.append(entry)
+    for c in _load(CONFLICT_FILE, []):
+        conn.execute("INSERT INTO conflicts (resolved, data) VALUES (?, ?)",
+                     (1 if c.get("resolved") else 0, json.dumps(c, ensure_ascii=False)))
+        CONFLICT_LOG.append(c)
+
+
+def _migrate_activity_table(conn: sqlite3.Connection) -> None:
+    """예전 DB 의 activity 테이블 → 활동 로그 세그먼트로 옮긴 뒤 테이블 삭제."""
+    if not conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'activity'").fetchone():
+        return
+    for (entry,) in conn.execute("SELECT entry FROM activity ORDER BY ts, id"):
+        ACTIVITY_LOG.append(json.loads(entry))
+    conn.execute("DROP TABLE activity")
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 # 활동 로그
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 def _log(entry: dict) -> None:
-    logs = _load(LOG_FILE, [])
-    logs.append({"at": _now(), **entry})
-    logs = logs[-200:]
-    _save(LOG_FILE, logs)
+    """활동 로그 1건 추가 (세그먼트 끝에 한 줄 — 기존 기록은 읽지 않음). 트랜잭션 안이면 COMMIT 후 기록."""
+    _after_commit(ACTIVITY_LOG.append, {"at": _now(), **entry})
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -176,35 +393,47 @@ def _log(entry: dict) -> None:
 def _detect_conflicts(state: dict, new_actor: str, new_files: list[str]) -> list[dict]:
     """
     새 작업 등록 시 기존 작업과 충돌 여부 검사.
+    경로는 정규화 후 트라이(path_claims)로 비교 → 디렉터리 · glob 클레임의 포함 관계도 겹침으로 판단.
     반환: 감지된 충돌 목록 (빈 리스트면 충돌 없음)
     """
     conflicts = []
     actors = state.get("actors", {})
 
+    active = {}
     for actor_id, actor_state in actors.items():
         if actor_id == new_actor:
             continue
         if actor_state.get("status") not in (STATUS_RUNNING, STATUS_WAITING):
             continue
-
         # 충돌 규칙 확인
         pair = tuple(sorted([new_actor, actor_id]))
-        may_conflict = CONFLICT_RULES.get(pair, False)
-        if not may_conflict:
-            continue
-
-        # 파일 겹침 확인
+        if CONFLICT_RULES.get(pair, False):
+            active[actor_id] = actor_state
+
+    # 활성 클레임 트라이 1회 구성 → 새 파일마다 경로 깊이만큼만 탐색
+    trie = ClaimTrie()
+    for actor_id, actor_state in active.items():
+        for f in actor_state.get("target_files", []):
+            trie.add(actor_id, f)
+    overlaps: dict[str, list[tuple[str, str]]] = {}
+    for f in new_files:
+        for owner, existing, claimed in trie.overlaps(f, exclude=new_actor, per_owner=CONFLICT_SAMPLE):
+            overlaps.setdefault(owner, []).append((existing, claimed))
+
+    for actor_id, actor_state in active.items():
         existing_files = set(actor_state.get("target_files", []))
         new_files_set  = set(new_files)
-        overlap = existing_files & new_files_set
+        pairs = overlaps.get(actor_id)
 
-        if overlap:
+        if pairs:
             conflicts.append({
                 "type": "file_overlap",
                 "severity": SEVERITY_CRIT,
                 "actor_a": actor_id,
                 "actor_b": new_actor,
-                "overlapping_files": sorted(overlap),
+                # 포함 관계면 더 구체적인(깊은) 쪽 경로
+                "overlapping_files": sorted({max(e, c, key=len) for e, c in pairs}),
+                "overlap_claims": sorted({(e, c) for e, c in pairs}),
                 "actor_a_action": actor_state.get("action"),
                 "detected_at": _now(),
                 "resolved": False,
@@ -226,12 +455,13 @@ def _detect_conflicts(state: dict, new_actor: str, new_files: list[str]) -> list
     return conflicts
 
 
-def _save_conflicts(conflicts: list[dict]) -> None:
-    """충돌을 conflicts.json에 저장."""
-    existing = _load(CONFLICT_FILE, [])
-    existing.extend(conflicts)
-    existing = existing[-100:]  # 최근 100개 유지
-    _save(CONFLICT_FILE, existing)
+def _save_conflicts(conflicts: list[dict], conn: sqlite3.Connection) -> None:
+    """충돌 저장 — DB 에는 최근 CONFLICT_KEEP 개 (해제 처리용), 전체 이력은 CONFLICT_LOG."""
+    for c in conflicts:
+        cur = conn.execute("INSERT INTO conflicts (resolved, data) VALUES (0, ?)",
+                           (json.dumps(c, ensure_ascii=False),))
+        conn.execute("DELETE FROM conflicts WHERE id <= ?", (cur.lastrowid - CONFLICT_KEEP,))
+        _after_commit(CONFLICT_LOG.append, c)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -239,7 +469,10 @@ def _save_conflicts(conflicts: list[dict]) -> None:
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 def tg_notify(text: str) -> None:
-    """텔레그램으로 메시지 전송."""
+    """텔레그램으로 메시지 전송 (tg_dispatch 가 있으면 큐에 넣고 즉시 반환)."""
+    if tg_dispatch is not None:
+        tg_dispatch.notify(text)
+        return
     bot_token = os.environ.get("TELEGRAM_BOT_TOKEN", "").strip()
     chat_id   = os.environ.get("TELEGRAM_CHAT_ID", "").strip()
     if not bot_token or not chat_id:
@@ -258,6 +491,22 @@ def tg_notify(text: str) -> None:
         pass
 
 
+def _publish(topic: str, data: dict | None = None, once: bool = False) -> int:
+    """state_bus 알림 (트랜잭션 커밋 후 호출). 반환: 받은 구독자 수."""
+    if state_bus is None:
+        return 0
+    try:
+        return state_bus.publish(topic, data, once=once)
+    except Exception:
+        return 0
+
+
+def _notify_telegram(kind: str, text: str) -> None:
+    """텔레그램 알림 — 구독 중인 봇이 있으면 봇이 보내고, 없으면 직접 전송."""
+    if not _publish(f"telegram.{kind}", {"text": text}, once=True):
+        tg_notify(text)
+
+
 def _notify_conflict(conflicts: list[dict]) -> None:
     """충돌 발생 시 Steve에게 텔레그램 알림."""
     for c in conflicts:
@@ -283,7 +532,8 @@ def _notify_conflict(conflicts: list[dict]) -> None:
                 f"동시에 다른 파일을 수정 중입니다.\n"
                 f"⚠️ git 충돌 위험이 있습니다."
             )
-        tg_notify(msg)
+        _publish("conflict", c)
+        _notify_telegram("conflict", msg)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -300,78 +550,135 @@ def _register_task(
 ) -> list[dict]:
     """
     작업 등록 + 충돌 감지 + 상태 저장.
+    다른 도구 상태 읽기 → 충돌 검사 → 내 상태 쓰기를 한 트랜잭션(쓰기 락)에서 처리하므로
+    두 프로세스가 동시에 등록해도 서로의 등록을 못 보고 지나치는 일이 없다.
     반환: 감지된 충돌 목록.
     """
-    state = _load_state()
-    target_files = target_files or []
-
-    # 충돌 감지
+    target_files = [_normalize_path(f) for f in target_files or []]
     conflicts = []
-    if check_conflict:
-        conflicts = _detect_conflicts(state, actor, target_files)
-        if conflicts:
-            state.setdefault("unresolved_conflicts", []).extend(conflicts)
-            _save_conflicts(conflicts)
-            _notify_conflict(conflicts)
-
-    # 상태 업데이트
-    state["actors"][actor].update({
-        "status": STATUS_RUNNING,
-        "action": action,
-        "target_files": target_files,
-        "progress": progress or None,
-        "detail": detail or None,
-        "started_at": _now(),
-        "last_active": _now(),
-    })
-    _save_state(state)
-    _log({"actor": actor, "action": action, "status": STATUS_RUNNING,
-          "files": target_files, "detail": detail})
+    with _tx() as conn:
+        if check_conflict:
+            conflicts = _detect_conflicts({"actors": _read_actors(conn)}, actor, target_files)
+            if conflicts:
+                _save_conflicts(conflicts, conn)
+
+        now = _now()
+        _set_actor(
+            conn, actor,
+            status=STATUS_RUNNING,
+            action=action,
+            target_files=target_files,
+            progress=progress or None,
+            detail=detail or None,
+            started_at=now,
+            last_active=now,
+        )
+        _log({"actor": actor, "action": action, "status": STATUS_RUNNING,
+              "files": target_files, "detail": detail})
+
+    # 알림은 락을 놓은 뒤에
+    _publish(f"actor.{actor}", {"actor": actor, "status": STATUS_RUNNING, "action": action})
+    if conflicts:
+        _notify_conflict(conflicts)
     return conflicts
 
 
 def _update_actor(actor: str, **kwargs) -> None:
-    state = _load_state()
-    state["actors"][actor].update({k: v for k, v in kwargs.items() if v is not None})
-    state["actors"][actor]["last_active"] = _now()
-    _save_state(state)
+    fields = {k: v for k, v in kwargs.items() if v is not None}
+    with _tx() as conn:
+        _set_actor(conn, actor, **fields, last_active=_now())
 
 
 def _complete_actor(actor: str, result: str = "") -> None:
-    state = _load_state()
-    action = state["actors"][actor].get("action", "unknown")
-    state["actors"][actor].update({
-        "status": STATUS_DONE,
-        "detail": result or "완료",
-        "target_files": [],
-        "last_active": _now(),
-    })
-    state["last_completed"] = {"actor": actor, "action": action, "result": result, "at": _now()}
-    _save_state(state)
-    _log({"actor": actor, "action": action, "status": STATUS_DONE, "result": result})
+    with _tx() as conn:
+        row = conn.execute("SELECT action FROM actors WHERE actor = ?", (actor,)).fetchone()
+        action = (row[0] if row else None) or "unknown"
+        now = _now()
+        _set_actor(
+            conn, actor,
+            status=STATUS_DONE,
+            detail=result or "완료",
+            target_files=[],
+            last_active=now,
+        )
+        conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('last_completed', ?)",
+            (json.dumps({"actor": actor, "action": action, "result": result, "at": now}, ensure_ascii=False),),
+        )
+        _log({"actor": actor, "action": action, "status": STATUS_DONE, "result": result})
+    _publish(f"actor.{actor}", {"actor": actor, "status": STATUS_DONE, "action": action, "result": result})
+    text = f"✅ *{actor}* 작업 완료: {action}"
+    if result:
+        text += f"\n_{result}_"
+    # 봇이 떠 있을 때만 (완료 알림은 원래 직접 보내지 않았음)
+    _publish("telegram.done", {"text": text}, once=True)
 
 
 def _error_actor(actor: str, error: str) -> None:
-    state = _load_state()
-    state["actors"][actor].update({
-        "status": STATUS_ERROR,
-        "detail": error,
-        "last_active": _now(),
-    })
-    _save_state(state)
-    _log({"actor": actor, "status": STATUS_ERROR, "error": error})
+    with _tx() as conn:
+        _set_actor(conn, actor, status=STATUS_ERROR, detail=error, last_active=_now())
+        _log({"actor": actor, "status": STATUS_ERROR, "error": error})
+    _publish(f"actor.{actor}", {"actor": actor, "status": STATUS_ERROR, "error": error})
+    _publish("telegram.error", {"text": f"❌ *{actor}* 오류\n_{error}_"}, once=True)
 
 
 def _idle_actor(actor: str) -> None:
-    state = _load_state()
-    state["actors"][actor].update({
-        "status": STATUS_IDLE,
-        "action": None,
-        "target_files": [],
-        "progress": None,
-        "detail": None,
-    })
-    _save_state(state)
+    with _tx() as conn:
+        _set_actor(
+            conn, actor,
+            status=STATUS_IDLE,
+            action=None,
+            target_files=[],
+            progress=None,
+            detail=None,
+        )
+    _publish(f"actor.{actor}", {"actor": actor, "status": STATUS_IDLE})
+
+
+def _add_note(actor: str, note: str, set_session_note: bool = False) -> None:
+    with _tx() as conn:
+        if set_session_note:
+            _set_actor(conn, actor, session_note=note)
+        _append_limited(conn, "notes", NOTE_KEEP, {"from": actor, "msg": note, "at": _now()})
+
+
+def _pop_messages(actor: str) -> list[dict]:
+    """actor 로 온 메시지를 읽고 같은 트랜잭션에서 삭제 (두 번 읽히지 않음)."""
+    with _tx() as conn:
+        rows = conn.execute(
+            "SELECT id, data FROM messages WHERE to_actor = ? ORDER BY id", (actor,)
+        ).fetchall()
+        if rows:
+            conn.execute("DELETE FROM messages WHERE to_actor = ? AND id <= ?", (actor, rows[-1][0]))
+            _touch(conn)
+    return [json.loads(r[1]) for r in rows]
+
+
+def _wait_messages(actor: str, timeout: float) -> list[dict]:
+    """
+    actor 로 온 메시지를 읽되, 없으면 message.{actor} 알림이 올 때까지 최대 timeout 초 기다림.
+    구독을 먼저 열고 DB 를 확인하므로 그 사이에 온 메시지도 놓치지 않음.
+    state_bus 를 못 쓰면 1초 간격 확인으로 대체.
+    """
+    try:
+        sub = state_bus.Subscriber([f"message.{actor}"]) if state_bus else None
+    except OSError:
+        sub = None
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            msgs = _pop_messages(actor)
+            remaining = deadline - time.monotonic()
+            if msgs or remaining <= 0:
+                return msgs
+            if sub:
+                sub.get(remaining)
+                sub.drain()
+            else:
+                time.sleep(min(1.0, remaining))
+    finally:
+        if sub:
+            sub.close()
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -389,14 +696,15 @@ def claude_update_progress(progress: str, detail: str = "") -> None:
 
 
 def claude_set_waiting(reason: str, wait_sec: int) -> None:
-    state = _load_state()
-    state["actors"][ACTOR_CLAUDE].update({
-        "status": STATUS_WAITING,
-        "detail": f"{reason} ({wait_sec}초 대기)",
-        "last_active": _now(),
-    })
-    _save_state(state)
-    _log({"actor": ACTOR_CLAUDE, "status": STATUS_WAITING, "reason": reason, "wait_sec": wait_sec})
+    with _tx() as conn:
+        _set_actor(
+            conn, ACTOR_CLAUDE,
+            status=STATUS_WAITING,
+            detail=f"{reason} ({wait_sec}초 대기)",
+            last_active=_now(),
+        )
+        _log({"actor": ACTOR_CLAUDE, "status": STATUS_WAITING, "reason": reason, "wait_sec": wait_sec})
+    _publish(f"actor.{ACTOR_CLAUDE}", {"actor": ACTOR_CLAUDE, "status": STATUS_WAITING, "reason": reason})
 
 
 def claude_set_done(result: str = "") -> None:
@@ -408,21 +716,17 @@ def claude_set_error(error: str) -> None:
 
 
 def claude_set_file_modified(filepath: str) -> None:
-    state = _load_state()
-    files = state["actors"][ACTOR_CLAUDE].get("target_files", [])
-    if filepath not in files:
-        files.append(filepath)
-    state["actors"][ACTOR_CLAUDE]["target_files"] = files[-10:]
-    state["actors"][ACTOR_CLAUDE]["last_active"] = _now()
-    _save_state(state)
+    with _tx() as conn:
+        row = conn.execute("SELECT target_files FROM actors WHERE actor = ?", (ACTOR_CLAUDE,)).fetchone()
+        files = json.loads(row[0]) if row and row[0] else []
+        filepath = _normalize_path(filepath)
+        if filepath not in files:
+            files.append(filepath)
+        _set_actor(conn, ACTOR_CLAUDE, target_files=files[-10:], last_active=_now())
 
 
 def claude_add_note(note: str) -> None:
-    state = _load_state()
-    state["actors"][ACTOR_CLAUDE]["session_note"] = note
-    state["shared_notes"].append({"from": ACTOR_CLAUDE, "msg": note, "at": _now()})
-    state["shared_notes"] = state["shared_notes"][-30:]
-    _save_state(state)
+    _add_note(ACTOR_CLAUDE, note, set_session_note=True)
     tg_notify(f"📝 *Claude Code 메모*\n_{note}_")
 
 
@@ -432,12 +736,12 @@ def claude_idle() -> None:
 
 def claude_check_messages() -> list[dict]:
     """Claude Code로 온 메시지 확인 후 삭제."""
-    state = _load_state()
-    msgs = state["messages"].get(ACTOR_CLAUDE, [])
-    if msgs:
-        state["messages"][ACTOR_CLAUDE] = []
-        _save_state(state)
-    return msgs
+    return _pop_messages(ACTOR_CLAUDE)
+
+
+def claude_wait_messages(timeout: float = 60) -> list[dict]:
+    """메시지가 올 때까지 최대 timeout 초 기다렸다가 확인 후 삭제."""
+    return _wait_messages(ACTOR_CLAUDE, timeout)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -464,11 +768,7 @@ def cursor_set_error(error: str) -> None:
 
 
 def cursor_add_note(note: str) -> None:
-    state = _load_state()
-    state["actors"][ACTOR_CURSOR]["session_note"] = note
-    state["shared_notes"].append({"from": ACTOR_CURSOR, "msg": note, "at": _now()})
-    state["shared_notes"] = state["shared_notes"][-30:]
-    _save_state(state)
+    _add_note(ACTOR_CURSOR, note, set_session_note=True)
     tg_notify(f"🎯 *Cursor AI 메모*\n_{note}_")
 
 
@@ -478,12 +778,12 @@ def cursor_idle() -> None:
 
 def cursor_check_messages() -> list[dict]:
     """Cursor AI로 온 메시지 확인 후 삭제."""
-    state = _load_state()
-    msgs = state["messages"].get(ACTOR_CURSOR, [])
-    if msgs:
-        state["messages"][ACTOR_CURSOR] = []
-        _save_state(state)
-    return msgs
+    return _pop_messages(ACTOR_CURSOR)
+
+
+def cursor_wait_messages(timeout: float = 60) -> list[dict]:
+    """메시지가 올 때까지 최대 timeout 초 기다렸다가 확인 후 삭제."""
+    return _wait_messages(ACTOR_CURSOR, timeout)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -564,8 +864,7 @@ def telegram_format_status() -> str:
 
 
 def telegram_get_activity_log(limit: int = 15) -> str:
-    logs = _load(LOG_FILE, [])
-    recent = logs[-limit:][::-1]
+    recent = ACTIVITY_LOG.tail(limit)[::-1]
     lines = [f"📋 *활동 로그* (최신 {len(recent)}개)\n"]
     actor_icon = {ACTOR_CLAUDE: "🖥", ACTOR_CURSOR: "🎯", ACTOR_TELEGRAM: "📱", ACTOR_SCRIPT: "⚙️"}
     status_icon = {STATUS_RUNNING: "▶️", STATUS_DONE: "✅", STATUS_ERROR: "❌", STATUS_WAITING: "⏳"}
@@ -584,9 +883,13 @@ def telegram_get_activity_log(limit: int = 15) -> str:
 
 def telegram_get_conflicts(unresolved_only: bool = True) -> str:
     """충돌 목록을 텔레그램용 텍스트로 반환."""
-    conflicts = _load(CONFLICT_FILE, [])
+    query = "SELECT data, resolved FROM conflicts"
     if unresolved_only:
-        conflicts = [c for c in conflicts if not c.get("resolved")]
+        query += " WHERE resolved = 0"
+    conflicts = [
+        {**json.loads(data), "resolved": bool(resolved)}
+        for data, resolved in _db().execute(query + " ORDER BY id")
+    ]
     if not conflicts:
         return "✅ *감지된 충돌 없음*"
     lines = [f"🚨 *충돌 목록* ({len(conflicts)}건)\n"]
@@ -604,45 +907,35 @@ def telegram_get_conflicts(unresolved_only: bool = True) -> str:
 
 def telegram_resolve_conflicts() -> str:
     """모든 미해결 충돌을 해결 처리."""
-    state = _load_state()
-    count = 0
-    for c in state.get("unresolved_conflicts", []):
-        if not c.get("resolved"):
-            c["resolved"] = True
-            c["resolved_at"] = _now()
-            count += 1
-    state["unresolved_conflicts"] = [c for c in state["unresolved_conflicts"] if not c.get("resolved")]
-    _save_state(state)
-
-    # conflict_file도 업데이트
-    conflicts = _load(CONFLICT_FILE, [])
-    for c in conflicts:
-        if not c.get("resolved"):
-            c["resolved"] = True
-            c["resolved_at"] = _now()
-    _save(CONFLICT_FILE, conflicts)
-    _log({"actor": ACTOR_TELEGRAM, "action": "충돌 해제", "count": count})
+    with _tx() as conn:
+        rows = conn.execute("SELECT id, data FROM conflicts WHERE resolved = 0").fetchall()
+        now = _now()
+        for cid, data in rows:
+            c = json.loads(data)
+            c.update({"resolved": True, "resolved_at": now})
+            conn.execute("UPDATE conflicts SET resolved = 1, data = ? WHERE id = ?",
+                         (json.dumps(c, ensure_ascii=False), cid))
+        count = len(rows)
+        _touch(conn)
+        _log({"actor": ACTOR_TELEGRAM, "action": "충돌 해제", "count": count})
+    _publish("conflict.resolved", {"count": count})
     return f"✅ {count}건의 충돌이 해제되었습니다."
 
 
 def telegram_send_message(to_actor: str, msg: str) -> None:
     """특정 도구로 메시지 전달."""
-    state = _load_state()
-    state["messages"].setdefault(to_actor, []).append({
-        "from": ACTOR_TELEGRAM,
-        "msg": msg,
-        "at": _now(),
-        "read": False,
-    })
-    state["messages"][to_actor] = state["messages"][to_actor][-10:]
-    _save_state(state)
+    with _tx() as conn:
+        _append_limited(conn, "messages", MESSAGE_KEEP, {
+            "from": ACTOR_TELEGRAM,
+            "msg": msg,
+            "at": _now(),
+            "read": False,
+        }, to_actor=to_actor)
+    _publish(f"message.{to_actor}", {"from": ACTOR_TELEGRAM})
 
 
 def telegram_add_note(note: str) -> None:
-    state = _load_state()
-    state["shared_notes"].append({"from": ACTOR_TELEGRAM, "msg": note, "at": _now()})
-    state["shared_notes"] = state["shared_notes"][-30:]
-    _save_state(state)
+    _add_note(ACTOR_TELEGRAM, note)
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -698,15 +991,34 @@ if __name__ == "__main__":
         elif subcmd == "messages":
             msgs = cursor_check_messages()
             print(json.dumps(msgs, ensure_ascii=False))
+        elif subcmd == "wait":
+            timeout = float(args[2]) if len(args) > 2 else 60
+            print(json.dumps(cursor_wait_messages(timeout), ensure_ascii=False))
+
+    elif args[0] == "watch":
+        # 변경 알림 실시간 출력 (python3 shared_state.py watch "actor.*" conflict)
+        patterns = args[1:] or ["*"]
+        with state_bus.Subscriber(patterns) as sub:
+            try:
+                while True:
+                    event = sub.get()
+                    if event:
+                        print(json.dumps({"topic": event[0], **event[1]}, ensure_ascii=False), flush=True)
+            except KeyboardInterrupt:
+                pass
 
     elif args[0] == "idle":
         claude_idle()
         print("✅ Claude Code 상태를 idle로 초기화했습니다.")
 
     elif args[0] == "reset":
+        for suffix in ("", "-wal", "-shm"):
+            Path(str(DB_FILE) + suffix).unlink(missing_ok=True)
         STATE_FILE.unlink(missing_ok=True)
         LOG_FILE.unlink(missing_ok=True)
         CONFLICT_FILE.unlink(missing_ok=True)
+        for seg in LOGS_DIR.glob("*"):
+            seg.unlink()
         print("✅ 모든 상태 파일 초기화 완료")
 
     else:
@@ -721,6 +1033,8 @@ if __name__ == "__main__":
             "  python3 shared_state.py cursor done [result]\n"
             "  python3 shared_state.py cursor idle\n"
             "  python3 shared_state.py cursor messages\n"
+            "  python3 shared_state.py cursor wait [초]\n"
+            "  python3 shared_state.py watch [토픽 패턴 ...]\n"
             "  python3 shared_state.py idle\n"
             "  python3 shared_state.py reset\n"
         )
@@ -0,0 +1,200 @@
+"""
+state_bus.py — shared_state 변경 알림 (Unix 도메인 소켓 pub/sub)
+
+상태 자체는 shared_state.sqlite 에 있고, 여기서는 "바뀌었다"는 알림만 즉시 전달한다.
+구독자가 메시지·상태를 주기적으로 다시 읽지 않고 알림이 올 때만 DB 를 읽으면 된다.
+
+구조 (별도 브로커 프로세스 없음):
+  - 구독자마다 BUS_DIR/{pid}-{n}.sock 에 데이터그램 소켓을 열고, 받을 토픽 패턴을 같은 이름의 .topics 에 적어 둠
+    (consumer 구독자는 첫 줄에 CONSUMER_MARK)
+  - publish() 는 디렉터리의 소켓 중 패턴이 맞는 곳에 데이터그램 1개씩 non-blocking 전송
+      · 받는 쪽이 죽어 있으면(ECONNREFUSED) 소켓 파일 정리
+      · 받는 쪽 버퍼가 가득 차면 버림 — 알림은 힌트일 뿐이고 실제 상태는 DB 에 있음
+  - once=True 면 패턴이 맞는 consumer 구독자(Subscriber(..., consumer=True)) 1곳에만 전달
+    (텔레그램 봇이 여러 개 떠 있어도 알림은 1번). 일반 구독자(shared_state watch 등)도 알림은 받지만
+    반환값에 세지 않음 → 발행 측은 "처리할 봇이 있었는지"를 반환값으로 판단
+  - AF_UNIX 가 없는 환경(Windows)에서는 publish() 가 0 을 돌려주고 Subscriber 는 OSError
+
+토픽:
+  actor.{actor}        도구 상태 전이 (running / done / error / waiting / idle)
+  message.{actor}      {actor} 앞으로 메시지 도착
+  conflict             충돌 감지 · conflict.resolved 해제
+  telegram.{kind}      텔레그램으로 보낼 알림 (봇이 구독, once=True)
+
+환경변수:
+  STATE_BUS_DIR   소켓 디렉터리 (기본: 임시 디렉터리/geekbrox-bus-{작업 폴더 해시})
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import itertools
+import json
+import os
+import select
+import socket
+import tempfile
+import threading
+from pathlib import Path
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 경로 설정
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+SCRIPT_DIR   = Path(__file__).resolve().parent
+PROJECT_DIR  = SCRIPT_DIR.parent.parent
+CONTENT_DIR  = PROJECT_DIR / "teams" / "content" / "workspace"
+
+# 소켓 경로 길이 제한(약 104~108자) 때문에 작업 폴더 안이 아니라 짧은 임시 경로 사용
+_default_dir = Path(tempfile.gettempdir()) / (
+    "geekbrox-bus-" + hashlib.sha1(str(CONTENT_DIR).encode()).hexdigest()[:8]
+)
+BUS_DIR = Path(os.environ.get("STATE_BUS_DIR") or _default_dir)
+
+MAX_DATAGRAM = 64 * 1024
+AVAILABLE = hasattr(socket, "AF_UNIX")
+
+_seq = itertools.count(1)
+CONSUMER_MARK = "#consumer"
+_topics_cache: dict[str, tuple[list[str], bool]] = {}   # 소켓 이름 → (패턴, consumer 여부) (구독자 파일을 매번 읽지 않도록)
+_send_lock = threading.Lock()
+_send_sock: socket.socket | None = None
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 발행
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _sender() -> socket.socket:
+    global _send_sock
+    if _send_sock is None:
+        _send_sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        _send_sock.setblocking(False)
+    return _send_sock
+
+
+def _patterns(name: str) -> tuple[list[str], bool] | None:
+    cached = _topics_cache.get(name)
+    if cached is None:
+        try:
+            lines = (BUS_DIR / name).with_suffix(".topics").read_text(encoding="utf-8").split()
+        except FileNotFoundError:
+            return None
+        consumer = bool(lines) and lines[0] == CONSUMER_MARK
+        cached = _topics_cache[name] = (lines[1:] if consumer else lines, consumer)
+    return cached
+
+
+def _drop(name: str) -> None:
+    _topics_cache.pop(name, None)
+    for suffix in (".sock", ".topics"):
+        (BUS_DIR / name).with_suffix(suffix).unlink(missing_ok=True)
+
+
+def publish(topic: str, data: dict | None = None, once: bool = False) -> int:
+    """
+    topic 알림 전송. 반환: 전달된 구독자 수 (구독자가 없거나 버스를 못 쓰면 0).
+    once=True 면 consumer 구독자 1곳에만 보내고 그 수(0 또는 1)만 반환 — 일반 구독자는 받되 세지 않음.
+    호출 측을 막지 않음 — 실패는 조용히 무시.
+    """
+    if not AVAILABLE or not BUS_DIR.exists():
+        return 0
+    payload = json.dumps({"topic": topic, "data": data or {}}, ensure_ascii=False).encode("utf-8")
+    if len(payload) > MAX_DATAGRAM:
+        payload = json.dumps({"topic": topic, "data": {"truncated": True}}).encode("utf-8")
+    delivered = 0
+    consumed = False
+    with _send_lock:
+        sock = _sender()
+        try:
+            names = sorted(p.stem for p in BUS_DIR.glob("*.sock"))
+        except OSError:
+            return 0
+        for gone in _topics_cache.keys() - set(names):
+            _topics_cache.pop(gone, None)
+        for name in names:
+            cached = _patterns(name)
+            if not cached:
+                continue
+            patterns, consumer = cached
+            if not any(fnmatch.fnmatchcase(topic, p) for p in patterns):
+                continue
+            if once and consumer and consumed:
+                continue             # 이미 다른 consumer 가 받음
+            try:
+                sock.sendto(payload, str(BUS_DIR / f"{name}.sock"))
+            except (ConnectionRefusedError, FileNotFoundError):
+                _drop(name)          # 구독자가 close() 없이 종료됨
+                continue
+            except OSError:
+                continue             # 받는 쪽 버퍼 가득 참(EAGAIN) 등 — 버림
+            if not once:
+                delivered += 1
+            elif consumer:
+                consumed = True
+                delivered = 1
+    return delivered
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 구독
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class Subscriber:
+    """
+    토픽 패턴(fnmatch: "actor.*", "message.cursor_ai")을 구독.
+    get(timeout) 으로 기다리거나, fileno() 를 select / asyncio add_reader 에 등록해 사용.
+    consumer=True 면 once=True 알림을 실제로 처리하는 쪽(텔레그램 봇)으로 등록 — 발행 측 반환값에 셈.
+    """
+
+    def __init__(self, patterns: list[str], consumer: bool = False):
+        if not AVAILABLE:
+            raise OSError("Unix 도메인 소켓을 쓸 수 없는 환경")
+        BUS_DIR.mkdir(parents=True, exist_ok=True)
+        self.name = f"{os.getpid()}-{next(_seq)}"
+        self.path = BUS_DIR / f"{self.name}.sock"
+        # 패턴 파일을 먼저 써 두고 bind → 발행 측이 소켓을 보면 패턴도 항상 있음
+        lines = ([CONSUMER_MARK] if consumer else []) + list(patterns)
+        self.path.with_suffix(".topics").write_text("\n".join(lines), encoding="utf-8")
+        self.path.unlink(missing_ok=True)
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sock.bind(str(self.path))
+        self._sock.setblocking(False)
+
+    def fileno(self) -> int:
+        return self._sock.fileno()
+
+    def get(self, timeout: float | None = None) -> tuple[str, dict] | None:
+        """알림 1개 (topic, data). timeout 안에 없으면 None."""
+        ready, _, _ = select.select([self._sock], [], [], timeout)
+        if not ready:
+            return None
+        events = self.drain(1)
+        return events[0] if events else None
+
+    def drain(self, limit: int | None = None) -> list[tuple[str, dict]]:
+        """이미 도착한 알림을 모두(또는 limit 개) 꺼냄. 기다리지 않음."""
+        events = []
+        while limit is None or len(events) < limit:
+            try:
+                raw = self._sock.recv(MAX_DATAGRAM)
+            except (BlockingIOError, InterruptedError):
+                break
+            try:
+                msg = json.loads(raw)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+            events.append((msg.get("topic", ""), msg.get("data") or {}))
+        return events
+
+    def close(self) -> None:
+        try:
+            self._sock.close()
+        finally:
+            _drop(self.name)
+
+    def __enter__(self) -> "Subscriber":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,506 @@
+"""
+task_queue.py — 텔레그램 봇 공용 작업 대기열 (SQLite, 재시작해도 유지)
+
+content_team_bot.py · atlas_bot.py 가 같은 DB 파일을 쓴다.
+  - enqueue(): 스크립트 실행 작업 등록 — 우선순위(high / normal / low), 지연·예약 실행(run_at)
+  - claim(): BEGIN IMMEDIATE 안에서 실행할 작업 1건을 가져감
+      · 같은 레인(기본: 스크립트 이름)에 실행 중인 작업이 있으면 건너뜀
+        → 두 봇이 같은 파이프라인 단계를 동시에 돌리지 않음
+      · 가져간 작업은 VISIBILITY_SEC 동안만 내 것 — heartbeat() 로 연장.
+        봇이 죽어 연장이 끊기면 다른 봇(또는 재시작한 봇)이 다시 가져감 (at-least-once)
+  - release(): 봇이 종료될 때 실행 중이던 작업을 대기열로 되돌림 (재시작 후 이어서 실행)
+      · QueueRunner.stop(terminate=...) 는 실행 중인 스크립트를 먼저 끝낸 뒤 되돌림
+        → 죽어 가는 프로세스와 다른 봇이 가져간 같은 작업이 겹쳐 돌지 않음
+  - complete(): 결과 기록. 레인별 간격(TASK_LANE_GAPS)이 있으면 그만큼 뒤에 다음 작업
+  - QueueRunner: 봇 이벤트 루프 안에서 TASK_WORKERS 개 워커로 대기열을 비움
+      · 고정 대기 없이 바로 다음 작업 (Claude 호출 한도는 generate_post 쪽 llm_rate_limit 이 관리)
+      · 새 작업은 state_bus 알림(tasks.enqueued)으로 바로 깨어남, 없으면 TASK_POLL_SEC 간격 확인
+
+환경변수:
+  TASK_WORKERS          봇 1개당 동시 실행 작업 수 (기본 1)
+  TASK_VISIBILITY_SEC   가져간 작업 소유 유지 시간 (기본 600초, 실행 중 1/3 마다 연장)
+  TASK_MAX_ATTEMPTS     봇이 죽어 다시 가져가는 최대 횟수 (기본 3)
+  TASK_LANE_GAPS        레인별 작업 간 최소 간격 (예: "post_to_tistory.py=30")
+  TASK_POLL_SEC         알림이 없을 때 대기열 확인 간격 (기본 5초)
+
+CLI:
+  python3 task_queue.py list
+  python3 task_queue.py add <script> [--priority high|normal|low] [--delay 초] [--at "YYYY-MM-DD HH:MM"] [-- 스크립트 인자 ...]
+      (스크립트에 넘길 인자는 반드시 -- 뒤에 — 대기열 옵션이 스크립트로 넘어가지 않음)
+  python3 task_queue.py cancel <id>
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Awaitable, Callable
+
+try:
+    import state_bus   # 새 작업 알림 (없으면 주기적 확인만)
+except ImportError:
+    state_bus = None
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 경로 / 설정
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+SCRIPT_DIR   = Path(__file__).resolve().parent
+PROJECT_DIR  = SCRIPT_DIR.parent.parent
+DB_FILE      = PROJECT_DIR / "teams" / "content" / "workspace" / "blog" / "data" / "task_queue.sqlite"
+
+WORKERS        = int(os.environ.get("TASK_WORKERS", "1"))
+VISIBILITY_SEC = int(os.environ.get("TASK_VISIBILITY_SEC", "600"))
+MAX_ATTEMPTS   = int(os.environ.get("TASK_MAX_ATTEMPTS", "3"))
+POLL_SEC       = float(os.environ.get("TASK_POLL_SEC", "5"))
+
+PRIORITY = {"high": 0, "normal": 5, "low": 9}
+
+STATUS_READY     = "ready"
+STATUS_RUNNING   = "running"
+STATUS_DONE      = "done"
+STATUS_FAILED    = "failed"
+STATUS_CANCELLED = "cancelled"
+
+STATUS_ICON = {
+    STATUS_READY: "⏸", STATUS_RUNNING: "▶️", STATUS_DONE: "✅",
+    STATUS_FAILED: "❌", STATUS_CANCELLED: "🛑",
+}
+
+
+def _parse_gaps(raw: str) -> dict[str, float]:
+    gaps = {}
+    for item in raw.split(","):
+        lane, _, sec = item.strip().partition("=")
+        try:
+            gaps[lane] = float(sec)
+        except ValueError:
+            continue
+    return gaps
+
+
+LANE_GAPS = _parse_gaps(os.environ.get("TASK_LANE_GAPS", ""))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id             INTEGER PRIMARY KEY AUTOINCREMENT,
+    script         TEXT NOT NULL,
+    args           TEXT NOT NULL DEFAULT '[]',
+    label          TEXT,
+    lane           TEXT NOT NULL,
+    priority       INTEGER NOT NULL DEFAULT 5,
+    run_at         REAL NOT NULL,
+    status         TEXT NOT NULL DEFAULT 'ready',
+    attempts       INTEGER NOT NULL DEFAULT 0,
+    owner          TEXT,
+    visible_until  REAL,
+    created_at     REAL NOT NULL,
+    started_at     REAL,
+    finished_at    REAL,
+    ok             INTEGER,
+    output         TEXT,
+    meta           TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_ready ON tasks(status, priority, run_at);
+CREATE TABLE IF NOT EXISTS lanes (
+    lane      TEXT PRIMARY KEY,
+    ready_at  REAL NOT NULL
+);
+"""
+
+_local = threading.local()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 저장소
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _db() -> sqlite3.Connection:
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        DB_FILE.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(DB_FILE), timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        _local.conn = conn
+    return conn
+
+
+@contextmanager
+def _tx():
+    conn = _db()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+
+class Task:
+    def __init__(self, row: sqlite3.Row):
+        self.id = row["id"]
+        self.script = row["script"]
+        self.args: list[str] = json.loads(row["args"])
+        self.label = row["label"] or row["script"]
+        self.lane = row["lane"]
+        self.priority = row["priority"]
+        self.run_at = row["run_at"]
+        self.status = row["status"]
+        self.attempts = row["attempts"]
+        self.owner = row["owner"]
+        self.ok = None if row["ok"] is None else bool(row["ok"])
+        self.output = row["output"] or ""
+        self.meta: dict = json.loads(row["meta"] or "{}")
+
+    def summary(self) -> str:
+        icon = STATUS_ICON.get(self.status, "•")
+        line = f"{icon} #{self.id} {self.label}"
+        if self.status == STATUS_READY and self.run_at > time.time():
+            line += f" ({datetime.fromtimestamp(self.run_at).strftime('%m-%d %H:%M')} 예약)"
+        if self.priority != PRIORITY["normal"]:
+            line += " ⬆️" if self.priority < PRIORITY["normal"] else " ⬇️"
+        return line
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 등록 / 조회
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def enqueue(script: str, args: list[str] | None = None, label: str = "",
+            priority: str = "normal", delay: float = 0, run_at: float | None = None,
+            lane: str | None = None, meta: dict | None = None, dedupe: bool = True) -> tuple[int, bool]:
+    """
+    작업 등록. 반환: (작업 id, 새로 등록했는지)
+    dedupe=True 면 같은 스크립트·인자의 작업이 이미 대기/실행 중일 때 그 id 를 돌려줌 (버튼 중복 클릭).
+    """
+    args_json = json.dumps(list(args or []), ensure_ascii=False)
+    now = time.time()
+    with _tx() as conn:
+        if dedupe:
+            row = conn.execute(
+                "SELECT id FROM tasks WHERE script = ? AND args = ? AND status IN ('ready', 'running')",
+                (script, args_json),
+            ).fetchone()
+            if row:
+                return row["id"], False
+        cur = conn.execute(
+            "INSERT INTO tasks (script, args, label, lane, priority, run_at, created_at, meta)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (script, args_json, label or script, lane or script, PRIORITY.get(priority, PRIORITY["normal"]),
+             run_at if run_at is not None else now + delay, now,
+             json.dumps(meta or {}, ensure_ascii=False)),
+        )
+        task_id = cur.lastrowid
+    if state_bus is not None:
+        state_bus.publish("tasks.enqueued", {"id": task_id})
+    return task_id, True
+
+
+def get(task_id: int) -> Task | None:
+    row = _db().execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchone()
+    return Task(row) if row else None
+
+
+def pending(limit: int = 20) -> list[Task]:
+    """대기 · 실행 중인 작업 (실행 순서대로)."""
+    rows = _db().execute(
+        "SELECT * FROM tasks WHERE status IN ('ready', 'running')"
+        " ORDER BY status = 'ready', priority, run_at, id LIMIT ?", (limit,),
+    ).fetchall()
+    return [Task(r) for r in rows]
+
+
+def recent(limit: int = 10) -> list[Task]:
+    rows = _db().execute(
+        "SELECT * FROM tasks WHERE status NOT IN ('ready', 'running') ORDER BY finished_at DESC LIMIT ?",
+        (limit,),
+    ).fetchall()
+    return [Task(r) for r in rows]
+
+
+def counts() -> dict[str, int]:
+    return {r[0]: r[1] for r in _db().execute("SELECT status, COUNT(*) FROM tasks GROUP BY status")}
+
+
+def position(task_id: int) -> int:
+    """앞에 대기 중인 작업 수 (같은 레인 기준)."""
+    task = get(task_id)
+    if not task or task.status != STATUS_READY:
+        return 0
+    row = _db().execute(
+        "SELECT COUNT(*) FROM tasks WHERE lane = ? AND status IN ('ready', 'running') AND id != ?"
+        " AND (status = 'running' OR priority < ? OR (priority = ? AND run_at <= ?))",
+        (task.lane, task.id, task.priority, task.priority, task.run_at),
+    ).fetchone()
+    return row[0]
+
+
+def update_meta(task_id: int, **values) -> None:
+    """meta 에 값 추가 (예: 등록 후에야 알 수 있는 텔레그램 message_id)."""
+    with _tx() as conn:
+        row = conn.execute("SELECT meta FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        if row:
+            meta = {**json.loads(row["meta"] or "{}"), **values}
+            conn.execute("UPDATE tasks SET meta = ? WHERE id = ?", (json.dumps(meta, ensure_ascii=False), task_id))
+
+
+def cancel(task_id: int) -> bool:
+    """대기 중인 작업만 취소 (실행 중인 작업은 봇의 /cancel 로 프로세스를 멈춤)."""
+    with _tx() as conn:
+        cur = conn.execute(
+            "UPDATE tasks SET status = 'cancelled', finished_at = ? WHERE id = ? AND status = 'ready'",
+            (time.time(), task_id),
+        )
+    return cur.rowcount > 0
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 소비
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def claim(owner: str) -> Task | None:
+    """실행할 작업 1건 가져가기. 소유 기간이 지난 작업은 먼저 되돌리거나 실패 처리."""
+    now = time.time()
+    with _tx() as conn:
+        conn.execute(
+            "UPDATE tasks SET status = 'ready', owner = NULL"
+            " WHERE status = 'running' AND visible_until < ? AND attempts < ?",
+            (now, MAX_ATTEMPTS),
+        )
+        conn.execute(
+            "UPDATE tasks SET status = 'failed', ok = 0, finished_at = ?,"
+            " output = '실행하던 봇이 응답 없음 (최대 재시도 초과)'"
+            " WHERE status = 'running' AND visible_until < ?",
+            (now, now),
+        )
+        row = conn.execute(
+            "SELECT * FROM tasks WHERE status = 'ready' AND run_at <= ?"
+            " AND lane NOT IN (SELECT lane FROM tasks WHERE status = 'running')"
+            " AND lane NOT IN (SELECT lane FROM lanes WHERE ready_at > ?)"
+            " ORDER BY priority, run_at, id LIMIT 1",
+            (now, now),
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute(
+            "UPDATE tasks SET status = 'running', owner = ?, attempts = attempts + 1,"
+            " visible_until = ?, started_at = ? WHERE id = ?",
+            (owner, now + VISIBILITY_SEC, now, row["id"]),
+        )
+        row = conn.execute("SELECT * FROM tasks WHERE id = ?", (row["id"],)).fetchone()
+    return Task(row)
+
+
+def heartbeat(task_id: int, owner: str) -> bool:
+    """소유 기간 연장. False 면 소유권을 잃음 (다른 봇이 가져갔거나 취소됨)."""
+    with _tx() as conn:
+        cur = conn.execute(
+            "UPDATE tasks SET visible_until = ? WHERE id = ? AND owner = ? AND status = 'running'",
+            (time.time() + VISIBILITY_SEC, task_id, owner),
+        )
+    return cur.rowcount > 0
+
+
+def complete(task_id: int, owner: str, ok: bool, output: str = "") -> bool:
+    now = time.time()
+    with _tx() as conn:
+        cur = conn.execute(
+            "UPDATE tasks SET status = ?, ok = ?, output = ?, finished_at = ?, owner = NULL"
+            " WHERE id = ? AND owner = ? AND status = 'running'",
+            (STATUS_DONE if ok else STATUS_FAILED, int(ok), output[-4000:], now, task_id, owner),
+        )
+        row = conn.execute("SELECT lane FROM tasks WHERE id = ?", (task_id,)).fetchone()
+        gap = LANE_GAPS.get(row["lane"], 0) if row else 0
+        if gap:
+            conn.execute("INSERT OR REPLACE INTO lanes (lane, ready_at) VALUES (?, ?)", (row["lane"], now + gap))
+    return cur.rowcount > 0
+
+
+def release(task_id: int, owner: str) -> bool:
+    """실행하던 작업을 대기열로 되돌림 (봇 정상 종료 — 재시도 횟수에 넣지 않음)."""
+    with _tx() as conn:
+        cur = conn.execute(
+            "UPDATE tasks SET status = 'ready', owner = NULL, attempts = MAX(attempts - 1, 0)"
+            " WHERE id = ? AND owner = ? AND status = 'running'",
+            (task_id, owner),
+        )
+    return cur.rowcount > 0
+
+
+def next_due() -> float | None:
+    """다음 작업을 가져갈 수 있는 가장 이른 시각 (대기 작업이 없으면 None)."""
+    row = _db().execute(
+        "SELECT MIN(MAX(t.run_at, COALESCE(l.ready_at, 0))) FROM tasks t"
+        " LEFT JOIN lanes l ON l.lane = t.lane WHERE t.status = 'ready'"
+    ).fetchone()
+    return row[0]
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 봇 이벤트 루프용 실행기
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class QueueRunner:
+    """
+    execute(task) → (성공 여부, 출력) 을 돌려주는 코루틴으로 대기열을 비움.
+    on_start(task) · on_done(task, ok, out) 은 텔레그램 알림용 (예외는 무시).
+    """
+
+    def __init__(self, execute: Callable[[Task], Awaitable[tuple[bool, str]]],
+                 on_start: Callable[[Task], Awaitable[None]] | None = None,
+                 on_done: Callable[[Task, bool, str], Awaitable[None]] | None = None,
+                 name: str = "bot", workers: int = WORKERS):
+        self.execute = execute
+        self.on_start = on_start
+        self.on_done = on_done
+        self.owner = f"{name}@{socket.gethostname()}:{os.getpid()}"
+        self.workers = max(1, workers)
+        self._wake = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+        self._sub = None
+        self._stopping = False
+
+    def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        if state_bus is not None:
+            try:
+                self._sub = state_bus.Subscriber(["tasks.*"])
+                loop.add_reader(self._sub.fileno(), self._on_bus)
+            except OSError:
+                self._sub = None
+        self._tasks = [loop.create_task(self._worker(i), name=f"task-worker-{i}") for i in range(self.workers)]
+
+    async def stop(self, terminate: Callable[[], Awaitable[None]] | None = None) -> None:
+        """
+        새 작업을 더 가져가지 않고 종료. terminate 가 주어지면 먼저 실행(실행 중인 스크립트 종료)하고,
+        그 때문에 끝난 작업은 실패로 기록하지 않고 대기열로 되돌린다 (release 는 프로세스가 죽은 뒤).
+        """
+        self._stopping = True
+        if self._sub is not None:
+            asyncio.get_running_loop().remove_reader(self._sub.fileno())
+            self._sub.close()
+            self._sub = None
+        if terminate is not None:
+            try:
+                await terminate()
+            except Exception:
+                pass
+        for t in self._tasks:
+            t.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def wake(self) -> None:
+        self._wake.set()
+
+    def _on_bus(self) -> None:
+        if self._sub.drain():
+            self._wake.set()
+
+    async def _worker(self, index: int) -> None:
+        while not self._stopping:
+            task = await asyncio.to_thread(claim, self.owner)
+            if task is None:
+                due = await asyncio.to_thread(next_due)
+                now = time.time()
+                # 예약 · 레인 간격이면 그 시각까지, 레인이 실행 중이면 tasks.done 알림(또는 POLL_SEC)까지
+                timeout = min(POLL_SEC, due - now) if due is not None and due > now else POLL_SEC
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._handle(task)
+            if state_bus is not None:
+                state_bus.publish("tasks.done", {"id": task.id})
+
+    async def _handle(self, task: Task) -> None:
+        beat = asyncio.get_running_loop().create_task(self._heartbeat(task))
+        try:
+            await self._notify(self.on_start, task)
+            try:
+                ok, out = await self.execute(task)
+            except Exception as e:
+                ok, out = False, f"실행 오류: {e}"
+        except asyncio.CancelledError:
+            await asyncio.shield(asyncio.to_thread(release, task.id, self.owner))
+            raise
+        finally:
+            beat.cancel()
+        if self._stopping:
+            # stop(terminate=...) 로 스크립트가 중단됨 — 결과 대신 대기열로 되돌림
+            await asyncio.shield(asyncio.to_thread(release, task.id, self.owner))
+            return
+        if await asyncio.to_thread(complete, task.id, self.owner, ok, out):
+            await self._notify(self.on_done, task, ok, out)
+
+    async def _heartbeat(self, task: Task) -> None:
+        while True:
+            await asyncio.sleep(VISIBILITY_SEC / 3)
+            await asyncio.to_thread(heartbeat, task.id, self.owner)
+
+    @staticmethod
+    async def _notify(callback, *args) -> None:
+        if callback is None:
+            return
+        try:
+            await callback(*args)
+        except Exception:
+            pass
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# CLI
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    # "--" 뒤는 스크립트 인자 그대로, 앞쪽만 대기열 옵션으로 해석
+    argv = sys.argv[1:]
+    script_args: list[str] = []
+    if "--" in argv:
+        cut = argv.index("--")
+        argv, script_args = argv[:cut], argv[cut + 1:]
+
+    parser = argparse.ArgumentParser(description="봇 공용 작업 대기열")
+    sub = parser.add_subparsers(dest="cmd")
+    sub.add_parser("list", help="대기 · 실행 중 · 최근 작업")
+    add = sub.add_parser("add", help="작업 등록")
+    add.add_argument("script", help="실행할 스크립트 (스크립트 인자는 -- 뒤에)")
+    add.add_argument("--priority", choices=list(PRIORITY), default="normal")
+    add.add_argument("--delay", type=float, default=0, help="몇 초 뒤 실행")
+    add.add_argument("--at", help='예약 시각 "YYYY-MM-DD HH:MM"')
+    add.add_argument("--label", default="")
+    cancel_p = sub.add_parser("cancel", help="대기 중인 작업 취소")
+    cancel_p.add_argument("id", type=int)
+    opts = parser.parse_args(argv)
+    if script_args and opts.cmd != "add":
+        parser.error("-- 뒤 인자는 add 에서만 사용")
+
+    if opts.cmd == "add":
+        at = datetime.strptime(opts.at, "%Y-%m-%d %H:%M").timestamp() if opts.at else None
+        task_id, created = enqueue(opts.script, script_args, label=opts.label, priority=opts.priority,
+                                   delay=opts.delay, run_at=at)
+        print(f"{'✅ 등록' if created else 'ℹ️ 이미 대기 중'}: #{task_id}")
+    elif opts.cmd == "cancel":
+        print("✅ 취소" if cancel(opts.id) else "❌ 대기 중인 작업이 아님")
+    else:
+        print("📋 대기 · 실행 중")
+        for t in pending():
+            print(" ", t.summary())
+        print("🕘 최근 완료")
+        for t in recent():
+            print(" ", t.summary())
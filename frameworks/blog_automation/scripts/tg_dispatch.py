@@ -0,0 +1,239 @@
+"""
+tg_dispatch.py — 텔레그램 알림 백그라운드 전송기 (큐 + 진행 메시지 병합)
+
+generate_post.py · shared_state.py 의 알림이 글 생성 루프 안에서 10초 타임아웃 HTTP 요청으로
+진행을 막지 않도록, 호출 측은 큐에 넣기만 하고 전송은 데몬 스레드 1개가 맡는다.
+  - notify(text)          일반 메시지 (순서대로 전송)
+  - progress(key, text)   진행 상황 메시지 — key 별로 메시지 1개를 editMessageText 로 계속 갱신,
+                          전송 전에 새 내용이 오면 마지막 것만 보냄 (병합)
+  - 커넥션 재사용 (requests.Session 1개)
+  - 전체 초당 30건 · 채팅별 초당 TG_CHAT_RATE 건 토큰 버킷, 429 의 retry_after 준수
+  - 큐가 가득 차면 가장 오래된 일반 메시지를 버림 — 호출 측은 절대 기다리지 않음
+  - 종료 시(atexit) 최대 TG_FLUSH_SEC 초 동안 남은 메시지 전송
+
+환경변수:
+  TELEGRAM_BOT_TOKEN, TELEGRAM_CHAT_ID   없으면 모든 호출이 조용히 무시됨
+  TG_QUEUE_MAX      대기 메시지 최대 수 (기본 200)
+  TG_CHAT_RATE      채팅별 초당 메시지 수 (기본 1)
+  TG_PROGRESS_SEC   같은 진행 메시지를 다시 고치기까지 최소 간격 (기본 3초)
+  TG_FLUSH_SEC      종료 시 남은 메시지 전송 대기 (기본 5초)
+"""
+
+from __future__ import annotations
+
+import atexit
+import collections
+import os
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from throttle import TokenBucket
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 설정
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+API_BASE      = "https://api.telegram.org"
+QUEUE_MAX     = int(os.environ.get("TG_QUEUE_MAX", "200"))
+CHAT_RATE     = float(os.environ.get("TG_CHAT_RATE", "1"))
+PROGRESS_SEC  = float(os.environ.get("TG_PROGRESS_SEC", "3"))
+FLUSH_SEC     = float(os.environ.get("TG_FLUSH_SEC", "5"))
+GLOBAL_RATE   = 30.0   # Bot API 전체 한도
+SEND_TIMEOUT  = 10
+MAX_ATTEMPTS  = 3
+
+
+class TelegramDispatcher:
+    def __init__(self, bot_token: str, default_chat: str):
+        self.bot_token = bot_token
+        self.default_chat = default_chat
+        self._session = requests.Session()
+        self._session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        self._global = TokenBucket(GLOBAL_RATE, GLOBAL_RATE)
+        self._chats: dict[str, TokenBucket] = {}
+
+        self._cond = threading.Condition()
+        self._messages: collections.deque = collections.deque()   # (chat_id, text)
+        # key → {"chat", "text", "message_id", "sent_text", "sent_at"}
+        self._progress: dict[str, dict] = {}
+        self._inflight = False
+        self._flushing = False
+        self.dropped = 0
+        self._thread = threading.Thread(target=self._run, name="tg-dispatch", daemon=True)
+        self._thread.start()
+
+    # ── 호출 측 API (즉시 반환) ──
+
+    def notify(self, text: str, chat_id: str | None = None) -> None:
+        with self._cond:
+            if len(self._messages) >= QUEUE_MAX:
+                self._messages.popleft()
+                self.dropped += 1
+            self._messages.append((chat_id or self.default_chat, text))
+            self._cond.notify()
+
+    def progress(self, key: str, text: str, chat_id: str | None = None) -> None:
+        with self._cond:
+            entry = self._progress.setdefault(
+                key, {"chat": chat_id or self.default_chat, "message_id": None,
+                      "sent_text": None, "sent_at": 0.0},
+            )
+            entry["text"] = text
+            self._cond.notify()
+
+    def end_progress(self, key: str) -> None:
+        """다음 progress(key) 는 기존 메시지를 고치지 않고 새 메시지로 시작."""
+        with self._cond:
+            entry = self._progress.get(key)
+            if entry and entry.get("text") in (None, entry.get("sent_text")):
+                self._progress.pop(key, None)
+            elif entry:
+                entry["closing"] = True
+
+    def flush(self, timeout: float = FLUSH_SEC) -> bool:
+        """대기 중인 메시지를 timeout 초 안에 모두 보냈으면 True."""
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._flushing = True
+            try:
+                while self._pending_locked(ignore_interval=True) or self._inflight:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._cond.notify_all()
+                    self._cond.wait(min(remaining, 0.2))
+            finally:
+                self._flushing = False
+        return True
+
+    # ── 전송 스레드 ──
+
+    def _pending_locked(self, ignore_interval: bool = False):
+        """다음에 보낼 작업. 일반 메시지가 우선, 진행 메시지는 최소 간격이 지난 것만."""
+        if self._messages:
+            return ("message", self._messages[0])
+        now = time.monotonic()
+        for key, e in self._progress.items():
+            if e.get("text") is None or e["text"] == e["sent_text"]:
+                continue
+            if ignore_interval or e["message_id"] is None or now - e["sent_at"] >= PROGRESS_SEC:
+                return ("progress", key)
+        return None
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                job = self._pending_locked(self._flushing)
+                while job is None:
+                    self._cond.wait(timeout=PROGRESS_SEC)
+                    job = self._pending_locked(self._flushing)
+                kind, item = job
+                if kind == "message":
+                    self._messages.popleft()
+                    chat, text, entry = item[0], item[1], None
+                else:
+                    entry = self._progress[item]
+                    chat, text = entry["chat"], entry["text"]
+                self._inflight = True
+            try:
+                if kind == "message":
+                    self._call("sendMessage", chat, {"text": text})
+                else:
+                    self._send_progress(item, entry, chat, text)
+            except Exception:
+                pass   # 알림 실패는 조용히 무시 (메인 작업 영향 없음)
+            finally:
+                with self._cond:
+                    self._inflight = False
+                    self._cond.notify_all()
+
+    def _send_progress(self, key: str, entry: dict, chat: str, text: str) -> None:
+        if entry["message_id"]:
+            result = self._call("editMessageText", chat, {"message_id": entry["message_id"], "text": text})
+        else:
+            result = self._call("sendMessage", chat, {"text": text})
+        with self._cond:
+            if isinstance(result, dict) and result.get("message_id"):
+                entry["message_id"] = result["message_id"]
+            entry["sent_text"] = text
+            entry["sent_at"] = time.monotonic()
+            if entry.get("closing") and entry.get("text") == text:
+                self._progress.pop(key, None)
+
+    def _bucket(self, chat: str) -> TokenBucket:
+        bucket = self._chats.get(chat)
+        if bucket is None:
+            bucket = self._chats[chat] = TokenBucket(CHAT_RATE, max(1.0, CHAT_RATE * 3))
+        return bucket
+
+    def _call(self, method: str, chat: str, params: dict):
+        payload = {"chat_id": chat, "parse_mode": "Markdown", **params}
+        url = f"{API_BASE}/bot{self.bot_token}/{method}"
+        for _ in range(MAX_ATTEMPTS):
+            self._bucket(chat).acquire()
+            self._global.acquire()
+            resp = self._session.post(url, json=payload, timeout=SEND_TIMEOUT)
+            try:
+                data = resp.json()
+            except ValueError:
+                data = {}
+            if resp.status_code == 429:
+                wait = float((data.get("parameters") or {}).get("retry_after", 1))
+                self._bucket(chat).pause(wait)
+                continue
+            if not data.get("ok"):
+                desc = data.get("description", "")
+                if "not modified" in desc:
+                    return None
+                if "parse" in desc and payload.get("parse_mode"):
+                    # Markdown 오류 (제목의 _ * 등) → 일반 텍스트로 재전송
+                    payload.pop("parse_mode")
+                    continue
+                return None
+            return data.get("result")
+        return None
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 모듈 단위 싱글턴
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+_dispatcher: TelegramDispatcher | None = None
+_init_lock = threading.Lock()
+
+
+def get_dispatcher() -> TelegramDispatcher | None:
+    """환경변수가 없으면 None. 프로세스 내 첫 호출 시 전송 스레드 시작."""
+    global _dispatcher
+    bot_token = os.environ.get("TELEGRAM_BOT_TOKEN", "").strip()
+    chat_id   = os.environ.get("TELEGRAM_CHAT_ID", "").strip()
+    if not bot_token or not chat_id:
+        return None
+    with _init_lock:
+        if _dispatcher is None:
+            _dispatcher = TelegramDispatcher(bot_token, chat_id)
+            atexit.register(_dispatcher.flush)
+        return _dispatcher
+
+
+def notify(text: str) -> None:
+    d = get_dispatcher()
+    if d:
+        d.notify(text)
+
+
+def progress(key: str, text: str) -> None:
+    d = get_dispatcher()
+    if d:
+        d.progress(key, text)
+
+
+def end_progress(key: str) -> None:
+    d = get_dispatcher()
+    if d:
+        d.end_progress(key)
+
+
+def flush(timeout: float = FLUSH_SEC) -> bool:
+    return _dispatcher.flush(timeout) if _dispatcher else True
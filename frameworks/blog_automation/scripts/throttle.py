@@ -0,0 +1,133 @@
+"""
+throttle.py — 외부 API 호출용 동시성 제한 + 토큰 버킷 Rate Limiter
+
+역할:
+  - provider(tmdb / anilist / youtube / reddit / mal ...)별로
+    ① 동시에 진행 가능한 요청 수 (Semaphore)
+    ② 초당 요청 수 (Token Bucket)
+    를 함께 제한
+  - 고정 time.sleep() 대신 "다음 요청이 안전한 가장 이른 시점"까지만 대기
+
+사용 예:
+    from throttle import throttled
+    with throttled("tmdb"):
+        resp = requests.get(url, timeout=10)
+
+환경변수 (선택, provider 대문자):
+  THROTTLE_<PROVIDER>_RATE         초당 허용 요청 수 (예: THROTTLE_TMDB_RATE=4)
+  THROTTLE_<PROVIDER>_CONCURRENCY  동시 요청 수     (예: THROTTLE_TMDB_CONCURRENCY=4)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# provider별 기본 한도
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# (초당 요청 수, 버스트 허용량, 동시 요청 수)
+PROVIDER_LIMITS: dict[str, tuple[float, float, int]] = {
+    "anilist": (1.4, 3, 2),   # 공식 90 req/min
+    "tmdb":    (4.0, 8, 4),   # 약 40 req/10s
+    "youtube": (5.0, 5, 2),   # 일일 쿼터가 병목 → 속도는 여유
+    "reddit":  (1.0, 2, 1),   # 비인증 공개 API → 보수적으로
+    "mal":     (4.0, 8, 4),   # 공식 한도 비공개 — 429 시 http_cache 가 백오프 재시도
+    "image_cdn": (20.0, 20, 8),  # TMDB/AniList 이미지 CDN — API 한도 없음, 커넥션 수만 제한
+}
+DEFAULT_LIMIT: tuple[float, float, int] = (2.0, 2, 2)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 토큰 버킷
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 capacity개까지 쌓이는 스레드 안전 토큰 버킷."""
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = max(rate, 0.001)
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """토큰을 확보할 때까지 대기. 반환: 실제 대기한 초."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
+            waited += wait
+
+    def pause(self, seconds: float) -> None:
+        """서버가 429/Retry-After를 돌려준 경우 — 버킷을 비워 seconds 동안 요청 중단."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# provider 단위 제한 (동시성 + 속도)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class ProviderThrottle:
+    def __init__(self, name: str, rate: float, burst: float, concurrency: int):
+        self.name = name
+        self.bucket = TokenBucket(rate, burst)
+        self.concurrency = max(1, concurrency)
+        self._sem = threading.BoundedSemaphore(self.concurrency)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        with self._sem:
+            self.bucket.acquire()
+            yield
+
+
+_registry: dict[str, ProviderThrottle] = {}
+_registry_lock = threading.Lock()
+
+
+def _env_number(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, "") or default)
+    except ValueError:
+        return default
+
+
+def get_throttle(provider: str) -> ProviderThrottle:
+    """provider 이름으로 공유 ProviderThrottle 반환 (프로세스 내 싱글턴)."""
+    with _registry_lock:
+        t = _registry.get(provider)
+        if t is None:
+            rate, burst, conc = PROVIDER_LIMITS.get(provider, DEFAULT_LIMIT)
+            key = provider.upper()
+            rate = _env_number(f"THROTTLE_{key}_RATE", rate)
+            conc = int(_env_number(f"THROTTLE_{key}_CONCURRENCY", conc))
+            t = ProviderThrottle(provider, rate, max(burst, 1.0), conc)
+            _registry[provider] = t
+        return t
+
+
+@contextmanager
+def throttled(provider: str) -> Iterator[None]:
+    """provider 한도 안에서 요청 1건을 실행하는 컨텍스트."""
+    with get_throttle(provider).slot():
+        yield
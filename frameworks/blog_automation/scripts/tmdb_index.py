@@ -0,0 +1,210 @@
+"""
+tmdb_index.py — AniList / MAL ID → TMDB TV ID 매핑 인덱스
+
+TMDB 검색 결과 첫 번째를 그대로 쓰면 동명 작품·실사판을 잘못 고르는 일이 있어,
+한 번 제대로 고른 결과를 blog/data/tmdb_index.json 에 저장해 두고 다음부터는 /tv/{id} 로 바로 간다.
+
+매칭 점수 (0~1.3):
+  - 제목 유사도: TMDB name · original_name  ×  AniList romaji · english · native (difflib, 정규화 후 최댓값)
+  - 첫 방영 연도: 같으면 +0.15, 1년 차이 +0.05, 그 이상 -0.2
+      · 단 TMDB 가 더 이른 경우(시즌 속편 — TMDB 는 시리즈 첫 방영일, AniList 는 해당 시즌 시작 연도)
+        제목 유사도가 SEQUEL_SIM 이상이면 감점하지 않음
+  - 제목 비교 시 AniList 쪽 시즌 표기("Season 2", "2nd Season", "第2期", "Part 2" 등)를 뗀 제목도 함께 비교
+  - 애니메이션 장르(16) +0.1, 원어 일본어 +0.05
+  TMDB_MATCH_MIN(기본 0.6) 미만이면 매칭 실패로 기록하고 TMDB_INDEX_MISS_DAYS 후 다시 검색.
+
+인덱스 파일은 파일 락 안에서 다시 읽어 병합 저장 (generate_post --workers 여러 프로세스가 동시에 기록).
+
+사용 예:
+    found, tmdb_id = tmdb_index.lookup(anilist_id, mal_id)
+    if not found:
+        tmdb_id, score, name = tmdb_index.best_match(results, titles, year)
+        tmdb_index.remember(anilist_id, mal_id, tmdb_id, score, name)
+"""
+
+from __future__ import annotations
+
+import difflib
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows — 락 없이 동작
+    fcntl = None
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 경로 / 설정
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+SCRIPT_DIR   = Path(__file__).resolve().parent
+PROJECT_DIR  = SCRIPT_DIR.parent.parent
+INDEX_FILE   = PROJECT_DIR / "teams" / "content" / "workspace" / "blog" / "data" / "tmdb_index.json"
+
+MATCH_MIN = float(os.environ.get("TMDB_MATCH_MIN", "0.6"))
+# 이 이상 제목이 비슷하면 TMDB 첫 방영이 몇 년 앞서도 같은 시리즈(시즌 속편)로 본다
+SEQUEL_SIM = float(os.environ.get("TMDB_SEQUEL_SIM", "0.7"))
+# 매칭 실패 기록을 믿는 기간 — 방영 직전 작품은 나중에 TMDB 에 등록되기도 함
+MISS_DAYS = int(os.environ.get("TMDB_INDEX_MISS_DAYS", "7"))
+
+ANIMATION_GENRE = 16
+
+_lock = threading.Lock()
+_index: dict | None = None
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 인덱스 파일
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _load() -> dict:
+    global _index
+    if _index is None:
+        try:
+            _index = json.loads(INDEX_FILE.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            _index = {}
+    return _index
+
+
+@contextmanager
+def _file_locked():
+    INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with open(INDEX_FILE.with_suffix(".lock"), "a+") as lock:
+        if fcntl:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _update(apply) -> None:
+    """락 안에서 파일을 다시 읽어 apply(index) 로 고친 뒤 원자적으로 저장 (다른 프로세스 기록 보존)."""
+    global _index
+    with _lock, _file_locked():
+        try:
+            index = json.loads(INDEX_FILE.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            index = {}
+        apply(index)
+        tmp = INDEX_FILE.with_name(f".{INDEX_FILE.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(index, ensure_ascii=False, indent=2), encoding="utf-8")
+        tmp.replace(INDEX_FILE)
+        _index = index
+
+
+def _keys(anilist_id: int | None, mal_id: int | None) -> list[str]:
+    return [k for k in (
+        f"anilist:{anilist_id}" if anilist_id else None,
+        f"mal:{mal_id}" if mal_id else None,
+    ) if k]
+
+
+def lookup(anilist_id: int | None, mal_id: int | None) -> tuple[bool, int | None]:
+    """
+    반환: (인덱스에 유효한 기록이 있는지, tmdb_id)
+    매칭 실패 기록은 MISS_DAYS 동안 (True, None) 으로 돌려줘 검색을 반복하지 않는다.
+    """
+    with _lock:
+        index = _load()
+        for key in _keys(anilist_id, mal_id):
+            entry = index.get(key)
+            if not entry:
+                continue
+            if entry.get("tmdb_id"):
+                return True, entry["tmdb_id"]
+            if time.time() - entry.get("matched_at", 0) < MISS_DAYS * 86400:
+                return True, None
+    return False, None
+
+
+def remember(anilist_id: int | None, mal_id: int | None, tmdb_id: int | None,
+             score: float = 0.0, name: str = "") -> None:
+    """매칭 결과(실패 포함)를 AniList · MAL 두 키 모두에 기록."""
+    keys = _keys(anilist_id, mal_id)
+    if not keys:
+        return
+    entry = {"tmdb_id": tmdb_id, "score": round(score, 3), "name": name, "matched_at": time.time()}
+    _update(lambda index: index.update((key, entry) for key in keys))
+
+
+def forget(anilist_id: int | None, mal_id: int | None) -> None:
+    """잘못된 매핑을 지울 때 (다음 실행에서 다시 검색)."""
+    keys = _keys(anilist_id, mal_id)
+
+    def apply(index: dict) -> None:
+        for key in keys:
+            index.pop(key, None)
+
+    _update(apply)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 매칭 점수
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def _normalize(text: str) -> str:
+    text = unicodedata.normalize("NFKC", text or "").casefold()
+    return re.sub(r"[\W_]+", "", text)
+
+
+def title_similarity(a: str, b: str) -> float:
+    a, b = _normalize(a), _normalize(b)
+    if not a or not b:
+        return 0.0
+    if a == b:
+        return 1.0
+    return difflib.SequenceMatcher(None, a, b).ratio()
+
+
+_SEASON_SUFFIX = re.compile(
+    r"[\s:\-–]*(?:(?:season|part|cour)\s*\d+|\d+(?:st|nd|rd|th)\s*(?:season|part|cour)"
+    r"|(?:the\s+)?final\s+season|第\s*\d+\s*(?:期|クール|部)|\d+\s*기|\s+\d+|\s+(?:ii|iii|iv))\s*$",
+    re.IGNORECASE,
+)
+
+
+def strip_season(title: str) -> str:
+    """'Title Season 2' · 'Title 2nd Season' · 'タイトル 第2期' → 'Title' (시즌 표기가 없으면 그대로)."""
+    return _SEASON_SUFFIX.sub("", title or "").strip() or (title or "")
+
+
+def score_candidate(candidate: dict, titles: list[str], year: int | None) -> float:
+    """TMDB /search/tv 결과 1건의 점수."""
+    names = [candidate.get("name") or "", candidate.get("original_name") or ""]
+    variants = {v for t in titles if t for v in (t, strip_season(t))}
+    sim = max((title_similarity(n, t) for n in names for t in variants), default=0.0)
+    score = sim
+    air = (candidate.get("first_air_date") or "")[:4]
+    if year and air.isdigit():
+        diff = int(air) - year
+        if diff == 0:
+            score += 0.15
+        elif abs(diff) == 1:
+            score += 0.05
+        elif not (diff < 0 and sim >= SEQUEL_SIM):   # 시즌 속편은 TMDB 첫 방영이 앞섬
+            score -= 0.2
+    if ANIMATION_GENRE in (candidate.get("genre_ids") or []):
+        score += 0.1
+    if candidate.get("original_language") == "ja":
+        score += 0.05
+    return score
+
+
+def best_match(results: list[dict], titles: list[str], year: int | None) -> tuple[int | None, float, str]:
+    """검색 결과 중 최고점 후보. 반환: (tmdb_id 또는 None, 점수, TMDB 제목)"""
+    best_id, best_score, best_name = None, 0.0, ""
+    for cand in results:
+        s = score_candidate(cand, titles, year)
+        if s > best_score:
+            best_id, best_score, best_name = cand.get("id"), s, cand.get("name") or ""
+    if best_score < MATCH_MIN:
+        return None, best_score, best_name
+    return best_id, best_score, best_name
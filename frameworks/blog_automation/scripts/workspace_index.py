@@ -0,0 +1,415 @@
+"""
+workspace_index.py — 봇 대시보드 · 현황 화면용 작업 폴더 인덱스 (메모리, 증분 갱신)
+
+content_team_bot.py · atlas_bot.py 가 버튼을 누를 때마다 drafts / published / images / design / ops
+폴더를 glob · rglob 하고 파일마다 stat() 하던 것을 대체한다.
+  - 시작할 때 한 번 전체 스캔 (봇 post_init 에서 start())
+  - 이후 변경은 watchdog(inotify 등) 이벤트로 해당 파일만 반영
+      · watchdog 이 없으면 WORKSPACE_RESCAN_SEC 마다 백그라운드 재스캔 (크기 · mtime 비교)
+      · watchdog 이 있어도 WORKSPACE_VERIFY_SEC 마다 한 번 재스캔 (놓친 이벤트 · 나중에 생긴 폴더)
+  - 디렉터리마다 확장자별 개수 · 총 크기(하위 포함)를 유지 → count() · size() 는 O(1)
+    mtime 순 · 이름 순 정렬 목록을 유지 → 최신 N개는 O(N), 갱신은 이분 탐색
+  - 숨김 파일·폴더(.*)와 __pycache__ 는 제외
+
+환경변수:
+  WORKSPACE_RESCAN_SEC   watchdog 이 없을 때 재스캔 간격 (기본 30초)
+  WORKSPACE_VERIFY_SEC   watchdog 이 있을 때 보정용 재스캔 간격 (기본 600초)
+
+사용 예:
+    ws = WorkspaceIndex([DRAFTS_DIR, OPS_DIR])
+    ws.start()
+    ws.count(DRAFTS_DIR, ".md")
+    ws.files(OPS_DIR, ".md", recursive=True, limit=5)   # 최근 수정 5개
+"""
+
+from __future__ import annotations
+
+import bisect
+import fnmatch
+import os
+import threading
+from collections import Counter
+from pathlib import Path
+from typing import NamedTuple
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 설정
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+RESCAN_SEC = int(os.environ.get("WORKSPACE_RESCAN_SEC", "30"))
+VERIFY_SEC = int(os.environ.get("WORKSPACE_VERIFY_SEC", "600"))
+SKIP_DIRS  = {"__pycache__"}
+
+
+class FileEntry(NamedTuple):
+    path: Path
+    size: int
+    mtime: float
+
+
+def _skip(name: str) -> bool:
+    return name.startswith(".") or name in SKIP_DIRS
+
+
+class _DirNode:
+    __slots__ = ("files", "names", "recent", "tree_recent", "counts", "tree_counts",
+                 "size", "tree_size", "subdirs")
+
+    def __init__(self):
+        self.files: dict[str, FileEntry] = {}             # 바로 아래 파일 (이름 → 항목)
+        self.names: list[str] = []                        # 바로 아래 파일 이름 (정렬)
+        self.recent: list[tuple[float, str]] = []         # 바로 아래 (mtime, 경로) 오름차순
+        self.tree_recent: list[tuple[float, str]] = []    # 하위 전체 (mtime, 경로) 오름차순
+        self.counts: Counter = Counter()                  # 바로 아래 확장자별 개수
+        self.tree_counts: Counter = Counter()             # 하위 전체 확장자별 개수
+        self.size = 0
+        self.tree_size = 0
+        self.subdirs: set[str] = set()
+
+
+def _insort(items: list, item) -> None:
+    bisect.insort(items, item)
+
+
+def _discard(items: list, item) -> None:
+    i = bisect.bisect_left(items, item)
+    if i < len(items) and items[i] == item:
+        del items[i]
+
+
+class WorkspaceIndex:
+    def __init__(self, roots: list[Path]):
+        self.roots = [Path(os.path.abspath(r)) for r in roots]
+        self._lock = threading.RLock()
+        self._entries: dict[str, FileEntry] = {}
+        self._dirs: dict[str, _DirNode] = {}
+        self._built = False
+        self._observer = None
+        self._watched: set[str] = set()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def watching(self) -> bool:
+        return self._observer is not None
+
+    # ── 시작 / 종료 ──
+
+    def start(self) -> None:
+        """전체 스캔 후 watchdog 감시(없으면 주기적 재스캔) 시작. 여러 번 불러도 한 번만."""
+        if self._thread is not None:
+            return
+        self.rescan()
+        if Observer is not None:
+            self._observer = Observer()
+            self._watch_roots()
+            self._observer.start()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._rescan_loop, name="workspace-index", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+            self._watched.clear()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _watch_roots(self) -> None:
+        handler = _Handler(self)
+        for root in self.roots:
+            key = str(root)
+            if key in self._watched or not root.is_dir():
+                continue
+            try:
+                self._observer.schedule(handler, key, recursive=True)
+                self._watched.add(key)
+            except OSError:
+                pass   # inotify 감시 수 한도 등 → 주기적 재스캔에 맡김
+
+    def _rescan_loop(self) -> None:
+        interval = VERIFY_SEC if self.watching else RESCAN_SEC
+        while not self._stop.wait(interval):
+            try:
+                self.rescan()
+                if self._observer is not None:
+                    self._watch_roots()   # 시작할 때 없던 폴더
+            except Exception:
+                pass
+
+    # ── 조회 ──
+
+    def count(self, directory: Path, suffix: str | None = None, recursive: bool = False) -> int:
+        with self._lock:
+            node = self._node_for(directory)
+            if node is None:
+                return 0
+            if suffix is None:
+                return len(node.tree_recent if recursive else node.files)
+            return (node.tree_counts if recursive else node.counts)[suffix.lower()]
+
+    def size(self, directory: Path, recursive: bool = False) -> int:
+        with self._lock:
+            node = self._node_for(directory)
+            if node is None:
+                return 0
+            return node.tree_size if recursive else node.size
+
+    def files(self, directory: Path, suffix: str | None = None, recursive: bool = False,
+              order: str = "mtime", reverse: bool = True, limit: int | None = None) -> list[FileEntry]:
+        """
+        디렉터리의 파일 목록. order="mtime" 이면 최근 수정 순, "name" 이면 이름 순
+        (reverse=False 면 오래된 순 / 가나다 순). limit 개까지만.
+        """
+        suffix = suffix.lower() if suffix else None
+        with self._lock:
+            node = self._node_for(directory)
+            if node is None:
+                return []
+            if order == "name" and not recursive:
+                base = os.path.abspath(directory)
+                keys = (os.path.join(base, name) for name in
+                        (reversed(node.names) if reverse else node.names))
+            elif order == "name":
+                keys = iter(sorted((p for _, p in node.tree_recent), reverse=reverse))
+            else:
+                items = node.tree_recent if recursive else node.recent
+                keys = (p for _, p in (reversed(items) if reverse else items))
+            out: list[FileEntry] = []
+            for key in keys:
+                entry = self._entries[key]
+                if suffix and entry.path.suffix.lower() != suffix:
+                    continue
+                out.append(entry)
+                if limit is not None and len(out) >= limit:
+                    break
+            return out
+
+    def paths(self, *args, **kwargs) -> list[Path]:
+        return [e.path for e in self.files(*args, **kwargs)]
+
+    def latest(self, directory: Path, suffix: str | None = None, recursive: bool = False) -> FileEntry | None:
+        found = self.files(directory, suffix, recursive=recursive, limit=1)
+        return found[0] if found else None
+
+    def subdirs(self, directory: Path) -> list[Path]:
+        with self._lock:
+            node = self._node_for(directory)
+            return [Path(directory, name) for name in sorted(node.subdirs)] if node else []
+
+    def glob(self, directory: Path, pattern: str) -> list[FileEntry]:
+        """하위 전체에서 파일 이름이 pattern(fnmatch)에 맞는 것 (드문 조회용, O(n))."""
+        with self._lock:
+            node = self._node_for(directory)
+            if node is None:
+                return []
+            return [self._entries[p] for _, p in reversed(node.tree_recent)
+                    if fnmatch.fnmatch(os.path.basename(p), pattern)]
+
+    def entry(self, path: Path) -> FileEntry | None:
+        with self._lock:
+            self._ensure_built()
+            return self._entries.get(os.path.abspath(path))
+
+    def _node_for(self, directory: Path) -> _DirNode | None:
+        self._ensure_built()
+        return self._dirs.get(os.path.abspath(directory))
+
+    def _ensure_built(self) -> None:
+        if not self._built:
+            self.rescan()   # start() 전에 조회 (CLI 등) → 그 자리에서 한 번 스캔
+
+    # ── 갱신 ──
+
+    def rescan(self, directory: Path | None = None) -> None:
+        """디렉터리(기본: 모든 루트)를 다시 읽어 달라진 파일만 반영."""
+        targets = [os.path.abspath(directory)] if directory else [str(r) for r in self.roots]
+        for top in targets:
+            if not self._indexed(top):
+                continue
+            seen_files, seen_dirs = self._walk(top)
+            with self._lock:
+                for key in [k for k in self._entries if k == top or k.startswith(top + os.sep)]:
+                    if key not in seen_files:
+                        self._remove_file(key)
+                for key, entry in seen_files.items():
+                    old = self._entries.get(key)
+                    if old is None or old.size != entry.size or old.mtime != entry.mtime:
+                        self._put_file(entry)
+                for key in seen_dirs:
+                    self._ensure_dir(key)
+                for key in [k for k in self._dirs if k.startswith(top + os.sep) and k not in seen_dirs]:
+                    self._remove_dir(key)
+        self._built = True
+
+    def upsert(self, path: Path) -> None:
+        """파일 1개 반영 (새로 생김 · 수정됨). 없어졌으면 제거."""
+        key = os.path.abspath(path)
+        if not self._indexed(key):
+            return
+        try:
+            st = os.stat(key)
+        except OSError:
+            self.discard(path)
+            return
+        if not os.path.isfile(key):
+            self.rescan(Path(key))
+            return
+        with self._lock:
+            self._put_file(FileEntry(Path(key), st.st_size, st.st_mtime))
+
+    def discard(self, path: Path) -> None:
+        """파일(또는 디렉터리 전체) 제거 — 봇이 직접 지운 파일을 바로 반영할 때도 사용."""
+        key = os.path.abspath(path)
+        with self._lock:
+            if key in self._entries:
+                self._remove_file(key)
+            elif key in self._dirs:
+                for k in [k for k in self._entries if k.startswith(key + os.sep)]:
+                    self._remove_file(k)
+                self._remove_dir(key)
+
+    @staticmethod
+    def _walk(top: str) -> tuple[dict[str, FileEntry], set[str]]:
+        files: dict[str, FileEntry] = {}
+        dirs: set[str] = set()
+        if not os.path.isdir(top):
+            return files, dirs
+        dirs.add(top)
+        stack = [top]
+        while stack:
+            cur = stack.pop()
+            try:
+                it = os.scandir(cur)
+            except OSError:
+                continue
+            with it:
+                for de in it:
+                    if _skip(de.name):
+                        continue
+                    try:
+                        if de.is_dir(follow_symlinks=False):
+                            dirs.add(de.path)
+                            stack.append(de.path)
+                        elif de.is_file():
+                            st = de.stat()
+                            files[de.path] = FileEntry(Path(de.path), st.st_size, st.st_mtime)
+                    except OSError:
+                        continue
+        return files, dirs
+
+    def _root_of(self, key: str) -> str | None:
+        for root in self.roots:
+            r = str(root)
+            if key == r or key.startswith(r + os.sep):
+                return r
+        return None
+
+    def _indexed(self, key: str) -> bool:
+        """루트 아래이고 숨김 · 제외 폴더를 거치지 않는 경로인지."""
+        root = self._root_of(key)
+        if root is None:
+            return False
+        return not any(_skip(part) for part in Path(key).relative_to(root).parts)
+
+    def _ensure_dir(self, key: str) -> _DirNode:
+        node = self._dirs.get(key)
+        if node is None:
+            node = self._dirs[key] = _DirNode()
+            root = self._root_of(key)
+            if key != root:
+                self._ensure_dir(os.path.dirname(key)).subdirs.add(os.path.basename(key))
+        return node
+
+    def _chain(self, dir_key: str):
+        """dir_key 와 루트까지의 상위 디렉터리 노드."""
+        root = self._root_of(dir_key)
+        key = dir_key
+        while True:
+            yield self._ensure_dir(key)
+            if key == root:
+                return
+            key = os.path.dirname(key)
+
+    def _put_file(self, entry: FileEntry) -> None:
+        key = str(entry.path)
+        if key in self._entries:
+            self._remove_file(key)
+        dir_key, name = os.path.split(key)
+        suffix = entry.path.suffix.lower()
+        item = (entry.mtime, key)
+        self._entries[key] = entry
+        parent = self._ensure_dir(dir_key)
+        parent.files[name] = entry
+        _insort(parent.names, name)
+        _insort(parent.recent, item)
+        parent.counts[suffix] += 1
+        parent.size += entry.size
+        for node in self._chain(dir_key):
+            _insort(node.tree_recent, item)
+            node.tree_counts[suffix] += 1
+            node.tree_size += entry.size
+
+    def _remove_file(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        dir_key, name = os.path.split(key)
+        suffix = entry.path.suffix.lower()
+        item = (entry.mtime, key)
+        parent = self._dirs.get(dir_key)
+        if parent is None:
+            return
+        parent.files.pop(name, None)
+        _discard(parent.names, name)
+        _discard(parent.recent, item)
+        parent.counts[suffix] -= 1
+        parent.size -= entry.size
+        for node in self._chain(dir_key):
+            _discard(node.tree_recent, item)
+            node.tree_counts[suffix] -= 1
+            node.tree_size -= entry.size
+
+    def _remove_dir(self, key: str) -> None:
+        for k in [k for k in self._dirs if k == key or k.startswith(key + os.sep)]:
+            self._dirs.pop(k, None)
+        parent = self._dirs.get(os.path.dirname(key))
+        if parent is not None:
+            parent.subdirs.discard(os.path.basename(key))
+
+
+class _Handler(FileSystemEventHandler):
+    """watchdog 이벤트 → 인덱스 반영 (watchdog 스레드에서 호출)."""
+
+    def __init__(self, index: WorkspaceIndex):
+        self.index = index
+
+    def on_created(self, event):
+        if event.is_directory:
+            self.index.rescan(Path(event.src_path))
+        else:
+            self.index.upsert(Path(event.src_path))
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self.index.upsert(Path(event.src_path))
+
+    def on_deleted(self, event):
+        self.index.discard(Path(event.src_path))
+
+    def on_moved(self, event):
+        self.index.discard(Path(event.src_path))
+        if event.is_directory:
+            self.index.rescan(Path(event.dest_path))
+        else:
+            self.index.upsert(Path(event.dest_path))